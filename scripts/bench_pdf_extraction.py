@@ -0,0 +1,145 @@
+"""PDF 抽取基准：本地快速抽取 vs GROBID 的单篇耗时与章节召回
+
+对语料目录中的每篇 PDF 分别走快速抽取（pypdf + 标题启发式）和 GROBID，比较：
+- 单篇耗时（中位数 / P90）
+- 六个章节摘要槽位的召回：GROBID 找到的槽位中快速抽取也找到的比例
+- 快速通道接受率：快速抽取核心章节数达到 PDF_MIN_P1_SECTIONS、无需回退 GROBID 的比例
+- 正文提取的 GitHub 链接是否一致
+
+语料默认取 arXiv PDF 下载缓存目录（运行过增强阶段即有），也可指定任意目录。
+GROBID 不可用或加 --no-grobid 时只报告快速抽取的耗时与接受率。
+
+用法:
+    python scripts/bench_pdf_extraction.py
+    python scripts/bench_pdf_extraction.py --corpus ~/arxiv_pdfs --limit 50
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+# 添加项目根目录到路径
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.common import constants  # noqa: E402
+from src.enhancer import PDFContent, PDFEnhancer  # noqa: E402
+from src.enhancer.fast_pdf_extractor import extract_article  # noqa: E402
+
+_SLOTS = (
+    "introduction_summary",
+    "method_summary",
+    "evaluation_summary",
+    "dataset_summary",
+    "baselines_summary",
+    "conclusion_summary",
+)
+
+
+def _found(content: Optional[PDFContent]) -> set[str]:
+    if content is None:
+        return set()
+    return {slot for slot in _SLOTS if getattr(content, slot)}
+
+
+def _percentile(values: List[float], q: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+async def run(corpus: Path, limit: int, use_grobid: bool) -> None:
+    pdfs = sorted(corpus.glob("*.pdf"))[:limit]
+    if not pdfs:
+        print(f"语料目录中没有PDF: {corpus}")
+        return
+
+    enhancer = PDFEnhancer(cache_dir=str(corpus))
+    if use_grobid:
+        # 端点版本在 probe() 中异步探测，构造后 known_versions 为空
+        await enhancer.grobid_pool.probe()
+    use_grobid = use_grobid and bool(enhancer.grobid_pool.known_versions)
+    print(f"语料 {len(pdfs)} 篇, GROBID: {'启用' if use_grobid else '跳过'}")
+
+    fast_seconds: List[float] = []
+    grobid_seconds: List[float] = []
+    accepted = 0
+    slot_hits: Dict[str, int] = {slot: 0 for slot in _SLOTS}
+    slot_totals: Dict[str, int] = {slot: 0 for slot in _SLOTS}
+    github_agree = github_total = 0
+
+    for pdf_path in pdfs:
+        started = time.perf_counter()
+        article = extract_article(pdf_path)
+        fast = (
+            enhancer._build_pdf_content(article, constants.PDF_FAST_EXTRACTOR_VERSION)
+            if article
+            else None
+        )
+        fast_seconds.append(time.perf_counter() - started)
+        if fast and enhancer._count_p1_sections(fast) >= constants.PDF_MIN_P1_SECTIONS:
+            accepted += 1
+
+        line = f"{pdf_path.name:<28} 快速 {fast_seconds[-1]:6.2f}s 槽位{len(_found(fast))}"
+        if use_grobid:
+            started = time.perf_counter()
+            try:
+                grobid_article, version = await enhancer.grobid_pool.parse(pdf_path)
+            except Exception as exc:  # noqa: BLE001
+                print(f"{line}  GROBID失败: {exc}")
+                continue
+            grobid_seconds.append(time.perf_counter() - started)
+            grobid = (
+                enhancer._build_pdf_content(grobid_article, version)
+                if isinstance(grobid_article, dict)
+                else None
+            )
+            expected, got = _found(grobid), _found(fast)
+            for slot in expected:
+                slot_totals[slot] += 1
+                slot_hits[slot] += slot in got
+            grobid_url = grobid and enhancer._extract_urls_from_pdf(grobid)["github_url"]
+            if grobid_url:
+                github_total += 1
+                fast_url = fast and enhancer._extract_urls_from_pdf(fast)["github_url"]
+                github_agree += fast_url == grobid_url
+            line += f" | GROBID {grobid_seconds[-1]:6.2f}s 槽位{len(expected)}"
+        print(line)
+
+    print("\n== 汇总 ==")
+    print(
+        f"快速抽取: 中位 {statistics.median(fast_seconds):.2f}s, "
+        f"P90 {_percentile(fast_seconds, 0.9):.2f}s, "
+        f"接受率 {accepted / len(pdfs):.0%} (核心章节≥{constants.PDF_MIN_P1_SECTIONS})"
+    )
+    if grobid_seconds:
+        print(
+            f"GROBID:   中位 {statistics.median(grobid_seconds):.2f}s, "
+            f"P90 {_percentile(grobid_seconds, 0.9):.2f}s"
+        )
+        total = sum(slot_totals.values())
+        print(f"章节召回(相对GROBID): {sum(slot_hits.values()) / max(total, 1):.0%}")
+        for slot in _SLOTS:
+            if slot_totals[slot]:
+                print(f"  {slot:<22}{slot_hits[slot]}/{slot_totals[slot]}")
+        if github_total:
+            print(f"GitHub链接一致: {github_agree}/{github_total}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="PDF抽取基准：快速抽取 vs GROBID")
+    parser.add_argument("--corpus", type=Path, default=Path(constants.ARXIV_PDF_CACHE_DIR))
+    parser.add_argument("--limit", type=int, default=100)
+    parser.add_argument("--no-grobid", action="store_true", help="只测快速抽取")
+    args = parser.parse_args()
+    asyncio.run(run(args.corpus, args.limit, not args.no_grobid))
+
+
+if __name__ == "__main__":
+    main()
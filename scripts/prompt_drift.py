@@ -0,0 +1,175 @@
+"""对比完整/精简评分prompt的评分漂移（离线，基于评分缓存）
+
+同一候选在 full 与 compact 两种prompt下的缓存键不同，本脚本读取两者的缓存结果，
+统计各维度分数差异、任务领域一致率与prompt长度缩减，用于决定能否切换到 compact。
+
+用法:
+    python scripts/prompt_drift.py --candidates candidates.jsonl
+    python scripts/prompt_drift.py --fallback-db fallback.db --max-mean-drift 0.5
+    python scripts/prompt_drift.py --candidates candidates.jsonl --fill  # 缺失时调用LLM补齐
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import sqlite3
+import sys
+from dataclasses import fields
+from datetime import datetime
+from pathlib import Path
+from statistics import mean
+from typing import Dict, List, Tuple
+
+# 添加项目根目录到路径
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.models import RawCandidate  # noqa: E402
+from src.scorer.llm_scorer import LLMScorer, UnifiedBenchmarkExtraction  # noqa: E402
+
+SCORE_FIELDS = [
+    "activity_score",
+    "reproducibility_score",
+    "license_score",
+    "novelty_score",
+    "relevance_score",
+]
+_RAW_FIELDS = {f.name for f in fields(RawCandidate)}
+
+
+def _to_candidate(data: dict) -> RawCandidate:
+    data = {k: v for k, v in data.items() if k in _RAW_FIELDS}
+    if isinstance(data.get("publish_date"), str):
+        data["publish_date"] = datetime.fromisoformat(data["publish_date"])
+    data["raw_metadata"] = data.get("raw_metadata") or {}
+    return RawCandidate(**data)
+
+
+def load_candidates(args: argparse.Namespace) -> List[RawCandidate]:
+    """从JSONL或SQLite降级库读取候选"""
+
+    candidates: List[RawCandidate] = []
+    if args.candidates:
+        with open(args.candidates, "r", encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    candidates.append(_to_candidate(json.loads(line)))
+    if args.fallback_db:
+        conn = sqlite3.connect(args.fallback_db)
+        for (raw_json,) in conn.execute("SELECT raw_json FROM fallback_candidates"):
+            candidates.append(_to_candidate(json.loads(raw_json)))
+        conn.close()
+    return candidates[: args.limit] if args.limit else candidates
+
+
+async def _fill_missing(
+    scorer: LLMScorer, candidates: List[RawCandidate], mode: str
+) -> None:
+    """以指定prompt模式为缓存缺失的候选补齐评分（会产生LLM调用）"""
+
+    scorer.prompt_mode = mode
+    results = await asyncio.gather(
+        *(scorer.score(c) for c in candidates), return_exceptions=True
+    )
+    failed = sum(1 for r in results if isinstance(r, Exception))
+    print(f"[{mode}] 补齐{len(candidates) - failed}条, 失败{failed}条")
+
+
+async def collect_pairs(
+    scorer: LLMScorer, candidates: List[RawCandidate], fill: bool
+) -> List[Tuple[RawCandidate, UnifiedBenchmarkExtraction, UnifiedBenchmarkExtraction]]:
+    keys = {
+        id(c): (scorer._cache_key(c, "full"), scorer._cache_key(c, "compact"))
+        for c in candidates
+    }
+    all_keys = [key for pair in keys.values() for key in pair]
+    cached = await scorer._lookup_cached(all_keys)
+
+    if fill and scorer.client:
+        for index, mode in enumerate(("full", "compact")):
+            missing = [c for c in candidates if keys[id(c)][index] not in cached]
+            if missing:
+                await _fill_missing(scorer, missing, mode)
+        await scorer.flush_cache_writes()
+        cached = await scorer._lookup_cached(all_keys)
+
+    pairs = []
+    for c in candidates:
+        full_key, compact_key = keys[id(c)]
+        if full_key in cached and compact_key in cached:
+            pairs.append((c, cached[full_key], cached[compact_key]))
+    return pairs
+
+
+def report(
+    scorer: LLMScorer,
+    candidates: List[RawCandidate],
+    pairs: List[
+        Tuple[RawCandidate, UnifiedBenchmarkExtraction, UnifiedBenchmarkExtraction]
+    ],
+) -> float:
+    """打印漂移报告，返回各维度平均绝对差的最大值"""
+
+    reductions = [
+        1 - len(scorer._build_prompt(c, "compact")) / len(scorer._build_prompt(c, "full"))
+        for c in candidates
+    ]
+    print(f"候选{len(candidates)}条, 两种prompt均有缓存{len(pairs)}条")
+    print(f"prompt长度平均缩减: {mean(reductions) * 100:.1f}%")
+    if not pairs:
+        print("无可对比样本，请先以两种模式各运行一次或使用 --fill")
+        return 0.0
+
+    drifts: Dict[str, List[float]] = {name: [] for name in SCORE_FIELDS}
+    total_drift: List[float] = []
+    domain_same = 0
+    for candidate, full, compact in pairs:
+        for name in SCORE_FIELDS:
+            drifts[name].append(abs(getattr(full, name) - getattr(compact, name)))
+        total_drift.append(
+            abs(
+                scorer._to_scored_candidate(candidate, full).total_score
+                - scorer._to_scored_candidate(candidate, compact).total_score
+            )
+        )
+        domain_same += full.task_domain == compact.task_domain
+
+    print(f"{'维度':<24}{'平均|Δ|':>10}{'最大|Δ|':>10}{'|Δ|≥2占比':>12}")
+    for name, values in drifts.items():
+        big = sum(1 for v in values if v >= 2) / len(values)
+        print(f"{name:<24}{mean(values):>10.2f}{max(values):>10.2f}{big:>11.0%}")
+    print(f"{'total_score':<24}{mean(total_drift):>10.2f}{max(total_drift):>10.2f}")
+    print(f"任务领域一致率: {domain_same / len(pairs):.0%}")
+    return max(mean(values) for values in drifts.values())
+
+
+async def main() -> int:
+    parser = argparse.ArgumentParser(description="完整/精简prompt评分漂移对比")
+    parser.add_argument("--candidates", help="候选JSONL（RawCandidate字段）")
+    parser.add_argument("--fallback-db", help="SQLite降级库路径（读取raw_json）")
+    parser.add_argument("--limit", type=int, default=0, help="最多对比条数")
+    parser.add_argument("--fill", action="store_true", help="缓存缺失时调用LLM补齐")
+    parser.add_argument(
+        "--max-mean-drift",
+        type=float,
+        default=None,
+        help="任一维度平均漂移超过该值时以非0退出",
+    )
+    args = parser.parse_args()
+    if not args.candidates and not args.fallback_db:
+        parser.error("需要 --candidates 或 --fallback-db")
+
+    candidates = load_candidates(args)
+    async with LLMScorer() as scorer:
+        pairs = await collect_pairs(scorer, candidates, args.fill)
+        worst = report(scorer, candidates, pairs)
+
+    if args.max_mean_drift is not None and worst > args.max_mean_drift:
+        print(f"漂移超限: {worst:.2f} > {args.max_mean_drift:.2f}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
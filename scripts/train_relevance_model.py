@@ -0,0 +1,228 @@
+"""训练相关性预筛模型并输出召回报告（离线）
+
+以历史LLM评分的 relevance_score 为标签训练哈希n-gram线性模型，按URL哈希切出验证集，
+在验证集上校准安全边际（保证LLM判定达标的候选至少 --target-recall 被保留），
+再报告召回、丢弃率与不同边际下的取舍，最后写出模型文件。
+
+标签来源（可组合，按URL去重，后读入的覆盖先读入的）:
+    --labels      运行时写入的 logs/relevance_labels.jsonl（含低于下限的负样本，首选）
+    --fallback-db SQLite降级库 fallback_candidates（仅含入库记录，负样本偏少）
+    --feishu      飞书多维表格导出（同上，仅含入库记录）
+
+用法:
+    python scripts/train_relevance_model.py --labels logs/relevance_labels.jsonl
+    python scripts/train_relevance_model.py --labels a.jsonl --fallback-db fallback.db --feishu
+    python scripts/train_relevance_model.py --labels a.jsonl --evaluate models/relevance_model.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import sqlite3
+import sys
+import zlib
+from pathlib import Path
+from typing import Any, Dict, List, Sequence, Tuple
+
+# 添加项目根目录到路径
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.common import constants  # noqa: E402
+from src.prefilter.relevance_model import (  # noqa: E402
+    LabeledExample,
+    RelevanceModel,
+    calibrate_margin,
+    evaluate_relevance_model,
+    train_relevance_model,
+)
+
+_MARGIN_SWEEP = (0.0, 0.5, 1.0, 1.5, 2.0, 3.0)
+
+
+def _text(value: Any) -> str:
+    """飞书文本字段可能是富文本段列表"""
+
+    if isinstance(value, list):
+        return "".join(
+            v.get("text", "") if isinstance(v, dict) else str(v) for v in value
+        )
+    if isinstance(value, dict):
+        return str(value.get("link") or value.get("text") or "")
+    return str(value or "")
+
+
+def _example(data: Dict[str, Any]) -> LabeledExample | None:
+    score = data.get("relevance_score")
+    if score is None or not data.get("title"):
+        return None
+    return LabeledExample(
+        title=_text(data.get("title")),
+        abstract=_text(data.get("abstract")),
+        source=_text(data.get("source")).lower(),
+        relevance=float(score),
+        url=_text(data.get("url")),
+    )
+
+
+def load_labels(path: str) -> List[LabeledExample]:
+    examples = []
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                example = _example(json.loads(line))
+                if example:
+                    examples.append(example)
+    return examples
+
+
+def load_fallback_db(path: str) -> List[LabeledExample]:
+    examples = []
+    conn = sqlite3.connect(path)
+    try:
+        rows = conn.execute("SELECT score_json, raw_json FROM fallback_candidates")
+        for score_json, raw_json in rows:
+            data = {**json.loads(raw_json), **json.loads(score_json)}
+            example = _example(data)
+            if example:
+                examples.append(example)
+    finally:
+        conn.close()
+    return examples
+
+
+async def load_feishu() -> List[LabeledExample]:
+    from src.storage.feishu_storage import FeishuStorage
+
+    records = await FeishuStorage().read_brief_records(
+        fields=["title", "abstract", "source", "url", "relevance_score"]
+    )
+    return [e for e in (_example(r) for r in records) if e]
+
+
+def dedupe(examples: Sequence[LabeledExample]) -> List[LabeledExample]:
+    by_key: Dict[str, LabeledExample] = {}
+    for example in examples:
+        by_key[example.url or example.title.lower()] = example
+    return list(by_key.values())
+
+
+def split(
+    examples: Sequence[LabeledExample], holdout_percent: int
+) -> Tuple[List[LabeledExample], List[LabeledExample]]:
+    """按URL哈希切分，重新训练时同一候选始终落在同一侧"""
+
+    train, holdout = [], []
+    for example in examples:
+        key = (example.url or example.title).encode("utf-8")
+        (holdout if zlib.crc32(key) % 100 < holdout_percent else train).append(example)
+    return train, holdout
+
+
+def print_report(
+    name: str, metrics: Dict[str, Any], floor: float, margin: float
+) -> None:
+    print(
+        f"[{name}] 样本{metrics['samples']}条 (达标{metrics['positives']}条, 下限{floor:.1f}, "
+        f"边际{margin:.2f}): 召回{metrics['recall']:.1%}, 丢弃率{metrics['drop_rate']:.1%}, "
+        f"丢弃正确率{metrics['dropped_precision']:.1%}, MAE {metrics['mae']:.2f}"
+    )
+
+
+def print_sweep(
+    model: RelevanceModel, holdout: Sequence[LabeledExample], floor: float
+) -> None:
+    original = model.margin
+    print(f"{'边际':>6}{'召回':>10}{'丢弃率':>10}{'丢弃正确率':>12}")
+    for margin in sorted({*_MARGIN_SWEEP, round(original, 2)}):
+        model.margin = margin
+        m = evaluate_relevance_model(model, holdout, floor)
+        print(
+            f"{margin:>6.2f}{m['recall']:>10.1%}{m['drop_rate']:>10.1%}"
+            f"{m['dropped_precision']:>12.1%}"
+        )
+    model.margin = original
+
+
+async def main() -> int:
+    parser = argparse.ArgumentParser(description="训练相关性预筛模型")
+    parser.add_argument("--labels", action="append", default=[], help="标签JSONL，可多次指定")
+    parser.add_argument("--fallback-db", help="SQLite降级库路径")
+    parser.add_argument("--feishu", action="store_true", help="读取飞书多维表格")
+    parser.add_argument("--output", default=constants.RELEVANCE_MODEL_PATH)
+    parser.add_argument("--evaluate", help="只评估已有模型文件，不训练")
+    parser.add_argument("--floor", type=float, default=constants.RELEVANCE_HARD_FLOOR)
+    parser.add_argument(
+        "--target-recall", type=float, default=constants.RELEVANCE_MODEL_TARGET_RECALL
+    )
+    parser.add_argument("--holdout-percent", type=int, default=20)
+    parser.add_argument("--epochs", type=int, default=15)
+    parser.add_argument("--learning-rate", type=float, default=0.2)
+    parser.add_argument("--l2", type=float, default=1e-5)
+    parser.add_argument("--min-samples", type=int, default=200, help="样本不足时拒绝训练")
+    args = parser.parse_args()
+
+    examples: List[LabeledExample] = []
+    if args.fallback_db:
+        examples += load_fallback_db(args.fallback_db)
+    if args.feishu:
+        examples += await load_feishu()
+    for path in args.labels:
+        examples += load_labels(path)
+    examples = dedupe(examples)
+    if not examples:
+        parser.error("没有可用标签，需要 --labels / --fallback-db / --feishu")
+
+    positives = sum(1 for e in examples if e.relevance >= args.floor)
+    print(f"标签{len(examples)}条: 达标{positives}条, 低于下限{len(examples) - positives}条")
+
+    if args.evaluate:
+        model = RelevanceModel.load(Path(args.evaluate))
+        metrics = evaluate_relevance_model(model, examples, args.floor)
+        print_report("全部", metrics, args.floor, model.margin)
+        print_sweep(model, examples, args.floor)
+        return 0
+
+    if len(examples) < args.min_samples:
+        print(f"样本不足{args.min_samples}条，未训练")
+        return 1
+    if positives == len(examples):
+        print("警告: 没有低于下限的负样本，模型无法学到丢弃边界，请补充 --labels 运行时标签")
+
+    train, holdout = split(examples, args.holdout_percent)
+    model = train_relevance_model(
+        train,
+        epochs=args.epochs,
+        learning_rate=args.learning_rate,
+        l2=args.l2,
+    )
+    predictions = [model.predict_text(e.title, e.abstract, e.source) for e in holdout]
+    model.margin = calibrate_margin(
+        predictions, [e.relevance for e in holdout], args.floor, args.target_recall
+    )
+    model.floor = args.floor
+
+    train_metrics = evaluate_relevance_model(model, train, args.floor)
+    holdout_metrics = evaluate_relevance_model(model, holdout, args.floor)
+    print_report("训练集", train_metrics, args.floor, model.margin)
+    print_report("验证集", holdout_metrics, args.floor, model.margin)
+    print_sweep(model, holdout, args.floor)
+
+    model.metrics = {
+        "train": train_metrics,
+        "holdout": holdout_metrics,
+        "target_recall": args.target_recall,
+        "label_sources": {
+            "labels": args.labels,
+            "fallback_db": args.fallback_db,
+            "feishu": args.feishu,
+        },
+    }
+    model.save(Path(args.output))
+    print(f"模型已写入: {args.output} (非零权重{len(model.to_dict()['weights'])}维)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
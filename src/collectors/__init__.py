@@ -5,12 +5,20 @@ from src.collectors.dbengines_collector import DBEnginesCollector
 from src.collectors.github_collector import GitHubCollector
 from src.collectors.helm_collector import HelmCollector
 from src.collectors.huggingface_collector import HuggingFaceCollector
+from src.collectors.scheduler import (
+    CollectionReport,
+    CollectionScheduler,
+    CollectorRun,
+)
 from src.collectors.semantic_scholar_collector import SemanticScholarCollector
 from src.collectors.techempower_collector import TechEmpowerCollector
 from src.collectors.twitter_collector import TwitterCollector
 
 __all__ = [
     "ArxivCollector",
+    "CollectionReport",
+    "CollectionScheduler",
+    "CollectorRun",
     "DBEnginesCollector",
     "GitHubCollector",
     "HelmCollector",
@@ -4,12 +4,18 @@ from __future__ import annotations
 
 import asyncio
 import logging
-from datetime import datetime, timedelta
-from typing import List, Optional, Tuple
+import os
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
 
 import arxiv
 import requests
 
+from src.collectors.arxiv_state import ArxivHarvestState, HighWaterMark
 from src.common import constants
 from src.common.datetime_utils import ensure_utc, get_retry_delay
 from src.common.url_extractor import URLExtractor
@@ -19,6 +25,59 @@ from src.models import RawCandidate
 logger = logging.getLogger(__name__)
 
 
+class _RequestPacer:
+    """跨线程共享的请求节拍器：保证相邻两次 arXiv API 请求间隔不小于 interval"""
+
+    def __init__(self, interval: float) -> None:
+        self.interval = interval
+        self._lock = threading.Lock()
+        self._next_slot = 0.0
+
+    def wait(self) -> float:
+        """预约下一个请求时段并睡到该时刻，返回等待的秒数"""
+
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self.interval
+        delay = slot - now
+        if delay > 0:
+            time.sleep(delay)
+        return delay
+
+
+# arXiv 要求同一来源每3秒最多一个请求，所有分片（及所有采集器实例）共用一个节拍
+_ARXIV_PACER = _RequestPacer(constants.ARXIV_API_MIN_INTERVAL_SECONDS)
+
+
+class _PacedSession(requests.Session):
+    """给requests.Session注入默认timeout（P15: 避免请求无超时导致线程悬挂），并按全局节拍发请求"""
+
+    def __init__(self, timeout_seconds: int, pacer: _RequestPacer) -> None:
+        super().__init__()
+        self._timeout_seconds = timeout_seconds
+        self._pacer = pacer
+
+    def request(self, method: str, url: str, **kwargs):  # type: ignore[override]
+        kwargs.setdefault("timeout", self._timeout_seconds)
+        self._pacer.wait()
+        return super().request(method, url, **kwargs)
+
+
+@dataclass(slots=True)
+class _ShardProgress:
+    """单个分类分片的采集断点，重试时从 offset 继续翻页而不是从第一页开始"""
+
+    category: str
+    query: str
+    limit: int  # 本分片最多读取的结果数（max_results 按分类均分）
+    mark: Optional[HighWaterMark] = None
+    results: List[arxiv.Result] = field(default_factory=list)
+    offset: int = 0  # 已读取的结果数（含跳过的已采集论文）
+    skipped: int = 0
+    done: bool = False
+
+
 class ArxivCollector:
     """负责抓取最近24小时内的Benchmark相关论文"""
 
@@ -33,90 +92,220 @@ class ArxivCollector:
         self.timeout = cfg.timeout_seconds
         self.max_retries = cfg.max_retries
         self.lookback = timedelta(hours=cfg.lookback_hours)
+        self.overlap = timedelta(hours=constants.ARXIV_WATERMARK_OVERLAP_HOURS)
+        # 增量采集水位，初始化失败时退化为每次全量查询
+        state_path = os.getenv("ARXIV_STATE_PATH", constants.ARXIV_STATE_PATH)
+        self.state: Optional[ArxivHarvestState] = None
+        if state_path:
+            try:
+                self.state = ArxivHarvestState(Path(state_path))
+            except Exception as exc:  # noqa: BLE001
+                logger.warning("arXiv采集水位初始化失败,每次全量查询: %s", exc)
+        # 已完成分片的候选，调度器超时取消时返回这部分结果
+        self.partial_candidates: List[RawCandidate] = []
+        self._emitted_ids: set[str] = set()
+        # 已完成分片的新水位，本次结果入库后由 commit_state() 持久化
+        self._pending_marks: Dict[str, HighWaterMark] = {}
 
     async def collect(self) -> List[RawCandidate]:
-        """抓取并返回候选列表,失败时返回空列表"""
+        """按分类分片抓取并返回候选列表,全部失败时返回空列表
+
+        每个分类一个查询分片，分片在线程中逐页拉取，请求经全局节拍器排队，
+        一个分片解析结果时其他分片可以继续发请求。失败的分片从断点重试，
+        已完成的分片立即转换候选并暂存新水位；水位要等调用方在结果入库后
+        调用 commit_state() 才会保存，中途崩溃的运行下次会重新采集这些论文。
+        """
 
         if not self.enabled:
             logger.info("arXiv采集器已禁用,直接返回空列表")
             return []
 
+        self.partial_candidates = []
+        self._emitted_ids = set()
+        self._pending_marks = {}
+        # max_results 是整次采集的上限，按分类均分给各分片，合并后不超过 max_results
+        shard_limit = max(1, self.max_results // max(1, len(self.categories)))
+        shards = [
+            _ShardProgress(
+                category=category,
+                query=self._build_query(category),
+                limit=shard_limit,
+            )
+            for category in self.categories
+        ]
+        if self.state is not None:
+            for shard in shards:
+                shard.mark = await self.state.load(shard.query)
+
+        semaphore = asyncio.Semaphore(constants.ARXIV_SHARD_CONCURRENCY)
         retry_delays = constants.ARXIV_RETRY_DELAYS_SECONDS
         last_exc: Exception | None = None
         for attempt in range(1, self.max_retries + 1):
-            try:
-                results = await asyncio.to_thread(self._fetch_results)
-                return await self._to_candidates(results)
-            except (TimeoutError, requests.exceptions.Timeout) as exc:
-                last_exc = exc
-                if attempt >= self.max_retries:
-                    break
-                delay = get_retry_delay(attempt, retry_delays)
+            pending = [shard for shard in shards if not shard.done]
+            outcomes = await asyncio.gather(
+                *(self._harvest_shard(shard, semaphore) for shard in pending),
+                return_exceptions=True,
+            )
+            failed = [
+                (shard, exc)
+                for shard, exc in zip(pending, outcomes)
+                if isinstance(exc, Exception)
+            ]
+            if not failed:
+                break
+            last_exc = failed[-1][1]
+            for shard, exc in failed:
                 logger.warning(
-                    "arXiv查询超时,准备重试(%s/%s), 等待%s秒后重试, 错误: %r",
-                    attempt,
-                    self.max_retries,
-                    delay,
-                    exc,
-                )
-                await asyncio.sleep(delay)
-            except Exception as exc:  # noqa: BLE001
-                last_exc = exc
-                if attempt >= self.max_retries:
-                    break
-                delay = get_retry_delay(attempt, retry_delays)
-                logger.error(
-                    "arXiv采集失败(%s/%s): %s, %s秒后重试",
+                    "arXiv分片%s失败(%s/%s), 已读取%d条, 错误: %r",
+                    shard.category,
                     attempt,
                     self.max_retries,
+                    shard.offset,
                     exc,
-                    delay,
                 )
-                await asyncio.sleep(delay)
+            if attempt >= self.max_retries:
+                break
+            delay = get_retry_delay(attempt, retry_delays)
+            logger.warning(
+                "arXiv %d个分片未完成, 等待%s秒后从断点重试",
+                len(failed),
+                delay,
+            )
+            await asyncio.sleep(delay)
 
-        logger.error(
-            "arXiv连续失败%s次,返回空列表, 超时配置=%s秒, 最后错误: %r",
-            self.max_retries,
-            self.timeout,
-            last_exc,
+        unfinished = [shard for shard in shards if not shard.done]
+        if unfinished:
+            logger.error(
+                "arXiv分片%s连续失败%s次,保留已读取的部分结果, 超时配置=%s秒, 最后错误: %r",
+                ",".join(shard.category for shard in unfinished),
+                self.max_retries,
+                self.timeout,
+                last_exc,
+            )
+            # 未完成分片不更新水位，下次运行重新覆盖这段时间
+            for shard in unfinished:
+                await self._emit(shard.results)
+
+        logger.info(
+            "arXiv采集完成,分片%d/%d完成,有效候选%s条",
+            len(shards) - len(unfinished),
+            len(shards),
+            len(self.partial_candidates),
         )
-        return []
+        return list(self.partial_candidates)
+
+    def _build_query(self, category: str) -> str:
+        query = " OR ".join([f'all:"{kw}"' for kw in self.keywords])
+        return f"({query}) AND cat:{category}"
 
-    def _fetch_results(self) -> List[arxiv.Result]:
-        """同步执行arXiv查询,供线程池调用"""
+    async def _harvest_shard(
+        self, shard: _ShardProgress, semaphore: asyncio.Semaphore
+    ) -> None:
+        """拉取单个分片，完成后立即转换候选并暂存水位"""
 
-        class _TimeoutSession(requests.Session):
-            """给requests.Session注入默认timeout（P15: 避免请求无超时导致线程悬挂）"""
+        async with semaphore:
+            await asyncio.to_thread(self._fetch_shard, shard)
+        shard.done = True
+        if shard.mark is not None:
+            logger.info(
+                "arXiv分片%s增量采集: 水位%s, 新论文%d篇, 跳过已采集%d篇",
+                shard.category,
+                shard.mark.latest_published.isoformat(),
+                len(shard.results),
+                shard.skipped,
+            )
+        await self._emit(shard.results)
+        self._stage_mark(shard.query, shard.mark, shard.results)
 
-            def __init__(self, timeout_seconds: int) -> None:
-                super().__init__()
-                self._timeout_seconds = timeout_seconds
+    def _fetch_shard(self, shard: _ShardProgress) -> None:
+        """同步拉取分片，供线程池调用
 
-            def request(self, method: str, url: str, **kwargs):  # type: ignore[override]
-                kwargs.setdefault("timeout", self._timeout_seconds)
-                return super().request(method, url, **kwargs)
+        结果按提交时间倒序逐页拉取，遇到早于回溯窗口或水位重叠窗口的论文即停止翻页；
+        重叠窗口内已见过的 ID 直接跳过。读取进度记录在 shard 上，异常退出后可从断点继续。
+        """
 
-        query = " OR ".join([f'all:"{kw}"' for kw in self.keywords])
-        cat_filter = " OR ".join([f"cat:{cat}" for cat in self.categories])
         search = arxiv.Search(
-            query=f"({query}) AND ({cat_filter})",
-            max_results=self.max_results,
+            query=shard.query,
+            max_results=shard.limit,
             sort_by=arxiv.SortCriterion.SubmittedDate,
             sort_order=arxiv.SortOrder.Descending,
         )
+        # 有水位时新论文通常不足一页，用小页尽早停止翻页
+        page_limit = (
+            constants.ARXIV_INCREMENTAL_PAGE_SIZE
+            if shard.mark is not None
+            else constants.ARXIV_PAGE_SIZE_LIMIT
+        )
+        # 请求间隔由全局节拍器控制，关闭SDK自身按实例计算的等待
         client = arxiv.Client(
-            page_size=min(self.max_results, constants.ARXIV_PAGE_SIZE_LIMIT),
+            page_size=min(shard.limit, page_limit),
+            delay_seconds=0,
             num_retries=0,
         )
         # P15: arxiv.py内部requests默认无timeout，这里强制注入，避免asyncio超时取消后线程仍继续跑
-        client._session = _TimeoutSession(timeout_seconds=self.timeout)
-        return list(client.results(search))
+        client._session = _PacedSession(self.timeout, _ARXIV_PACER)
+
+        stop_before = datetime.now(timezone.utc) - self.lookback
+        if shard.mark is not None:
+            stop_before = max(stop_before, shard.mark.stop_before(self.overlap))
+
+        for paper in client.results(search, offset=shard.offset):
+            shard.offset += 1
+            published_dt = ensure_utc(paper.published)
+            if published_dt and published_dt < stop_before:
+                break
+            if shard.mark is not None and self._arxiv_id(paper) in shard.mark.seen:
+                shard.skipped += 1
+                continue
+            shard.results.append(paper)
+
+    async def _emit(self, results: List[arxiv.Result]) -> None:
+        """转换候选并按 arXiv ID 去重（跨分类的论文会出现在多个分片中）"""
+
+        fresh = []
+        for paper in results:
+            arxiv_id = self._arxiv_id(paper)
+            if arxiv_id not in self._emitted_ids:
+                self._emitted_ids.add(arxiv_id)
+                fresh.append(paper)
+        self.partial_candidates.extend(await self._to_candidates(fresh))
+
+    async def commit_state(self) -> None:
+        """保存已完成分片的新水位，需在本次采集结果入库（或被过滤）之后调用"""
+
+        if self.state is None:
+            return
+        pending, self._pending_marks = self._pending_marks, {}
+        for query, mark in pending.items():
+            await self.state.save(query, mark)
+
+    def _stage_mark(
+        self,
+        query: str,
+        mark: Optional[HighWaterMark],
+        results: List[arxiv.Result],
+    ) -> None:
+        """本次见到的论文并入水位，暂存到 commit_state() 时再持久化"""
+
+        if self.state is None:
+            return
+        papers = [
+            (self._arxiv_id(paper), published)
+            for paper in results
+            if (published := ensure_utc(paper.published)) is not None
+        ]
+        if not papers:
+            return
+        base = mark or HighWaterMark(latest_published=min(p for _, p in papers))
+        self._pending_marks[query] = base.advance(papers, self.overlap)
+
+    @staticmethod
+    def _arxiv_id(paper: arxiv.Result) -> str:
+        return paper.entry_id.split("/")[-1].split("v")[0]
 
     async def _to_candidates(self, results: List[arxiv.Result]) -> List[RawCandidate]:
         """将arXiv返回转成内部数据结构"""
 
-        from datetime import timezone
-
         cutoff = datetime.now(timezone.utc) - self.lookback
         candidates: List[RawCandidate] = []
 
@@ -127,7 +316,7 @@ class ArxivCollector:
                 continue
 
             raw_authors, raw_institutions = self._extract_authors_institutions(paper)
-            arxiv_id = paper.entry_id.split("/")[-1].split("v")[0]
+            arxiv_id = self._arxiv_id(paper)
 
             # 从论文摘要和comment中提取数据集URL
             text_to_search = f"{paper.summary or ''}\n{paper.comment or ''}"
@@ -155,7 +344,6 @@ class ArxivCollector:
                 )
             )
 
-        logger.info("arXiv采集完成,有效候选%s条", len(candidates))
         return candidates
 
     @staticmethod
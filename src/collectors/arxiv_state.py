@@ -0,0 +1,137 @@
+"""arXiv 增量采集水位持久化
+
+每次运行都按提交时间倒序重新拉取最多 max_results 条、再丢弃回溯窗口外的结果，
+绝大部分页面都是上次已经见过的论文。这里按查询语句保存水位：
+- latest_published: 已见过的最新提交时间
+- seen: 水位前 ARXIV_WATERMARK_OVERLAP_HOURS 内已见过的 arXiv ID 及其提交时间
+
+arXiv 的 published 是 v1 提交时间，而论文要到公告后才出现在 API 中，同一批公告的
+提交时间跨度约一天，审核延迟的论文还会更晚出现。因此采集时回看水位前一段重叠窗口，
+窗口内按 ID 去重，早于窗口的结果视为已采集并停止翻页。
+
+水位只在本次结果入库之后才保存（ArxivCollector.commit_state），运行中途失败时
+下次仍会重新采集这些论文。水位读写失败只记录日志，退化为全量查询。
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import logging
+import sqlite3
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Dict, Iterable, Optional, Tuple
+
+from src.common.datetime_utils import ensure_utc
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(slots=True)
+class HighWaterMark:
+    """单个查询的采集水位"""
+
+    latest_published: datetime
+    seen: Dict[str, datetime] = field(default_factory=dict)
+
+    def stop_before(self, overlap: timedelta) -> datetime:
+        """早于该时间的结果均已采集过，翻页到此即可停止"""
+
+        return self.latest_published - overlap
+
+    def advance(
+        self, papers: Iterable[Tuple[str, datetime]], overlap: timedelta
+    ) -> "HighWaterMark":
+        """合并本次见到的 (arxiv_id, published)，丢弃重叠窗口外的旧 ID"""
+
+        seen = dict(self.seen)
+        seen.update(papers)
+        latest = max([self.latest_published, *seen.values()])
+        floor = latest - overlap
+        recent = {
+            arxiv_id: published for arxiv_id, published in seen.items() if published >= floor
+        }
+        return HighWaterMark(latest_published=latest, seen=recent)
+
+
+def query_key(query: str) -> str:
+    """查询语句的稳定键，关键词或分类变化后自动从头采集"""
+
+    return hashlib.sha256(query.encode("utf-8")).hexdigest()[:32]
+
+
+class ArxivHarvestState:
+    """基于SQLite的 arXiv 查询水位存储"""
+
+    def __init__(self, db_path: Path) -> None:
+        self.db_path = Path(db_path)
+        self._init_db()
+
+    def _init_db(self) -> None:
+        """初始化数据库结构"""
+
+        conn = sqlite3.connect(self.db_path)
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS arxiv_watermarks (
+                query_key TEXT PRIMARY KEY,
+                query TEXT NOT NULL,
+                latest_published TEXT NOT NULL,
+                seen TEXT NOT NULL,
+                updated_at REAL NOT NULL
+            )
+            """
+        )
+        conn.commit()
+        conn.close()
+
+    async def load(self, query: str) -> Optional[HighWaterMark]:
+        try:
+            return await asyncio.to_thread(self._load_sync, query_key(query))
+        except Exception as exc:  # noqa: BLE001
+            logger.warning("读取arXiv采集水位失败,本次全量查询: %s", exc)
+            return None
+
+    def _load_sync(self, key: str) -> Optional[HighWaterMark]:
+        conn = sqlite3.connect(self.db_path)
+        row = conn.execute(
+            "SELECT latest_published, seen FROM arxiv_watermarks WHERE query_key = ?",
+            (key,),
+        ).fetchone()
+        conn.close()
+        if row is None:
+            return None
+        seen = {
+            arxiv_id: ensure_utc(datetime.fromisoformat(published))
+            for arxiv_id, published in json.loads(row[1]).items()
+        }
+        latest = ensure_utc(datetime.fromisoformat(row[0]))
+        return HighWaterMark(latest_published=latest, seen=seen)
+
+    async def save(self, query: str, mark: HighWaterMark) -> None:
+        try:
+            await asyncio.to_thread(self._save_sync, query, mark)
+        except Exception as exc:  # noqa: BLE001
+            logger.warning("写入arXiv采集水位失败: %s", exc)
+
+    def _save_sync(self, query: str, mark: HighWaterMark) -> None:
+        seen = {arxiv_id: published.isoformat() for arxiv_id, published in mark.seen.items()}
+        conn = sqlite3.connect(self.db_path)
+        conn.execute(
+            "INSERT OR REPLACE INTO arxiv_watermarks "
+            "(query_key, query, latest_published, seen, updated_at) "
+            "VALUES (?, ?, ?, ?, ?)",
+            (
+                query_key(query),
+                query,
+                mark.latest_published.isoformat(),
+                json.dumps(seen, sort_keys=True),
+                time.time(),
+            ),
+        )
+        conn.commit()
+        conn.close()
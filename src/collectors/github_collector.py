@@ -6,13 +6,17 @@ import asyncio
 import logging
 import os
 import re
+from collections import Counter
+from contextlib import asynccontextmanager
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
-from typing import Any, Dict, List, Optional, cast
+from typing import Any, AsyncIterator, Dict, List, Mapping, Optional, Sequence, cast
 
 import httpx
 
 from src.common import clean_summary_text, constants
+from src.common.http_cache import shared_github_cache
+from src.common.rate_limit import RetryPolicy, send_with_retry
 from src.common.url_extractor import URLExtractor
 from src.config import Settings, get_settings
 from src.models import RawCandidate
@@ -29,6 +33,52 @@ class ReadmeExtraction:
     dataset_size: Optional[str]
 
 
+class _BudgetedPool:
+    """搜索与README请求共用的有界并发池。
+
+    总并发不超过 GITHUB_MAX_CONCURRENCY；每类额度（search/core/graphql，见
+    x-ratelimit-resource）的并发再按最近一次响应的剩余额度收缩，避免把额度打穿后
+    整批请求一起等待重置。
+    """
+
+    def __init__(self, max_workers: int) -> None:
+        self.max_workers = max(1, max_workers)
+        self._in_flight: Counter[str] = Counter()
+        self._limits: Dict[str, int] = {}
+        self._cond = asyncio.Condition()
+
+    def _can_start(self, resource: str) -> bool:
+        total = sum(self._in_flight.values())
+        limit = self._limits.get(resource, self.max_workers)
+        return total < self.max_workers and self._in_flight[resource] < limit
+
+    @asynccontextmanager
+    async def slot(self, resource: str) -> AsyncIterator[None]:
+        async with self._cond:
+            await self._cond.wait_for(lambda: self._can_start(resource))
+            self._in_flight[resource] += 1
+        try:
+            yield
+        finally:
+            async with self._cond:
+                self._in_flight[resource] -= 1
+                self._cond.notify_all()
+
+    def observe(self, headers: Mapping[str, str]) -> None:
+        """根据响应头中的剩余额度调整该类请求的并发上限"""
+
+        resource = headers.get("x-ratelimit-resource")
+        try:
+            remaining = int(headers.get("x-ratelimit-remaining", ""))
+        except ValueError:
+            return
+        if resource:
+            self._limits[resource] = max(
+                1,
+                min(self.max_workers, remaining // constants.GITHUB_RATE_BUDGET_PER_WORKER),
+            )
+
+
 class GitHubCollector:
     """通过GitHub Search API抓取高质量Benchmark仓库"""
 
@@ -82,7 +132,15 @@ class GitHubCollector:
         self.token = self.github_config.token or os.getenv("GITHUB_TOKEN")
         self.max_retries = self.github_config.max_retries
         self.retry_delay = self.github_config.retry_delay_seconds
+        self.retry_policy = RetryPolicy(
+            max_attempts=self.max_retries, base_delay=self.retry_delay
+        )
         self._readme_cache: Dict[str, Optional[str]] = {}
+        # 跨进程持久的ETag/README快照缓存，与PDF增强器共用
+        self.http_cache = shared_github_cache()
+        self._pool = _BudgetedPool(constants.GITHUB_MAX_CONCURRENCY)
+        # 调度器超时取消时读取的部分结果
+        self.partial_candidates: List[RawCandidate] = []
 
     async def collect(self) -> List[RawCandidate]:
         if not self.github_config.enabled:
@@ -94,6 +152,8 @@ class GitHubCollector:
         headers = self._build_headers("application/vnd.github+json")
         timeout = httpx.Timeout(self.timeout)
 
+        # 话题搜索并发展开，README按批走GraphQL；两类请求共用有界并发池
+        self._pool = _BudgetedPool(constants.GITHUB_MAX_CONCURRENCY)
         async with httpx.AsyncClient(
             timeout=timeout, headers=headers, follow_redirects=True
         ) as client:
@@ -128,44 +188,34 @@ class GitHubCollector:
         data = resp.json()
         items = data.get("items", [])
 
-        parsed: List[RawCandidate] = []
-        for repo in items:
-            if not self._passes_basic_repo_filters(repo):
-                continue
+        repos = [repo for repo in items if self._passes_basic_repo_filters(repo)]
+        await self._prefetch_readmes(client, repos)
 
+        parsed: List[RawCandidate] = []
+        for repo in repos:
             candidate = await self._build_candidate(client, repo, topic)
             if candidate:
                 parsed.append(candidate)
+                self.partial_candidates.append(candidate)
 
         return parsed
 
     async def _request_with_retry(
         self, client: httpx.AsyncClient, params: Dict[str, Any], topic: str
     ) -> httpx.Response:
-        last_exc: Optional[Exception] = None
-        for attempt in range(1, self.max_retries + 1):
-            try:
-                resp = await client.get(self.api_url, params=params)
-                resp.raise_for_status()
-                return resp
-            except (httpx.HTTPError, httpx.TransportError) as exc:  # noqa: PERF203
-                last_exc = exc
-                if attempt == self.max_retries:
-                    break
-                delay = self.retry_delay * attempt
-                logger.warning(
-                    "GitHub API调用失败(topic=%s, attempt=%s/%s): %r，%s后重试",
-                    topic,
-                    attempt,
-                    self.max_retries,
-                    exc,
-                    delay,
-                )
-                await asyncio.sleep(delay)
+        """搜索请求：与README请求共享 api.github.com 的限速额度，限流时按重置时间等待"""
 
-        if last_exc:
-            raise last_exc
-        raise RuntimeError("GitHub API未知错误")
+        async with self._pool.slot("search"):
+            resp = await send_with_retry(
+                client, "GET", self.api_url, policy=self.retry_policy, params=params
+            )
+        self._pool.observe(resp.headers)
+        if resp.is_error:
+            logger.warning(
+                "GitHub API调用失败(topic=%s): HTTP %s", topic, resp.status_code
+            )
+        resp.raise_for_status()
+        return resp
 
     @staticmethod
     def _parse_datetime(value: str | None) -> datetime | None:
@@ -254,7 +304,17 @@ class GitHubCollector:
         url = f"https://api.github.com/repos/{full_name}/readme"
         headers = self._build_headers("application/vnd.github.raw")
         try:
-            resp = await client.get(url, headers=headers)
+            async with self._pool.slot("core"):
+                if self.http_cache is not None:
+                    # 带ETag的条件请求，README未变化时返回304且不计额度
+                    resp = await self.http_cache.conditional_get(
+                        client, url, headers=headers, policy=self.retry_policy
+                    )
+                else:
+                    resp = await send_with_retry(
+                        client, "GET", url, policy=self.retry_policy, headers=headers
+                    )
+            self._pool.observe(resp.headers)
             resp.raise_for_status()
             content = resp.text[:max_size]
             self._readme_cache[full_name] = content
@@ -264,6 +324,109 @@ class GitHubCollector:
             self._readme_cache[full_name] = None
             return None
 
+    async def _prefetch_readmes(
+        self, client: httpx.AsyncClient, repos: Sequence[Dict[str, Any]]
+    ) -> None:
+        """预取README写入内存缓存：先查本地快照，再按批走GraphQL；未取到的留给REST兜底"""
+
+        pushed_at: Dict[str, str] = {}
+        for repo in repos:
+            name = repo.get("full_name") or ""
+            if name.count("/") == 1 and name not in self._readme_cache:
+                pushed_at[name] = str(repo.get("pushed_at") or "")
+
+        if self.http_cache is not None:
+            # 仓库自上次采集后没有新推送时，README 直接取本地快照
+            for name, validator in pushed_at.items():
+                if not validator:
+                    continue
+                body = await self.http_cache.get_snapshot(f"readme:{name}", validator)
+                if body is not None:
+                    self._readme_cache[name] = body.decode("utf-8", errors="replace")
+
+        # GraphQL API 必须鉴权，无token时只能走REST
+        if not self.token:
+            return
+        pending = [name for name in pushed_at if name not in self._readme_cache]
+        batch_size = constants.GITHUB_README_GRAPHQL_BATCH
+        await asyncio.gather(
+            *(
+                self._fetch_readme_batch(
+                    client, pending[start : start + batch_size], pushed_at
+                )
+                for start in range(0, len(pending), batch_size)
+            )
+        )
+
+    async def _fetch_readme_batch(
+        self,
+        client: httpx.AsyncClient,
+        full_names: Sequence[str],
+        pushed_at: Mapping[str, str],
+        max_size: int = 10000,
+    ) -> None:
+        query, variables = self._readme_query(full_names)
+        try:
+            async with self._pool.slot("graphql"):
+                resp = await send_with_retry(
+                    client,
+                    "POST",
+                    constants.GITHUB_GRAPHQL_API,
+                    policy=self.retry_policy,
+                    json={"query": query, "variables": variables},
+                )
+            self._pool.observe(resp.headers)
+            resp.raise_for_status()
+            data = resp.json().get("data") or {}
+        except (httpx.HTTPError, ValueError) as exc:
+            logger.debug("GraphQL README批量获取失败(%d个仓库): %s", len(full_names), exc)
+            return
+
+        for index, full_name in enumerate(full_names):
+            repository = data.get(f"r{index}") or {}
+            text = next(
+                (
+                    blob["text"]
+                    for blob in (
+                        repository.get(f"p{path_index}")
+                        for path_index in range(len(constants.GITHUB_README_PATHS))
+                    )
+                    if blob and blob.get("text")
+                ),
+                None,
+            )
+            if text is None:
+                continue
+            self._readme_cache[full_name] = text[:max_size]
+            if self.http_cache is not None and pushed_at.get(full_name):
+                await self.http_cache.put_snapshot(
+                    f"readme:{full_name}",
+                    pushed_at[full_name],
+                    text[:max_size].encode("utf-8"),
+                )
+
+    @staticmethod
+    def _readme_query(full_names: Sequence[str]) -> tuple[str, Dict[str, str]]:
+        """拼出一次取多个仓库README的GraphQL查询（仓库名走变量，避免转义问题）"""
+
+        blobs = " ".join(
+            f'p{index}: object(expression: "HEAD:{path}") {{ ... on Blob {{ text }} }}'
+            for index, path in enumerate(constants.GITHUB_README_PATHS)
+        )
+        declarations: List[str] = []
+        fields: List[str] = []
+        variables: Dict[str, str] = {}
+        for index, full_name in enumerate(full_names):
+            owner, name = full_name.split("/", 1)
+            declarations.append(f"$o{index}: String!, $n{index}: String!")
+            fields.append(
+                f"r{index}: repository(owner: $o{index}, name: $n{index}) {{ {blobs} }}"
+            )
+            variables[f"o{index}"] = owner
+            variables[f"n{index}"] = name
+        query = f"query({', '.join(declarations)}) {{ {' '.join(fields)} }}"
+        return query, variables
+
     def _build_headers(self, accept: str) -> dict[str, str]:
         headers = {"Accept": accept, "User-Agent": "BenchScope/1.0"}
         if self.token:
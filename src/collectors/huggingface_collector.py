@@ -10,18 +10,26 @@ from typing import Any, List, Optional
 import httpx
 
 from src.common import constants
+from src.common.datetime_utils import ensure_utc
+from src.common.rate_limit import RetryPolicy, send_with_retry
 from src.config import Settings, get_settings
 from src.models import RawCandidate
 
 logger = logging.getLogger(__name__)
 
+_HF_RETRY_POLICY = RetryPolicy(
+    max_attempts=constants.HUGGINGFACE_HTTP_MAX_RETRIES,
+    base_delay=constants.HUGGINGFACE_HTTP_RETRY_DELAY_SECONDS,
+)
+
 HF_DATASETS_EXPAND_FIELDS: tuple[str, ...] = (
     # P15: 显式请求必要字段，避免API默认字段不足导致过滤全为空
-    "downloads",
-    "tags",
-    "lastModified",
-    "cardData",
-    "description",
+    # 指定 expand 后API只返回这些字段（外加id），不要添加下游不读取的字段
+    "downloads",  # 下载量过滤、raw_metadata
+    "tags",  # 关键词匹配、task_type
+    "lastModified",  # publish_date、分页截止
+    "cardData",  # pretty_name、authors、摘要
+    "description",  # cardData无摘要时的兜底
 )
 
 
@@ -38,6 +46,8 @@ class HuggingFaceCollector:
             headers=self._build_headers(),
             follow_redirects=True,
         )
+        # 调度器超时取消时读取的部分结果
+        self.partial_candidates: List[RawCandidate] = []
 
     def _build_headers(self) -> dict[str, str]:
         headers = {"Accept": "application/json"}
@@ -65,9 +75,11 @@ class HuggingFaceCollector:
             await self.aclose()
             return []
 
+        self.partial_candidates = []
         try:
-            datasets = await self._fetch_datasets()
-            candidates = self._build_candidates(datasets)
+            # 候选在 _fetch_datasets 中按关键词增量构建，这里直接返回
+            await self._fetch_datasets()
+            candidates = list(self.partial_candidates)
             logger.info("HuggingFace采集完成,候选数%s", len(candidates))
             return candidates
         except httpx.TimeoutException as exc:
@@ -112,26 +124,43 @@ class HuggingFaceCollector:
         return candidates
 
     async def _fetch_datasets(self) -> List[dict[str, Any]]:
-        """通过HuggingFace官方API搜索数据集并合并去重（P15: 增强网络稳定性）"""
+        """通过HuggingFace官方API并发搜索各关键词，按完成顺序合并去重（P15: 增强网络稳定性）"""
 
         all_datasets: List[dict[str, Any]] = []
         seen_ids: set[str] = set()
+        semaphore = asyncio.Semaphore(constants.HUGGINGFACE_KEYWORD_CONCURRENCY)
 
-        for keyword in self.cfg.keywords:
-            keyword = str(keyword or "").strip()
-            if not keyword:
-                continue
-            datasets = await self._fetch_datasets_by_keyword(keyword)
-            for ds in datasets:
-                ds_id = str(ds.get("id") or ds.get("_id") or "")
-                if ds_id and ds_id not in seen_ids:
-                    seen_ids.add(ds_id)
-                    all_datasets.append(ds)
+        async def fetch(keyword: str) -> List[dict[str, Any]]:
+            async with semaphore:
+                return await self._fetch_datasets_by_keyword(keyword)
+
+        keywords = [str(kw or "").strip() for kw in self.cfg.keywords]
+        tasks = [asyncio.create_task(fetch(kw)) for kw in keywords if kw]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                datasets = await next_done
+                fresh: List[dict[str, Any]] = []
+                for ds in datasets:
+                    ds_id = str(ds.get("id") or ds.get("_id") or "")
+                    if ds_id and ds_id not in seen_ids:
+                        seen_ids.add(ds_id)
+                        fresh.append(ds)
+                all_datasets.extend(fresh)
+                self.partial_candidates.extend(self._build_candidates(fresh))
+        finally:
+            # 任一关键词失败或被取消时，不留下仍在运行的请求
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
 
         return all_datasets
 
     async def _fetch_datasets_by_keyword(self, keyword: str) -> List[dict[str, Any]]:
-        """按关键词搜索数据集（P15: 含超时与重试）"""
+        """按关键词搜索数据集（P15: 含超时与重试）
+
+        结果按 lastModified 倒序，沿 Link 头的 next 翻页；当前页最旧的数据集已早于
+        回溯窗口时停止，不再拉取更旧的页面。
+        """
 
         params: dict[str, Any] = {
             "search": keyword,
@@ -141,36 +170,46 @@ class HuggingFaceCollector:
             "expand": list(HF_DATASETS_EXPAND_FIELDS),
         }
 
-        resp = await self._get_with_retry(params=params)
+        resp = await self._get_with_retry(self.api_url, params=params)
+        page = self._parse_page(resp)
+        datasets = list(page)
+        pages = 1
+        while pages < constants.HUGGINGFACE_MAX_PAGES and self._page_within_lookback(page):
+            next_url = resp.links.get("next", {}).get("url")
+            if not next_url:
+                break
+            # next 链接已携带游标与全部查询参数
+            resp = await self._get_with_retry(next_url)
+            page = self._parse_page(resp)
+            datasets.extend(page)
+            pages += 1
+        return datasets
+
+    @staticmethod
+    def _parse_page(resp: httpx.Response) -> List[dict[str, Any]]:
         payload = resp.json()
         if not isinstance(payload, list):
             return []
         return [item for item in payload if isinstance(item, dict)]
 
-    async def _get_with_retry(self, params: dict[str, Any]) -> httpx.Response:
-        """带重试的GET请求（P15: 网络抖动/瞬断时提高成功率）"""
+    def _page_within_lookback(self, page: List[dict[str, Any]]) -> bool:
+        """当前页最后（最旧）一项仍在回溯窗口内时才继续翻页"""
 
-        last_exc: Exception | None = None
-        for attempt in range(1, constants.HUGGINGFACE_HTTP_MAX_RETRIES + 1):
-            try:
-                resp = await self.http_client.get(self.api_url, params=params)
-                resp.raise_for_status()
-                return resp
-            except (httpx.TimeoutException, httpx.NetworkError) as exc:  # noqa: PERF203
-                last_exc = exc
-                if attempt >= constants.HUGGINGFACE_HTTP_MAX_RETRIES:
-                    raise
-                delay = constants.HUGGINGFACE_HTTP_RETRY_DELAY_SECONDS * attempt
-                logger.warning(
-                    "HuggingFace请求失败,准备重试(%s/%s), 等待%s秒, 错误: %r",
-                    attempt,
-                    constants.HUGGINGFACE_HTTP_MAX_RETRIES,
-                    delay,
-                    exc,
-                )
-                await asyncio.sleep(delay)
-
-        raise RuntimeError(f"HuggingFace请求失败: {last_exc!r}")
+        if not page:
+            return False
+        last_modified = ensure_utc(self._parse_datetime(page[-1].get("lastModified")))
+        return last_modified is not None and self._is_within_lookback(last_modified)
+
+    async def _get_with_retry(
+        self, url: str, params: Optional[dict[str, Any]] = None
+    ) -> httpx.Response:
+        """带重试的GET请求（P15: 网络抖动/瞬断时提高成功率），限速与退避见 rate_limit"""
+
+        resp = await send_with_retry(
+            self.http_client, "GET", url, policy=_HF_RETRY_POLICY, params=params
+        )
+        resp.raise_for_status()
+        return resp
 
     def _normalize_dataset(self, dataset: Any) -> dict[str, Any]:
         """兼容 DatasetInfo/字典,统一输出字典"""
@@ -296,4 +335,4 @@ class HuggingFaceCollector:
 
     def _is_within_lookback(self, publish_date: datetime) -> bool:
         now = datetime.now(timezone.utc)
-        return now - publish_date <= timedelta(days=constants.HUGGINGFACE_LOOKBACK_DAYS)
+        return now - publish_date <= timedelta(days=self.cfg.lookback_days)
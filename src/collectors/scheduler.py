@@ -0,0 +1,185 @@
+"""采集调度器：所有采集器并发启动，按来源独立截止时间与取消预算"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Awaitable, Callable, List, Optional, Protocol, Sequence, Tuple
+
+from src.config import Settings, get_settings
+from src.models import RawCandidate
+
+logger = logging.getLogger(__name__)
+
+
+class Collector(Protocol):
+    """采集器协议：只要求实现 collect()"""
+
+    async def collect(self) -> List[RawCandidate]: ...
+
+
+@dataclass(slots=True)
+class CollectorRun:
+    """单个采集器的执行结果"""
+
+    source: str
+    name: str
+    status: str  # ok / timeout / error
+    elapsed: float
+    candidates: List[RawCandidate] = field(default_factory=list)
+    error: Optional[str] = None
+
+
+@dataclass(slots=True)
+class CollectionReport:
+    """一次调度的汇总结果，candidates 保持采集器声明顺序"""
+
+    runs: List[CollectorRun]
+    wall_time: float
+
+    @property
+    def candidates(self) -> List[RawCandidate]:
+        merged: List[RawCandidate] = []
+        for run in self.runs:
+            merged.extend(run.candidates)
+        return merged
+
+    @property
+    def critical_path(self) -> Optional[CollectorRun]:
+        """耗时最长的来源，即决定Step 1墙钟时间的关键路径"""
+
+        if not self.runs:
+            return None
+        return max(self.runs, key=lambda run: run.elapsed)
+
+
+ResultCallback = Callable[[CollectorRun], Awaitable[None]]
+
+
+class CollectionScheduler:
+    """并发执行采集器，单个来源超时不会拖慢其他来源
+
+    - 每个来源使用 sources.yaml 中的 deadline_seconds 作为硬截止时间
+    - 超时后发出取消，并最多等待 cancel_grace_seconds 让采集器关闭连接
+    - 超时来源若暴露 partial_candidates，则返回已采集到的部分结果
+    - on_result 在每个来源结束时立即回调，供流式管道提前消费结果
+    """
+
+    def __init__(
+        self,
+        collectors: Sequence[Tuple[str, Collector]],
+        settings: Optional[Settings] = None,
+        on_result: Optional[ResultCallback] = None,
+    ) -> None:
+        self.settings = settings or get_settings()
+        self.collectors = list(collectors)
+        self.on_result = on_result
+
+    async def run(self) -> CollectionReport:
+        start = time.perf_counter()
+        runs = await asyncio.gather(
+            *(self._run_one(source, collector) for source, collector in self.collectors)
+        )
+        report = CollectionReport(
+            runs=list(runs), wall_time=time.perf_counter() - start
+        )
+        self._log_report(report)
+        return report
+
+    async def _run_one(self, source: str, collector: Collector) -> CollectorRun:
+        run = await self._collect_with_deadline(source, collector)
+        if self.on_result is not None:
+            await self.on_result(run)
+        return run
+
+    async def _collect_with_deadline(
+        self, source: str, collector: Collector
+    ) -> CollectorRun:
+        schedule = self.settings.sources.schedule_for(source)
+        name = collector.__class__.__name__
+        start = time.perf_counter()
+        task = asyncio.create_task(collector.collect(), name=f"collect:{source}")
+
+        done, _pending = await asyncio.wait({task}, timeout=schedule.deadline_seconds)
+        if task in done:
+            elapsed = time.perf_counter() - start
+            exc = task.exception()
+            if exc is not None:
+                logger.error("  ✗ %s失败: %s", name, exc)
+                return CollectorRun(
+                    source=source,
+                    name=name,
+                    status="error",
+                    elapsed=elapsed,
+                    error=repr(exc),
+                )
+            candidates = task.result() or []
+            logger.info("  ✓ %s: %d条 (%.1fs)", name, len(candidates), elapsed)
+            return CollectorRun(
+                source=source,
+                name=name,
+                status="ok",
+                elapsed=elapsed,
+                candidates=list(candidates),
+            )
+
+        # 截止时间已到：取消任务并在取消预算内等待其退出
+        task.cancel()
+        await asyncio.wait({task}, timeout=schedule.cancel_grace_seconds)
+        if not task.done():
+            logger.warning(
+                "%s未在取消预算%.1fs内退出，放弃等待",
+                name,
+                schedule.cancel_grace_seconds,
+            )
+        elif not task.cancelled() and task.exception() is None:
+            # 取消信号到达前恰好完成，直接使用完整结果
+            candidates = task.result() or []
+            elapsed = time.perf_counter() - start
+            logger.info("  ✓ %s: %d条 (%.1fs)", name, len(candidates), elapsed)
+            return CollectorRun(
+                source=source,
+                name=name,
+                status="ok",
+                elapsed=elapsed,
+                candidates=list(candidates),
+            )
+
+        partial = list(getattr(collector, "partial_candidates", None) or [])
+        elapsed = time.perf_counter() - start
+        logger.warning(
+            "  ⏱ %s超过截止时间%.0fs，已取消，保留部分结果%d条",
+            name,
+            schedule.deadline_seconds,
+            len(partial),
+        )
+        return CollectorRun(
+            source=source,
+            name=name,
+            status="timeout",
+            elapsed=elapsed,
+            candidates=partial,
+            error=f"deadline {schedule.deadline_seconds:.0f}s exceeded",
+        )
+
+    @staticmethod
+    def _log_report(report: CollectionReport) -> None:
+        logger.info("===== 采集耗时分布 (墙钟%.1fs) =====", report.wall_time)
+        for run in sorted(report.runs, key=lambda r: -r.elapsed):
+            logger.info(
+                "  %s: %6.1fs  %-7s %d条",
+                run.source.ljust(15),
+                run.elapsed,
+                run.status,
+                len(run.candidates),
+            )
+        slowest = report.critical_path
+        if slowest:
+            logger.info(
+                "采集关键路径: %s (%.1fs, 串行耗时合计%.1fs)",
+                slowest.source,
+                slowest.elapsed,
+                sum(run.elapsed for run in report.runs),
+            )
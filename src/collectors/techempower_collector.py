@@ -40,6 +40,8 @@ class TechEmpowerCollector:
         self.timeout = cfg.timeout_seconds
         self.min_composite_score = cfg.min_composite_score
         self.score_scale = constants.TECHEMPOWER_SCORE_SCALE
+        # 调度器超时取消时读取的部分结果
+        self.partial_candidates: List[RawCandidate] = []
 
     async def collect(self) -> List[RawCandidate]:
         """采集候选项"""
@@ -70,9 +72,9 @@ class TechEmpowerCollector:
                         logger.warning("TechEmpower原始数据为空, uuid=%s", run_uuid)
                         continue
 
-                    candidates.extend(
-                        self._build_candidates(run, run_meta, raw_payload)
-                    )
+                    run_candidates = self._build_candidates(run, run_meta, raw_payload)
+                    candidates.extend(run_candidates)
+                    self.partial_candidates.extend(run_candidates)
         except httpx.TimeoutException:
             logger.error("TechEmpower请求超时(>%ss)", self.timeout)
             return []
@@ -85,6 +85,9 @@ class TwitterCollector:
         if self.enabled and not self.bearer_token:
             raise ValueError("TWITTER_BEARER_TOKEN环境变量未配置")
 
+        # 调度器超时取消时读取的部分结果（每个关键词完成后追加）
+        self.partial_candidates: List[RawCandidate] = []
+
     async def collect(self) -> List[RawCandidate]:
         """采集 Twitter 推文并转换为 RawCandidate 列表"""
 
@@ -98,7 +101,10 @@ class TwitterCollector:
 
         logger.info("开始 Twitter 采集...")
 
-        all_tweets: List[Dict] = []
+        self.partial_candidates = []
+        seen_ids: set[str] = set()
+        unique_count = 0
+        filtered_count = 0
         queries: List[str] = list(self.tier1_queries) + list(self.tier2_queries)
 
         if not queries:
@@ -118,8 +124,18 @@ class TwitterCollector:
                 logger.info("搜索关键词 [%s/%s]: %s", idx, len(queries), query)
                 try:
                     tweets = await self._search_tweets(client, query)
-                    all_tweets.extend(tweets)
                     logger.info("  找到 %s 条推文", len(tweets))
+                    # 去重 + 预筛选 + 转换逐个关键词进行，超时取消时已完成的关键词结果可用
+                    unique_tweets = [
+                        tweet
+                        for tweet in self._deduplicate(tweets)
+                        if tweet["id"] not in seen_ids
+                    ]
+                    seen_ids.update(tweet["id"] for tweet in unique_tweets)
+                    filtered_tweets = self._prefilter(unique_tweets)
+                    unique_count += len(unique_tweets)
+                    filtered_count += len(filtered_tweets)
+                    self.partial_candidates.extend(self._to_candidates(filtered_tweets))
                 except httpx.HTTPStatusError as exc:
                     status_code = exc.response.status_code
                     if status_code == 429:
@@ -133,24 +149,20 @@ class TwitterCollector:
                 if idx < len(queries) and self.rate_limit_delay > 0:
                     await asyncio.sleep(self.rate_limit_delay)
 
-        # 去重
-        unique_tweets = self._deduplicate(all_tweets)
-        logger.info("Twitter 去重后: %s 条推文", len(unique_tweets))
+        logger.info("Twitter 去重后: %s 条推文", unique_count)
+        logger.info("Twitter 预筛选后: %s 条推文", filtered_count)
+        logger.info("✓ Twitter采集完成,有效候选 %s 条", len(self.partial_candidates))
+        return list(self.partial_candidates)
 
-        # 预筛选
-        filtered_tweets = self._prefilter(unique_tweets)
-        logger.info("Twitter 预筛选后: %s 条推文", len(filtered_tweets))
+    def _to_candidates(self, tweets: List[Dict]) -> List[RawCandidate]:
+        """批量转换为 RawCandidate，单条失败只记录日志"""
 
-        # 转换为 RawCandidate
         candidates: List[RawCandidate] = []
-        for tweet in filtered_tweets:
+        for tweet in tweets:
             try:
-                candidate = self._to_candidate(tweet)
-                candidates.append(candidate)
+                candidates.append(self._to_candidate(tweet))
             except Exception as exc:  # noqa: BLE001
                 logger.warning("Twitter 推文转换失败(id=%s): %s", tweet.get("id"), exc)
-
-        logger.info("✓ Twitter采集完成,有效候选 %s 条", len(candidates))
         return candidates
 
     async def _search_tweets(
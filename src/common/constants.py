@@ -12,13 +12,24 @@ GROBID_HEALTH_TIMEOUT: Final[float] = 2.0
 GROBID_MAX_RETRIES: Final[int] = 3
 GROBID_RETRY_DELAY_SECONDS: Final[float] = 2.0  # 降低重试延迟，加快失败恢复
 PDF_ENHANCER_MAX_CONCURRENCY: Final[int] = 3  # 降低并发，减轻云端GROBID压力
+# GROBID 端点池：GROBID_URLS 逗号分隔多个本地容器，按健康度与负载路由
+GROBID_ENDPOINT_INITIAL_CONCURRENCY: Final[int] = 2  # 每端点起始并发，按延迟自适应增减
+GROBID_ENDPOINT_MAX_CONCURRENCY: Final[int] = 6  # 单容器上限（GROBID默认10个处理线程）
+GROBID_ENDPOINT_MAX_FAILURES: Final[int] = 3  # 连续网络失败次数达到后摘除端点
+GROBID_ENDPOINT_COOLDOWN_SECONDS: Final[float] = 30.0  # 摘除后冷却时间，之后以并发1试探恢复
+GROBID_LATENCY_EWMA_ALPHA: Final[float] = 0.2
+GROBID_LATENCY_TOLERANCE: Final[float] = 2.0  # 单次耗时超过均值该倍数视为过载，并发减1
+GROBID_POOL_POLL_SECONDS: Final[float] = 1.0  # 所有端点满载时的等待轮询间隔
 PDF_DOWNLOAD_CHUNK_SIZE: Final[int] = 8192
+PDF_DOWNLOAD_MAX_CONCURRENCY: Final[int] = 4  # 同时下载的PDF数，共享同一连接池
 ARXIV_PDF_EXPORT_BASE: Final[str] = "https://export.arxiv.org/pdf"
 ARXIV_PDF_PRIMARY_BASE: Final[str] = "https://arxiv.org/pdf"
 ARXIV_PDF_TIMEOUT_SECONDS: Final[int] = 30
 ARXIV_PDF_HTTP_MAX_RETRIES: Final[int] = 2
 ARXIV_PDF_HTTP_RETRY_DELAY_SECONDS: Final[float] = 5.0
 ARXIV_PDF_CACHE_DIR: Final[str] = "/tmp/arxiv_pdf_cache"  # PDF缓存目录
+PDF_CONTENT_CACHE_PATH: Final[str] = "pdf_content_cache.db"  # GROBID解析结果缓存
+PDF_CONTENT_CACHE_MAX_MB: Final[int] = 256  # 超出后按最近访问时间淘汰
 ARXIV_IMAGE_CACHE_PREFIX: Final[str] = "arxiv_pdf_image:"
 ARXIV_IMAGE_CONVERT_DPI: Final[int] = 150  # pdf2image渲染DPI
 PDF_SECTION_P1_CONFIGS: Final[list[tuple[str, list[str], int]]] = [
@@ -33,6 +44,36 @@ PDF_SECTION_P2_CONFIGS: Final[list[tuple[str, list[str], int]]] = [
 ]
 PDF_MIN_P1_SECTIONS: Final[int] = 2
 PDF_MIN_P2_SECTIONS: Final[int] = 1
+# 本地快速抽取（pypdf），核心章节不足 PDF_MIN_P1_SECTIONS 时回退 GROBID
+PDF_FAST_EXTRACTOR_VERSION: Final[str] = "pypdf-fast-1"  # 写入解析缓存键，规则变更时递增
+PDF_FAST_AFFILIATION_KEYWORDS: Final[list[str]] = [
+    "University",
+    "Universität",
+    "Université",
+    "Institute",
+    "College",
+    "School of",
+    "Laboratory",
+    "Lab",
+    "Academy",
+    "Research",
+    "Center",
+    "Centre",
+    "Inc.",
+    "Google",
+    "Microsoft",
+    "Meta",
+    "DeepMind",
+    "OpenAI",
+    "Anthropic",
+    "NVIDIA",
+    "Amazon",
+    "Alibaba",
+    "Tencent",
+    "ByteDance",
+    "Baidu",
+    "Huawei",
+]
 
 # ---- Collector 配置 ----
 ARXIV_MAX_RESULTS: Final[int] = 50
@@ -51,6 +92,11 @@ ARXIV_RETRY_DELAYS_SECONDS: Final[tuple[int, ...]] = (
 )  # 指数退避: 5s, 10s, 15s
 ARXIV_PAGE_SIZE_LIMIT: Final[int] = 2000  # arXiv API单页最大结果数上限
 ARXIV_LOOKBACK_HOURS: Final[int] = 168  # 7天窗口，相关论文发布频率低
+ARXIV_STATE_PATH: Final[str] = "arxiv_state.db"  # 增量采集水位（每个查询已见过的最新论文）
+ARXIV_WATERMARK_OVERLAP_HOURS: Final[int] = 48  # 水位回看窗口：公告批次与审核延迟的论文晚于水位出现
+ARXIV_INCREMENTAL_PAGE_SIZE: Final[int] = 25  # 有水位时的单页结果数，尽早停止翻页
+ARXIV_API_MIN_INTERVAL_SECONDS: Final[float] = 3.0  # arXiv API使用条款：每3秒最多一个请求
+ARXIV_SHARD_CONCURRENCY: Final[int] = 3  # 同时翻页的分类分片数，请求仍按全局节拍排队
 ARXIV_KEYWORDS: Final[list[str]] = [
     # P0 - 编程
     "code generation benchmark",
@@ -94,6 +140,13 @@ ARXIV_CATEGORIES: Final[list[str]] = [
 
 GITHUB_TRENDING_URL: Final[str] = "https://github.com/trending"
 GITHUB_SEARCH_API: Final[str] = "https://api.github.com/search/repositories"
+GITHUB_GRAPHQL_API: Final[str] = "https://api.github.com/graphql"
+GITHUB_MAX_CONCURRENCY: Final[int] = 6  # 搜索与README请求共用的并发上限
+GITHUB_RATE_BUDGET_PER_WORKER: Final[int] = 5  # 按剩余额度收缩并发：每5次剩余额度允许1个并发
+GITHUB_README_GRAPHQL_BATCH: Final[int] = 20  # 一次GraphQL请求取README的仓库数
+GITHUB_README_PATHS: Final[tuple[str, ...]] = ("README.md", "readme.md", "README.rst", "README")
+GITHUB_HTTP_CACHE_PATH: Final[str] = "github_http_cache.db"  # ETag条件请求缓存，采集器与PDF增强器共用
+GITHUB_HTTP_CACHE_MAX_ENTRIES: Final[int] = 20_000  # 超出后按最近使用时间淘汰
 GITHUB_TOPICS: Final[list[str]] = [
     # P0 - 编程
     "code-generation",
@@ -280,6 +333,8 @@ HUGGINGFACE_TASK_CATEGORIES: Final[list[str]] = [
 HUGGINGFACE_MIN_DOWNLOADS: Final[int] = 100
 HUGGINGFACE_MAX_RESULTS: Final[int] = 50
 HUGGINGFACE_LOOKBACK_DAYS: Final[int] = 14  # 14天窗口，数据集更新频率中等
+HUGGINGFACE_KEYWORD_CONCURRENCY: Final[int] = 4  # 并发搜索的关键词数，请求仍受主机令牌桶限速
+HUGGINGFACE_MAX_PAGES: Final[int] = 5  # 单个关键词沿Link头最多翻页数
 
 # Twitter/X配置
 TWITTER_LOOKBACK_DAYS: Final[int] = 7
@@ -315,6 +370,32 @@ DBENGINES_BASE_URL: Final[str] = "https://db-engines.com/en"
 DBENGINES_TIMEOUT_SECONDS: Final[int] = 15
 DBENGINES_MAX_RESULTS: Final[int] = 50
 
+# ---- 采集调度配置 ----
+# 每个数据源的硬截止时间（秒），超时后取消采集并返回已拿到的部分结果
+COLLECTOR_DEADLINE_SECONDS_BY_SOURCE: Final[dict[str, float]] = {
+    "arxiv": 240.0,  # 3次重试 × 60秒超时 + 退避，需更宽裕
+    "github": 120.0,
+    "huggingface": 90.0,
+    "helm": 60.0,
+    "techempower": 90.0,
+    "dbengines": 45.0,
+    "twitter": 120.0,
+    "default": 120.0,
+}
+# 取消预算：发出cancel后等待采集器清理连接的最长时间（秒）
+COLLECTOR_CANCEL_GRACE_SECONDS: Final[float] = 5.0
+
+# ---- 流水线模式 ----
+# batch: 各阶段全量屏障（默认）；streaming: 候选逐条流经 去重→预筛→增强→评分→入库
+PIPELINE_MODE_DEFAULT: Final[str] = "batch"
+PIPELINE_MODES: Final[tuple[str, ...]] = ("batch", "streaming")
+# 每个阶段入口队列容量，满时上游阻塞形成背压
+STREAMING_QUEUE_MAXSIZE: Final[int] = 64
+# 评分阶段worker数，与批量模式的评分并发保持同一量级
+STREAMING_SCORE_WORKERS: Final[int] = 16
+# 入库阶段攒批大小，减少飞书写入与去重查询次数
+STREAMING_STORE_BATCH_SIZE: Final[int] = 25
+
 # ---- Prefilter 配置 ----
 PREFILTER_SIMILARITY_THRESHOLD: Final[float] = 0.9
 PREFILTER_MIN_GITHUB_STARS: Final[int] = 30  # 从10提高到30，过滤低质量仓库
@@ -522,6 +603,95 @@ TOOL_NEGATIVE_PATTERNS: Final[list[str]] = [
     "data processing tool",
 ]
 
+# 预筛选规则内联词表（与其他关键词表一起编译进 KeywordMatcher）
+# 非Benchmark特征：框架/系统描述、资源列表、教程课程、无关领域
+PREFILTER_NON_BENCHMARK_PATTERNS: Final[list[str]] = [
+    "framework for",
+    "we propose a",
+    "we implement",
+    "we develop",
+    "a novel system",
+    "agent framework",
+    "gui agent",
+    "awesome",
+    "curated list",
+    "collection of",
+    "list of tools",
+    "list of resources",
+    "tutorial",
+    "course",
+    "learning path",
+    "how to",
+    "robot",
+    "robotics",
+    "autonomous vehicle",
+    "medical",
+    "healthcare",
+]
+# 命中非Benchmark特征时，需要以下强信号之一才放行
+PREFILTER_STRONG_BENCHMARK_SIGNALS: Final[list[str]] = [
+    "benchmark",
+    "evaluation",
+    "leaderboard",
+    "test set",
+    "dataset",
+]
+# 工具仓库判定的豁免信号（如 "Tokenizer Benchmark" 不视为工具）
+PREFILTER_TOOL_OVERRIDE_SIGNALS: Final[list[str]] = [
+    "benchmark dataset",
+    "evaluation benchmark",
+    "test set",
+    "leaderboard",
+    "benchmark suite",
+    "evaluation suite",
+]
+# 非MGX应用领域论文的豁免信号
+PREFILTER_MGX_CORE_KEYWORDS: Final[list[str]] = [
+    "code generation",
+    "code completion",
+    "code review",
+    "multi-agent",
+    "agent collaboration",
+    "tool use",
+    "api call",
+    "function call",
+    "web automation",
+    "gui automation",
+    "browser automation",
+    "software engineering",
+    "programming",
+]
+# GitHub README：资源汇总类项目
+PREFILTER_CURATED_LIST_PATTERNS: Final[list[str]] = [
+    "curated list",
+    "collection of",
+    "list of tools",
+    "awesome list",
+    "资源汇总",
+    "资源列表",
+]
+# GitHub README：Benchmark特征（至少满足一项）
+PREFILTER_GITHUB_BENCHMARK_FEATURES: Final[list[str]] = [
+    "benchmark",
+    "evaluation",
+    "test set",
+    "dataset",
+    "leaderboard",
+    "baseline",
+    "performance",
+    "comparison",
+    "vs",
+    "versus",
+    "testing",
+    "test suite",
+    "test framework",
+    "ranking",
+    "rating",
+    "score",
+]
+# GitHub标题：awesome-list
+PREFILTER_AWESOME_TITLE_PATTERNS: Final[list[str]] = ["awesome-", "awesome "]
+
 # 判定“真 Benchmark / Benchmark 方法论”的正向特征
 BENCHMARK_DATASET_KEYWORDS: Final[list[str]] = [
     "benchmark",
@@ -562,6 +732,9 @@ LLM_DEFAULT_MODEL: Final[str] = (
     "gpt-4o-mini"  # 成本优化: $8/天→$0.5/天 (-94%), 评分质量足够用于预筛选
 )
 LLM_MODEL: Final[str] = LLM_DEFAULT_MODEL
+# full: 完整评分prompt；compact: 省略空字段/空章节与重复示例，降低输入token
+LLM_PROMPT_MODE_DEFAULT: Final[str] = "full"
+LLM_PROMPT_MODES: Final[tuple[str, ...]] = ("full", "compact")
 LLM_TIMEOUT_SECONDS: Final[int] = 30
 LLM_CACHE_TTL_SECONDS: Final[int] = 7 * 24 * 3600
 LLM_MAX_RETRIES: Final[int] = 3
@@ -571,10 +744,34 @@ LLM_BACKEND_REASONING_MIN_CHARS: Final[int] = 150  # 后端专项推理最小字
 LLM_OVERALL_REASONING_MIN_CHARS: Final[int] = 150  # overall_reasoning最小字符数
 LLM_TOTAL_REASONING_MIN_CHARS: Final[int] = 600  # 600字符足够，避免无意义重试
 LLM_SELF_HEAL_MAX_ATTEMPTS: Final[int] = 2  # 2次纠偏足够，节省tokens
+# 纠偏方式 patch: 只请求不合格字段的JSON补丁；resend: 追加对话重发完整JSON（旧行为）
+LLM_REPAIR_MODE_DEFAULT: Final[str] = "patch"
+LLM_REPAIR_MODES: Final[tuple[str, ...]] = ("patch", "resend")
+LLM_REPAIR_MAX_TOKENS: Final[int] = 1500  # 补丁响应只含少量推理字段
+LLM_REPAIR_CONTEXT_CHARS: Final[int] = 600  # 补丁请求携带的摘要长度
+LLM_REPAIR_TOTAL_SHORTAGE_FIELDS: Final[int] = 3  # 总字数不足时扩写的最短字段数
+# 评分后端 realtime: chat.completions实时调用；batch: 未命中请求走OpenAI Batch API
+LLM_SCORING_BACKEND_DEFAULT: Final[str] = "realtime"
+LLM_SCORING_BACKENDS: Final[tuple[str, ...]] = ("realtime", "batch")
+LLM_BATCH_POLL_SECONDS: Final[float] = 30.0
+LLM_BATCH_MAX_WAIT_SECONDS: Final[float] = 20 * 60  # CI任务30分钟超时，留出回退时间
 SCORE_CONCURRENCY: Final[int] = 50  # GPT-4o速率限制高，充分利用并发能力
+# 自适应并发（AIMD）：SCORE_CONCURRENCY 作为窗口上限
+LLM_CONCURRENCY_INITIAL: Final[int] = 8
+LLM_CONCURRENCY_MIN: Final[int] = 1
+LLM_CONCURRENCY_DECREASE_FACTOR: Final[float] = 0.5
+LLM_CONCURRENCY_DECREASE_COOLDOWN_SECONDS: Final[float] = 2.0
+LLM_LATENCY_WINDOW: Final[int] = 50  # 计算p95的最近样本数
+LLM_LATENCY_MIN_SAMPLES: Final[int] = 10
+LLM_LATENCY_P95_TARGET_SECONDS: Final[float] = 45.0  # 超过即视为服务端过载
+LLM_RATE_LIMIT_LOW_WATERMARK: Final[float] = 0.1  # 剩余配额低于10%提前收缩
+LLM_RATE_LIMIT_DEFAULT_PAUSE_SECONDS: Final[float] = 5.0  # 429未带retry-after时的暂停
 REDIS_DEFAULT_URL: Final[str] = "redis://localhost:6379/0"
 REDIS_TTL_DAYS: Final[int] = 7
 REDIS_KEY_PREFIX: Final[str] = "benchscope:"
+LLM_DISK_CACHE_PATH: Final[str] = "llm_score_cache.db"  # Redis不可用时的本地评分缓存
+LLM_MEMORY_CACHE_SIZE: Final[int] = 2048  # 进程内LRU评分缓存条数
+LLM_CACHE_WRITE_BATCH_SIZE: Final[int] = 20  # 评分缓存攒批写入阈值（Redis pipeline）
 RULE_SCORE_THRESHOLDS: Final[dict[int, int]] = {
     1000: 8,
     500: 6,
@@ -616,6 +813,15 @@ BENCHMARK_POSITIVE_SIGNALS: Final[list[str]] = [
 # 相关性硬下限（低于此分数不入库）
 RELEVANCE_HARD_FLOOR: Final[float] = 2.0  # 临时降低到2.0以测试推送功能
 
+# 相关性模型预筛（规则预筛与LLM评分之间，模型文件由 scripts/train_relevance_model.py 生成）
+RELEVANCE_MODEL_PATH: Final[str] = "models/relevance_model.json"  # 文件不存在时该层透传
+RELEVANCE_MODEL_HASH_DIM: Final[int] = 1 << 18
+RELEVANCE_MODEL_WORD_NGRAMS: Final[int] = 2  # 词unigram + bigram
+RELEVANCE_MODEL_ABSTRACT_CHARS: Final[int] = 2000  # 摘要只取前N字符，与训练一致
+RELEVANCE_MODEL_MIN_WEIGHT: Final[float] = 1e-4  # 保存时裁掉的极小权重
+RELEVANCE_MODEL_TARGET_RECALL: Final[float] = 0.98  # 校准安全边际时要求的达标样本召回
+RELEVANCE_LABELS_FILE: Final[str] = "relevance_labels.jsonl"  # 日志目录下的评分标签（训练数据）
+
 # ============================================================
 # 权威来源配置（用于分数兜底保护）
 # ============================================================
@@ -700,13 +906,41 @@ QUALITY_PASS_THRESHOLD: Final[float] = 6.5
 
 # HTTP请求配置
 HTTP_CLIENT_TIMEOUT: Final[int] = 10  # 飞书webhook请求超时(秒)
+HTTP_POOL_TIMEOUT_SECONDS: Final[float] = 10.0  # 共享客户端默认超时，单次请求可覆盖
+HTTP_POOL_MAX_CONNECTIONS_PER_HOST: Final[int] = 10
+HTTP_POOL_KEEPALIVE_EXPIRY_SECONDS: Final[float] = 30.0
+HTTP_POOL_CONNECT_RETRIES: Final[int] = 2  # 仅重试建连失败，请求级重试由调用方决定
+
+# 按主机的令牌桶限速与重试（src/common/rate_limit.py）
+# 主机 -> (每秒请求数, 突发容量)；未列出的主机不限速，只做重试与限流暂停
+HTTP_HOST_RATE_LIMITS: Final[dict[str, tuple[float, int]]] = {
+    "api.github.com": (10.0, 10),
+    "huggingface.co": (5.0, 5),
+    "open.feishu.cn": (10.0, 5),
+}
+HTTP_RETRY_STATUSES: Final[frozenset[int]] = frozenset({429, 500, 502, 503, 504})
+HTTP_RETRY_MAX_WAIT_SECONDS: Final[float] = 120.0  # 限流提示等待超过此值直接放弃，不空等
 
 # 预筛选规则
 PREFILTER_MIN_TITLE_LENGTH: Final[int] = 10
 PREFILTER_MIN_ABSTRACT_LENGTH: Final[int] = 20
+PREFILTER_RULES_PATH: Final[str] = "config/prefilter_rules.yaml"  # 相对项目根目录
+PREFILTER_RULES_RELOAD_SECONDS: Final[float] = 5.0  # 检查规则文件修改时间的最小间隔
+PREFILTER_RULE_STATS_FILE: Final[str] = "prefilter_rule_stats.json"  # 日志目录下
 
 SQLITE_DB_PATH: Final[str] = "fallback.db"
 SQLITE_RETENTION_DAYS: Final[int] = 7
+
+# ---- 飞书记录本地索引 ----
+# 本地镜像飞书记录的url_key/来源/创建时间/发布日期，去重不再每次全表翻页
+FEISHU_INDEX_DB_PATH: Final[str] = "feishu_index.db"
+# 增量刷新按该字段倒序翻页，遇到早于水位的记录即停止；表中缺失时回退到创建时间
+FEISHU_INDEX_MODIFIED_FIELD: Final[str] = "最后更新时间"
+FEISHU_INDEX_CREATED_FIELD: Final[str] = "创建时间"
+# 水位回退窗口（毫秒），容忍飞书服务端与本机时钟偏差
+FEISHU_INDEX_OVERLAP_MS: Final[int] = 10 * 60 * 1000
+# 超过该天数未全量同步时强制全量拉取，兜底捕获飞书侧删除的记录
+FEISHU_INDEX_FULL_RESYNC_DAYS: Final[int] = 7
 NOTIFY_TOP_K: Final[int] = 5
 
 # ---- 日志 ----
@@ -749,6 +983,37 @@ DEDUP_LOOKBACK_DAYS_BY_SOURCE: Final[dict[str, int]] = {
     "default": DEDUP_LOOKBACK_DAYS,
 }
 
+# ---- 跨来源近似重复合并（预筛选前） ----
+# 同一Benchmark常以 arXiv论文/GitHub仓库/HF数据集 三种形态出现，合并后只评分一次
+NEAR_DUP_ENABLED: Final[bool] = True
+NEAR_DUP_SHINGLE_SIZE: Final[int] = 4  # 标题字符shingle长度
+NEAR_DUP_NUM_PERM: Final[int] = 64  # MinHash签名长度
+NEAR_DUP_BANDS: Final[int] = 16  # LSH分桶数（每桶4行），约0.5相似度起进入候选对
+NEAR_DUP_TITLE_THRESHOLD: Final[float] = 0.8  # MinHash估计Jaccard达到该值视为同一标题
+NEAR_DUP_MIN_NAME_KEY_LEN: Final[int] = 5  # 名称键（论文冒号前缀/仓库名）最短长度
+NEAR_DUP_GENERIC_NAMES: Final[frozenset[str]] = frozenset(
+    {
+        "benchmark",
+        "benchmarks",
+        "dataset",
+        "datasets",
+        "evaluation",
+        "leaderboard",
+        "evals",
+    }
+)
+# 合并后保留的主候选来源优先级（越靠前越优先，论文可走PDF增强）
+NEAR_DUP_SOURCE_PRIORITY: Final[tuple[str, ...]] = (
+    "arxiv",
+    "semantic_scholar",
+    "github",
+    "huggingface",
+    "helm",
+    "techempower",
+    "dbengines",
+    "twitter",
+)
+
 # ============================================================
 # 推送多样性与低优先精选配置
 # ============================================================
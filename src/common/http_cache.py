@@ -0,0 +1,260 @@
+"""GitHub API 响应的持久化条件请求缓存
+
+同一批热门 Benchmark 仓库每天都会被采集器与 PDF 增强器重复请求，每次都消耗
+5000次/小时的额度。这里把响应连同 ETag / Last-Modified 存进 SQLite：
+- conditional_get() 带上 If-None-Match / If-Modified-Since，GitHub 返回 304 时
+  直接用缓存内容构造响应（304 不计入限流额度）
+- put_snapshot() / get_snapshot() 按外部校验值存取内容，用于 GraphQL 取到的 README
+  （GraphQL 不支持条件请求，以搜索结果里的 pushed_at 作为校验值，未推送过新提交就不再请求）
+- 条目数超过上限时按最近使用时间淘汰
+- 统计条件请求数、304 数与快照命中数，运行结束时输出
+
+缓存读写失败只记录日志，不影响正常请求。
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import os
+import sqlite3
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+import httpx
+
+from src.common import constants
+from src.common.rate_limit import DEFAULT_RETRY_POLICY, RetryPolicy, send_with_retry
+
+logger = logging.getLogger(__name__)
+
+# 构造缓存响应时保留的响应头
+_KEPT_HEADERS = ("content-type", "etag", "last-modified")
+# (etag, last_modified, validator, headers, body)
+_Entry = Tuple[Optional[str], Optional[str], Optional[str], Dict[str, str], bytes]
+
+
+@dataclass(slots=True)
+class HTTPCacheStats:
+    """条件请求与快照命中统计"""
+
+    requests: int = 0  # 带校验头发出的条件请求
+    not_modified: int = 0  # 其中返回304的次数
+    stored: int = 0
+    snapshot_hits: int = 0
+    snapshot_misses: int = 0
+
+    @property
+    def not_modified_rate(self) -> float:
+        return self.not_modified / self.requests if self.requests else 0.0
+
+    @property
+    def snapshot_hit_rate(self) -> float:
+        total = self.snapshot_hits + self.snapshot_misses
+        return self.snapshot_hits / total if total else 0.0
+
+
+class HTTPResponseCache:
+    """基于SQLite的HTTP响应缓存，按最近使用时间淘汰"""
+
+    def __init__(self, db_path: Path, max_entries: int) -> None:
+        self.db_path = Path(db_path)
+        self.max_entries = max_entries
+        self.stats = HTTPCacheStats()
+        self._init_db()
+
+    def _init_db(self) -> None:
+        """初始化数据库结构"""
+
+        conn = sqlite3.connect(self.db_path)
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS http_cache (
+                cache_key TEXT PRIMARY KEY,
+                etag TEXT,
+                last_modified TEXT,
+                validator TEXT,
+                headers TEXT NOT NULL,
+                body BLOB NOT NULL,
+                accessed_at REAL NOT NULL
+            )
+            """
+        )
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_http_cache_accessed "
+            "ON http_cache (accessed_at)"
+        )
+        conn.commit()
+        conn.close()
+
+    async def conditional_get(
+        self,
+        client: httpx.AsyncClient,
+        url: str,
+        *,
+        headers: Optional[Dict[str, str]] = None,
+        policy: RetryPolicy = DEFAULT_RETRY_POLICY,
+        **kwargs: Any,
+    ) -> httpx.Response:
+        """GET 请求，有缓存时附带校验头，304 时返回缓存内容（状态码按200）"""
+
+        headers = dict(headers or {})
+        key = f"{headers.get('Accept', '')}|{url}"
+        cached = await self._load(key)
+        if cached is not None:
+            etag, last_modified, _, _, _ = cached
+            if etag:
+                headers["If-None-Match"] = etag
+            if last_modified:
+                headers["If-Modified-Since"] = last_modified
+            if etag or last_modified:
+                self.stats.requests += 1
+
+        response = await send_with_retry(
+            client, "GET", url, policy=policy, headers=headers, **kwargs
+        )
+        if response.status_code == 304 and cached is not None:
+            self.stats.not_modified += 1
+            _, _, _, stored_headers, body = cached
+            return httpx.Response(
+                200,
+                headers=stored_headers,
+                content=body,
+                request=response.request,
+            )
+
+        etag = response.headers.get("etag")
+        last_modified = response.headers.get("last-modified")
+        if response.status_code == 200 and (etag or last_modified):
+            kept = {
+                name: response.headers[name]
+                for name in _KEPT_HEADERS
+                if name in response.headers
+            }
+            await self._store(key, etag, last_modified, None, kept, response.content)
+        return response
+
+    async def get_snapshot(self, key: str, validator: str) -> Optional[bytes]:
+        """取校验值一致的快照内容，不一致或不存在时返回 None"""
+
+        cached = await self._load(key)
+        if cached is None or cached[2] != validator:
+            self.stats.snapshot_misses += 1
+            return None
+        self.stats.snapshot_hits += 1
+        return cached[4]
+
+    async def put_snapshot(self, key: str, validator: str, body: bytes) -> None:
+        await self._store(key, None, None, validator, {}, body)
+
+    def log_stats(self) -> None:
+        stats = self.stats
+        if not (stats.requests or stats.snapshot_hits or stats.snapshot_misses):
+            return
+        logger.info(
+            "GitHub响应缓存: 条件请求%d次, 304命中%d次(%.1f%%), 快照命中%d/%d(%.1f%%), 写入%d条",
+            stats.requests,
+            stats.not_modified,
+            stats.not_modified_rate * 100,
+            stats.snapshot_hits,
+            stats.snapshot_hits + stats.snapshot_misses,
+            stats.snapshot_hit_rate * 100,
+            stats.stored,
+        )
+
+    # ---- SQLite 读写（在线程中执行） ----
+
+    async def _load(self, key: str) -> Optional[_Entry]:
+        try:
+            return await asyncio.to_thread(self._load_sync, key)
+        except Exception as exc:  # noqa: BLE001
+            logger.debug("读取HTTP缓存失败(%s): %s", key, exc)
+            return None
+
+    def _load_sync(self, key: str) -> Optional[_Entry]:
+        conn = sqlite3.connect(self.db_path)
+        row = conn.execute(
+            "SELECT etag, last_modified, validator, headers, body "
+            "FROM http_cache WHERE cache_key = ?",
+            (key,),
+        ).fetchone()
+        if row:
+            conn.execute(
+                "UPDATE http_cache SET accessed_at = ? WHERE cache_key = ?",
+                (time.time(), key),
+            )
+            conn.commit()
+        conn.close()
+        if row is None:
+            return None
+        etag, last_modified, validator, headers, body = row
+        return etag, last_modified, validator, json.loads(headers), bytes(body)
+
+    async def _store(
+        self,
+        key: str,
+        etag: Optional[str],
+        last_modified: Optional[str],
+        validator: Optional[str],
+        headers: Dict[str, str],
+        body: bytes,
+    ) -> None:
+        try:
+            await asyncio.to_thread(
+                self._store_sync, key, etag, last_modified, validator, headers, body
+            )
+        except Exception as exc:  # noqa: BLE001
+            logger.debug("写入HTTP缓存失败(%s): %s", key, exc)
+            return
+        self.stats.stored += 1
+
+    def _store_sync(
+        self,
+        key: str,
+        etag: Optional[str],
+        last_modified: Optional[str],
+        validator: Optional[str],
+        headers: Dict[str, str],
+        body: bytes,
+    ) -> None:
+        conn = sqlite3.connect(self.db_path)
+        conn.execute(
+            "INSERT OR REPLACE INTO http_cache "
+            "(cache_key, etag, last_modified, validator, headers, body, accessed_at) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (key, etag, last_modified, validator, json.dumps(headers), body, time.time()),
+        )
+        # 超出上限时删除最久未使用的条目
+        conn.execute(
+            "DELETE FROM http_cache WHERE cache_key IN ("
+            "SELECT cache_key FROM http_cache ORDER BY accessed_at DESC LIMIT -1 OFFSET ?)",
+            (self.max_entries,),
+        )
+        conn.commit()
+        conn.close()
+
+
+_SHARED: Dict[str, HTTPResponseCache] = {}
+
+
+def shared_github_cache() -> Optional[HTTPResponseCache]:
+    """采集器与PDF增强器共用的GitHub响应缓存，初始化失败时返回 None"""
+
+    path = os.getenv("GITHUB_HTTP_CACHE_PATH", constants.GITHUB_HTTP_CACHE_PATH)
+    cache = _SHARED.get(path)
+    if cache is None:
+        try:
+            cache = HTTPResponseCache(Path(path), constants.GITHUB_HTTP_CACHE_MAX_ENTRIES)
+        except Exception as exc:  # noqa: BLE001
+            logger.warning("GitHub响应缓存初始化失败,不使用条件请求: %s", exc)
+            return None
+        _SHARED[path] = cache
+    return cache
+
+
+def log_http_cache_stats() -> None:
+    for cache in _SHARED.values():
+        cache.log_stats()
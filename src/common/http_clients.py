@@ -0,0 +1,150 @@
+"""进程级共享 HTTP 客户端注册表
+
+飞书存储/通知、GitHub 元数据、GROBID 探活等调用原先每次都新建 httpx.AsyncClient，
+每个请求都要重新握手 TLS。这里按 scheme+host 复用客户端：
+- 每个主机一个带连接池的 AsyncClient，h2 可用时启用 HTTP/2
+- 统一默认超时（单次请求可用 timeout= 覆盖）与建连失败重试
+- 通过 httpcore trace 统计每个主机的请求数与新建连接数，得出连接复用率
+- 生命周期跟随 main()：结束时 close_http_clients() 输出统计并关闭全部连接
+
+调用方通过 get_http_client(url) 取客户端，不要自行关闭。
+"""
+
+from __future__ import annotations
+
+import asyncio
+import importlib.util
+import logging
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Tuple
+
+import httpx
+
+from src.common import constants
+
+logger = logging.getLogger(__name__)
+
+_HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+
+@dataclass(slots=True)
+class HostStats:
+    """单个主机的请求与建连计数"""
+
+    requests: int = 0
+    connections: int = 0
+
+    @property
+    def reuse_rate(self) -> float:
+        """复用已有连接的请求占比"""
+
+        if not self.requests:
+            return 0.0
+        return max(0, self.requests - self.connections) / self.requests
+
+
+class HTTPClientRegistry:
+    """按主机缓存 httpx.AsyncClient，跟随事件循环重建"""
+
+    def __init__(
+        self,
+        timeout: float = constants.HTTP_POOL_TIMEOUT_SECONDS,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ) -> None:
+        self.timeout = timeout
+        self.stats: Dict[str, HostStats] = {}
+        self._transport = transport
+        self._clients: Dict[Tuple[str, str, Optional[int]], httpx.AsyncClient] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def client(self, url: str) -> httpx.AsyncClient:
+        """返回 url 所在主机的共享客户端"""
+
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            # 连接池绑定在创建它的事件循环上，换循环（测试中每个用例一个）后重建
+            self._clients = {}
+            self._loop = loop
+
+        parsed = httpx.URL(url)
+        key = (parsed.scheme, parsed.host, parsed.port)
+        client = self._clients.get(key)
+        if client is None or client.is_closed:
+            client = self._build(self._host_label(parsed))
+            self._clients[key] = client
+        return client
+
+    async def aclose(self) -> None:
+        clients, self._clients = list(self._clients.values()), {}
+        for client in clients:
+            try:
+                await client.aclose()
+            except Exception as exc:  # noqa: BLE001
+                logger.debug("关闭HTTP客户端失败: %s", exc)
+
+    def log_stats(self) -> None:
+        """输出各主机请求数与连接复用率"""
+
+        for host, stats in sorted(self.stats.items(), key=lambda item: -item[1].requests):
+            logger.info(
+                "HTTP连接池 %s: 请求%d次, 新建连接%d个, 复用率%.1f%%",
+                host,
+                stats.requests,
+                stats.connections,
+                stats.reuse_rate * 100,
+            )
+
+    # ---- 内部实现 ----
+
+    @staticmethod
+    def _host_label(url: httpx.URL) -> str:
+        port = f":{url.port}" if url.port else ""
+        return f"{url.scheme}://{url.host}{port}"
+
+    def _build(self, host: str) -> httpx.AsyncClient:
+        stats = self.stats.setdefault(host, HostStats())
+
+        async def trace(event: str, info: Dict[str, Any]) -> None:
+            # connection.connect_tcp.complete / connection.connect_unix_socket.complete
+            if event.startswith("connection.connect_") and event.endswith(".complete"):
+                stats.connections += 1
+
+        async def on_request(request: httpx.Request) -> None:
+            stats.requests += 1
+            request.extensions.setdefault("trace", trace)
+
+        limits = httpx.Limits(
+            max_connections=constants.HTTP_POOL_MAX_CONNECTIONS_PER_HOST,
+            max_keepalive_connections=constants.HTTP_POOL_MAX_CONNECTIONS_PER_HOST,
+            keepalive_expiry=constants.HTTP_POOL_KEEPALIVE_EXPIRY_SECONDS,
+        )
+        transport = self._transport or httpx.AsyncHTTPTransport(
+            http2=_HTTP2_AVAILABLE,
+            limits=limits,
+            retries=constants.HTTP_POOL_CONNECT_RETRIES,
+        )
+        return httpx.AsyncClient(
+            timeout=self.timeout,
+            transport=transport,
+            event_hooks={"request": [on_request]},
+        )
+
+
+_REGISTRY = HTTPClientRegistry()
+
+
+def get_http_client(url: str) -> httpx.AsyncClient:
+    """取进程级共享客户端（按 url 的主机区分）"""
+
+    return _REGISTRY.client(url)
+
+
+def http_client_registry() -> HTTPClientRegistry:
+    return _REGISTRY
+
+
+async def close_http_clients() -> None:
+    """输出连接复用统计并关闭全部共享客户端，由 main() 在退出前调用"""
+
+    _REGISTRY.log_stats()
+    await _REGISTRY.aclose()
@@ -0,0 +1,263 @@
+"""按上游主机的令牌桶限速与统一重试策略
+
+GitHub / HuggingFace / 飞书各自实现了一套重试：有的固定线性等待，有的对 429 额外
+盲等 10 秒，都不读取服务端给出的恢复时间，并发任务之间也互不知道对方刚被限流。
+这里统一为：
+- 每个主机一个令牌桶（HTTP_HOST_RATE_LIMITS），同一主机的所有并发任务共享额度
+- 429 / GitHub 的 403 限流响应按 Retry-After、X-RateLimit-Reset（飞书为
+  x-ogw-ratelimit-reset）计算等待，并暂停整个主机，而不是每个任务各自退避重撞
+- 其他可重试状态与网络错误按指数退避（带抖动）
+- 服务端要求的等待超过 HTTP_RETRY_MAX_WAIT_SECONDS 时直接返回响应，不空等
+- 记录每个主机的请求数、重试数、限流次数，以及限速等待与退避等待的累计时间
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import random
+import time
+from dataclasses import dataclass, field
+from datetime import timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, Dict, Mapping, Optional
+
+import httpx
+
+from src.common import constants
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True, slots=True)
+class RetryPolicy:
+    """重试次数与退避参数"""
+
+    max_attempts: int = 3
+    base_delay: float = 1.0
+    max_delay: float = 30.0
+    multiplier: float = 2.0
+    rate_limit_delay: float = 0.0  # 限流响应未给出等待时间时，在退避之外额外等待
+    retry_statuses: frozenset[int] = field(
+        default_factory=lambda: constants.HTTP_RETRY_STATUSES
+    )
+
+    def backoff(self, attempt: int) -> float:
+        """第 attempt 次失败后的退避时间：指数增长，取 [d/2, d] 之间的随机值避免同时重试"""
+
+        delay = min(self.base_delay * self.multiplier ** (attempt - 1), self.max_delay)
+        return delay / 2 + random.uniform(0, delay / 2)
+
+
+DEFAULT_RETRY_POLICY = RetryPolicy()
+
+
+@dataclass(slots=True)
+class HostRateStats:
+    """单个主机的限速与重试统计"""
+
+    requests: int = 0
+    retries: int = 0
+    rate_limited: int = 0
+    gave_up: int = 0  # 服务端要求的等待过长而放弃的次数
+    throttle_wait: float = 0.0  # 令牌桶/限流暂停累计等待（秒）
+    backoff_wait: float = 0.0  # 错误退避累计等待（秒）
+
+
+class HostLimiter:
+    """单个主机的令牌桶，附带限流暂停"""
+
+    def __init__(self, host: str, rate: Optional[float], burst: int) -> None:
+        self.host = host
+        self.rate = rate
+        self.burst = max(1, burst)
+        self.stats = HostRateStats()
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+
+    async def acquire(self) -> float:
+        """取一个令牌，返回等待的秒数"""
+
+        waited = 0.0
+        while True:
+            now = time.monotonic()
+            if now < self._paused_until:
+                delay = self._paused_until - now
+            elif self.rate is None:
+                break
+            else:
+                self._tokens = min(
+                    float(self.burst), self._tokens + (now - self._updated) * self.rate
+                )
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    break
+                delay = (1 - self._tokens) / self.rate
+            await asyncio.sleep(delay)
+            waited += delay
+        self.stats.throttle_wait += waited
+        return waited
+
+    def pause(self, seconds: float) -> None:
+        """限流后暂停该主机的所有请求"""
+
+        self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+
+
+_LIMITERS: Dict[str, HostLimiter] = {}
+
+
+def host_limiter(url: str) -> HostLimiter:
+    """取 url 所在主机的限速器（进程内共享）"""
+
+    host = httpx.URL(url).host
+    limiter = _LIMITERS.get(host)
+    if limiter is None:
+        rate, burst = constants.HTTP_HOST_RATE_LIMITS.get(host, (None, 1))
+        limiter = HostLimiter(host, rate, burst)
+        _LIMITERS[host] = limiter
+    return limiter
+
+
+def rate_limit_wait_seconds(
+    headers: Mapping[str, str], now: Optional[float] = None
+) -> Optional[float]:
+    """从响应头解析服务端要求的等待时间，无提示时返回 None"""
+
+    now = time.time() if now is None else now
+    retry_after = headers.get("retry-after")
+    if retry_after:
+        try:
+            return max(float(retry_after), 0.0)
+        except ValueError:
+            try:
+                moment = parsedate_to_datetime(retry_after)
+            except (TypeError, ValueError):
+                moment = None
+            if moment is not None:
+                if moment.tzinfo is None:
+                    moment = moment.replace(tzinfo=timezone.utc)
+                return max(moment.timestamp() - now, 0.0)
+
+    feishu_reset = headers.get("x-ogw-ratelimit-reset")
+    if feishu_reset:
+        try:
+            return max(float(feishu_reset), 0.0)
+        except ValueError:
+            pass
+
+    # GitHub：额度耗尽时 X-RateLimit-Reset 为恢复时刻的 Unix 时间戳
+    if headers.get("x-ratelimit-remaining") == "0":
+        try:
+            return max(float(headers.get("x-ratelimit-reset", "")) - now, 0.0)
+        except ValueError:
+            pass
+    return None
+
+
+def is_rate_limited(response: httpx.Response) -> bool:
+    """429，或 GitHub 以 403 返回的一级/二级限流"""
+
+    if response.status_code == 429:
+        return True
+    return response.status_code == 403 and (
+        "retry-after" in response.headers
+        or response.headers.get("x-ratelimit-remaining") == "0"
+    )
+
+
+async def send_with_retry(
+    client: httpx.AsyncClient,
+    method: str,
+    url: str,
+    *,
+    policy: RetryPolicy = DEFAULT_RETRY_POLICY,
+    **kwargs: Any,
+) -> httpx.Response:
+    """经主机令牌桶发送请求并按策略重试。
+
+    重试用尽或等待过长时返回最后一次响应（由调用方决定是否 raise_for_status），
+    网络错误重试用尽时原样抛出。
+    """
+
+    limiter = host_limiter(url)
+    stats = limiter.stats
+    attempt = 0
+    while True:
+        attempt += 1
+        await limiter.acquire()
+        stats.requests += 1
+        last_attempt = attempt >= policy.max_attempts
+        try:
+            response = await client.request(method, url, **kwargs)
+        except httpx.TransportError as exc:
+            if last_attempt:
+                raise
+            delay = policy.backoff(attempt)
+            limited = False
+            reason = repr(exc)
+        else:
+            limited = is_rate_limited(response)
+            if not limited and response.status_code not in policy.retry_statuses:
+                return response
+            if limited:
+                stats.rate_limited += 1
+            if last_attempt:
+                return response
+            hinted = rate_limit_wait_seconds(response.headers)
+            if hinted is None:
+                delay = policy.backoff(attempt) + (policy.rate_limit_delay if limited else 0)
+            else:
+                delay = hinted
+            if delay > constants.HTTP_RETRY_MAX_WAIT_SECONDS:
+                stats.gave_up += 1
+                logger.warning(
+                    "%s 要求等待%.0f秒后重试，超过上限%.0f秒，放弃: %s",
+                    limiter.host,
+                    delay,
+                    constants.HTTP_RETRY_MAX_WAIT_SECONDS,
+                    url,
+                )
+                return response
+            reason = f"HTTP {response.status_code}"
+
+        stats.retries += 1
+        logger.warning(
+            "%s 请求失败(%s)，%.1f秒后重试(%d/%d): %s",
+            limiter.host,
+            reason,
+            delay,
+            attempt,
+            policy.max_attempts,
+            url,
+        )
+        if limited:
+            # 同主机的其他并发任务一起等待，由 acquire 计入限速等待
+            limiter.pause(delay)
+        else:
+            await asyncio.sleep(delay)
+            stats.backoff_wait += delay
+
+
+def rate_limit_stats() -> Dict[str, HostRateStats]:
+    return {host: limiter.stats for host, limiter in _LIMITERS.items()}
+
+
+def log_rate_limit_stats() -> None:
+    """输出各主机的请求、重试与等待时间"""
+
+    for host, stats in sorted(rate_limit_stats().items(), key=lambda item: -item[1].requests):
+        if not stats.requests:
+            continue
+        logger.info(
+            "HTTP限速 %s: 请求%d次, 重试%d次, 限流%d次, 放弃%d次, 限速等待%.1fs, 退避等待%.1fs",
+            host,
+            stats.requests,
+            stats.retries,
+            stats.rate_limited,
+            stats.gave_up,
+            stats.throttle_wait,
+            stats.backoff_wait,
+        )
@@ -22,11 +22,15 @@ class OpenAISettings:
     api_key: str
     model: str = constants.LLM_DEFAULT_MODEL
     base_url: Optional[str] = None
+    prompt_mode: str = constants.LLM_PROMPT_MODE_DEFAULT  # full/compact
+    repair_mode: str = constants.LLM_REPAIR_MODE_DEFAULT  # patch/resend
+    scoring_backend: str = constants.LLM_SCORING_BACKEND_DEFAULT  # realtime/batch
 
 
 @dataclass(slots=True)
 class RedisSettings:
     url: str = constants.REDIS_DEFAULT_URL
+    disk_cache_path: Path = Path(constants.LLM_DISK_CACHE_PATH)  # 本地兜底缓存
 
 
 @dataclass(slots=True)
@@ -37,6 +41,8 @@ class FeishuSettings:
     bitable_table_id: str
     webhook_url: Optional[str] = None
     webhook_secret: Optional[str] = None  # Webhook签名密钥（可选）
+    index_path: Path = Path(constants.FEISHU_INDEX_DB_PATH)  # 飞书记录本地索引
+    index_force_resync: bool = False  # True时忽略水位，全量重建本地索引
 
 
 @dataclass(slots=True)
@@ -146,6 +152,16 @@ class TwitterSourceSettings:
     rate_limit_delay: float = constants.TWITTER_RATE_LIMIT_DELAY
 
 
+@dataclass(slots=True)
+class SourceScheduleSettings:
+    """单个数据源的调度预算（截止时间 + 取消预算）"""
+
+    deadline_seconds: float = constants.COLLECTOR_DEADLINE_SECONDS_BY_SOURCE[
+        "default"
+    ]
+    cancel_grace_seconds: float = constants.COLLECTOR_CANCEL_GRACE_SECONDS
+
+
 @dataclass(slots=True)
 class SourcesSettings:
     arxiv: ArxivSourceSettings = field(default_factory=ArxivSourceSettings)
@@ -159,6 +175,15 @@ class SourcesSettings:
     )
     dbengines: DBEnginesSourceSettings = field(default_factory=DBEnginesSourceSettings)
     twitter: TwitterSourceSettings = field(default_factory=TwitterSourceSettings)
+    # 按来源的调度预算，未配置的来源由 schedule_for 回退到常量默认值
+    schedules: dict[str, SourceScheduleSettings] = field(default_factory=dict)
+
+    def schedule_for(self, source: str) -> SourceScheduleSettings:
+        """读取某个数据源的截止时间与取消预算"""
+
+        if source in self.schedules:
+            return self.schedules[source]
+        return _default_schedule(source)
 
 
 @dataclass(slots=True)
@@ -170,6 +195,8 @@ class Settings:
     sqlite_path: Path
     sources: SourcesSettings
     twitter_bearer_token: Optional[str] = None
+    pipeline_mode: str = constants.PIPELINE_MODE_DEFAULT
+    relevance_model_path: Path = Path(constants.RELEVANCE_MODEL_PATH)
 
 
 def _get_env(key: str, default: Optional[str] = None) -> str:
@@ -196,8 +223,28 @@ def get_settings() -> Settings:
             api_key=_get_env("OPENAI_API_KEY", ""),
             model=os.getenv("OPENAI_MODEL", constants.LLM_DEFAULT_MODEL),
             base_url=os.getenv("OPENAI_BASE_URL"),
+            prompt_mode=_load_mode(
+                "LLM_PROMPT_MODE",
+                constants.LLM_PROMPT_MODE_DEFAULT,
+                constants.LLM_PROMPT_MODES,
+            ),
+            repair_mode=_load_mode(
+                "LLM_REPAIR_MODE",
+                constants.LLM_REPAIR_MODE_DEFAULT,
+                constants.LLM_REPAIR_MODES,
+            ),
+            scoring_backend=_load_mode(
+                "LLM_SCORING_BACKEND",
+                constants.LLM_SCORING_BACKEND_DEFAULT,
+                constants.LLM_SCORING_BACKENDS,
+            ),
+        ),
+        redis=RedisSettings(
+            url=os.getenv("REDIS_URL", constants.REDIS_DEFAULT_URL),
+            disk_cache_path=Path(
+                os.getenv("LLM_DISK_CACHE_PATH", constants.LLM_DISK_CACHE_PATH)
+            ),
         ),
-        redis=RedisSettings(url=os.getenv("REDIS_URL", constants.REDIS_DEFAULT_URL)),
         feishu=FeishuSettings(
             app_id=_get_env("FEISHU_APP_ID", ""),
             app_secret=_get_env("FEISHU_APP_SECRET", ""),
@@ -205,6 +252,11 @@ def get_settings() -> Settings:
             bitable_table_id=_get_env("FEISHU_BITABLE_TABLE_ID", ""),
             webhook_url=os.getenv("FEISHU_WEBHOOK_URL"),
             webhook_secret=os.getenv("FEISHU_WEBHOOK_SECRET"),  # 可选：Webhook签名密钥
+            index_path=Path(
+                os.getenv("FEISHU_INDEX_DB_PATH", constants.FEISHU_INDEX_DB_PATH)
+            ),
+            index_force_resync=os.getenv("FEISHU_INDEX_FORCE_RESYNC", "").lower()
+            in {"1", "true", "yes"},
         ),
         logging=LoggingSettings(
             level=os.getenv("LOG_LEVEL", "INFO"),
@@ -213,9 +265,25 @@ def get_settings() -> Settings:
         sqlite_path=Path(sqlite_path_str),
         sources=_load_sources_settings(sources_path),
         twitter_bearer_token=os.getenv("TWITTER_BEARER_TOKEN"),
+        pipeline_mode=_load_mode(
+            "PIPELINE_MODE", constants.PIPELINE_MODE_DEFAULT, constants.PIPELINE_MODES
+        ),
+        relevance_model_path=Path(
+            os.getenv("RELEVANCE_MODEL_PATH", constants.RELEVANCE_MODEL_PATH)
+        ),
     )
 
 
+def _load_mode(key: str, default: str, allowed: tuple[str, ...]) -> str:
+    """读取枚举型环境变量（如 PIPELINE_MODE），非法值回退到默认值"""
+
+    mode = os.getenv(key, default).strip().lower()
+    if mode not in allowed:
+        logging.getLogger(__name__).warning("未知%s=%s，回退到%s", key, mode, default)
+        return default
+    return mode
+
+
 def _load_sources_settings(path: Path) -> SourcesSettings:
     """从YAML加载数据源配置,异常时使用默认值"""
 
@@ -237,7 +305,20 @@ def _load_sources_settings(path: Path) -> SourcesSettings:
     twitter_cfg = data.get("twitter", {})
     twitter_filters = twitter_cfg.get("filters", {}) or {}
     twitter_queries = twitter_cfg.get("search_queries", {}) or {}
+    schedules = {
+        name: _load_schedule_settings(name, cfg)
+        for name, cfg in (
+            ("arxiv", arxiv_cfg),
+            ("helm", helm_cfg),
+            ("github", github_cfg),
+            ("huggingface", huggingface_cfg),
+            ("techempower", techempower_cfg),
+            ("dbengines", dbengines_cfg),
+            ("twitter", twitter_cfg),
+        )
+    }
     return SourcesSettings(
+        schedules=schedules,
         arxiv=ArxivSourceSettings(
             enabled=bool(arxiv_cfg.get("enabled", True)),
             max_results=int(arxiv_cfg.get("max_results", constants.ARXIV_MAX_RESULTS)),
@@ -389,6 +470,26 @@ def _load_sources_settings(path: Path) -> SourcesSettings:
     )
 
 
+def _default_schedule(source: str) -> SourceScheduleSettings:
+    deadlines = constants.COLLECTOR_DEADLINE_SECONDS_BY_SOURCE
+    return SourceScheduleSettings(
+        deadline_seconds=deadlines.get(source, deadlines["default"]),
+        cancel_grace_seconds=constants.COLLECTOR_CANCEL_GRACE_SECONDS,
+    )
+
+
+def _load_schedule_settings(source: str, cfg: dict) -> SourceScheduleSettings:
+    """读取数据源的 deadline_seconds / cancel_grace_seconds，缺省回退常量"""
+
+    default = _default_schedule(source)
+    return SourceScheduleSettings(
+        deadline_seconds=float(cfg.get("deadline_seconds", default.deadline_seconds)),
+        cancel_grace_seconds=float(
+            cfg.get("cancel_grace_seconds", default.cancel_grace_seconds)
+        ),
+    )
+
+
 def _ensure_list(value: object, fallback: list[str]) -> list[str]:
     if isinstance(value, list) and value:
         return [str(item) for item in value]
@@ -3,6 +3,7 @@
 提供基于 arXiv PDF 的深度解析与数据增强能力。
 """
 
+from src.enhancer.grobid_pool import GrobidPool, grobid_urls_from_env
 from src.enhancer.pdf_enhancer import PDFContent, PDFEnhancer
 
-__all__ = ["PDFContent", "PDFEnhancer"]
+__all__ = ["GrobidPool", "PDFContent", "PDFEnhancer", "grobid_urls_from_env"]
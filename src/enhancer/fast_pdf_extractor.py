@@ -0,0 +1,252 @@
+"""本地快速 PDF 文本抽取（pypdf + 标题启发式），GROBID 之前的快速通道。
+
+增强阶段最终只用到六个章节摘要与正文中的 URL，完整的 GROBID TEI 解析对此偏重。
+这里用 pypdf 直接抽取文本，按论文常见排版识别章节：
+- 编号标题 "3 Experiments" / "3.1 Dataset" / "III. EVALUATION"，编号须单调递增，
+  避免把正文里以数字开头的行误判为标题
+- 无编号的常见标题（Abstract / Introduction / Conclusion / References ...）
+- 参考文献之后的附录字母编号 "A Dataset Details"
+- 出现在过半页面的行视为页眉页脚并去除，行尾连字符断词合并
+
+输出与 scipdf 的 article_dict 结构一致（title/abstract/sections/authors/references），
+由 PDFEnhancer 复用同一套转换逻辑。作者姓名不可靠地抽取，只从首页标题与摘要之间
+按机构关键词识别单位行，用于补全 raw_institutions。
+"""
+
+from __future__ import annotations
+
+import logging
+import re
+import unicodedata
+from collections import Counter
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from pypdf import PdfReader
+
+from src.common import constants
+
+logger = logging.getLogger(__name__)
+
+# pypdf 对缺少 fontTools 的字体会逐页打印编码警告，不影响文本抽取
+logging.getLogger("pypdf").setLevel(logging.ERROR)
+
+_NUMBERED_HEADING = re.compile(
+    r"^(?P<num>\d{1,2}(?:\.\d{1,2}){0,2})\.?\s+(?P<title>[A-Z][^\n]{1,80})$"
+)
+_ROMAN_HEADING = re.compile(r"^(?P<num>[IVX]{1,5})\.\s+(?P<title>[A-Z][^\n]{1,80})$")
+_APPENDIX_HEADING = re.compile(
+    r"^(?P<num>[A-H](?:\.\d{1,2}){0,2})\.?\s+(?P<title>[A-Z][^\n]{1,80})$"
+)
+_ABSTRACT_INLINE = re.compile(
+    r"^abstract(?:\s*[.:\-—–]\s*|\s*$)(?P<rest>.*)$", re.IGNORECASE
+)
+# 小型大写排版被抽成 "I NTRODUCTION"，合并回 "INTRODUCTION"
+_SMALL_CAPS_SPLIT = re.compile(r"\b([A-Z]) (?=[A-Z]{2,}\b)")
+_HYPHEN_BREAK = re.compile(r"(\w)-\n(\w)")
+_BRACKET_REFERENCE = re.compile(r"(?:^|\n)\[\d{1,3}\]\s*")
+_PAGE_NUMBER = re.compile(r"^\d{1,3}$")
+_EMAIL = re.compile(r"\S+@\S+")
+
+_UNNUMBERED_HEADINGS = frozenset(
+    {
+        "introduction",
+        "related work",
+        "background",
+        "method",
+        "methods",
+        "methodology",
+        "experiments",
+        "evaluation",
+        "results",
+        "discussion",
+        "limitations",
+        "conclusion",
+        "conclusions",
+        "acknowledgements",
+        "acknowledgments",
+        "code availability",
+        "data availability",
+        "appendix",
+    }
+)
+_REFERENCE_HEADINGS = frozenset({"references", "bibliography"})
+_ROMAN_VALUES = {"I": 1, "V": 5, "X": 10}
+
+
+def _roman_to_int(numeral: str) -> int:
+    total = 0
+    for current, following in zip(numeral, numeral[1:] + " "):
+        value = _ROMAN_VALUES[current]
+        total += -value if _ROMAN_VALUES.get(following, 0) > value else value
+    return total
+
+
+def _is_affiliation(line: str) -> bool:
+    return any(keyword in line for keyword in constants.PDF_FAST_AFFILIATION_KEYWORDS)
+
+
+def _plausible_title(title: str) -> bool:
+    """标题行：词数有限、不以句读结尾、字母占比高"""
+
+    title = title.strip()
+    if len(title.split()) > 10 or title[-1] in ".,;:":
+        return False
+    letters = sum(ch.isalpha() for ch in title)
+    return letters >= 0.6 * len(title.replace(" ", ""))
+
+
+class _HeadingTracker:
+    """按编号单调性判定标题，过滤正文中以数字开头的行"""
+
+    def __init__(self) -> None:
+        self.path: Tuple[int, ...] = ()
+        self.in_appendix = False
+
+    def accept(self, line: str, front_matter: bool = False) -> Optional[str]:
+        """判定标题行；front_matter 时带上标编号的机构/邮箱行不算标题"""
+
+        if line.isupper():
+            line = _SMALL_CAPS_SPLIT.sub(r"\1", line)
+        lowered = line.lower().rstrip(":")
+        if lowered in _REFERENCE_HEADINGS:
+            self.in_appendix = True
+            return line.title()
+        if lowered in _UNNUMBERED_HEADINGS:
+            return line.title() if line.isupper() else line
+
+        match = _NUMBERED_HEADING.match(line)
+        if match and front_matter and _is_affiliation(line):
+            return None
+        if match and not self.in_appendix:
+            numbers = tuple(int(part) for part in match.group("num").split("."))
+            return self._advance(numbers, match.group("title"))
+
+        match = _ROMAN_HEADING.match(line)
+        if match and not self.in_appendix:
+            return self._advance((_roman_to_int(match.group("num")),), match.group("title"))
+
+        match = _APPENDIX_HEADING.match(line)
+        if match and self.in_appendix and _plausible_title(match.group("title")):
+            return match.group("title").strip()
+        return None
+
+    def _advance(self, numbers: Tuple[int, ...], title: str) -> Optional[str]:
+        if not _plausible_title(title):
+            return None
+        depth = len(numbers)
+        parent, last = numbers[:-1], numbers[-1]
+        if parent != self.path[: depth - 1]:
+            return None
+        previous = self.path[depth - 1] if len(self.path) >= depth else 0
+        # 同级编号只允许 +1（子节允许跳过一个，兼容抽取漏行）
+        if not (previous < last <= previous + (1 if depth == 1 else 2)):
+            return None
+        self.path = numbers
+        title = title.strip()
+        return title.title() if title.isupper() else title
+
+
+def _page_lines(reader: PdfReader) -> List[List[str]]:
+    pages: List[List[str]] = []
+    for page in reader.pages:
+        text = unicodedata.normalize("NFKC", page.extract_text() or "")
+        pages.append([line.strip() for line in text.splitlines() if line.strip()])
+    return pages
+
+
+def _strip_running_lines(pages: List[List[str]]) -> List[List[str]]:
+    """去掉页码与在过半页面重复出现的页眉页脚"""
+
+    if len(pages) < 3:
+        return pages
+    counts = Counter(line for lines in pages for line in set(lines))
+    repeated = {line for line, count in counts.items() if count > len(pages) / 2}
+    return [
+        [line for line in lines if line not in repeated and not _PAGE_NUMBER.match(line)]
+        for lines in pages
+    ]
+
+
+def _join(lines: List[str]) -> str:
+    text = _HYPHEN_BREAK.sub(r"\1\2", "\n".join(lines))
+    return re.sub(r"\s+", " ", text).strip()
+
+
+def _split_references(lines: List[str]) -> List[str]:
+    text = "\n".join(lines)
+    if _BRACKET_REFERENCE.search(text):
+        parts = _BRACKET_REFERENCE.split(text)
+    else:
+        # 作者-年份格式：以句号结尾的行之后另起一条
+        parts = re.split(r"(?<=\.)\n(?=[A-Z][A-Za-z'\-]+,)", text)
+    return [_join(part.splitlines()) for part in parts if part.strip()]
+
+
+def _affiliations(front_matter: List[str]) -> List[str]:
+    found: List[str] = []
+    for line in front_matter:
+        if not _is_affiliation(line):
+            continue
+        cleaned = _EMAIL.sub("", line).strip(" ,;*†‡§0123456789")
+        if cleaned and cleaned not in found:
+            found.append(cleaned)
+    return found
+
+
+def extract_article(pdf_path: Path) -> Optional[Dict[str, Any]]:
+    """抽取 PDF 全文并切分章节，返回 scipdf 风格的 article_dict；无文本层时返回 None"""
+
+    try:
+        reader = PdfReader(str(pdf_path))
+        pages = _strip_running_lines(_page_lines(reader))
+    except Exception as exc:  # noqa: BLE001
+        logger.debug("快速抽取失败 (%s): %s", pdf_path.name, exc)
+        return None
+    if not any(pages):
+        return None
+
+    lines = [line for page in pages for line in page]
+    tracker = _HeadingTracker()
+    front: List[str] = []
+    abstract: List[str] = []
+    sections: List[Tuple[str, List[str]]] = []
+    references: List[str] = []
+    in_abstract = False
+
+    for line in lines:
+        heading = tracker.accept(line, front_matter=not sections)
+        if heading is not None:
+            in_abstract = False
+            if heading.lower() in _REFERENCE_HEADINGS:
+                sections.append(("References", references))
+            else:
+                sections.append((heading, []))
+            continue
+
+        if not sections:
+            inline = _ABSTRACT_INLINE.match(line)
+            if inline and not in_abstract and not abstract:
+                in_abstract = True
+                if inline.group("rest"):
+                    abstract.append(inline.group("rest"))
+                continue
+            (abstract if in_abstract else front).append(line)
+            continue
+        sections[-1][1].append(line)
+
+    title = next((line for line in front if len(line) >= 4), "")
+    return {
+        "title": title,
+        "abstract": _join(abstract),
+        "sections": [
+            {"heading": heading, "text": _join(body)}
+            for heading, body in sections
+            if body is not references
+        ],
+        "authors": [
+            {"name": "", "affiliation": {"institution": institution}}
+            for institution in _affiliations(front[1:])
+        ],
+        "references": _split_references(references),
+    }
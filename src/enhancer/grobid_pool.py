@@ -0,0 +1,343 @@
+"""GROBID 端点池：多实例健康感知路由与自适应并发。
+
+原先 PDFEnhancer 只持有一个 grobid_url，全局并发固定为 3，本地失败后整体切到
+云端 Space。这里改为端点池：
+- GROBID_URLS（逗号分隔）配置多个本地容器，未配置时沿用 GROBID_URL / 本地探测
+- 每个端点记录在途请求数、每MB解析耗时（EWMA）与连续失败次数
+- 每个 PDF 路由到预计完成最早的健康端点：耗时 × (在途+1) / 并发上限
+- 并发上限按 AIMD 自适应：正常完成缓慢增加，耗时明显劣化减1，网络失败减半
+- 连续网络失败达到阈值后摘除端点并冷却，冷却结束以并发1试探恢复
+- 云端 Space 只作为兜底：所有本地端点都被摘除时才会使用
+- 记录每个端点的 GROBID 版本，解析结果附带版本号供 PDFContent 缓存区分
+
+解析调用运行在端点池自己的线程池中（大小等于各端点并发上限之和），
+不与默认 to_thread 线程池争抢，增加容器即可线性扩展吞吐。
+"""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import logging
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+)
+
+import httpx
+import requests
+from scipdf.pdf import parse_pdf_to_dict  # type: ignore[import]
+
+from src.common import constants
+
+logger = logging.getLogger(__name__)
+
+ParseFn = Callable[..., Optional[Dict[str, Any]]]
+GROBID_UNKNOWN_VERSION = "unknown"
+
+
+class GrobidUnavailableError(RuntimeError):
+    """所有 GROBID 端点均处于摘除状态。"""
+
+
+@dataclass(slots=True)
+class GrobidEndpoint:
+    """单个 GROBID 实例的运行状态。"""
+
+    url: str
+    max_limit: int
+    limit: float
+    fallback: bool = False
+    in_flight: int = 0
+    cost: Optional[float] = None  # 每MB解析耗时的EWMA（秒）
+    failures: int = 0  # 连续网络失败次数
+    down_until: float = 0.0
+    completed: int = 0
+    errors: int = 0
+    version: Optional[str] = None  # /api/version 返回值，探测成功后填充
+
+    @property
+    def capacity(self) -> int:
+        return max(1, int(self.limit))
+
+    def healthy(self, now: float) -> bool:
+        return now >= self.down_until
+
+    def expected_wait(self) -> float:
+        """新请求在该端点上的预计完成时间（相对值），未测得耗时的端点优先试探"""
+
+        return (self.cost or 0.0) * (self.in_flight + 1) / self.capacity
+
+
+def grobid_urls_from_env() -> List[str]:
+    """读取配置的 GROBID 地址：GROBID_URLS 优先，其次 GROBID_URL，默认本地"""
+
+    raw = os.getenv("GROBID_URLS") or os.getenv("GROBID_URL") or ""
+    urls = [url.strip().rstrip("/") for url in raw.split(",") if url.strip()]
+    return urls or [constants.GROBID_LOCAL_URL]
+
+
+def probe_grobid_version(base_url: str) -> Optional[str]:
+    """通过版本接口探测 GROBID 可用性，返回版本号，不可用时返回 None。"""
+
+    health_url = f"{base_url.rstrip('/')}{constants.GROBID_HEALTH_PATH}"
+    try:
+        response = httpx.get(health_url, timeout=constants.GROBID_HEALTH_TIMEOUT)
+        response.raise_for_status()
+        return response.text.strip() or GROBID_UNKNOWN_VERSION
+    except httpx.HTTPStatusError as exc:
+        logger.debug("GROBID状态异常(%s): %s", base_url, exc)
+    except httpx.RequestError as exc:
+        logger.debug("GROBID连接失败(%s): %s", base_url, exc)
+    return None
+
+
+def is_endpoint_error(exc: BaseException) -> bool:
+    """判断异常是否来源于 GROBID 服务/网络（计入端点健康度），而非 PDF 本身"""
+
+    if isinstance(exc, (httpx.RequestError, requests.RequestException, OSError)):
+        return True
+    return "SSL" in str(exc).upper()
+
+
+class GrobidPool:
+    """GROBID 端点池，按健康度与负载路由解析请求。"""
+
+    def __init__(
+        self,
+        urls: Sequence[str],
+        fallback_url: Optional[str] = constants.GROBID_CLOUD_URL,
+        parse_fn: ParseFn = parse_pdf_to_dict,
+    ) -> None:
+        if not urls and not fallback_url:
+            raise ValueError("至少需要一个 GROBID 端点")
+
+        self.endpoints: List[GrobidEndpoint] = [
+            GrobidEndpoint(
+                url=url,
+                max_limit=constants.GROBID_ENDPOINT_MAX_CONCURRENCY,
+                limit=float(constants.GROBID_ENDPOINT_INITIAL_CONCURRENCY),
+            )
+            for url in dict.fromkeys(urls)
+        ]
+        if fallback_url and fallback_url not in {e.url for e in self.endpoints}:
+            # 云端 Space 资源有限，沿用原先的全局并发上限
+            cloud_limit = max(1, constants.PDF_ENHANCER_MAX_CONCURRENCY)
+            self.endpoints.append(
+                GrobidEndpoint(
+                    url=fallback_url,
+                    max_limit=cloud_limit,
+                    limit=float(cloud_limit),
+                    fallback=True,
+                )
+            )
+
+        self._parse_fn = parse_fn
+        self._executor = ThreadPoolExecutor(
+            max_workers=sum(e.max_limit for e in self.endpoints),
+            thread_name_prefix="grobid",
+        )
+        self._condition: Optional[asyncio.Condition] = None
+        self._condition_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._probe_task: Optional[asyncio.Task] = None
+        self._probe_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    @classmethod
+    def from_env(cls) -> "GrobidPool":
+        """按环境变量构建端点池；可用性探测在 probe() 中异步完成，避免阻塞事件循环"""
+
+        return cls(grobid_urls_from_env())
+
+    async def probe(self) -> None:
+        """探测未知版本端点的可用性，不可用的先进入冷却。
+
+        每个事件循环只探测一次，并发调用共享同一次探测；parse() 与解析缓存查询前都会等待。
+        """
+
+        loop = asyncio.get_running_loop()
+        if self._probe_task is None or self._probe_loop is not loop:
+            self._probe_task = loop.create_task(self._probe_endpoints())
+            self._probe_loop = loop
+        await asyncio.shield(self._probe_task)
+
+    async def _probe_endpoints(self) -> None:
+        loop = asyncio.get_running_loop()
+
+        async def _probe(endpoint: GrobidEndpoint) -> None:
+            endpoint.version = await loop.run_in_executor(
+                self._executor, probe_grobid_version, endpoint.url
+            )
+
+        pending = [e for e in self.endpoints if not e.fallback and e.version is None]
+        await asyncio.gather(*(_probe(e) for e in pending))
+        now = time.monotonic()
+        for endpoint in pending:
+            if endpoint.version is None:
+                self._mark_down(endpoint, now)
+        if pending and not self._primaries_healthy(now):
+            logger.warning(
+                "未检测到可用的本地GROBID服务，暂用云端兜底: %s", constants.GROBID_CLOUD_URL
+            )
+            fallbacks = [e for e in self.endpoints if e.fallback and e.version is None]
+            await asyncio.gather(*(_probe(e) for e in fallbacks))
+
+    @property
+    def concurrency(self) -> int:
+        """端点池可承载的最大并发，供上游决定同时处理多少篇 PDF"""
+
+        primaries = [e for e in self.endpoints if not e.fallback]
+        pool = primaries or self.endpoints
+        return sum(e.max_limit for e in pool)
+
+    @property
+    def known_versions(self) -> Set[str]:
+        """池内端点已探测到的 GROBID 版本"""
+
+        return {e.version for e in self.endpoints if e.version}
+
+    def describe(self) -> str:
+        return ", ".join(
+            f"{e.url}{'(兜底)' if e.fallback else ''}" for e in self.endpoints
+        )
+
+    async def parse(self, pdf_path: Path) -> Tuple[Optional[Dict[str, Any]], str]:
+        """在选中的端点上解析 PDF，返回 (解析结果, GROBID版本)。
+
+        异常原样抛出（端点状态已记录）。
+        """
+
+        size_mb = max(pdf_path.stat().st_size / 1_048_576, 0.1)
+        await self.probe()
+        loop = asyncio.get_running_loop()
+        async with self._lease() as endpoint:
+            if endpoint.version is None:
+                # 启动时未探测（兜底端点/冷却后恢复），首次使用时补齐
+                endpoint.version = await loop.run_in_executor(
+                    self._executor, probe_grobid_version, endpoint.url
+                )
+            started = time.perf_counter()
+            try:
+                result = await loop.run_in_executor(
+                    self._executor,
+                    functools.partial(
+                        self._parse_fn, str(pdf_path), grobid_url=endpoint.url
+                    ),
+                )
+            except Exception as exc:  # noqa: BLE001
+                self._record_failure(endpoint, exc)
+                raise
+            self._record_success(endpoint, (time.perf_counter() - started) / size_mb)
+            return result, endpoint.version or GROBID_UNKNOWN_VERSION
+
+    def log_summary(self) -> None:
+        now = time.monotonic()
+        for endpoint in self.endpoints:
+            if not (endpoint.completed or endpoint.errors):
+                continue
+            logger.info(
+                "GROBID端点 %s: 成功%d 失败%d, 并发上限%d, 耗时%.2fs/MB%s",
+                endpoint.url,
+                endpoint.completed,
+                endpoint.errors,
+                endpoint.capacity,
+                endpoint.cost or 0.0,
+                "" if endpoint.healthy(now) else " (冷却中)",
+            )
+
+    # ---- 路由 ----
+
+    def _get_condition(self) -> asyncio.Condition:
+        # PDFEnhancer 可能跨多个事件循环复用（测试中每个用例一个循环）
+        loop = asyncio.get_running_loop()
+        if self._condition is None or self._condition_loop is not loop:
+            self._condition = asyncio.Condition()
+            self._condition_loop = loop
+        return self._condition
+
+    def _primaries_healthy(self, now: float) -> List[GrobidEndpoint]:
+        return [e for e in self.endpoints if not e.fallback and e.healthy(now)]
+
+    def _pick(self, now: float) -> Optional[GrobidEndpoint]:
+        """选出预计完成最早的可用端点；全部满载返回 None，全部摘除抛出异常"""
+
+        candidates = self._primaries_healthy(now) or [
+            e for e in self.endpoints if e.fallback and e.healthy(now)
+        ]
+        if not candidates:
+            raise GrobidUnavailableError("所有GROBID端点均不可用")
+        available = [e for e in candidates if e.in_flight < e.capacity]
+        if not available:
+            return None
+        return min(available, key=lambda e: (e.expected_wait(), e.in_flight))
+
+    @asynccontextmanager
+    async def _lease(self) -> AsyncIterator[GrobidEndpoint]:
+        condition = self._get_condition()
+        async with condition:
+            while True:
+                endpoint = self._pick(time.monotonic())
+                if endpoint is not None:
+                    endpoint.in_flight += 1
+                    break
+                # 满载时等待释放；带超时以便感知冷却结束的端点
+                try:
+                    await asyncio.wait_for(
+                        condition.wait(), timeout=constants.GROBID_POOL_POLL_SECONDS
+                    )
+                except asyncio.TimeoutError:
+                    pass
+        try:
+            yield endpoint
+        finally:
+            async with condition:
+                endpoint.in_flight -= 1
+                condition.notify_all()
+
+    # ---- 状态更新（均在事件循环线程执行） ----
+
+    def _record_success(self, endpoint: GrobidEndpoint, cost: float) -> None:
+        endpoint.completed += 1
+        endpoint.failures = 0
+        if endpoint.cost is None:
+            endpoint.cost = cost
+            return
+        overloaded = cost > endpoint.cost * constants.GROBID_LATENCY_TOLERANCE
+        alpha = constants.GROBID_LATENCY_EWMA_ALPHA
+        endpoint.cost = (1 - alpha) * endpoint.cost + alpha * cost
+        if overloaded:
+            endpoint.limit = max(1.0, endpoint.limit - 1)
+        else:
+            # 每完成一轮（约 limit 个请求）并发加1
+            endpoint.limit = min(float(endpoint.max_limit), endpoint.limit + 1 / endpoint.limit)
+
+    def _record_failure(self, endpoint: GrobidEndpoint, exc: BaseException) -> None:
+        endpoint.errors += 1
+        if not is_endpoint_error(exc):
+            return
+        endpoint.failures += 1
+        endpoint.limit = max(1.0, endpoint.limit / 2)
+        if endpoint.failures >= constants.GROBID_ENDPOINT_MAX_FAILURES:
+            self._mark_down(endpoint, time.monotonic())
+
+    def _mark_down(self, endpoint: GrobidEndpoint, now: float) -> None:
+        endpoint.down_until = now + constants.GROBID_ENDPOINT_COOLDOWN_SECONDS
+        endpoint.limit = 1.0
+        logger.warning(
+            "GROBID端点暂时摘除%.0f秒: %s",
+            constants.GROBID_ENDPOINT_COOLDOWN_SECONDS,
+            endpoint.url,
+        )
+
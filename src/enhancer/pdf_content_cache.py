@@ -0,0 +1,249 @@
+"""PDF 解析结果（PDFContent）持久缓存
+
+GROBID 解析是增强阶段最贵的一步，而 7 天回溯窗口内同一篇 arXiv 论文会在多次运行中
+反复出现。这里按 arXiv ID + PDF 内容哈希 + GROBID 版本缓存序列化后的 PDFContent：
+- 本地已有 PDF 时按哈希精确匹配，PDF 更新（新版本）自动失效
+- 本地没有 PDF 时取该 arXiv ID 最近一次的解析结果，连下载一起跳过
+- GROBID 版本不在当前端点池已知版本内的条目视为过期
+- 总大小超过上限时按最近访问时间淘汰
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import logging
+import sqlite3
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Collection, Optional
+
+if TYPE_CHECKING:
+    from src.enhancer.pdf_enhancer import PDFContent
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(slots=True)
+class PDFContentCacheStats:
+    """解析缓存命中/未命中/淘汰统计"""
+
+    hits: int = 0
+    misses: int = 0
+    writes: int = 0
+    evictions: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+def hash_pdf(pdf_path: Path) -> str:
+    """PDF 内容 SHA-256（分块读取，避免大文件整读入内存）"""
+
+    digest = hashlib.sha256()
+    with pdf_path.open("rb") as handle:
+        for chunk in iter(lambda: handle.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def serialize_content(content: "PDFContent") -> str:
+    return json.dumps(asdict(content), ensure_ascii=False)
+
+
+def deserialize_content(payload: str) -> "PDFContent":
+    from src.enhancer.pdf_enhancer import PDFContent
+
+    data = json.loads(payload)
+    data["authors_affiliations"] = [
+        (name, affiliation) for name, affiliation in data.get("authors_affiliations", [])
+    ]
+    return PDFContent(**data)
+
+
+class PDFContentCache:
+    """基于SQLite的 PDFContent 缓存，按总大小LRU淘汰"""
+
+    def __init__(self, db_path: Path, max_bytes: int) -> None:
+        self.db_path = Path(db_path)
+        self.max_bytes = max_bytes
+        self.stats = PDFContentCacheStats()
+        self._init_db()
+
+    def _init_db(self) -> None:
+        """初始化数据库结构"""
+
+        conn = sqlite3.connect(self.db_path)
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS pdf_content (
+                arxiv_id TEXT NOT NULL,
+                pdf_sha256 TEXT NOT NULL,
+                grobid_version TEXT NOT NULL,
+                payload TEXT NOT NULL,
+                size_bytes INTEGER NOT NULL,
+                created_at REAL NOT NULL,
+                accessed_at REAL NOT NULL,
+                PRIMARY KEY (arxiv_id, pdf_sha256, grobid_version)
+            )
+            """
+        )
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_pdf_content_accessed "
+            "ON pdf_content (accessed_at)"
+        )
+        conn.commit()
+        conn.close()
+
+    async def get(
+        self,
+        arxiv_id: str,
+        pdf_sha256: Optional[str],
+        grobid_versions: Collection[str],
+    ) -> Optional["PDFContent"]:
+        """查找解析结果；pdf_sha256 为空时取该论文最近一次的结果"""
+
+        payload = await asyncio.to_thread(
+            self._get_sync, arxiv_id, pdf_sha256, list(grobid_versions)
+        )
+        if payload is None:
+            self.stats.misses += 1
+            return None
+        try:
+            content = deserialize_content(payload)
+        except (ValueError, TypeError) as exc:
+            logger.warning("PDF解析缓存条目损坏 (%s): %s", arxiv_id, exc)
+            self.stats.misses += 1
+            return None
+        self.stats.hits += 1
+        return content
+
+    def _get_sync(
+        self, arxiv_id: str, pdf_sha256: Optional[str], grobid_versions: list[str]
+    ) -> Optional[str]:
+        if not grobid_versions:
+            return None
+        placeholders = ",".join("?" * len(grobid_versions))
+        query = (
+            "SELECT rowid, payload FROM pdf_content "
+            f"WHERE arxiv_id = ? AND grobid_version IN ({placeholders})"
+        )
+        params: list[object] = [arxiv_id, *grobid_versions]
+        if pdf_sha256:
+            query += " AND pdf_sha256 = ?"
+            params.append(pdf_sha256)
+        query += " ORDER BY created_at DESC LIMIT 1"
+
+        conn = sqlite3.connect(self.db_path)
+        row = conn.execute(query, params).fetchone()
+        if row:
+            conn.execute(
+                "UPDATE pdf_content SET accessed_at = ? WHERE rowid = ?",
+                (time.time(), row[0]),
+            )
+            conn.commit()
+        conn.close()
+        return row[1] if row else None
+
+    async def cached_ids(
+        self, arxiv_ids: Collection[str], grobid_versions: Collection[str]
+    ) -> set[str]:
+        """批量判断哪些论文已有可用解析结果（不计入命中统计，供下载预取过滤）"""
+
+        return await asyncio.to_thread(
+            self._cached_ids_sync, list(arxiv_ids), list(grobid_versions)
+        )
+
+    def _cached_ids_sync(
+        self, arxiv_ids: list[str], grobid_versions: list[str]
+    ) -> set[str]:
+        if not arxiv_ids or not grobid_versions:
+            return set()
+        id_marks = ",".join("?" * len(arxiv_ids))
+        version_marks = ",".join("?" * len(grobid_versions))
+        conn = sqlite3.connect(self.db_path)
+        rows = conn.execute(
+            "SELECT DISTINCT arxiv_id FROM pdf_content "
+            f"WHERE arxiv_id IN ({id_marks}) AND grobid_version IN ({version_marks})",
+            [*arxiv_ids, *grobid_versions],
+        ).fetchall()
+        conn.close()
+        return {row[0] for row in rows}
+
+    async def put(
+        self,
+        arxiv_id: str,
+        pdf_sha256: str,
+        grobid_version: str,
+        content: "PDFContent",
+    ) -> None:
+        payload = serialize_content(content)
+        evicted = await asyncio.to_thread(
+            self._put_sync, arxiv_id, pdf_sha256, grobid_version, payload
+        )
+        self.stats.writes += 1
+        self.stats.evictions += evicted
+
+    def _put_sync(
+        self, arxiv_id: str, pdf_sha256: str, grobid_version: str, payload: str
+    ) -> int:
+        now = time.time()
+        conn = sqlite3.connect(self.db_path)
+        conn.execute(
+            "INSERT OR REPLACE INTO pdf_content "
+            "(arxiv_id, pdf_sha256, grobid_version, payload, size_bytes, "
+            "created_at, accessed_at) VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (
+                arxiv_id,
+                pdf_sha256,
+                grobid_version,
+                payload,
+                len(payload.encode("utf-8")),
+                now,
+                now,
+            ),
+        )
+        evicted = self._evict(conn)
+        conn.commit()
+        conn.close()
+        return evicted
+
+    def _evict(self, conn: sqlite3.Connection) -> int:
+        """超出上限时按最近访问时间淘汰，降到上限的90%以留出余量"""
+
+        total = conn.execute(
+            "SELECT COALESCE(SUM(size_bytes), 0) FROM pdf_content"
+        ).fetchone()[0]
+        if total <= self.max_bytes:
+            return 0
+        target = int(self.max_bytes * 0.9)
+        evicted = 0
+        rows = conn.execute(
+            "SELECT rowid, size_bytes FROM pdf_content ORDER BY accessed_at ASC"
+        ).fetchall()
+        for rowid, size in rows:
+            if total <= target:
+                break
+            conn.execute("DELETE FROM pdf_content WHERE rowid = ?", (rowid,))
+            total -= size
+            evicted += 1
+        return evicted
+
+    def log_stats(self) -> None:
+        """输出本次运行的解析缓存命中率"""
+
+        stats = self.stats
+        if not (stats.hits or stats.misses):
+            return
+        logger.info(
+            "PDF解析缓存: 命中%d 未命中%d 命中率%.1f%%, 写入%d条, 淘汰%d条",
+            stats.hits,
+            stats.misses,
+            stats.hit_rate * 100,
+            stats.writes,
+            stats.evictions,
+        )
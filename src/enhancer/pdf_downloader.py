@@ -0,0 +1,166 @@
+"""arXiv PDF 异步下载管理器。
+
+原实现先在事件循环线程上同步调用 arxiv SDK 查询（阻塞所有协程），再用线程池下载，
+HTTP 兜底则在线程里用同步 httpx.stream + time.sleep。这里改为：
+- 全部下载走进程级共享的 arXiv 客户端（连接池，h2 可用时启用 HTTP/2）
+- 信号量限制同时下载数，同一篇论文的并发请求合并为一个任务
+- 先写同目录下的临时文件，校验 PDF 头后原子 rename，进程崩溃不会在缓存里留下半截 PDF
+- prefetch() 在候选通过预筛后立即排队下载，与前面论文的解析重叠
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import time
+import uuid
+from pathlib import Path
+from typing import Dict, Iterable, Optional
+
+import httpx
+
+from src.common import constants
+from src.common.http_clients import HTTPClientRegistry, http_client_registry
+
+logger = logging.getLogger(__name__)
+
+_PARTIAL_SUFFIX = ".part"
+
+
+class PDFDownloader:
+    """arXiv PDF 下载器：共享连接池、并发受限、原子落盘。"""
+
+    def __init__(
+        self,
+        cache_dir: Path,
+        concurrency: Optional[int] = None,
+        clients: Optional[HTTPClientRegistry] = None,
+    ) -> None:
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.concurrency = max(1, concurrency or constants.PDF_DOWNLOAD_MAX_CONCURRENCY)
+        self.downloaded = 0
+        self.failed = 0
+        self._clients = clients or http_client_registry()
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._inflight: Dict[str, asyncio.Task] = {}
+        self._remove_stale_partials()
+
+    def path_for(self, arxiv_id: str) -> Path:
+        return self.cache_dir / f"{arxiv_id}.pdf"
+
+    async def fetch(self, arxiv_id: str) -> Optional[Path]:
+        """返回本地 PDF 路径（已缓存直接返回），下载失败返回 None"""
+
+        pdf_path = self.path_for(arxiv_id)
+        if pdf_path.exists():
+            logger.debug("命中 PDF 缓存: %s", arxiv_id)
+            return pdf_path
+        # shield：调用方被取消时不中断共享的下载任务
+        return await asyncio.shield(self._schedule(arxiv_id))
+
+    def prefetch(self, arxiv_ids: Iterable[str]) -> int:
+        """后台排队下载，不等待结果；返回新排队的数量"""
+
+        scheduled = 0
+        for arxiv_id in arxiv_ids:
+            if arxiv_id in self._inflight or self.path_for(arxiv_id).exists():
+                continue
+            self._schedule(arxiv_id)
+            scheduled += 1
+        return scheduled
+
+    async def aclose(self) -> None:
+        for task in list(self._inflight.values()):
+            task.cancel()
+        self._inflight.clear()
+
+    # ---- 内部实现 ----
+
+    def _bind_loop(self) -> None:
+        # 同一实例可能跨多个事件循环使用（测试中每个用例一个循环）
+        loop = asyncio.get_running_loop()
+        if self._loop is loop:
+            return
+        self._loop = loop
+        self._semaphore = asyncio.Semaphore(self.concurrency)
+        self._inflight = {}
+
+    def _schedule(self, arxiv_id: str) -> asyncio.Task:
+        self._bind_loop()
+        task = self._inflight.get(arxiv_id)
+        if task is None:
+            task = asyncio.create_task(self._download(arxiv_id))
+            self._inflight[arxiv_id] = task
+            task.add_done_callback(lambda _: self._inflight.pop(arxiv_id, None))
+        return task
+
+    async def _download(self, arxiv_id: str) -> Optional[Path]:
+        assert self._semaphore is not None
+        async with self._semaphore:
+            pdf_path = self.path_for(arxiv_id)
+            if pdf_path.exists():
+                return pdf_path
+            # 逐步尝试 export → 主站直连，404 时等待再试，缓解 PDF 尚未同步的问题
+            for attempt in range(1, constants.ARXIV_PDF_HTTP_MAX_RETRIES + 1):
+                for base_url in (
+                    constants.ARXIV_PDF_EXPORT_BASE,
+                    constants.ARXIV_PDF_PRIMARY_BASE,
+                ):
+                    pdf_url = f"{base_url.rstrip('/')}/{arxiv_id}.pdf"
+                    if await self._stream_to_file(pdf_url, pdf_path):
+                        self.downloaded += 1
+                        logger.info("PDF 下载成功: %s", arxiv_id)
+                        return pdf_path
+                if attempt < constants.ARXIV_PDF_HTTP_MAX_RETRIES:
+                    await asyncio.sleep(constants.ARXIV_PDF_HTTP_RETRY_DELAY_SECONDS)
+        self.failed += 1
+        logger.error("PDF 下载失败: %s", arxiv_id)
+        return None
+
+    async def _stream_to_file(self, pdf_url: str, pdf_path: Path) -> bool:
+        """串流写入临时文件，校验通过后原子替换为正式文件"""
+
+        client = self._clients.client(pdf_url)
+        partial = pdf_path.with_name(f"{pdf_path.name}.{uuid.uuid4().hex}{_PARTIAL_SUFFIX}")
+        try:
+            async with client.stream(
+                "GET",
+                pdf_url,
+                timeout=constants.ARXIV_PDF_TIMEOUT_SECONDS,
+                follow_redirects=True,
+            ) as response:
+                response.raise_for_status()
+                with partial.open("wb") as file_obj:
+                    async for chunk in response.aiter_bytes(
+                        constants.PDF_DOWNLOAD_CHUNK_SIZE
+                    ):
+                        file_obj.write(chunk)
+            with partial.open("rb") as file_obj:
+                header = file_obj.read(5)
+            if header != b"%PDF-":
+                # arXiv 在 PDF 尚未生成时会返回 HTML 提示页
+                logger.debug("PDF直连返回非PDF内容(%s)", pdf_url)
+                return False
+            os.replace(partial, pdf_path)
+            return True
+        except httpx.HTTPStatusError as exc:
+            logger.debug("PDF直连状态异常(%s): %s", pdf_url, exc)
+        except httpx.RequestError as exc:
+            logger.debug("PDF直连请求失败(%s): %s", pdf_url, exc)
+        finally:
+            partial.unlink(missing_ok=True)
+        return False
+
+    def _remove_stale_partials(self) -> None:
+        """清理崩溃遗留的临时文件（保留一小时内的，可能属于并行运行的进程）"""
+
+        cutoff = time.time() - 3600
+        for partial in self.cache_dir.glob(f"*{_PARTIAL_SUFFIX}"):
+            try:
+                if partial.stat().st_mtime < cutoff:
+                    partial.unlink()
+            except OSError:
+                continue
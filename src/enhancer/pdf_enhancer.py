@@ -2,10 +2,11 @@
 
 功能概览:
 1. 下载 arXiv PDF 到本地缓存目录
-2. 使用 scipdf_parser 解析 PDF 全文结构
+2. 先用 pypdf 本地快速抽取章节，核心章节不足时再用 scipdf_parser (GROBID) 解析全文结构
 3. 提取 Evaluation / Dataset / Baselines 等关键章节摘要
 4. 提取作者与机构信息，补全 raw_institutions
 5. 将解析结果写入 RawCandidate 的摘要与 raw_metadata，用于后续 LLM 评分
+6. 解析结果按 arXiv ID + PDF 哈希 + GROBID 版本持久缓存，重复出现的论文跳过下载与解析
 """
 
 from __future__ import annotations
@@ -14,19 +15,20 @@ import asyncio
 import logging
 import os
 import re
-import time
 import warnings
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
-import arxiv
-import httpx
-import requests
 from bs4 import XMLParsedAsHTMLWarning
-from scipdf.pdf import parse_pdf_to_dict  # type: ignore[import]
 
 from src.common import constants
+from src.common.http_cache import shared_github_cache
+from src.common.http_clients import get_http_client
+from src.enhancer.fast_pdf_extractor import extract_article
+from src.enhancer.grobid_pool import GrobidPool
+from src.enhancer.pdf_content_cache import PDFContentCache, hash_pdf
+from src.enhancer.pdf_downloader import PDFDownloader
 from src.models import RawCandidate
 
 # 过滤 scipdf_parser 库的 XML 解析警告
@@ -57,6 +59,7 @@ class PDFContent:
     extracted_github_url: Optional[str] = None  # 从PDF正文提取的GitHub链接
     extracted_dataset_url: Optional[str] = None  # 从PDF正文提取的数据集链接
     extracted_paper_url: Optional[str] = None  # 从PDF正文提取的论文链接
+    grobid_version: Optional[str] = None  # 解析器版本：GROBID版本或快速抽取版本（缓存键的一部分）
 
 
 class PDFEnhancer:
@@ -70,33 +73,68 @@ class PDFEnhancer:
     - 任一阶段失败（下载/解析/提取）时，返回原始 candidate，不影响主流程
     """
 
-    def __init__(self, cache_dir: Optional[str] = None) -> None:
+    def __init__(
+        self, cache_dir: Optional[str] = None, content_cache_path: Optional[str] = None
+    ) -> None:
         """初始化 PDF 增强器。
 
         Args:
             cache_dir: PDF 缓存目录，默认使用 /tmp/arxiv_pdf_cache
+            content_cache_path: 解析结果缓存库路径，默认读取 PDF_CONTENT_CACHE_PATH
         """
         # 使用本地缓存目录，避免重复下载同一篇论文
         self.cache_dir = Path(cache_dir or constants.ARXIV_PDF_CACHE_DIR)
         self.cache_dir.mkdir(parents=True, exist_ok=True)
+        # 共享连接池的异步下载器：并发受限、同篇合并、原子落盘
+        self.downloader = PDFDownloader(self.cache_dir)
+        self._prefetch_tasks: set[asyncio.Task] = set()
+
+        # GROBID 端点池：GROBID_URLS/GROBID_URL 配置的实例按健康度与负载路由，云端兜底
+        # 端点探测在首次查缓存/解析时异步进行，构造时不发起网络请求
+        self.grobid_pool = GrobidPool.from_env()
 
-        # 自动判定 GROBID 服务：优先环境变量，其次本地探测，最后云端兜底
-        self.grobid_url = self._resolve_grobid_url()
+        self.content_cache: Optional[PDFContentCache] = None
+        try:
+            self.content_cache = PDFContentCache(
+                Path(
+                    content_cache_path
+                    or os.getenv("PDF_CONTENT_CACHE_PATH", constants.PDF_CONTENT_CACHE_PATH)
+                ),
+                constants.PDF_CONTENT_CACHE_MAX_MB * 1024 * 1024,
+            )
+        except Exception as exc:  # noqa: BLE001
+            logger.warning("PDF解析缓存初始化失败,每次重新解析: %s", exc)
+
+        # 本地快速抽取：够用时跳过 GROBID，PDF_FAST_PATH=0 关闭
+        self.fast_path_enabled = os.getenv("PDF_FAST_PATH", "1").lower() in {
+            "1",
+            "true",
+            "yes",
+        }
+        self.fast_path_hits = 0
+        self.fast_path_fallbacks = 0
 
         logger.info(
             "PDFEnhancer 初始化完成，缓存目录: %s, GROBID服务: %s",
             self.cache_dir,
-            self.grobid_url,
+            self.grobid_pool.describe(),
         )
 
+    @property
+    def concurrency(self) -> int:
+        """同时处理的候选数，随 GROBID 端点数扩展（不低于原固定并发）"""
+
+        return max(constants.PDF_ENHANCER_MAX_CONCURRENCY, self.grobid_pool.concurrency)
+
     async def enhance_candidate(self, candidate: RawCandidate) -> RawCandidate:
         """增强单个候选项，仅处理 arXiv 来源。
 
         整体流程：
         1. 解析 URL 获取 arXiv ID
-        2. 下载 PDF（带缓存）
-        3. 解析 PDF 结构
-        4. 合并解析结果到 RawCandidate
+        2. 查解析结果缓存，命中则跳过 3-4
+        3. 下载 PDF（带缓存）
+        4. 解析 PDF 结构并写入解析结果缓存
+        5. 合并解析结果到 RawCandidate
         """
         if candidate.source != "arxiv":
             return candidate
@@ -107,15 +145,18 @@ class PDFEnhancer:
             return candidate
 
         try:
-            pdf_path = await self._download_pdf(arxiv_id)
-            if not pdf_path:
-                return candidate
+            pdf_content = await self._load_cached_content(arxiv_id)
+            if pdf_content is None:
+                pdf_path = await self._download_pdf(arxiv_id)
+                if not pdf_path:
+                    return candidate
 
-            await self._generate_arxiv_cover(arxiv_id, pdf_path, candidate)
+                await self._generate_arxiv_cover(arxiv_id, pdf_path, candidate)
 
-            pdf_content = await self._parse_pdf(pdf_path)
-            if not pdf_content:
-                return candidate
+                pdf_content = await self._parse_pdf(pdf_path)
+                if not pdf_content:
+                    return candidate
+                await self._store_content(arxiv_id, pdf_path, pdf_content)
 
             enhanced = await self._merge_pdf_content(candidate, pdf_content)
             logger.info("PDF 增强成功: %s (%s)", candidate.title[:80], arxiv_id)
@@ -131,8 +172,9 @@ class PDFEnhancer:
         if not candidates:
             return []
 
-        concurrency = max(1, constants.PDF_ENHANCER_MAX_CONCURRENCY)
-        semaphore = asyncio.Semaphore(concurrency)
+        # 下载与解析重叠：先把未命中解析缓存的 PDF 全部排队下载
+        self.prefetch(candidates)
+        semaphore = asyncio.Semaphore(max(1, self.concurrency))
         results: List[Optional[RawCandidate]] = [None] * len(candidates)
 
         async def _enhance_with_lock(index: int, candidate: RawCandidate) -> None:
@@ -146,115 +188,169 @@ class PDFEnhancer:
         for task in asyncio.as_completed(tasks):
             await task
 
+        self.log_summary()
+
         # 并发执行后保持输入顺序，与调用方解耦
         return [
             item if item is not None else candidates[idx]
             for idx, item in enumerate(results)
         ]
 
-    async def _download_pdf(self, arxiv_id: str) -> Optional[Path]:
-        """下载 arXiv PDF（带缓存）。"""
-
-        pdf_path = self.cache_dir / f"{arxiv_id}.pdf"
-
-        if pdf_path.exists():
-            logger.debug("命中 PDF 缓存: %s", arxiv_id)
-            return pdf_path
+    def prefetch(self, candidates: List[RawCandidate]) -> None:
+        """后台预取候选的 PDF（跳过已有解析缓存的论文），不等待下载完成"""
 
-        sdk_success = await self._download_via_arxiv_sdk(arxiv_id, pdf_path)
-        if not sdk_success:
-            http_success = await self._download_via_http(arxiv_id, pdf_path)
-            if not http_success:
-                return None
+        arxiv_ids = [
+            arxiv_id
+            for candidate in candidates
+            if candidate.source == "arxiv"
+            and (
+                arxiv_id := self._extract_arxiv_id(
+                    candidate.url or candidate.paper_url or ""
+                )
+            )
+        ]
+        if not arxiv_ids:
+            return
+        task = asyncio.create_task(self._prefetch_uncached(arxiv_ids))
+        self._prefetch_tasks.add(task)
+        task.add_done_callback(self._prefetch_tasks.discard)
+
+    async def _prefetch_uncached(self, arxiv_ids: List[str]) -> None:
+        if self.content_cache:
+            try:
+                cached = await self.content_cache.cached_ids(
+                    arxiv_ids, await self._parser_versions()
+                )
+            except Exception as exc:  # noqa: BLE001
+                logger.debug("预取时查询解析缓存失败: %s", exc)
+                cached = set()
+            arxiv_ids = [arxiv_id for arxiv_id in arxiv_ids if arxiv_id not in cached]
+        self.downloader.prefetch(arxiv_ids)
+
+    async def aclose(self) -> None:
+        """取消未完成的预取与下载（连接池由 close_http_clients 统一关闭）"""
+
+        for task in list(self._prefetch_tasks):
+            task.cancel()
+        await self.downloader.aclose()
+
+    def log_summary(self) -> None:
+        """输出 PDF 下载、GROBID 端点与解析缓存统计"""
+
+        if self.downloader.downloaded or self.downloader.failed:
+            logger.info(
+                "PDF下载: 成功%d篇, 失败%d篇",
+                self.downloader.downloaded,
+                self.downloader.failed,
+            )
+        self.grobid_pool.log_summary()
+        if self.content_cache:
+            self.content_cache.log_stats()
+        if self.fast_path_hits or self.fast_path_fallbacks:
+            logger.info(
+                "PDF快速抽取: 直接使用%d篇, 章节不足回退GROBID%d篇",
+                self.fast_path_hits,
+                self.fast_path_fallbacks,
+            )
 
-        if not pdf_path.exists() or pdf_path.stat().st_size == 0:
-            logger.warning("PDF 文件异常（空文件）: %s", arxiv_id)
-            if pdf_path.exists():
-                pdf_path.unlink(missing_ok=True)
-            return None
+    async def _parser_versions(self) -> set[str]:
+        """当前可接受的解析器版本（缓存命中条件），首次调用时等待 GROBID 端点探测"""
 
-        return pdf_path
+        await self.grobid_pool.probe()
+        versions = set(self.grobid_pool.known_versions)
+        if self.fast_path_enabled:
+            versions.add(constants.PDF_FAST_EXTRACTOR_VERSION)
+        return versions
 
-    async def _download_via_arxiv_sdk(self, arxiv_id: str, pdf_path: Path) -> bool:
-        """通过官方 arxiv SDK 下载 PDF。"""
+    async def _load_cached_content(self, arxiv_id: str) -> Optional[PDFContent]:
+        """查解析结果缓存：本地已有 PDF 时按内容哈希匹配，否则取最近一次结果"""
 
+        if not self.content_cache:
+            return None
+        pdf_path = self.cache_dir / f"{arxiv_id}.pdf"
         try:
-            search = arxiv.Search(id_list=[arxiv_id])
-            paper = next(search.results())
-        except StopIteration:
-            logger.warning("未找到对应 arXiv 论文: %s", arxiv_id)
-            return False
+            pdf_sha256 = (
+                await asyncio.to_thread(hash_pdf, pdf_path) if pdf_path.exists() else None
+            )
+            content = await self.content_cache.get(
+                arxiv_id, pdf_sha256, await self._parser_versions()
+            )
         except Exception as exc:  # noqa: BLE001
-            logger.warning("arXiv API 查询失败 (%s): %s", arxiv_id, exc)
-            return False
+            logger.warning("读取PDF解析缓存失败 (%s): %s", arxiv_id, exc)
+            return None
+        if content is not None:
+            logger.debug("命中 PDF 解析缓存: %s", arxiv_id)
+        return content
 
+    async def _store_content(
+        self, arxiv_id: str, pdf_path: Path, pdf_content: PDFContent
+    ) -> None:
+        if not self.content_cache or not pdf_content.grobid_version:
+            return
         try:
-            await asyncio.to_thread(
-                paper.download_pdf,
-                dirpath=str(self.cache_dir),
-                filename=f"{arxiv_id}.pdf",
+            pdf_sha256 = await asyncio.to_thread(hash_pdf, pdf_path)
+            await self.content_cache.put(
+                arxiv_id, pdf_sha256, pdf_content.grobid_version, pdf_content
             )
         except Exception as exc:  # noqa: BLE001
-            logger.warning("arXiv导出PDF失败，准备走HTTP兜底 (%s): %s", arxiv_id, exc)
-            return False
-
-        logger.info("PDF 下载成功 (export.arxiv.org): %s", arxiv_id)
-        return True
-
-    async def _download_via_http(self, arxiv_id: str, pdf_path: Path) -> bool:
-        """使用 HTTP 直连下载 PDF，解决 export 延迟导致的404。"""
-
-        success = await asyncio.to_thread(self._stream_pdf_to_file, arxiv_id, pdf_path)
-        if success:
-            logger.info("PDF 直连下载成功: %s", arxiv_id)
-        else:
-            logger.error("PDF 直连下载失败: %s", arxiv_id)
-        return success
-
-    def _stream_pdf_to_file(self, arxiv_id: str, pdf_path: Path) -> bool:
-        """串流写入 PDF 文件（同步函数，供线程池调用）。"""
-
-        pdf_path.parent.mkdir(parents=True, exist_ok=True)
-        # 逐步尝试 export → 主站直连，并在 404 场景下等待再试，缓解 PDF 尚未同步的问题
-        for attempt in range(1, constants.ARXIV_PDF_HTTP_MAX_RETRIES + 1):
-            for base_url in (
-                constants.ARXIV_PDF_EXPORT_BASE,
-                constants.ARXIV_PDF_PRIMARY_BASE,
-            ):
-                pdf_url = f"{base_url.rstrip('/')}/{arxiv_id}.pdf"
-                try:
-                    with httpx.stream(
-                        "GET",
-                        pdf_url,
-                        timeout=constants.ARXIV_PDF_TIMEOUT_SECONDS,
-                        follow_redirects=True,
-                    ) as response:
-                        response.raise_for_status()
-                        with pdf_path.open("wb") as file_obj:
-                            for chunk in response.iter_bytes(
-                                constants.PDF_DOWNLOAD_CHUNK_SIZE
-                            ):
-                                file_obj.write(chunk)
-                    return True
-                except httpx.HTTPStatusError as exc:
-                    logger.debug("PDF直连状态异常(%s): %s", pdf_url, exc)
-                    if exc.response.status_code == 404:
-                        continue
-                except httpx.RequestError as exc:
-                    logger.debug("PDF直连请求失败(%s): %s", pdf_url, exc)
-            time.sleep(constants.ARXIV_PDF_HTTP_RETRY_DELAY_SECONDS)
-        return False
+            logger.warning("写入PDF解析缓存失败 (%s): %s", arxiv_id, exc)
+
+    async def _download_pdf(self, arxiv_id: str) -> Optional[Path]:
+        """下载 arXiv PDF（带缓存），预取中的同一篇论文直接等待其结果。"""
+
+        return await self.downloader.fetch(arxiv_id)
 
     async def _parse_pdf(self, pdf_path: Path) -> Optional[PDFContent]:
-        """使用 scipdf_parser 解析 PDF（带 GROBID 重试与自动切换）。"""
+        """解析 PDF：先本地快速抽取，核心章节不足时回退 GROBID（带重试与端点路由）。"""
+
+        if self.fast_path_enabled:
+            article_dict = await asyncio.to_thread(extract_article, pdf_path)
+            if article_dict:
+                content = self._build_pdf_content(
+                    article_dict, constants.PDF_FAST_EXTRACTOR_VERSION
+                )
+                if self._count_p1_sections(content) >= constants.PDF_MIN_P1_SECTIONS:
+                    self.fast_path_hits += 1
+                    return content
+            self.fast_path_fallbacks += 1
+            logger.debug("快速抽取核心章节不足，回退GROBID: %s", pdf_path.name)
 
-        article_dict = await self._call_grobid_with_retry(pdf_path)
+        article_dict, grobid_version = await self._call_grobid_with_retry(pdf_path)
         if not isinstance(article_dict, dict):
             if article_dict is None:
                 return None
             logger.warning("PDF解析结果非字典类型: %s", type(article_dict))
             return None
 
+        content = self._build_pdf_content(article_dict, grobid_version)
+        # 至少提取2个P1核心章节，若不足仅警告不阻断流程
+        p1_count = self._count_p1_sections(content)
+        if p1_count < constants.PDF_MIN_P1_SECTIONS:
+            logger.warning(
+                "PDF核心章节不足: %d < %d (期望), 可能影响LLM推理",
+                p1_count,
+                constants.PDF_MIN_P1_SECTIONS,
+            )
+        return content
+
+    @staticmethod
+    def _count_p1_sections(content: PDFContent) -> int:
+        return sum(
+            1
+            for summary in (
+                content.introduction_summary,
+                content.method_summary,
+                content.evaluation_summary,
+                content.dataset_summary,
+            )
+            if summary
+        )
+
+    def _build_pdf_content(
+        self, article_dict: Dict[str, Any], parser_version: Optional[str]
+    ) -> PDFContent:
+        """将 scipdf 风格的 article_dict（GROBID 或快速抽取）转换为 PDFContent。"""
+
         sections: Dict[str, str] = {}
         raw_sections: Any = article_dict.get("sections") or []
         for section in raw_sections:
@@ -277,7 +373,8 @@ class PDFEnhancer:
             else:
                 affiliation = str(affiliation_dict).strip()
 
-            if name:
+            # 快速抽取只识别机构行，作者名为空
+            if name or affiliation:
                 authors_affiliations.append((name, affiliation))
 
         introduction_summary = self._extract_section_summary(
@@ -311,24 +408,6 @@ class PDFEnhancer:
             max_len=constants.PDF_SECTION_P2_CONFIGS[1][2],
         )
 
-        # 至少提取2个P1核心章节，若不足仅警告不阻断流程
-        p1_count = sum(
-            1
-            for summary in (
-                introduction_summary,
-                method_summary,
-                evaluation_summary,
-                dataset_summary,
-            )
-            if summary
-        )
-        if p1_count < constants.PDF_MIN_P1_SECTIONS:
-            logger.warning(
-                "PDF核心章节不足: %d < %d (期望), 可能影响LLM推理",
-                p1_count,
-                constants.PDF_MIN_P1_SECTIONS,
-            )
-
         raw_references: Any = article_dict.get("references") or []
         references = [str(ref) for ref in raw_references]
 
@@ -344,17 +423,22 @@ class PDFEnhancer:
             introduction_summary=introduction_summary,
             method_summary=method_summary,
             conclusion_summary=conclusion_summary,
+            grobid_version=parser_version,
         )
 
-    async def _call_grobid_with_retry(self, pdf_path: Path) -> Optional[Dict[str, Any]]:
-        """调用 GROBID 并在连接异常时自动重试与重选服务。"""
+    async def _call_grobid_with_retry(
+        self, pdf_path: Path
+    ) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+        """调用 GROBID 并在异常时重试，重试由端点池路由到当前最合适的实例。
+
+        Returns:
+            (解析结果, GROBID版本)，全部重试失败时为 (None, None)
+        """
 
         last_exc: Optional[Exception] = None
         for attempt in range(1, constants.GROBID_MAX_RETRIES + 1):
             try:
-                return await asyncio.to_thread(
-                    parse_pdf_to_dict, str(pdf_path), grobid_url=self.grobid_url
-                )
+                return await self.grobid_pool.parse(pdf_path)
             except Exception as exc:  # noqa: BLE001
                 last_exc = exc
                 logger.warning(
@@ -364,26 +448,12 @@ class PDFEnhancer:
                     constants.GROBID_MAX_RETRIES,
                     exc,
                 )
-                if self._should_refresh_grobid(exc):
-                    self.grobid_url = self._resolve_grobid_url()
                 if attempt < constants.GROBID_MAX_RETRIES:
                     # 简单退避，给 HuggingFace Space 释放资源
                     await asyncio.sleep(constants.GROBID_RETRY_DELAY_SECONDS)
 
         logger.error("PDF 解析失败 (%s): %s", pdf_path.name, last_exc)
-        return None
-
-    def _should_refresh_grobid(self, exc: Exception) -> bool:
-        """判断异常是否来源于 GROBID 网络问题，如是则重新探测服务。"""
-
-        transient_errors = (
-            httpx.RequestError,
-            requests.RequestException,
-            OSError,
-        )
-        if isinstance(exc, transient_errors):
-            return True
-        return "SSL" in str(exc).upper()
+        return None, None
 
     def _extract_section_summary(
         self,
@@ -518,12 +588,24 @@ class PDFEnhancer:
             headers["Authorization"] = f"Bearer {token}"
 
         try:
-            async with httpx.AsyncClient(
-                timeout=constants.GITHUB_METADATA_TIMEOUT_SECONDS
-            ) as client:
-                response = await client.get(api_url, headers=headers)
-                response.raise_for_status()
-                data = response.json()
+            client = get_http_client(api_url)
+            cache = shared_github_cache()
+            if cache is not None:
+                # 与采集器共用ETag缓存，仓库元数据未变化时304不计额度
+                response = await cache.conditional_get(
+                    client,
+                    api_url,
+                    headers=headers,
+                    timeout=constants.GITHUB_METADATA_TIMEOUT_SECONDS,
+                )
+            else:
+                response = await client.get(
+                    api_url,
+                    headers=headers,
+                    timeout=constants.GITHUB_METADATA_TIMEOUT_SECONDS,
+                )
+            response.raise_for_status()
+            data = response.json()
         except Exception as exc:  # noqa: BLE001
             logger.debug("GitHub元数据获取失败(%s): %s", github_url, exc)
             return {}
@@ -641,36 +723,3 @@ class PDFEnhancer:
         arxiv_id = match.group(1)
         # 去掉版本号后缀 vN
         return arxiv_id.split("v")[0]
-
-    def _resolve_grobid_url(self) -> str:
-        """确定可用的 GROBID 服务地址。"""
-
-        env_url = os.getenv("GROBID_URL")
-        if env_url:
-            return env_url
-
-        if self._is_grobid_alive(constants.GROBID_LOCAL_URL):
-            return constants.GROBID_LOCAL_URL
-
-        logger.warning(
-            "未检测到本地GROBID服务，自动切换至云端: %s",
-            constants.GROBID_CLOUD_URL,
-        )
-        return constants.GROBID_CLOUD_URL
-
-    def _is_grobid_alive(self, base_url: str) -> bool:
-        """通过版本接口探测 GROBID 可用性。"""
-
-        health_url = f"{base_url.rstrip('/')}{constants.GROBID_HEALTH_PATH}"
-        try:
-            response = httpx.get(
-                health_url,
-                timeout=constants.GROBID_HEALTH_TIMEOUT,
-            )
-            response.raise_for_status()
-            return True
-        except httpx.HTTPStatusError as exc:
-            logger.debug("GROBID状态异常(%s): %s", base_url, exc)
-        except httpx.RequestError as exc:
-            logger.debug("GROBID连接失败(%s): %s", base_url, exc)
-        return False
@@ -4,18 +4,16 @@ from __future__ import annotations
 
 import asyncio
 import logging
-import os
 import subprocess
 import time
 from collections import Counter
-from datetime import datetime, timedelta, timezone
+from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, List
 
-import httpx
-
 from src.collectors import (
     ArxivCollector,
+    CollectionScheduler,
     DBEnginesCollector,
     GitHubCollector,
     HelmCollector,
@@ -24,12 +22,21 @@ from src.collectors import (
     TwitterCollector,
 )
 from src.common import constants
+from src.common.http_cache import log_http_cache_stats
+from src.common.http_clients import close_http_clients, get_http_client
+from src.common.rate_limit import log_rate_limit_stats
 from src.common.url_utils import canonicalize_url
 from src.config import Settings, get_settings
-from src.enhancer import PDFEnhancer
+from src.enhancer import PDFEnhancer, grobid_urls_from_env
 from src.models import RawCandidate, ScoredCandidate
 from src.notifier import FeishuNotifier
-from src.prefilter import prefilter_batch
+from src.pipeline import RecentUrlIndex, StreamingPipeline, merge_near_duplicates
+from src.prefilter import (
+    RelevanceGate,
+    append_relevance_labels,
+    export_rule_stats,
+    prefilter_batch,
+)
 from src.scorer import LLMScorer
 from src.storage import StorageManager
 
@@ -48,11 +55,12 @@ async def ensure_grobid_running(grobid_url: str, max_wait_seconds: int = 60) ->
     """
     # 1. 检查GROBID是否已运行
     try:
-        async with httpx.AsyncClient(timeout=3) as client:
-            resp = await client.get(f"{grobid_url}/api/isalive")
-            if resp.text.strip() == "true":
-                logger.info("✅ GROBID服务已运行: %s", grobid_url)
-                return True
+        resp = await get_http_client(grobid_url).get(
+            f"{grobid_url}/api/isalive", timeout=3
+        )
+        if resp.text.strip() == "true":
+            logger.info("✅ GROBID服务已运行: %s", grobid_url)
+            return True
     except Exception:
         logger.info("GROBID服务未运行，准备启动...")
 
@@ -111,11 +119,12 @@ async def ensure_grobid_running(grobid_url: str, max_wait_seconds: int = 60) ->
     start_time = time.time()
     while time.time() - start_time < max_wait_seconds:
         try:
-            async with httpx.AsyncClient(timeout=3) as client:
-                resp = await client.get(f"{grobid_url}/api/isalive")
-                if resp.text.strip() == "true":
-                    logger.info("✅ GROBID服务启动成功")
-                    return True
+            resp = await get_http_client(grobid_url).get(
+                f"{grobid_url}/api/isalive", timeout=3
+            )
+            if resp.text.strip() == "true":
+                logger.info("✅ GROBID服务启动成功")
+                return True
         except Exception:
             pass
         await asyncio.sleep(2)
@@ -125,6 +134,16 @@ async def ensure_grobid_running(grobid_url: str, max_wait_seconds: int = 60) ->
 
 
 async def main() -> None:
+    try:
+        await _run_pipeline()
+    finally:
+        # 共享HTTP连接池随主流程结束统一关闭
+        log_rate_limit_stats()
+        log_http_cache_stats()
+        await close_http_clients()
+
+
+async def _run_pipeline() -> None:
     settings = get_settings()
     _configure_logging(settings)
 
@@ -133,7 +152,8 @@ async def main() -> None:
     logger.info("=" * 60)
 
     # Step 0: 确保GROBID服务运行（用于PDF增强）
-    grobid_url = os.getenv("GROBID_URL", "http://localhost:8070")
+    # 多实例（GROBID_URLS）时只负责拉起第一个，其余容器由部署方管理
+    grobid_url = grobid_urls_from_env()[0]
     grobid_running = await ensure_grobid_running(
         grobid_url=grobid_url,
         max_wait_seconds=60,
@@ -145,25 +165,24 @@ async def main() -> None:
 
     # Step 1: 数据采集
     logger.info("[1/8] 数据采集...")
-    collectors = [
-        ArxivCollector(settings=settings),
-        # SemanticScholarCollector(),  # 暂时禁用：无API密钥
-        HelmCollector(settings=settings),
-        GitHubCollector(settings=settings),
-        HuggingFaceCollector(settings=settings),
-        TechEmpowerCollector(settings=settings),
-        DBEnginesCollector(settings=settings),
-        TwitterCollector(settings=settings),
-    ]
+    collectors = _build_collectors(settings)
+    if settings.pipeline_mode == "streaming":
+        if settings.openai.scoring_backend == "batch":
+            logger.warning("流式模式逐条评分，LLM_SCORING_BACKEND=batch 不生效，使用实时接口")
+        await _run_streaming(settings, collectors)
+    else:
+        await _run_batch(settings, collectors)
+    # 本次结果已入库或被过滤后才推进采集器的增量水位，运行中途失败时下次重新采集
+    await _commit_collector_state(collectors)
 
-    all_candidates: List[RawCandidate] = []
-    for collector in collectors:
-        try:
-            candidates = await collector.collect()
-            all_candidates.extend(candidates)
-            logger.info("  ✓ %s: %d条", collector.__class__.__name__, len(candidates))
-        except Exception as exc:  # noqa: BLE001
-            logger.error("  ✗ %s失败: %s", collector.__class__.__name__, exc)
+
+async def _run_batch(settings: Settings, collectors: List[tuple[str, Any]]) -> None:
+    """批量模式：全部采集完成后逐阶段去重→预筛→增强→评分→入库→通知"""
+
+    # 所有采集器并发启动，按 sources.yaml 的 deadline_seconds 独立截止
+    scheduler = CollectionScheduler(collectors, settings=settings)
+    collection_report = await scheduler.run()
+    all_candidates: List[RawCandidate] = collection_report.candidates
 
     logger.info("采集完成: 共%d条候选\n", len(all_candidates))
     if not all_candidates:
@@ -191,30 +210,12 @@ async def main() -> None:
     now = datetime.now()
     existing_records: list[dict[str, Any]] = await storage.read_existing_records()
     # 按来源应用不同的去重窗口
-    recent_urls_by_source: dict[str, set[str]] = {}
-    for record in existing_records:
-        # P12: 优先使用记录创建时间，兼容旧数据退回到发布时间
-        dedup_time = record.get("created_at") or record.get("publish_date")
-        url_value = record.get("url")
-        source_value = record.get("source", "default")
-        url_key = canonicalize_url(url_value)
-        if not isinstance(dedup_time, datetime) or not url_key:
-            continue
-        window_days = constants.DEDUP_LOOKBACK_DAYS_BY_SOURCE.get(
-            source_value, constants.DEDUP_LOOKBACK_DAYS_BY_SOURCE["default"]
-        )
-        if dedup_time >= now - timedelta(days=window_days):
-            recent_urls_by_source.setdefault(source_value, set()).add(url_key)
+    recent_index = RecentUrlIndex.from_records(existing_records, now=now)
 
     deduplicated: List[RawCandidate] = []
     duplicate_count = 0
     for c in internal_deduplicated:
-        window_days = constants.DEDUP_LOOKBACK_DAYS_BY_SOURCE.get(
-            c.source, constants.DEDUP_LOOKBACK_DAYS_BY_SOURCE["default"]
-        )
-        recent_urls = recent_urls_by_source.get(c.source, set())
-        url_key = canonicalize_url(c.url)
-        if url_key and url_key in recent_urls:
+        if recent_index.contains(c):
             duplicate_count += 1
             continue
         deduplicated.append(c)
@@ -247,19 +248,46 @@ async def main() -> None:
         logger.warning("去重后无新候选,流程终止")
         return
 
+    # Step 1.6: 跨来源近似重复合并（同一Benchmark的论文/仓库/数据集只评分一次）
+    logger.info("[1.6/8] 近似重复合并...")
+    deduplicated, near_dup_report = merge_near_duplicates(deduplicated)
+    logger.info(
+        "近似重复合并完成: %d条 → %d条 (簇%d个, 合并%d条, 节省LLM调用%d次)\n",
+        near_dup_report.input_count,
+        near_dup_report.output_count,
+        near_dup_report.clusters,
+        near_dup_report.merged,
+        near_dup_report.llm_calls_saved,
+    )
+
     # Step 2: 规则预筛选
     logger.info("[2/8] 规则预筛选...")
     filtered = prefilter_batch(deduplicated)
+    export_rule_stats(settings.logging.directory / constants.PREFILTER_RULE_STATS_FILE)
     filter_rate = 100 * (1 - len(filtered) / len(deduplicated)) if deduplicated else 0
     logger.info("预筛选完成: 保留%d条 (过滤率%.1f%%)\n", len(filtered), filter_rate)
     if not filtered:
         logger.warning("预筛选后无候选,流程终止")
         return
 
+    # Step 2.5: 相关性模型预筛（模型文件不存在时透传）
+    relevance_gate = RelevanceGate.from_path(settings.relevance_model_path)
+    if relevance_gate.enabled:
+        logger.info("[2.5/8] 相关性模型预筛...")
+        filtered = relevance_gate.filter_batch(filtered)
+        relevance_gate.log_summary()
+        logger.info("模型预筛完成: 保留%d条\n", len(filtered))
+        if not filtered:
+            logger.warning("模型预筛后无候选,流程终止")
+            return
+
     # Step 3: PDF 内容增强（仅对通过预筛选的候选进行深度解析）
     logger.info("[3/8] PDF内容增强...")
     pdf_enhancer = PDFEnhancer()
-    enhanced_candidates = await pdf_enhancer.enhance_batch(filtered)
+    try:
+        enhanced_candidates = await pdf_enhancer.enhance_batch(filtered)
+    finally:
+        await pdf_enhancer.aclose()
     arxiv_count = sum(1 for c in filtered if c.source == "arxiv")
     logger.info(
         "PDF增强完成: %d条候选 (其中arXiv %d条)\n",
@@ -268,10 +296,14 @@ async def main() -> None:
     )
 
     # Step 4: LLM评分（使用增强后的候选）
-    logger.info("[4/8] LLM评分...")
+    logger.info("[4/8] LLM评分 (后端=%s)...", settings.openai.scoring_backend)
     async with LLMScorer() as scorer:
         scored = await scorer.score_batch(enhanced_candidates)
     logger.info("评分完成: %d条\n", len(scored))
+    # 下限过滤前记录评分标签，供相关性模型离线训练（含负样本）
+    append_relevance_labels(
+        scored, settings.logging.directory / constants.RELEVANCE_LABELS_FILE
+    )
 
     # Step 4.5: 论文/权威源兜底打分（最新且相关不因无GitHub被重罚）
     logger.info("[4.5/8] 权威源分数兜底...")
@@ -302,6 +334,7 @@ async def main() -> None:
     actually_saved = await storage.save(qualified)  # 获取实际写入的记录（去重后）
     await storage.sync_from_sqlite()
     await storage.cleanup()
+    storage.log_snapshot_stats()
     logger.info("存储完成: 新增%d条\n", len(actually_saved))
 
     # Step 7: 飞书通知（仅通知新增记录，避免重复推送）
@@ -331,7 +364,14 @@ async def main() -> None:
     logger.info("BenchScope Phase 2 完成")
     logger.info("  采集: %d条", len(all_candidates))
     logger.info(
-        "  去重(Step1.5): %d条新发现 (过滤%d条)", len(deduplicated), duplicate_count
+        "  去重(Step1.5): %d条新发现 (过滤%d条)",
+        near_dup_report.input_count,
+        duplicate_count,
+    )
+    logger.info(
+        "  近似重复合并(Step1.6): 合并%d条, 节省LLM调用%d次",
+        near_dup_report.merged,
+        near_dup_report.llm_calls_saved,
     )
     logger.info("  预筛选: %d条", len(filtered))
     logger.info("  评分: %d条", len(scored))
@@ -351,6 +391,92 @@ async def main() -> None:
     logger.info("=" * 60)
 
 
+def _build_collectors(settings: Settings) -> List[tuple[str, Any]]:
+    """构建 (来源名, 采集器) 列表，来源名对应 sources.yaml 的调度配置"""
+
+    return [
+        ("arxiv", ArxivCollector(settings=settings)),
+        # ("semantic_scholar", SemanticScholarCollector()),  # 暂时禁用：无API密钥
+        ("helm", HelmCollector(settings=settings)),
+        ("github", GitHubCollector(settings=settings)),
+        ("huggingface", HuggingFaceCollector(settings=settings)),
+        ("techempower", TechEmpowerCollector(settings=settings)),
+        ("dbengines", DBEnginesCollector(settings=settings)),
+        ("twitter", TwitterCollector(settings=settings)),
+    ]
+
+
+async def _commit_collector_state(collectors: List[tuple[str, Any]]) -> None:
+    """保存支持增量采集的采集器水位（暴露 commit_state 的采集器）"""
+
+    for _name, collector in collectors:
+        commit_state = getattr(collector, "commit_state", None)
+        if commit_state is not None:
+            await commit_state()
+
+
+async def _run_streaming(settings: Settings, collectors: List[tuple[str, Any]]) -> None:
+    """流式模式：候选逐条流经去重→预筛→增强→评分→入库，最后统一通知"""
+
+    logger.info("流水线模式: streaming (阶段间有界队列, 无全量屏障)")
+    storage = StorageManager()
+    enhancer = PDFEnhancer()
+    async with LLMScorer() as scorer:
+        pipeline = StreamingPipeline(
+            collectors,
+            settings=settings,
+            storage=storage,
+            enhancer=enhancer,
+            scorer=scorer,
+            finalize=_finalize_scored,
+        )
+        try:
+            result = await pipeline.run()
+        finally:
+            await enhancer.aclose()
+    enhancer.log_summary()
+    export_rule_stats(settings.logging.directory / constants.PREFILTER_RULE_STATS_FILE)
+
+    await storage.sync_from_sqlite()
+    await storage.cleanup()
+    storage.log_snapshot_stats()
+
+    actually_saved = result.saved
+    notifier = FeishuNotifier(settings=settings)
+    if actually_saved:
+        await notifier.notify(actually_saved)
+        logger.info("通知完成: %d条新增候选\n", len(actually_saved))
+    else:
+        logger.info("无新增候选，跳过通知\n")
+
+    logger.info("=" * 60)
+    logger.info("BenchScope Phase 2 完成 (streaming)")
+    logger.info("  采集: %d条", result.counts["collected"])
+    logger.info(
+        "  去重(Step1.5): %d条新发现 (过滤%d条)",
+        result.counts["deduplicated"],
+        result.counts["feishu_duplicate"],
+    )
+    logger.info(
+        "  近似重复丢弃: %d条, 高优先级来源晚到补发: %d条",
+        result.counts["near_duplicate"],
+        result.counts["near_duplicate_promoted"],
+    )
+    logger.info("  预筛选: %d条", result.counts["prefiltered"])
+    logger.info("  评分: %d条", result.counts["scored"])
+    logger.info("  实际入库: %d条", len(actually_saved))
+    logger.info("=" * 60)
+
+
+def _finalize_scored(scored: List[ScoredCandidate]) -> List[ScoredCandidate]:
+    """评分后处理：权威源兜底 → 新鲜度加权 → 相关性下限 → 来源阈值"""
+
+    scored = [_apply_freshness_boost(_apply_recency_domain_floor(c)) for c in scored]
+    scored = _filter_by_relevance_floor(scored)
+    qualified, _filtered_count = _filter_by_source_threshold(scored)
+    return qualified
+
+
 def _configure_logging(settings: Settings) -> None:
     log_path = Path(settings.logging.directory) / settings.logging.file_name
     handlers = [
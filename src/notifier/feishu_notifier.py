@@ -11,10 +11,9 @@ import time
 from datetime import datetime, timezone
 from typing import List, Optional
 
-import httpx
-
 from src.common import constants
 from src.common.datetime_utils import calculate_age_days
+from src.common.http_clients import get_http_client
 from src.common.url_utils import canonicalize_url
 from src.config import Settings, get_settings
 from src.models import ScoredCandidate
@@ -925,16 +924,18 @@ class FeishuNotifier:
         if not self.webhook_url:
             raise RuntimeError("未配置飞书Webhook URL，无法发送通知")
 
-        async with httpx.AsyncClient(timeout=constants.HTTP_CLIENT_TIMEOUT) as client:
-            resp = await client.post(self.webhook_url, json=payload)
-            resp.raise_for_status()
-            data = resp.json()
-            if data.get("code") != 0:
-                raise RuntimeError(f"飞书Webhook返回错误: {data}")
-            if payload.get("msg_type") == "interactive":
-                logger.info("✅ 飞书卡片推送成功")
-            else:
-                logger.info("✅ 飞书文本推送成功")
+        client = get_http_client(self.webhook_url)
+        resp = await client.post(
+            self.webhook_url, json=payload, timeout=constants.HTTP_CLIENT_TIMEOUT
+        )
+        resp.raise_for_status()
+        data = resp.json()
+        if data.get("code") != 0:
+            raise RuntimeError(f"飞书Webhook返回错误: {data}")
+        if payload.get("msg_type") == "interactive":
+            logger.info("✅ 飞书卡片推送成功")
+        else:
+            logger.info("✅ 飞书文本推送成功")
 
     def _generate_signature(self, timestamp: int, secret: str) -> str:
         """生成飞书Webhook签名
@@ -0,0 +1,18 @@
+"""流水线模块导出"""
+
+from src.pipeline.dedup import RecentUrlIndex
+from src.pipeline.near_dedup import (
+    NearDuplicateIndex,
+    NearDuplicateReport,
+    merge_near_duplicates,
+)
+from src.pipeline.streaming import StreamingPipeline, StreamingResult
+
+__all__ = [
+    "NearDuplicateIndex",
+    "NearDuplicateReport",
+    "RecentUrlIndex",
+    "StreamingPipeline",
+    "StreamingResult",
+    "merge_near_duplicates",
+]
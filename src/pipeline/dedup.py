@@ -0,0 +1,48 @@
+"""与飞书历史记录的时间窗URL去重"""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+from typing import Any, Iterable, Optional
+
+from src.common import constants
+from src.common.url_utils import canonicalize_url
+from src.models import RawCandidate
+
+
+def _window_days(source: str) -> int:
+    return constants.DEDUP_LOOKBACK_DAYS_BY_SOURCE.get(
+        source, constants.DEDUP_LOOKBACK_DAYS_BY_SOURCE["default"]
+    )
+
+
+class RecentUrlIndex:
+    """按来源保存去重窗口内的已存在URL（规范化后）"""
+
+    def __init__(self) -> None:
+        self.urls_by_source: dict[str, set[str]] = {}
+
+    @classmethod
+    def from_records(
+        cls, records: Iterable[dict[str, Any]], now: Optional[datetime] = None
+    ) -> "RecentUrlIndex":
+        """从 read_existing_records() 的结果构建索引"""
+
+        index = cls()
+        now = now or datetime.now()
+        for record in records:
+            # P12: 优先使用记录创建时间，兼容旧数据退回到发布时间
+            dedup_time = record.get("created_at") or record.get("publish_date")
+            source_value = record.get("source", "default")
+            url_key = canonicalize_url(record.get("url"))
+            if not isinstance(dedup_time, datetime) or not url_key:
+                continue
+            if dedup_time >= now - timedelta(days=_window_days(source_value)):
+                index.urls_by_source.setdefault(source_value, set()).add(url_key)
+        return index
+
+    def contains(self, candidate: RawCandidate) -> bool:
+        url_key = canonicalize_url(candidate.url)
+        return bool(url_key) and url_key in self.urls_by_source.get(
+            candidate.source, set()
+        )
@@ -0,0 +1,286 @@
+"""跨来源近似重复检测与合并
+
+同一Benchmark常同时以 arXiv论文、GitHub仓库、HF数据集 出现，URL去重无法识别。
+这里用三类信号聚类，并将每个簇合并为一个信息更完整的 RawCandidate：
+1. 链接键：url/github_url/paper_url 以及HF tags中的 arxiv:ID
+2. 名称键：论文标题冒号前的短名 与 仓库/数据集名 归一化后相同
+3. 标题MinHash：字符shingle的MinHash + LSH分桶，估计Jaccard达到阈值
+"""
+
+from __future__ import annotations
+
+import logging
+import random
+import re
+import zlib
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from src.common import constants
+from src.common.url_utils import canonicalize_url
+from src.models import RawCandidate
+
+logger = logging.getLogger(__name__)
+
+_ARXIV_ID_RE = re.compile(r"arxiv\.org/(?:abs|pdf)/(\d{4}\.\d{4,5})", re.IGNORECASE)
+_ARXIV_TAG_RE = re.compile(r"arxiv:(\d{4}\.\d{4,5})", re.IGNORECASE)
+_GITHUB_RE = re.compile(r"github\.com/([\w.-]+)/([\w.-]+)", re.IGNORECASE)
+_HF_DATASET_RE = re.compile(
+    r"huggingface\.co/datasets/([\w.-]+(?:/[\w.-]+)?)", re.IGNORECASE
+)
+_NON_ALNUM_RE = re.compile(r"[^0-9a-z]+")
+_MERSENNE_PRIME = (1 << 61) - 1
+
+
+@dataclass(slots=True)
+class NearDuplicateReport:
+    """近似重复合并统计"""
+
+    input_count: int = 0
+    output_count: int = 0
+    clusters: int = 0  # 含2条及以上候选的簇数
+    merged: int = 0  # 被并入其他候选而移除的条数
+
+    @property
+    def llm_calls_saved(self) -> int:
+        """每条被合并的候选原本都要单独调用一次LLM评分"""
+
+        return self.merged
+
+
+def _link_keys(candidate: RawCandidate) -> set[str]:
+    """提取可跨来源比对的链接键
+
+    dataset_url 多为README/摘要中引用的第三方数据集（如HumanEval），
+    不代表候选本身，不参与聚类，避免把引用同一数据集的不同项目误合并。
+    """
+
+    keys: set[str] = set()
+    urls = [candidate.url, candidate.github_url, candidate.paper_url]
+    for url in urls:
+        if not url:
+            continue
+        for match in _ARXIV_ID_RE.finditer(url):
+            keys.add(f"arxiv:{match.group(1)}")
+        for match in _GITHUB_RE.finditer(url):
+            repo = match.group(2).removesuffix(".git")
+            keys.add(f"github:{match.group(1).lower()}/{repo.lower()}")
+        for match in _HF_DATASET_RE.finditer(url):
+            keys.add(f"hf:{match.group(1).lower()}")
+        if not any(k in url for k in ("arxiv.org", "github.com", "huggingface.co")):
+            url_key = canonicalize_url(url)
+            if url_key:
+                keys.add(f"url:{url_key}")
+
+    arxiv_id = (candidate.raw_metadata or {}).get("arxiv_id")
+    if arxiv_id:
+        keys.add(f"arxiv:{arxiv_id}")
+    # HF数据集tags常带 arxiv:2310.06770，直接关联到论文
+    tags = (candidate.raw_metadata or {}).get("tags", "")
+    for match in _ARXIV_TAG_RE.finditer(tags):
+        keys.add(f"arxiv:{match.group(1)}")
+    return keys
+
+
+def _name_key(candidate: RawCandidate) -> Optional[str]:
+    """提取Benchmark短名：仓库/数据集名，或论文标题冒号前的前缀"""
+
+    title = (candidate.title or "").strip()
+    if candidate.source in {"github", "huggingface"} and "/" in title:
+        name = title.rsplit("/", 1)[-1]
+    elif ":" in title:
+        name = title.split(":", 1)[0]
+        if len(name.split()) > 3:
+            return None
+    else:
+        return None
+
+    key = _NON_ALNUM_RE.sub("", name.lower())
+    if len(key) < constants.NEAR_DUP_MIN_NAME_KEY_LEN:
+        return None
+    if key in constants.NEAR_DUP_GENERIC_NAMES:
+        return None
+    return key
+
+
+def _normalize_title(title: str) -> str:
+    return " ".join(_NON_ALNUM_RE.sub(" ", (title or "").lower()).split())
+
+
+class _MinHasher:
+    """字符shingle MinHash，使用固定种子保证同一进程内签名可比"""
+
+    def __init__(self, num_perm: int, shingle_size: int) -> None:
+        rng = random.Random(20240601)
+        self.shingle_size = shingle_size
+        self.params = [
+            (rng.randrange(1, _MERSENNE_PRIME), rng.randrange(0, _MERSENNE_PRIME))
+            for _ in range(num_perm)
+        ]
+
+    def signature(self, text: str) -> Optional[Tuple[int, ...]]:
+        size = self.shingle_size
+        if len(text) < size:
+            return None
+        hashes = {
+            zlib.crc32(text[i : i + size].encode("utf-8"))
+            for i in range(len(text) - size + 1)
+        }
+        return tuple(
+            min((a * h + b) % _MERSENNE_PRIME for h in hashes) for a, b in self.params
+        )
+
+
+class NearDuplicateIndex:
+    """可增量添加的近似重复索引，批量合并与流式过滤共用"""
+
+    def __init__(self) -> None:
+        self.hasher = _MinHasher(
+            constants.NEAR_DUP_NUM_PERM, constants.NEAR_DUP_SHINGLE_SIZE
+        )
+        self.bands = constants.NEAR_DUP_BANDS
+        self.rows = constants.NEAR_DUP_NUM_PERM // constants.NEAR_DUP_BANDS
+        self.threshold = constants.NEAR_DUP_TITLE_THRESHOLD
+        self._keys: Dict[str, set[int]] = {}
+        self._buckets: Dict[Tuple[int, Tuple[int, ...]], set[int]] = {}
+        self._signatures: Dict[int, Tuple[int, ...]] = {}
+
+    def _band_keys(self, signature: Tuple[int, ...]) -> Iterable[Tuple[int, Tuple[int, ...]]]:
+        for band in range(self.bands):
+            start = band * self.rows
+            yield band, signature[start : start + self.rows]
+
+    def _signals(
+        self, candidate: RawCandidate
+    ) -> Tuple[set[str], Optional[Tuple[int, ...]]]:
+        keys = _link_keys(candidate)
+        name = _name_key(candidate)
+        if name:
+            keys.add(f"name:{name}")
+        return keys, self.hasher.signature(_normalize_title(candidate.title))
+
+    def add(self, item_id: int, candidate: RawCandidate) -> set[int]:
+        """加入候选并返回与之近似重复的已有条目ID"""
+
+        keys, signature = self._signals(candidate)
+        matches: set[int] = set()
+        for key in keys:
+            matches.update(self._keys.get(key, ()))
+
+        if signature is not None:
+            nearby: set[int] = set()
+            for band_key in self._band_keys(signature):
+                nearby.update(self._buckets.get(band_key, ()))
+            for other in nearby - matches:
+                other_sig = self._signatures[other]
+                same = sum(1 for x, y in zip(signature, other_sig) if x == y)
+                if same / len(signature) >= self.threshold:
+                    matches.add(other)
+            self._signatures[item_id] = signature
+            for band_key in self._band_keys(signature):
+                self._buckets.setdefault(band_key, set()).add(item_id)
+
+        for key in keys:
+            self._keys.setdefault(key, set()).add(item_id)
+        return matches
+
+
+def source_priority(candidate: RawCandidate) -> int:
+    """来源优先级，数值越小越适合作为簇的主条目（arXiv最高，可做PDF增强）"""
+
+    order = constants.NEAR_DUP_SOURCE_PRIORITY
+    return order.index(candidate.source) if candidate.source in order else len(order)
+
+
+def merge_into(primary: RawCandidate, others: Sequence[RawCandidate]) -> RawCandidate:
+    """把 others 的链接与元数据补到 primary 上（原地修改并返回 primary）"""
+
+    for other in others:
+        if not primary.github_url and other.github_url:
+            primary.github_url = other.github_url
+        if other.github_stars is not None:
+            primary.github_stars = max(primary.github_stars or 0, other.github_stars)
+        if not primary.paper_url and other.paper_url:
+            primary.paper_url = other.paper_url
+        if not primary.dataset_url and other.dataset_url:
+            primary.dataset_url = other.dataset_url
+        if not primary.license_type and other.license_type:
+            primary.license_type = other.license_type
+        if not primary.task_type and other.task_type:
+            primary.task_type = other.task_type
+        if not primary.abstract and other.abstract:
+            primary.abstract = other.abstract
+        for attr in (
+            "raw_metrics",
+            "raw_baselines",
+            "evaluation_metrics",
+            "raw_dataset_size",
+            "raw_authors",
+            "raw_institutions",
+        ):
+            if not getattr(primary, attr) and getattr(other, attr):
+                setattr(primary, attr, getattr(other, attr))
+
+    primary.raw_metadata = dict(primary.raw_metadata or {})
+    merged_from = [
+        item for item in primary.raw_metadata.get("merged_from", "").split(",") if item
+    ]
+    merged_from.extend(f"{c.source}:{c.url}" for c in others)
+    primary.raw_metadata["merged_from"] = ",".join(merged_from)
+    return primary
+
+
+def _merge_cluster(members: Sequence[RawCandidate]) -> RawCandidate:
+    """以优先级最高的来源为主，补齐其余成员的链接与元数据"""
+
+    ordered = sorted(members, key=source_priority)
+    return merge_into(ordered[0], ordered[1:])
+
+
+def merge_near_duplicates(
+    candidates: List[RawCandidate],
+) -> Tuple[List[RawCandidate], NearDuplicateReport]:
+    """聚类并合并近似重复候选，输出保持各簇首次出现的顺序"""
+
+    report = NearDuplicateReport(input_count=len(candidates))
+    if not constants.NEAR_DUP_ENABLED or len(candidates) < 2:
+        report.output_count = len(candidates)
+        return list(candidates), report
+
+    parent = list(range(len(candidates)))
+
+    def find(x: int) -> int:
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]
+            x = parent[x]
+        return x
+
+    index = NearDuplicateIndex()
+    for idx, candidate in enumerate(candidates):
+        for other in index.add(idx, candidate):
+            root_a, root_b = find(idx), find(other)
+            if root_a != root_b:
+                parent[max(root_a, root_b)] = min(root_a, root_b)
+
+    clusters: Dict[int, List[int]] = {}
+    for idx in range(len(candidates)):
+        clusters.setdefault(find(idx), []).append(idx)
+
+    merged: List[RawCandidate] = []
+    for root in sorted(clusters):
+        members = [candidates[i] for i in clusters[root]]
+        if len(members) == 1:
+            merged.append(members[0])
+            continue
+        report.clusters += 1
+        report.merged += len(members) - 1
+        result = _merge_cluster(members)
+        logger.debug(
+            "近似重复合并: %s ← %s",
+            result.title[:60],
+            result.raw_metadata.get("merged_from", ""),
+        )
+        merged.append(result)
+
+    report.output_count = len(merged)
+    return merged, report
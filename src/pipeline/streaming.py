@@ -0,0 +1,308 @@
+"""流式流水线：候选一经采集即流经 去重→预筛→PDF增强→评分→入库
+
+批量模式下每个阶段都是全量屏障，快速来源（HELM/DB-Engines）要等最慢的采集器结束。
+流式模式用有界队列串联各阶段，队列满时上游阻塞形成背压，端到端延迟接近单条最慢链路。
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, List, Optional, Sequence, Tuple
+
+from src.collectors.scheduler import (
+    CollectionReport,
+    CollectionScheduler,
+    Collector,
+    CollectorRun,
+)
+from src.common import constants
+from src.common.url_utils import canonicalize_url
+from src.config import Settings
+from src.enhancer import PDFEnhancer
+from src.models import RawCandidate, ScoredCandidate
+from src.pipeline.dedup import RecentUrlIndex
+from src.pipeline.near_dedup import NearDuplicateIndex, merge_into, source_priority
+from src.prefilter import RelevanceGate, append_relevance_labels, prefilter
+from src.scorer import LLMScorer
+from src.storage import StorageManager
+
+logger = logging.getLogger(__name__)
+
+# 队列结束标记：上游阶段全部完成后放入
+_DONE: Any = object()
+
+FinalizeHook = Callable[[List[ScoredCandidate]], List[ScoredCandidate]]
+
+
+@dataclass(slots=True)
+class StreamingResult:
+    """流式运行汇总，字段与批量模式的收尾统计一一对应"""
+
+    collection: Optional[CollectionReport] = None
+    counts: Counter[str] = field(default_factory=Counter)
+    saved: List[ScoredCandidate] = field(default_factory=list)
+    first_saved_after: Optional[float] = None  # 首条入库距启动的秒数
+    wall_time: float = 0.0
+
+
+class StreamingPipeline:
+    """基于有界 asyncio.Queue 的逐条流水线
+
+    Args:
+        collectors: (来源名, 采集器) 列表，交给 CollectionScheduler 并发执行
+        settings: 全局配置
+        storage: 存储管理器（去重读取与写入）
+        enhancer: PDF增强器
+        scorer: 已进入上下文的 LLMScorer
+        finalize: 评分后处理（分数兜底/新鲜度/相关性与来源阈值），返回可入库候选
+    """
+
+    def __init__(
+        self,
+        collectors: Sequence[Tuple[str, Collector]],
+        settings: Settings,
+        storage: StorageManager,
+        enhancer: PDFEnhancer,
+        scorer: LLMScorer,
+        finalize: FinalizeHook,
+    ) -> None:
+        self.collectors = list(collectors)
+        self.settings = settings
+        self.storage = storage
+        self.enhancer = enhancer
+        self.scorer = scorer
+        self.finalize = finalize
+        self.queue_size = constants.STREAMING_QUEUE_MAXSIZE
+        self.store_batch_size = constants.STREAMING_STORE_BATCH_SIZE
+        self.result = StreamingResult()
+        self._started_at = 0.0
+
+    async def run(self) -> StreamingResult:
+        self._started_at = time.perf_counter()
+        raw_q: asyncio.Queue = asyncio.Queue(maxsize=self.queue_size)
+        enhance_q: asyncio.Queue = asyncio.Queue(maxsize=self.queue_size)
+        score_q: asyncio.Queue = asyncio.Queue(maxsize=self.queue_size)
+        store_q: asyncio.Queue = asyncio.Queue(maxsize=self.queue_size)
+
+        # 飞书历史记录与采集并行读取，去重阶段首次使用时再等待
+        existing_task = asyncio.create_task(self.storage.read_existing_records())
+        filter_stage = _FilterStage(
+            existing_task,
+            self.result.counts,
+            RelevanceGate.from_path(self.settings.relevance_model_path),
+        )
+
+        async def emit(run: CollectorRun) -> None:
+            for candidate in run.candidates:
+                self.result.counts["collected"] += 1
+                await raw_q.put(candidate)
+
+        async def collect() -> None:
+            scheduler = CollectionScheduler(
+                self.collectors, settings=self.settings, on_result=emit
+            )
+            try:
+                self.result.collection = await scheduler.run()
+            finally:
+                await raw_q.put(_DONE)
+
+        async def filter_and_prefetch(candidate: RawCandidate) -> Optional[RawCandidate]:
+            kept = await filter_stage.handle(candidate)
+            if kept is not None:
+                # 通过预筛即开始下载PDF，与排在前面的候选的解析重叠
+                self.enhancer.prefetch([kept])
+            return kept
+
+        await asyncio.gather(
+            collect(),
+            self._stage("filter", 1, raw_q, enhance_q, filter_and_prefetch),
+            self._stage(
+                "enhance",
+                max(1, self.enhancer.concurrency),
+                enhance_q,
+                score_q,
+                self._enhance,
+            ),
+            self._stage(
+                "score",
+                max(1, constants.STREAMING_SCORE_WORKERS),
+                score_q,
+                store_q,
+                self._score,
+            ),
+            self._store(store_q),
+        )
+        if not existing_task.done():
+            existing_task.cancel()
+
+        self.result.wall_time = time.perf_counter() - self._started_at
+        filter_stage.gate.log_summary()
+        self._log_summary()
+        return self.result
+
+    async def _stage(
+        self,
+        name: str,
+        workers: int,
+        in_q: asyncio.Queue,
+        out_q: asyncio.Queue,
+        handler: Callable[[Any], Awaitable[Any]],
+    ) -> None:
+        """启动同一阶段的多个worker，全部结束后向下游传递结束标记"""
+
+        async def worker() -> None:
+            while True:
+                item = await in_q.get()
+                if item is _DONE:
+                    # 结束标记放回，让同阶段其他worker也能退出
+                    await in_q.put(_DONE)
+                    return
+                try:
+                    output = await handler(item)
+                except Exception as exc:  # noqa: BLE001
+                    logger.error("流式阶段%s处理失败: %s", name, exc)
+                    self.result.counts[f"{name}_error"] += 1
+                    continue
+                if output is not None:
+                    await out_q.put(output)
+
+        try:
+            await asyncio.gather(*(worker() for _ in range(workers)))
+        finally:
+            await out_q.put(_DONE)
+
+    async def _enhance(self, candidate: RawCandidate) -> RawCandidate:
+        enhanced = await self.enhancer.enhance_candidate(candidate)
+        self.result.counts["enhanced"] += 1
+        return enhanced
+
+    async def _score(self, candidate: RawCandidate) -> ScoredCandidate:
+        scored = await self.scorer.score(candidate)
+        self.result.counts["scored"] += 1
+        return scored
+
+    async def _store(self, store_q: asyncio.Queue) -> None:
+        """攒批入库，减少飞书写入与去重查询次数"""
+
+        buffer: List[ScoredCandidate] = []
+        while True:
+            item = await store_q.get()
+            if item is _DONE:
+                break
+            buffer.append(item)
+            if len(buffer) >= self.store_batch_size:
+                await self._flush(buffer)
+                buffer = []
+        await self._flush(buffer)
+
+    async def _flush(self, batch: List[ScoredCandidate]) -> None:
+        if not batch:
+            return
+        append_relevance_labels(
+            batch, self.settings.logging.directory / constants.RELEVANCE_LABELS_FILE
+        )
+        qualified = self.finalize(batch)
+        self.result.counts["qualified"] += len(qualified)
+        if not qualified:
+            return
+        saved = await self.storage.save(qualified)
+        if saved and self.result.first_saved_after is None:
+            self.result.first_saved_after = time.perf_counter() - self._started_at
+        self.result.saved.extend(saved)
+
+    def _log_summary(self) -> None:
+        counts = self.result.counts
+        logger.info(
+            "流式流水线完成: 采集%d → 去重后%d → 预筛%d → 评分%d → 达标%d → 入库%d (墙钟%.1fs)",
+            counts["collected"],
+            counts["deduplicated"],
+            counts["prefiltered"],
+            counts["scored"],
+            counts["qualified"],
+            len(self.result.saved),
+            self.result.wall_time,
+        )
+        if self.result.first_saved_after is not None:
+            logger.info("首条入库耗时: %.1fs", self.result.first_saved_after)
+
+
+class _FilterStage:
+    """去重 + 规则预筛选 + 相关性模型预筛，单worker执行以保证批内去重集合无竞争"""
+
+    def __init__(
+        self,
+        existing_task: asyncio.Task,
+        counts: Counter[str],
+        gate: Optional[RelevanceGate] = None,
+    ) -> None:
+        self.existing_task = existing_task
+        self.counts = counts
+        self.gate = gate or RelevanceGate(None)
+        self.seen_urls: set[str] = set()
+        self.index: Optional[RecentUrlIndex] = None
+        # 只登记通过预筛选与相关性门控的候选；kept[i] 为索引条目 i 所在簇已下发的主条目
+        self.near_dup = NearDuplicateIndex() if constants.NEAR_DUP_ENABLED else None
+        self.kept: List[RawCandidate] = []
+
+    async def handle(self, candidate: RawCandidate) -> Optional[RawCandidate]:
+        if self.index is None:
+            records = await self.existing_task
+            self.index = RecentUrlIndex.from_records(records)
+            logger.info("流式去重索引就绪: 飞书记录%d条", len(records))
+
+        url_key = canonicalize_url(candidate.url)
+        if not url_key or url_key in self.seen_urls:
+            self.counts["internal_duplicate"] += 1
+            return None
+        self.seen_urls.add(url_key)
+
+        if self.index.contains(candidate):
+            self.counts["feishu_duplicate"] += 1
+            return None
+        self.counts["deduplicated"] += 1
+
+        if not prefilter(candidate):
+            return None
+        self.counts["prefiltered"] += 1
+
+        if not self.gate.allows(candidate):
+            self.counts["relevance_model_dropped"] += 1
+            return None
+
+        if self.near_dup is not None:
+            return self._resolve_near_duplicate(candidate)
+        return candidate
+
+    def _resolve_near_duplicate(self, candidate: RawCandidate) -> Optional[RawCandidate]:
+        """与批量路径的 merge_near_duplicates 一致，按来源优先级选主条目
+
+        - 簇内已下发的主条目优先级不低于本条：补齐链接后丢弃本条
+        - 本条优先级更高（如 arXiv 晚于 GitHub 到达）：已下发的条目无法撤回，
+          仍下发本条（只有 arXiv 条目会做 PDF 增强），并作为该簇后续的主条目
+        """
+
+        assert self.near_dup is not None
+        item_id = len(self.kept)
+        matches = self.near_dup.add(item_id, candidate)
+        primaries = list({id(self.kept[m]): self.kept[m] for m in matches}.values())
+        if not primaries:
+            self.kept.append(candidate)
+            return candidate
+
+        best = min(primaries, key=source_priority)
+        if source_priority(candidate) < source_priority(best):
+            merge_into(candidate, primaries)
+            self.kept.append(candidate)
+            for other in matches:
+                self.kept[other] = candidate
+            self.counts["near_duplicate_promoted"] += 1
+            return candidate
+
+        merge_into(best, [candidate])
+        self.kept.append(best)
+        self.counts["near_duplicate"] += 1
+        return None
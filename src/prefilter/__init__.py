@@ -1,5 +1,23 @@
 """预筛选模块导出"""
 
-from src.prefilter.rule_filter import prefilter, prefilter_batch
+from src.prefilter.relevance_model import (
+    RelevanceGate,
+    RelevanceModel,
+    append_relevance_labels,
+)
+from src.prefilter.rule_filter import (
+    export_rule_stats,
+    get_rule_engine,
+    prefilter,
+    prefilter_batch,
+)
 
-__all__ = ["prefilter", "prefilter_batch"]
+__all__ = [
+    "RelevanceGate",
+    "RelevanceModel",
+    "append_relevance_labels",
+    "export_rule_stats",
+    "get_rule_engine",
+    "prefilter",
+    "prefilter_batch",
+]
@@ -0,0 +1,360 @@
+"""预筛选相关性模型：规则预筛与LLM评分之间的廉价打分层
+
+哈希n-gram线性回归，离线用历史LLM评分（relevance_score）训练，运行时只看标题、摘要与来源，
+预测值加上安全边际后仍低于 RELEVANCE_HARD_FLOOR 的候选直接丢弃，不再消耗LLM token。
+模型文件不存在或格式不符时整层透传，行为与未接入时一致。
+
+模型文件为JSON:
+    format / version   格式标识与版本号
+    dim / word_ngrams  哈希空间大小、词n-gram最大阶数（特征方案需与训练时一致）
+    bias / weights     截距与稀疏权重 {"哈希索引": 权重}
+    margin / floor     验证集按目标召回校准出的安全边际，及校准时的相关性下限
+    metrics            训练脚本写入的评估报告（召回、丢弃率、MAE等）
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import math
+import random
+import re
+import zlib
+from collections import Counter
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+from src.common import constants
+from src.models import RawCandidate, ScoredCandidate
+
+logger = logging.getLogger(__name__)
+
+MODEL_FORMAT = "benchscope-relevance-hashed-linear"
+MODEL_VERSION = 1
+
+# 英文词（允许连字符/下划线/点连接，如 swe-bench、gpt-4.1）与单个汉字
+_TOKEN_RE = re.compile(r"[a-z0-9]+(?:[-_.][a-z0-9]+)*|[一-鿿]")
+
+
+def _tokens(text: str) -> List[str]:
+    return _TOKEN_RE.findall((text or "").lower())
+
+
+@dataclass(slots=True)
+class LabeledExample:
+    """一条训练样本：候选文本 + LLM给出的相关性分"""
+
+    title: str
+    abstract: str
+    source: str
+    relevance: float
+    url: str = ""
+
+
+class HashedNgramFeaturizer:
+    """标题/摘要词n-gram + 来源的带符号哈希特征，次线性词频后L2归一化"""
+
+    def __init__(self, dim: int, word_ngrams: int) -> None:
+        self.dim = dim
+        self.word_ngrams = word_ngrams
+
+    def _add(self, counts: Dict[int, float], name: str) -> None:
+        h = zlib.crc32(name.encode("utf-8"))
+        index = h % self.dim
+        # 高位决定符号，冲突的两个特征期望上相互抵消而不是叠加
+        sign = 1.0 if (h // self.dim) & 1 else -1.0
+        counts[index] = counts.get(index, 0.0) + sign
+
+    def transform(self, title: str, abstract: str, source: str) -> Dict[int, float]:
+        counts: Dict[int, float] = {}
+        abstract = (abstract or "")[: constants.RELEVANCE_MODEL_ABSTRACT_CHARS]
+        for namespace, text in (("t", title), ("a", abstract)):
+            tokens = _tokens(text)
+            for n in range(1, self.word_ngrams + 1):
+                for i in range(len(tokens) - n + 1):
+                    self._add(counts, f"{namespace}:{' '.join(tokens[i : i + n])}")
+        self._add(counts, f"s:{(source or '').lower()}")
+
+        values = {
+            index: math.copysign(1.0 + math.log(abs(value)), value)
+            for index, value in counts.items()
+            if value
+        }
+        norm = math.sqrt(sum(v * v for v in values.values())) or 1.0
+        return {index: value / norm for index, value in values.items()}
+
+
+class RelevanceModel:
+    """哈希n-gram线性回归模型，预测值截断到 [0, 10]"""
+
+    def __init__(
+        self,
+        dim: int,
+        word_ngrams: int,
+        bias: float,
+        weights: Dict[int, float],
+        margin: float = 0.0,
+        floor: float = constants.RELEVANCE_HARD_FLOOR,
+        metrics: Optional[Dict[str, Any]] = None,
+        trained_at: str = "",
+    ) -> None:
+        self.featurizer = HashedNgramFeaturizer(dim, word_ngrams)
+        self.bias = bias
+        self.weights = weights
+        self.margin = margin
+        self.floor = floor
+        self.metrics = metrics or {}
+        self.trained_at = trained_at
+
+    def predict_text(self, title: str, abstract: str, source: str) -> float:
+        features = self.featurizer.transform(title, abstract, source)
+        value = self.bias + sum(
+            self.weights.get(index, 0.0) * x for index, x in features.items()
+        )
+        return min(10.0, max(0.0, value))
+
+    def predict(self, candidate: RawCandidate) -> float:
+        return self.predict_text(candidate.title, candidate.abstract or "", candidate.source)
+
+    def keeps(self, prediction: float, floor: Optional[float] = None) -> bool:
+        """预测值加安全边际达到下限即保留（宁可多送LLM，不误杀）"""
+
+        return prediction + self.margin >= (self.floor if floor is None else floor)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "format": MODEL_FORMAT,
+            "version": MODEL_VERSION,
+            "dim": self.featurizer.dim,
+            "word_ngrams": self.featurizer.word_ngrams,
+            "bias": self.bias,
+            "margin": self.margin,
+            "floor": self.floor,
+            "trained_at": self.trained_at,
+            "metrics": self.metrics,
+            # 权重极小的维度对预测几乎无贡献，裁掉以控制文件体积
+            "weights": {
+                str(index): round(weight, 6)
+                for index, weight in sorted(self.weights.items())
+                if abs(weight) >= constants.RELEVANCE_MODEL_MIN_WEIGHT
+            },
+        }
+
+    def save(self, path: Path) -> None:
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(
+            json.dumps(self.to_dict(), ensure_ascii=False, indent=1), encoding="utf-8"
+        )
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "RelevanceModel":
+        if data.get("format") != MODEL_FORMAT:
+            raise ValueError(f"未知模型格式: {data.get('format')}")
+        if int(data.get("version", 0)) != MODEL_VERSION:
+            raise ValueError(f"不支持的模型版本: {data.get('version')}")
+        return cls(
+            dim=int(data["dim"]),
+            word_ngrams=int(data["word_ngrams"]),
+            bias=float(data["bias"]),
+            weights={int(k): float(v) for k, v in data["weights"].items()},
+            margin=float(data.get("margin", 0.0)),
+            floor=float(data.get("floor", constants.RELEVANCE_HARD_FLOOR)),
+            metrics=data.get("metrics") or {},
+            trained_at=str(data.get("trained_at", "")),
+        )
+
+    @classmethod
+    def load(cls, path: Path) -> "RelevanceModel":
+        return cls.from_dict(json.loads(Path(path).read_text(encoding="utf-8")))
+
+
+def train_relevance_model(
+    examples: Sequence[LabeledExample],
+    *,
+    dim: int = constants.RELEVANCE_MODEL_HASH_DIM,
+    word_ngrams: int = constants.RELEVANCE_MODEL_WORD_NGRAMS,
+    epochs: int = 15,
+    learning_rate: float = 0.2,
+    l2: float = 1e-5,
+    seed: int = 42,
+) -> RelevanceModel:
+    """平方损失SGD训练，截距初始化为标签均值，学习率按轮次衰减"""
+
+    if not examples:
+        raise ValueError("训练样本为空")
+    featurizer = HashedNgramFeaturizer(dim, word_ngrams)
+    rows = [
+        (featurizer.transform(e.title, e.abstract, e.source), e.relevance)
+        for e in examples
+    ]
+    bias = sum(label for _, label in rows) / len(rows)
+    weights: Dict[int, float] = {}
+    order = list(range(len(rows)))
+    rng = random.Random(seed)
+
+    for epoch in range(epochs):
+        rng.shuffle(order)
+        rate = learning_rate / (1.0 + 0.5 * epoch)
+        for row in order:
+            features, label = rows[row]
+            error = (
+                bias + sum(weights.get(i, 0.0) * x for i, x in features.items()) - label
+            )
+            bias -= rate * error
+            for i, x in features.items():
+                w = weights.get(i, 0.0)
+                weights[i] = w - rate * (error * x + l2 * w)
+
+    return RelevanceModel(
+        dim=dim,
+        word_ngrams=word_ngrams,
+        bias=bias,
+        weights=weights,
+        trained_at=datetime.now().isoformat(timespec="seconds"),
+    )
+
+
+def calibrate_margin(
+    predictions: Sequence[float],
+    labels: Sequence[float],
+    floor: float,
+    target_recall: float,
+) -> float:
+    """选出最小安全边际，使LLM判定达标(label>=floor)的样本中至少 target_recall 被保留"""
+
+    positives = sorted(p for p, y in zip(predictions, labels) if y >= floor)
+    if not positives:
+        return 0.0
+    allowed_misses = int(len(positives) * (1.0 - target_recall))
+    return max(0.0, floor - positives[allowed_misses])
+
+
+def evaluate_relevance_model(
+    model: RelevanceModel, examples: Sequence[LabeledExample], floor: float
+) -> Dict[str, Any]:
+    """以LLM评分为标签评估：达标样本召回、整体丢弃率、丢弃正确率与MAE"""
+
+    predictions = [model.predict_text(e.title, e.abstract, e.source) for e in examples]
+    positives = [e.relevance >= floor for e in examples]
+    kept = [model.keeps(p, floor) for p in predictions]
+    pos_total = sum(positives)
+    pos_kept = sum(1 for k, pos in zip(kept, positives) if k and pos)
+    dropped = len(kept) - sum(kept)
+    dropped_correct = sum(1 for k, pos in zip(kept, positives) if not k and not pos)
+    return {
+        "samples": len(examples),
+        "positives": pos_total,
+        "recall": pos_kept / pos_total if pos_total else 1.0,
+        "drop_rate": dropped / len(examples) if examples else 0.0,
+        "dropped_precision": dropped_correct / dropped if dropped else 1.0,
+        "mae": (
+            sum(abs(p - e.relevance) for p, e in zip(predictions, examples))
+            / len(examples)
+            if examples
+            else 0.0
+        ),
+    }
+
+
+class RelevanceGate:
+    """运行时过滤层：未加载模型时全部放行，并统计各来源丢弃情况"""
+
+    def __init__(self, model: Optional[RelevanceModel]) -> None:
+        self.model = model
+        self.checked = 0
+        self.dropped: Counter[str] = Counter()
+
+    @classmethod
+    def from_path(cls, path: Path) -> "RelevanceGate":
+        path = Path(path)
+        if not path.exists():
+            logger.info("相关性模型不存在(%s)，跳过模型预筛", path)
+            return cls(None)
+        try:
+            model = RelevanceModel.load(path)
+        except Exception as exc:  # noqa: BLE001
+            logger.warning("相关性模型加载失败，跳过模型预筛: %s", exc)
+            return cls(None)
+        if model.floor != constants.RELEVANCE_HARD_FLOOR:
+            logger.warning(
+                "相关性模型按下限%.1f校准，当前下限%.1f，召回可能偏离训练报告",
+                model.floor,
+                constants.RELEVANCE_HARD_FLOOR,
+            )
+        logger.info(
+            "相关性模型已加载: %s (训练于%s, 边际%.2f, 验证召回%s)",
+            path,
+            model.trained_at or "未知",
+            model.margin,
+            model.metrics.get("holdout", {}).get("recall", "未知"),
+        )
+        return cls(model)
+
+    @property
+    def enabled(self) -> bool:
+        return self.model is not None
+
+    def allows(self, candidate: RawCandidate) -> bool:
+        if self.model is None:
+            return True
+        self.checked += 1
+        prediction = self.model.predict(candidate)
+        if self.model.keeps(prediction, constants.RELEVANCE_HARD_FLOOR):
+            return True
+        self.dropped[candidate.source] += 1
+        logger.debug(
+            "相关性模型过滤: %s (预测%.1f + 边际%.2f < %.1f)",
+            candidate.title[: constants.TITLE_TRUNCATE_SHORT],
+            prediction,
+            self.model.margin,
+            constants.RELEVANCE_HARD_FLOOR,
+        )
+        return False
+
+    def filter_batch(self, candidates: Iterable[RawCandidate]) -> List[RawCandidate]:
+        return [c for c in candidates if self.allows(c)]
+
+    def log_summary(self) -> None:
+        if self.model is None or not self.checked:
+            return
+        total = sum(self.dropped.values())
+        logger.info(
+            "相关性模型预筛: 检查%d条, 丢弃%d条 (%.1f%%), 按来源: %s",
+            self.checked,
+            total,
+            100 * total / self.checked,
+            dict(self.dropped) or "无",
+        )
+
+
+def append_relevance_labels(candidates: Iterable[ScoredCandidate], path: Path) -> int:
+    """追加评分结果作为训练标签（在相关性下限过滤之前调用，保留负样本）"""
+
+    lines = [
+        json.dumps(
+            {
+                "title": c.title,
+                "abstract": (c.abstract or "")[: constants.RELEVANCE_MODEL_ABSTRACT_CHARS],
+                "source": c.source,
+                "url": c.url,
+                "relevance_score": c.relevance_score,
+                "scored_at": datetime.now().isoformat(timespec="seconds"),
+            },
+            ensure_ascii=False,
+        )
+        for c in candidates
+    ]
+    if not lines:
+        return 0
+    try:
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with path.open("a", encoding="utf-8") as f:
+            f.write("\n".join(lines) + "\n")
+    except OSError as exc:
+        logger.warning("写入相关性标签失败: %s", exc)
+        return 0
+    return len(lines)
@@ -0,0 +1,404 @@
+"""声明式预筛选规则引擎：YAML规则编译为求值函数，按文件修改时间热加载
+
+规则文件格式见 config/prefilter_rules.yaml。每条规则编译成一个闭包，
+求值时共享同一个 KeywordHits（文本只小写一次）；逐条规则累计求值次数、命中次数与耗时，
+便于找出昂贵且从不命中的规则。
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Mapping, Optional, Sequence, Tuple
+
+import yaml
+
+from src.common import constants
+from src.models import RawCandidate
+from src.prefilter.keyword_matcher import KeywordHits, KeywordMatcher
+
+logger = logging.getLogger(__name__)
+
+_PROJECT_ROOT = Path(__file__).resolve().parents[2]
+
+Predicate = Callable[["RuleContext"], bool]
+
+
+class RuleConfigError(ValueError):
+    """规则文件格式错误"""
+
+
+class RuleContext:
+    """单条候选的求值上下文，关键词命中视图按需构造"""
+
+    __slots__ = ("candidate", "_matcher", "_hits")
+
+    def __init__(self, candidate: RawCandidate, matcher: KeywordMatcher) -> None:
+        self.candidate = candidate
+        self._matcher = matcher
+        self._hits: Optional[KeywordHits] = None
+
+    @property
+    def hits(self) -> KeywordHits:
+        if self._hits is None:
+            self._hits = self._matcher.scan(
+                self.candidate.title, self.candidate.abstract or ""
+            )
+        return self._hits
+
+
+@dataclass(slots=True)
+class RuleStats:
+    evaluations: int = 0
+    hits: int = 0
+    seconds: float = 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "evaluations": self.evaluations,
+            "hits": self.hits,
+            "hit_rate": self.hits / self.evaluations if self.evaluations else 0.0,
+            "total_ms": self.seconds * 1000,
+            "avg_us": self.seconds * 1e6 / self.evaluations if self.evaluations else 0.0,
+        }
+
+
+@dataclass(slots=True)
+class CompiledRule:
+    name: str
+    reason: str
+    predicate: Predicate
+    sources: Optional[frozenset[str]] = None  # 仅对这些来源生效
+    skip_sources: frozenset[str] = frozenset()
+    stats: RuleStats = field(default_factory=RuleStats)
+
+    def applies_to(self, source: str) -> bool:
+        if source in self.skip_sources:
+            return False
+        return self.sources is None or source in self.sources
+
+    def fires(self, context: RuleContext) -> bool:
+        """求值并计入统计；为真表示候选应被过滤"""
+
+        start = time.perf_counter()
+        fired = self.predicate(context)
+        self.stats.seconds += time.perf_counter() - start
+        self.stats.evaluations += 1
+        if fired:
+            self.stats.hits += 1
+        return fired
+
+
+# ---- 条件编译 ----
+
+
+def _resolve(value: Any, where: str) -> Any:
+    """'$NAME' 引用 constants 中的同名常量"""
+
+    if isinstance(value, str) and value.startswith("$"):
+        name = value[1:]
+        if not hasattr(constants, name):
+            raise RuleConfigError(f"{where}: 未知常量 {value}")
+        return getattr(constants, name)
+    return value
+
+
+def _str_list(value: Any, where: str) -> Tuple[str, ...]:
+    value = _resolve(value, where)
+    if isinstance(value, str) or not isinstance(value, (list, tuple, set, frozenset)):
+        raise RuleConfigError(f"{where}: 需要字符串列表")
+    return tuple(str(v) for v in value)
+
+
+def _field_text(candidate: RawCandidate, name: str) -> str:
+    return getattr(candidate, name, None) or ""
+
+
+def _age_days(publish_date: Optional[datetime]) -> Optional[int]:
+    if publish_date is None:
+        return None
+    if publish_date.tzinfo is None:
+        publish_date = publish_date.replace(tzinfo=timezone.utc)
+    return (datetime.now(timezone.utc) - publish_date).days
+
+
+def _compile_leaf(
+    key: str, arg: Any, tables: Mapping[str, Any], where: str
+) -> Predicate:
+    if key in {"keyword", "title_keyword", "abstract_keyword"}:
+        if arg not in tables:
+            raise RuleConfigError(f"{where}: 未定义的关键词表 {arg}")
+        table = str(arg)
+        if key == "title_keyword":
+            return lambda ctx: ctx.hits.in_title(table)
+        if key == "abstract_keyword":
+            return lambda ctx: ctx.hits.in_abstract(table)
+        return lambda ctx: ctx.hits.in_text(table)
+
+    if key == "shorter_than":
+        if not isinstance(arg, Mapping) or "field" not in arg or "length" not in arg:
+            raise RuleConfigError(f"{where}: shorter_than 需要 field 与 length")
+        name = str(arg["field"])
+        length = int(_resolve(arg["length"], where))
+        if arg.get("strip", True):
+            return lambda ctx: len(_field_text(ctx.candidate, name).strip()) < length
+        return lambda ctx: len(_field_text(ctx.candidate, name)) < length
+
+    if key == "url_startswith":
+        prefixes = _str_list(arg, where)
+        return lambda ctx: (ctx.candidate.url or "").startswith(prefixes)
+
+    if key == "source_in":
+        sources = frozenset(_str_list(arg, where))
+        return lambda ctx: ctx.candidate.source in sources
+
+    if key == "title_endswith":
+        suffixes = _str_list(arg, where)
+
+        def title_endswith(ctx: RuleContext) -> bool:
+            title = (ctx.candidate.title or "").lower()
+            return title.replace(" ", "-").replace("_", "-").endswith(suffixes)
+
+        return title_endswith
+
+    if key == "stars_below":
+        threshold = int(_resolve(arg, where))
+        return lambda ctx: (ctx.candidate.github_stars or 0) < threshold
+
+    if key == "missing":
+        name = str(arg)
+        return lambda ctx: not getattr(ctx.candidate, name, None)
+
+    if key == "older_than_days":
+        days = int(_resolve(arg, where))
+
+        def older_than(ctx: RuleContext) -> bool:
+            age = _age_days(ctx.candidate.publish_date)
+            return age is not None and age > days
+
+        return older_than
+
+    raise RuleConfigError(f"{where}: 未知条件 {key}")
+
+
+def _compile_condition(spec: Any, tables: Mapping[str, Any], where: str) -> Predicate:
+    if not isinstance(spec, Mapping) or len(spec) != 1:
+        raise RuleConfigError(f"{where}: 条件必须是只有一个键的映射，实际为 {spec!r}")
+    key, arg = next(iter(spec.items()))
+
+    if key in {"all", "any"}:
+        if not isinstance(arg, list) or not arg:
+            raise RuleConfigError(f"{where}: {key} 需要非空条件列表")
+        parts = tuple(
+            _compile_condition(item, tables, f"{where}.{key}[{i}]")
+            for i, item in enumerate(arg)
+        )
+        if key == "all":
+            return lambda ctx: all(p(ctx) for p in parts)
+        return lambda ctx: any(p(ctx) for p in parts)
+
+    if key == "not":
+        inner = _compile_condition(arg, tables, f"{where}.not")
+        return lambda ctx: not inner(ctx)
+
+    return _compile_leaf(str(key), arg, tables, where)
+
+
+# ---- 规则集 ----
+
+
+class RuleEngine:
+    """编译后的规则集，求值顺序与文件中一致"""
+
+    def __init__(
+        self,
+        rules: Sequence[CompiledRule],
+        matcher: KeywordMatcher,
+        evaluate_all: bool = False,
+        source: str = "",
+        mtime: float = 0.0,
+    ) -> None:
+        self.rules = list(rules)
+        self.matcher = matcher
+        self.evaluate_all = evaluate_all
+        self.source = source
+        self.mtime = mtime
+        self._by_name = {rule.name: rule for rule in self.rules}
+
+    @classmethod
+    def from_dict(
+        cls, data: Mapping[str, Any], source: str = "", mtime: float = 0.0
+    ) -> "RuleEngine":
+        if not isinstance(data, Mapping):
+            raise RuleConfigError("规则文件顶层必须是映射")
+        raw_tables = data.get("tables") or {}
+        tables = {
+            str(name): _str_list(words, f"tables.{name}")
+            for name, words in raw_tables.items()
+        }
+
+        rules: List[CompiledRule] = []
+        for index, spec in enumerate(data.get("rules") or []):
+            where = f"rules[{index}]"
+            if not isinstance(spec, Mapping) or "name" not in spec:
+                raise RuleConfigError(f"{where}: 缺少 name")
+            name = str(spec["name"])
+            where = f"rules[{index}]({name})"
+            if name in {rule.name for rule in rules}:
+                raise RuleConfigError(f"{where}: 规则名重复")
+            if "drop_if" not in spec:
+                raise RuleConfigError(f"{where}: 缺少 drop_if")
+            rules.append(
+                CompiledRule(
+                    name=name,
+                    reason=str(spec.get("reason", name)),
+                    predicate=_compile_condition(spec["drop_if"], tables, where),
+                    sources=(
+                        frozenset(_str_list(spec["sources"], where))
+                        if "sources" in spec
+                        else None
+                    ),
+                    skip_sources=frozenset(
+                        _str_list(spec.get("skip_sources", []), where)
+                    ),
+                )
+            )
+        if not rules:
+            raise RuleConfigError("规则文件中没有规则")
+
+        return cls(
+            rules,
+            KeywordMatcher(tables),
+            evaluate_all=bool(data.get("evaluate_all", False)),
+            source=source,
+            mtime=mtime,
+        )
+
+    @classmethod
+    def load(cls, path: Path) -> "RuleEngine":
+        path = Path(path)
+        mtime = path.stat().st_mtime
+        data = yaml.safe_load(path.read_text(encoding="utf-8")) or {}
+        return cls.from_dict(data, source=str(path), mtime=mtime)
+
+    def rule(self, name: str) -> CompiledRule:
+        return self._by_name[name]
+
+    def evaluate(self, candidate: RawCandidate) -> Tuple[bool, str, List[str]]:
+        """返回 (是否通过, 首个命中规则的原因或"pass", 全部命中的规则名)
+
+        evaluate_all 关闭时在首个命中处短路，命中列表只含该规则。
+        """
+
+        context = RuleContext(candidate, self.matcher)
+        reason = "pass"
+        fired: List[str] = []
+        for rule in self.rules:
+            if not rule.applies_to(candidate.source):
+                continue
+            if rule.fires(context):
+                fired.append(rule.name)
+                if reason == "pass":
+                    reason = rule.reason
+                if not self.evaluate_all:
+                    break
+        return reason == "pass", reason, fired
+
+    def inherit_stats(self, previous: "RuleEngine") -> None:
+        """热加载后延续同名规则的统计"""
+
+        for rule in self.rules:
+            old = previous._by_name.get(rule.name)
+            if old is not None:
+                rule.stats = old.stats
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        return {rule.name: rule.stats.to_dict() for rule in self.rules}
+
+    def log_stats(self) -> None:
+        if not any(rule.stats.evaluations for rule in self.rules):
+            return
+        logger.info(
+            "===== 预筛选规则统计 (%s%s) =====",
+            Path(self.source).name or "内置",
+            ", 全量求值" if self.evaluate_all else "",
+        )
+        for rule in self.rules:
+            s = rule.stats
+            logger.info(
+                "  %s 求值%6d 命中%6d (%.1f%%) 耗时%8.1fms 平均%6.1fµs",
+                rule.name.ljust(22),
+                s.evaluations,
+                s.hits,
+                100 * s.hits / s.evaluations if s.evaluations else 0.0,
+                s.seconds * 1000,
+                s.seconds * 1e6 / s.evaluations if s.evaluations else 0.0,
+            )
+
+    def export_stats(self, path: Path) -> None:
+        payload = {
+            "rules_file": self.source,
+            "evaluate_all": self.evaluate_all,
+            "exported_at": datetime.now().isoformat(timespec="seconds"),
+            "rules": self.stats(),
+        }
+        try:
+            path = Path(path)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(
+                json.dumps(payload, ensure_ascii=False, indent=2), encoding="utf-8"
+            )
+        except OSError as exc:
+            logger.warning("写入预筛选规则统计失败: %s", exc)
+
+
+class RuleEngineProvider:
+    """按修改时间热加载规则文件；新文件解析失败时保留上一版规则"""
+
+    def __init__(self, path: Path, check_interval: float) -> None:
+        self.path = Path(path)
+        self.check_interval = check_interval
+        self._engine: Optional[RuleEngine] = None
+        self._checked_at = 0.0
+        self._lock = threading.Lock()
+
+    def get(self) -> RuleEngine:
+        now = time.monotonic()
+        if self._engine is not None and now - self._checked_at < self.check_interval:
+            return self._engine
+        with self._lock:
+            self._checked_at = now
+            try:
+                mtime = self.path.stat().st_mtime
+            except OSError as exc:
+                if self._engine is None:
+                    raise RuleConfigError(f"预筛选规则文件不可读: {self.path}") from exc
+                logger.warning("预筛选规则文件不可读，继续使用上一版: %s", exc)
+                return self._engine
+            if self._engine is not None and mtime == self._engine.mtime:
+                return self._engine
+            try:
+                engine = RuleEngine.load(self.path)
+            except Exception as exc:  # noqa: BLE001
+                if self._engine is None:
+                    raise
+                logger.error("预筛选规则重新加载失败，继续使用上一版: %s", exc)
+                self._engine.mtime = mtime  # 同一份坏文件不再反复解析
+                return self._engine
+            if self._engine is not None:
+                engine.inherit_stats(self._engine)
+                logger.info("预筛选规则已重新加载: %s (%d条)", self.path, len(engine.rules))
+            else:
+                logger.debug("预筛选规则已加载: %s (%d条)", self.path, len(engine.rules))
+            self._engine = engine
+            return engine
+
+
+def default_rules_path() -> Path:
+    path = Path(constants.PREFILTER_RULES_PATH)
+    return path if path.is_absolute() else _PROJECT_ROOT / path
@@ -0,0 +1,161 @@
+"""OpenAI Batch API 评分后端
+
+日常采集对延迟不敏感，未命中缓存的评分请求可写成JSONL一次性提交到 /v1/batches，
+按批处理价格计费且不占用实时接口的速率限制。流程：
+1. 写入请求JSONL（保留在工作目录便于审计）并上传为 purpose=batch 文件
+2. 创建batch任务并轮询直到终态
+3. 下载输出文件，按 custom_id 返回每条请求的响应文本
+
+超过最长等待时间、提交失败或单条请求出错时，由调用方回退到实时接口。
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Mapping, Optional
+
+from openai import AsyncOpenAI
+
+logger = logging.getLogger(__name__)
+
+_TERMINAL_STATUSES = {"completed", "failed", "expired", "cancelled"}
+
+
+@dataclass(slots=True)
+class BatchOutcome:
+    """一次batch提交的结果"""
+
+    contents: Dict[str, str] = field(default_factory=dict)  # custom_id → 响应文本
+    usage: Dict[str, Any] = field(default_factory=dict)  # custom_id → usage字典
+    failed: List[str] = field(default_factory=list)
+    batch_id: Optional[str] = None
+    status: str = "not_submitted"
+    elapsed: float = 0.0
+
+
+class OpenAIBatchBackend:
+    """提交chat.completions批任务并等待结果"""
+
+    def __init__(
+        self,
+        client: AsyncOpenAI,
+        work_dir: Path,
+        poll_seconds: float,
+        max_wait_seconds: float,
+    ) -> None:
+        self.client = client
+        self.work_dir = Path(work_dir)
+        self.poll_seconds = poll_seconds
+        self.max_wait_seconds = max_wait_seconds
+
+    def _write_requests(
+        self,
+        requests: Mapping[str, List[Dict[str, Any]]],
+        model: str,
+        max_tokens: int,
+        temperature: float,
+    ) -> Path:
+        self.work_dir.mkdir(parents=True, exist_ok=True)
+        path = self.work_dir / f"score_batch_{datetime.now():%Y%m%d_%H%M%S}.jsonl"
+        with path.open("w", encoding="utf-8") as f:
+            for custom_id, messages in requests.items():
+                line = {
+                    "custom_id": custom_id,
+                    "method": "POST",
+                    "url": "/v1/chat/completions",
+                    "body": {
+                        "model": model,
+                        "messages": messages,
+                        "temperature": temperature,
+                        "max_tokens": max_tokens,
+                    },
+                }
+                f.write(json.dumps(line, ensure_ascii=False) + "\n")
+        return path
+
+    async def complete(
+        self,
+        requests: Mapping[str, List[Dict[str, Any]]],
+        *,
+        model: str,
+        max_tokens: int,
+        temperature: float,
+    ) -> BatchOutcome:
+        """提交请求并等待完成，任何环节失败都返回部分结果而不抛出"""
+
+        outcome = BatchOutcome()
+        if not requests:
+            return outcome
+        start = time.monotonic()
+        try:
+            path = self._write_requests(requests, model, max_tokens, temperature)
+            uploaded = await self.client.files.create(
+                file=(path.name, path.read_bytes()), purpose="batch"
+            )
+            batch = await self.client.batches.create(
+                input_file_id=uploaded.id,
+                endpoint="/v1/chat/completions",
+                completion_window="24h",
+            )
+            outcome.batch_id = batch.id
+            logger.info("Batch评分已提交: %s (%d条, 请求文件%s)", batch.id, len(requests), path)
+
+            while batch.status not in _TERMINAL_STATUSES:
+                if time.monotonic() - start > self.max_wait_seconds:
+                    logger.warning(
+                        "Batch评分等待超时(%.0fs)，取消并回退实时接口: %s",
+                        self.max_wait_seconds,
+                        batch.id,
+                    )
+                    await self.client.batches.cancel(batch.id)
+                    outcome.status = "timeout"
+                    break
+                await asyncio.sleep(self.poll_seconds)
+                batch = await self.client.batches.retrieve(batch.id)
+            else:
+                outcome.status = batch.status
+
+            if batch.output_file_id:
+                self._parse_output(
+                    (await self.client.files.content(batch.output_file_id)).text,
+                    outcome,
+                )
+        except Exception as exc:  # noqa: BLE001
+            logger.warning("Batch评分失败，回退实时接口: %s", exc)
+            outcome.status = "error"
+
+        outcome.failed = [cid for cid in requests if cid not in outcome.contents]
+        outcome.elapsed = time.monotonic() - start
+        logger.info(
+            "Batch评分结束: 状态=%s, 成功%d条, 待回退%d条, 耗时%.0fs",
+            outcome.status,
+            len(outcome.contents),
+            len(outcome.failed),
+            outcome.elapsed,
+        )
+        return outcome
+
+    @staticmethod
+    def _parse_output(text: str, outcome: BatchOutcome) -> None:
+        for line in text.splitlines():
+            if not line.strip():
+                continue
+            try:
+                item = json.loads(line)
+                response = item.get("response") or {}
+                if item.get("error") or response.get("status_code") != 200:
+                    continue
+                body = response["body"]
+                content = body["choices"][0]["message"]["content"] or ""
+            except (KeyError, IndexError, TypeError, json.JSONDecodeError) as exc:
+                logger.debug("Batch输出行解析失败: %s", exc)
+                continue
+            outcome.contents[item["custom_id"]] = content
+            if body.get("usage"):
+                outcome.usage[item["custom_id"]] = body["usage"]
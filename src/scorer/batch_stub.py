@@ -0,0 +1,302 @@
+"""OpenAI Batch API 本地替身服务（离线测试用）
+
+实现 batch 评分链路用到的最小接口子集：
+- POST /v1/files                上传请求JSONL
+- POST /v1/batches              创建任务
+- GET  /v1/batches/{id}         查询状态（前 N 次查询返回 in_progress）
+- POST /v1/batches/{id}/cancel  取消
+- GET  /v1/files/{id}/content   下载输出JSONL
+- POST /v1/chat/completions     实时接口（纠偏/回退路径）
+
+每条请求的响应内容由 responder(body) 生成，默认返回一份可通过校验的固定评分JSON。
+
+用法:
+    python -m src.scorer.batch_stub --port 8765
+    OPENAI_BASE_URL=http://127.0.0.1:8765/v1 LLM_SCORING_BACKEND=batch python -m src.main
+"""
+
+from __future__ import annotations
+
+import argparse
+import email
+import json
+import re
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, Optional
+
+Responder = Callable[[Dict[str, Any]], str]
+
+_BATCH_PATH_RE = re.compile(r"^/v1/batches/([\w-]+)(/cancel)?$")
+_FILE_CONTENT_RE = re.compile(r"^/v1/files/([\w-]+)/content$")
+
+
+def default_responder(body: Dict[str, Any]) -> str:
+    """返回满足 UnifiedBenchmarkExtraction 校验的固定评分"""
+
+    reasoning = "离线替身服务生成的评分推理，用于验证批处理链路的提交、轮询与解析流程。" * 6
+    return json.dumps(
+        {
+            "activity_score": 6.0,
+            "reproducibility_score": 6.0,
+            "license_score": 6.0,
+            "novelty_score": 6.0,
+            "relevance_score": 6.0,
+            "activity_reasoning": reasoning,
+            "reproducibility_reasoning": reasoning,
+            "license_reasoning": reasoning,
+            "novelty_reasoning": reasoning,
+            "relevance_reasoning": reasoning,
+            "backend_mgx_relevance": 0.0,
+            "backend_mgx_reasoning": "",
+            "backend_engineering_value": 0.0,
+            "backend_engineering_reasoning": "",
+            "overall_reasoning": reasoning,
+            "task_domain": "Coding",
+            "metrics": [],
+            "baselines": [],
+            "institution": "Unknown",
+            "authors": [],
+            "dataset_size": None,
+            "dataset_size_description": "Not specified",
+            "task_type": "Other",
+            "license_type": "Unknown",
+            "paper_url": "",
+            "reproduction_script_url": "",
+            "evaluation_metrics": [],
+        },
+        ensure_ascii=False,
+    )
+
+
+class BatchStubServer:
+    """线程内运行的Batch API替身，可作为上下文管理器使用"""
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        responder: Responder = default_responder,
+        polls_until_complete: int = 1,
+    ) -> None:
+        self.responder = responder
+        self.polls_until_complete = polls_until_complete
+        self.files: Dict[str, bytes] = {}
+        self.batches: Dict[str, Dict[str, Any]] = {}
+        self._polls: Dict[str, int] = {}
+        self._lock = threading.RLock()
+        self._server = ThreadingHTTPServer((host, port), self._handler_class())
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/v1"
+
+    def start(self) -> "BatchStubServer":
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self) -> "BatchStubServer":
+        return self.start()
+
+    def __exit__(self, *exc: object) -> None:
+        self.stop()
+
+    # ---- 业务逻辑 ----
+    def _store_file(self, filename: str, data: bytes, purpose: str) -> Dict[str, Any]:
+        file_id = f"file-{uuid.uuid4().hex[:12]}"
+        with self._lock:
+            self.files[file_id] = data
+        return {
+            "id": file_id,
+            "object": "file",
+            "bytes": len(data),
+            "created_at": int(time.time()),
+            "filename": filename,
+            "purpose": purpose,
+            "status": "processed",
+        }
+
+    def _create_batch(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        batch_id = f"batch_{uuid.uuid4().hex[:12]}"
+        batch = {
+            "id": batch_id,
+            "object": "batch",
+            "endpoint": params.get("endpoint", "/v1/chat/completions"),
+            "input_file_id": params["input_file_id"],
+            "completion_window": params.get("completion_window", "24h"),
+            "status": "in_progress",
+            "created_at": int(time.time()),
+            "output_file_id": None,
+            "error_file_id": None,
+            "request_counts": {"total": 0, "completed": 0, "failed": 0},
+        }
+        with self._lock:
+            self.batches[batch_id] = batch
+            self._polls[batch_id] = 0
+        return batch
+
+    def _complete_batch(self, batch: Dict[str, Any]) -> None:
+        lines = self.files[batch["input_file_id"]].decode("utf-8").splitlines()
+        output = []
+        for line in lines:
+            if not line.strip():
+                continue
+            request = json.loads(line)
+            output.append(
+                json.dumps(
+                    {
+                        "id": f"resp_{uuid.uuid4().hex[:8]}",
+                        "custom_id": request["custom_id"],
+                        "response": {
+                            "status_code": 200,
+                            "request_id": uuid.uuid4().hex[:8],
+                            "body": self._chat_completion(request["body"]),
+                        },
+                        "error": None,
+                    },
+                    ensure_ascii=False,
+                )
+            )
+        output_file = self._store_file(
+            "output.jsonl", ("\n".join(output) + "\n").encode("utf-8"), "batch_output"
+        )
+        batch["status"] = "completed"
+        batch["output_file_id"] = output_file["id"]
+        batch["request_counts"] = {
+            "total": len(output),
+            "completed": len(output),
+            "failed": 0,
+        }
+
+    def _chat_completion(self, body: Dict[str, Any]) -> Dict[str, Any]:
+        content = self.responder(body)
+        prompt_chars = len(json.dumps(body.get("messages", []), ensure_ascii=False))
+        return {
+            "id": f"chatcmpl-{uuid.uuid4().hex[:8]}",
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": body.get("model", "stub"),
+            "choices": [
+                {
+                    "index": 0,
+                    "finish_reason": "stop",
+                    "message": {"role": "assistant", "content": content},
+                }
+            ],
+            "usage": {
+                "prompt_tokens": prompt_chars // 4,
+                "completion_tokens": len(content) // 4,
+                "total_tokens": (prompt_chars + len(content)) // 4,
+            },
+        }
+
+    def _retrieve_batch(self, batch_id: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            batch = self.batches.get(batch_id)
+            if batch is None:
+                return None
+            if batch["status"] == "in_progress":
+                self._polls[batch_id] += 1
+                if self._polls[batch_id] >= self.polls_until_complete:
+                    self._complete_batch(batch)
+            return batch
+
+    def _cancel_batch(self, batch_id: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            batch = self.batches.get(batch_id)
+            if batch is not None and batch["status"] not in {"completed", "failed"}:
+                batch["status"] = "cancelled"
+            return batch
+
+    def _handler_class(self) -> type[BaseHTTPRequestHandler]:
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, format: str, *args: Any) -> None:  # noqa: A002
+                return
+
+            def _send_json(self, status: int, payload: Any) -> None:
+                data = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def _body(self) -> bytes:
+                length = int(self.headers.get("Content-Length") or 0)
+                return self.rfile.read(length)
+
+            def do_POST(self) -> None:  # noqa: N802
+                path = self.path.split("?", 1)[0]
+                if path == "/v1/files":
+                    message = email.message_from_bytes(
+                        f"Content-Type: {self.headers['Content-Type']}\r\n\r\n".encode()
+                        + self._body()
+                    )
+                    data, filename, purpose = b"", "input.jsonl", "batch"
+                    for part in message.walk():
+                        name = part.get_param("name", header="content-disposition")
+                        if name == "file":
+                            data = part.get_payload(decode=True) or b""
+                            filename = part.get_filename() or filename
+                        elif name == "purpose":
+                            purpose = (part.get_payload(decode=True) or b"").decode()
+                    self._send_json(200, stub._store_file(filename, data, purpose))
+                    return
+                if path == "/v1/chat/completions":
+                    self._send_json(200, stub._chat_completion(json.loads(self._body())))
+                    return
+                if path == "/v1/batches":
+                    self._send_json(200, stub._create_batch(json.loads(self._body())))
+                    return
+                match = _BATCH_PATH_RE.match(path)
+                if match and match.group(2):
+                    batch = stub._cancel_batch(match.group(1))
+                    self._send_json(200 if batch else 404, batch or {"error": "not found"})
+                    return
+                self._send_json(404, {"error": "not found"})
+
+            def do_GET(self) -> None:  # noqa: N802
+                path = self.path.split("?", 1)[0]
+                match = _BATCH_PATH_RE.match(path)
+                if match and not match.group(2):
+                    batch = stub._retrieve_batch(match.group(1))
+                    self._send_json(200 if batch else 404, batch or {"error": "not found"})
+                    return
+                match = _FILE_CONTENT_RE.match(path)
+                if match and match.group(1) in stub.files:
+                    data = stub.files[match.group(1)]
+                    self.send_response(200)
+                    self.send_header("Content-Type", "application/octet-stream")
+                    self.send_header("Content-Length", str(len(data)))
+                    self.end_headers()
+                    self.wfile.write(data)
+                    return
+                self._send_json(404, {"error": "not found"})
+
+        return Handler
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="OpenAI Batch API 本地替身")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--polls", type=int, default=1, help="第N次查询时完成任务")
+    args = parser.parse_args()
+    server = BatchStubServer(args.host, args.port, polls_until_complete=args.polls)
+    print(f"Batch替身服务: {server.base_url}")
+    server._server.serve_forever()
+
+
+if __name__ == "__main__":
+    main()
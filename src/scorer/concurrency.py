@@ -0,0 +1,254 @@
+"""LLM调用自适应并发控制（AIMD）
+
+固定信号量在限流时浪费重试、空闲时浪费吞吐。这里按以下信号动态调整在途窗口：
+1. 成功响应：加性增长，每完成一个窗口的请求窗口+1
+2. 429 / x-ratelimit-remaining-* 接近耗尽 / p95延迟超标：乘性收缩
+3. retry-after：全局暂停发放新请求，直到限流窗口恢复
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import re
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import AsyncIterator, Deque, Mapping, Optional
+
+from src.common import constants
+
+logger = logging.getLogger(__name__)
+
+_DURATION_PART_RE = re.compile(r"(\d+(?:\.\d+)?)(ms|s|m|h)")
+_DURATION_UNITS = {"ms": 0.001, "s": 1.0, "m": 60.0, "h": 3600.0}
+
+
+def _parse_duration(value: Optional[str]) -> Optional[float]:
+    """解析 retry-after(秒) 或 x-ratelimit-reset-*(如 "1m30s"、"250ms")"""
+
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    parts = _DURATION_PART_RE.findall(value)
+    if not parts:
+        return None
+    return sum(float(num) * _DURATION_UNITS[unit] for num, unit in parts)
+
+
+def retry_after_seconds(headers: Optional[Mapping[str, str]]) -> Optional[float]:
+    """从响应头提取建议等待时间"""
+
+    if not headers:
+        return None
+    retry_ms = headers.get("retry-after-ms")
+    if retry_ms:
+        try:
+            return max(float(retry_ms) / 1000, 0.0)
+        except ValueError:
+            pass
+    for name in (
+        "retry-after",
+        "x-ratelimit-reset-requests",
+        "x-ratelimit-reset-tokens",
+    ):
+        seconds = _parse_duration(headers.get(name))
+        if seconds is not None:
+            return seconds
+    return None
+
+
+def _remaining_ratio(headers: Mapping[str, str], kind: str) -> Optional[float]:
+    remaining = headers.get(f"x-ratelimit-remaining-{kind}")
+    limit = headers.get(f"x-ratelimit-limit-{kind}")
+    if remaining is None or not limit:
+        return None
+    try:
+        return float(remaining) / float(limit)
+    except (ValueError, ZeroDivisionError):
+        return None
+
+
+@dataclass(slots=True)
+class ConcurrencyReport:
+    """本次运行的并发控制统计"""
+
+    requests: int
+    rate_limited: int
+    errors: int
+    tokens: int
+    elapsed: float
+    final_limit: int
+    peak_limit: int
+    p95_latency: float
+
+    @property
+    def requests_per_minute(self) -> float:
+        return self.requests * 60 / self.elapsed if self.elapsed else 0.0
+
+    @property
+    def tokens_per_minute(self) -> float:
+        return self.tokens * 60 / self.elapsed if self.elapsed else 0.0
+
+
+class AdaptiveConcurrencyLimiter:
+    """AIMD并发窗口：按限流响应头与观测延迟调整同时在途的LLM请求数"""
+
+    def __init__(
+        self,
+        initial: int = constants.LLM_CONCURRENCY_INITIAL,
+        minimum: int = constants.LLM_CONCURRENCY_MIN,
+        maximum: int = constants.SCORE_CONCURRENCY,
+    ) -> None:
+        self.minimum = minimum
+        self.maximum = maximum
+        self.limit = float(min(max(initial, minimum), maximum))
+        self.peak_limit = int(self.limit)
+        self.in_flight = 0
+        self._cond = asyncio.Condition()
+        self._paused_until = 0.0
+        self._last_decrease = 0.0
+        self._latencies: Deque[float] = deque(maxlen=constants.LLM_LATENCY_WINDOW)
+        self._started: Optional[float] = None
+        self.requests = 0
+        self.rate_limited = 0
+        self.errors = 0
+        self.tokens = 0
+
+    @property
+    def window(self) -> int:
+        return max(self.minimum, int(self.limit))
+
+    def p95_latency(self) -> float:
+        if not self._latencies:
+            return 0.0
+        ordered = sorted(self._latencies)
+        return ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        """占用一个在途名额，窗口已满或处于限流暂停期时等待"""
+
+        async with self._cond:
+            while True:
+                pause = self._paused_until - time.monotonic()
+                if pause > 0:
+                    self._cond.release()
+                    try:
+                        await asyncio.sleep(pause)
+                    finally:
+                        await self._cond.acquire()
+                    continue
+                if self.in_flight < self.window:
+                    break
+                await self._cond.wait()
+            self.in_flight += 1
+            if self._started is None:
+                self._started = time.monotonic()
+        try:
+            yield
+        finally:
+            async with self._cond:
+                self.in_flight -= 1
+                self._cond.notify_all()
+
+    def _decrease(self, reason: str) -> None:
+        now = time.monotonic()
+        # 同一批在途请求的连续负反馈只收缩一次
+        if now - self._last_decrease < constants.LLM_CONCURRENCY_DECREASE_COOLDOWN_SECONDS:
+            return
+        self._last_decrease = now
+        previous = self.window
+        self.limit = max(
+            float(self.minimum), self.limit * constants.LLM_CONCURRENCY_DECREASE_FACTOR
+        )
+        logger.info("LLM并发窗口收缩 %d→%d (%s)", previous, self.window, reason)
+
+    def _increase(self) -> None:
+        self.limit = min(float(self.maximum), self.limit + 1.0 / self.limit)
+        self.peak_limit = max(self.peak_limit, self.window)
+
+    def record_success(
+        self,
+        latency: float,
+        headers: Optional[Mapping[str, str]] = None,
+        tokens: int = 0,
+    ) -> None:
+        """记录成功响应并据此调整窗口"""
+
+        self.requests += 1
+        self.tokens += tokens
+        self._latencies.append(latency)
+
+        if headers:
+            ratios = [
+                ratio
+                for ratio in (
+                    _remaining_ratio(headers, "requests"),
+                    _remaining_ratio(headers, "tokens"),
+                )
+                if ratio is not None
+            ]
+            if ratios and min(ratios) < constants.LLM_RATE_LIMIT_LOW_WATERMARK:
+                self._decrease(f"剩余配额{min(ratios):.0%}")
+                return
+
+        if (
+            len(self._latencies) >= constants.LLM_LATENCY_MIN_SAMPLES
+            and self.p95_latency() > constants.LLM_LATENCY_P95_TARGET_SECONDS
+        ):
+            self._decrease(f"p95延迟{self.p95_latency():.1f}s")
+            return
+        self._increase()
+
+    def record_rate_limited(self, headers: Optional[Mapping[str, str]] = None) -> None:
+        """记录429：收缩窗口，并按retry-after暂停发放新请求"""
+
+        self.rate_limited += 1
+        wait = retry_after_seconds(headers)
+        if wait is None:
+            wait = constants.LLM_RATE_LIMIT_DEFAULT_PAUSE_SECONDS
+        self._paused_until = max(self._paused_until, time.monotonic() + wait)
+        self._decrease(f"429限流, 暂停{wait:.1f}s")
+
+    def record_error(self, latency: float) -> None:
+        """记录超时等错误：视为过载信号"""
+
+        self.errors += 1
+        self._latencies.append(latency)
+        self._decrease("请求超时/失败")
+
+    def report(self) -> ConcurrencyReport:
+        elapsed = time.monotonic() - self._started if self._started else 0.0
+        return ConcurrencyReport(
+            requests=self.requests,
+            rate_limited=self.rate_limited,
+            errors=self.errors,
+            tokens=self.tokens,
+            elapsed=elapsed,
+            final_limit=self.window,
+            peak_limit=self.peak_limit,
+            p95_latency=self.p95_latency(),
+        )
+
+    def log_report(self) -> None:
+        report = self.report()
+        if not report.requests and not report.rate_limited:
+            return
+        logger.info(
+            "LLM并发控制: 请求%d次 (限流%d/失败%d), 吞吐%.1f次/分钟, "
+            "%.0f tokens/分钟, 窗口%d(峰值%d), p95延迟%.1fs",
+            report.requests,
+            report.rate_limited,
+            report.errors,
+            report.requests_per_minute,
+            report.tokens_per_minute,
+            report.final_limit,
+            report.peak_limit,
+            report.p95_latency,
+        )
@@ -16,18 +16,25 @@ import asyncio
 import hashlib
 import json
 import logging
+import time
+from types import SimpleNamespace
 from typing import Any, Awaitable, Dict, List, Optional, Tuple, cast
 
 import redis.asyncio as redis
 from redis.asyncio import Redis as AsyncRedis
-from openai import AsyncOpenAI
+from openai import AsyncOpenAI, RateLimitError
 from openai.types.chat import ChatCompletionMessageParam
 from pydantic import BaseModel, ConfigDict, Field, ValidationError, field_validator
-from tenacity import retry, stop_after_attempt, wait_exponential
+from tenacity import RetryCallState, retry, stop_after_attempt, wait_exponential
 
 from src.common import clean_summary_text, constants
 from src.config import get_settings
 from src.models import RawCandidate, ScoredCandidate
+from src.scorer.batch_backend import OpenAIBatchBackend
+from src.scorer.concurrency import AdaptiveConcurrencyLimiter
+from src.scorer.repair import RepairStats, pick_expansion_targets
+from src.scorer.token_budget import TokenLedger
+from src.scorer.score_cache import DiskScoreCache, LRUScoreCache, ScoreCacheStats
 
 logger = logging.getLogger(__name__)
 
@@ -471,6 +478,71 @@ MGX是一个AI原生的多智能体协作框架（Vibe Coding），专注以下
 """
 
 
+# ==================== 精简Prompt（LLM_PROMPT_MODE=compact） ====================
+# 由完整模板派生：去掉逐维度的“字符计数示例”、推理字数汇总与质量检查清单
+#（约束已在各维度、JSON Schema与system prompt中给出），候选信息只保留非空字段。
+_COMPACT_EXAMPLE_PREFIX = "- **字符计数示例**"
+_COMPACT_DROPPED_BLOCKS = ("【推理字数验证】",)
+
+
+def _build_compact_template(full: str) -> str:
+    intro, rest = full.split("=== 第1部分：候选基础信息 ===", 1)
+    rubric = "=== 第2部分：MGX场景定义 ===" + rest.split(
+        "=== 第2部分：MGX场景定义 ===", 1
+    )[1]
+    rubric, tail = rubric.split("=== 第10部分：质量检查清单 ===", 1)
+    rubric = "\n".join(
+        line
+        for line in rubric.splitlines()
+        if not line.lstrip().startswith(_COMPACT_EXAMPLE_PREFIX)
+    )
+    rubric = "\n\n".join(
+        block
+        for block in rubric.split("\n\n")
+        if not block.startswith(_COMPACT_DROPPED_BLOCKS)
+    )
+    closing = tail.strip().rsplit("\n\n", 1)[-1]
+    return (
+        f"{intro}=== 第1部分：候选基础信息 ===\n{{candidate_info}}\n\n"
+        f"{rubric.rstrip()}\n\n{{evidence}}{closing}\n"
+    )
+
+
+COMPACT_SCORING_PROMPT_TEMPLATE = _build_compact_template(
+    UNIFIED_SCORING_PROMPT_TEMPLATE
+)
+
+# 精简模式下“候选基础信息”与“深度内容”各行的展示名
+_COMPACT_INFO_LABELS = [
+    ("title", "标题"),
+    ("source", "来源"),
+    ("url", "URL"),
+    ("abstract", "摘要/README（截断）"),
+    ("github_stars", "GitHub Stars"),
+    ("publish_date", "发布日期"),
+    ("github_url", "GitHub URL"),
+    ("dataset_url", "数据集URL"),
+    ("paper_url", "论文URL"),
+    ("license_type", "许可证（初步识别）"),
+    ("task_type", "任务类型（初步识别）"),
+]
+_COMPACT_PDF_LABELS = [
+    ("introduction_summary", "Introduction部分摘要"),
+    ("method_summary", "Method/Approach部分摘要"),
+    ("evaluation_summary", "Evaluation/Experiments部分摘要"),
+    ("dataset_summary", "Dataset/Data部分摘要"),
+    ("baselines_summary", "Baselines/Related Work部分摘要"),
+    ("conclusion_summary", "Conclusion/Discussion部分摘要"),
+]
+_COMPACT_RAW_LABELS = [
+    ("raw_metrics", "原始指标"),
+    ("raw_baselines", "原始Baseline"),
+    ("raw_authors", "原始作者"),
+    ("raw_institutions", "原始机构"),
+    ("raw_dataset_size", "原始数据规模"),
+]
+
+
 # ==================== Pydantic数据模型 ====================
 class UnifiedBenchmarkExtraction(BaseModel):
     """全LLM统一评分输出模型（26个字段）"""
@@ -536,6 +608,61 @@ class UnifiedBenchmarkExtraction(BaseModel):
         return v
 
 
+# 系统提示词同样参与缓存键计算，修改后旧缓存自然失效
+SCORING_SYSTEM_PROMPT = (
+    "你是MGX BenchScope的Benchmark评估专家，将输出可直接入库的JSON评分结果。\n\n"
+    "【关键硬性要求——违反任意一条将视为失败】\n"
+    "1. activity/reproducibility/license/novelty/relevance_reasoning 各≥150字符（建议≥180字符）\n"
+    "2. 若 backend_mgx_relevance 或 backend_engineering_value > 0，则对应的 backend_*_reasoning 各≥200字符；否则可留空字符串\n"
+    "3. overall_reasoning ≥ 200字符，需要总结推荐意见、优势与风险\n"
+    f"4. 总推理字数≥{constants.LLM_TOTAL_REASONING_MIN_CHARS}字符（即便无后端字段，也需通过展开细节满足要求）\n\n"
+    "【如何保证字符要求】\n"
+    "- 提供具体数据（GitHub stars、提交时间、PR/Issue数量、算力需求等）并展开论述\n"
+    "- 每个推理段落结构为“证据→分析→结论”，至少2-3句话\n"
+    "- 如果信息不足也要写明推断依据与潜在风险，不得以一句话带过\n"
+    "- 输出前自行检查字符数；若不满足要求，继续补充细节再输出\n\n"
+    "【输出限制】严格遵循给定JSON Schema，不允许新增/缺失字段，不得返回 null（除明确允许）。"
+)
+
+
+REPAIR_SYSTEM_PROMPT = (
+    "你是MGX BenchScope的Benchmark评估专家，负责扩写评分推理字段。"
+    "只输出包含指定字段的JSON对象，不要输出其他字段或解释。"
+)
+
+
+def _reasoning_order(name: str) -> int:
+    if name in REASONING_FIELD_ORDER:
+        return REASONING_FIELD_ORDER.index(name)
+    return len(REASONING_FIELD_ORDER)
+
+
+def _schema_version() -> str:
+    """由输出Schema派生的版本号，字段/约束变化时缓存自动失效"""
+
+    schema = json.dumps(
+        UnifiedBenchmarkExtraction.model_json_schema(),
+        sort_keys=True,
+        ensure_ascii=False,
+    )
+    return hashlib.sha256(schema.encode("utf-8")).hexdigest()[:12]
+
+
+SCORE_SCHEMA_VERSION = _schema_version()
+
+
+_exponential_wait = wait_exponential(multiplier=1, min=2, max=10)
+
+
+def _retry_wait(retry_state: RetryCallState) -> float:
+    """429的等待由并发控制器按retry-after统一处理，其余错误指数退避"""
+
+    outcome = retry_state.outcome
+    if outcome is not None and isinstance(outcome.exception(), RateLimitError):
+        return 0.0
+    return _exponential_wait(retry_state)
+
+
 # ==================== LLM评分引擎 ====================
 class LLMScorer:
     """全LLM统一评分引擎（单次调用返回所有26个字段）"""
@@ -546,8 +673,26 @@ class LLMScorer:
         base_url = self.settings.openai.base_url
         self.client: Optional[AsyncOpenAI] = None
         if api_key:
-            self.client = AsyncOpenAI(api_key=api_key, base_url=base_url)
+            # 关闭SDK内置重试，让429直接反馈给并发控制器
+            self.client = AsyncOpenAI(api_key=api_key, base_url=base_url, max_retries=0)
+        self.limiter = AdaptiveConcurrencyLimiter()
+        self.prompt_mode = self.settings.openai.prompt_mode
+        self.token_ledger = TokenLedger()
+        self.repair_mode = self.settings.openai.repair_mode
+        self.scoring_backend = self.settings.openai.scoring_backend
+        self.repair_stats = RepairStats()
         self.redis_client: Optional[AsyncRedis] = None
+        self.memory_cache = LRUScoreCache(constants.LLM_MEMORY_CACHE_SIZE)
+        self.cache_stats = ScoreCacheStats()
+        self._pending_writes: Dict[str, str] = {}
+        self.disk_cache: Optional[DiskScoreCache] = None
+        try:
+            self.disk_cache = DiskScoreCache(
+                self.settings.redis.disk_cache_path,
+                constants.REDIS_TTL_DAYS * 86400,
+            )
+        except Exception as exc:  # noqa: BLE001
+            logger.warning("本地评分缓存初始化失败,仅使用Redis: %s", exc)
 
     async def __aenter__(self) -> "LLMScorer":
         try:
@@ -559,53 +704,190 @@ class LLMScorer:
             ping_future = cast(Awaitable[bool], self.redis_client.ping())
             await ping_future
         except Exception as exc:  # noqa: BLE001
-            logger.warning("Redis连接失败,将不使用缓存: %s", exc)
+            logger.warning("Redis连接失败,改用本地磁盘缓存: %s", exc)
             self.redis_client = None
         return self
 
     async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.flush_cache_writes()
+        await self._purge_disk_cache()
+        self.log_cache_stats()
+        self.limiter.log_report()
+        self.token_ledger.log_summary(self.prompt_mode)
+        self.repair_stats.log_summary()
         if self.redis_client:
             await self.redis_client.aclose()
             self.redis_client = None
 
-    def _cache_key(self, candidate: RawCandidate) -> str:
-        """生成Redis缓存键（基于标题+URL的MD5）"""
-        key_str = f"v2:{candidate.title}:{candidate.url}"  # v2表示新版prompt
-        digest = hashlib.md5(key_str.encode(), usedforsecurity=False).hexdigest()
-        return f"{constants.REDIS_KEY_PREFIX}unified_score:{digest}"
+    def _cache_key(
+        self, candidate: RawCandidate, prompt_mode: Optional[str] = None
+    ) -> str:
+        """生成内容寻址缓存键
 
-    async def _get_cached_score(
-        self, candidate: RawCandidate
-    ) -> Optional[UnifiedBenchmarkExtraction]:
-        """从Redis读取缓存评分"""
-        if not self.redis_client:
+        基于完整渲染的prompt、模型名与Schema版本的SHA256：
+        PDF增强补充的摘要、prompt模板或输出Schema变化都会自然产生新键，
+        而与prompt无关的候选字段变化不会使缓存失效。
+        """
+        model = self.settings.openai.model or constants.LLM_MODEL
+        hasher = hashlib.sha256()
+        for part in (
+            model,
+            SCORE_SCHEMA_VERSION,
+            SCORING_SYSTEM_PROMPT,
+            self._build_prompt(candidate, prompt_mode),
+        ):
+            hasher.update(part.encode("utf-8"))
+            hasher.update(b"\x00")
+        return f"{constants.REDIS_KEY_PREFIX}unified_score:{hasher.hexdigest()}"
+
+    @staticmethod
+    def _parse_cached(raw: str) -> Optional[UnifiedBenchmarkExtraction]:
+        try:
+            return UnifiedBenchmarkExtraction.model_validate_json(raw)
+        except ValidationError as exc:
+            logger.warning("缓存评分结果无法解析,视为未命中: %s", exc)
             return None
+
+    async def _lookup_cached(
+        self, keys: List[str]
+    ) -> Dict[str, UnifiedBenchmarkExtraction]:
+        """批量解析缓存：内存LRU → Redis MGET（单次往返） → 本地磁盘"""
+        start = time.perf_counter()
+        stats = self.cache_stats
+        found: Dict[str, UnifiedBenchmarkExtraction] = {}
+        pending: List[str] = []
+        for key in dict.fromkeys(keys):
+            cached = self.memory_cache.get(key)
+            if cached is not None:
+                found[key] = cached
+                stats.memory_hits += 1
+            else:
+                pending.append(key)
+
+        if pending and self.redis_client:
+            try:
+                values = await self.redis_client.mget(pending)
+            except Exception as exc:  # noqa: BLE001
+                logger.warning("读取Redis缓存失败: %s", exc)
+                values = [None] * len(pending)
+            remaining: List[str] = []
+            for key, raw in zip(pending, values):
+                extraction = self._parse_cached(raw) if raw else None
+                if extraction is None:
+                    remaining.append(key)
+                    continue
+                found[key] = extraction
+                self.memory_cache.put(key, extraction)
+                stats.redis_hits += 1
+            pending = remaining
+
+        backfill: Dict[str, str] = {}
+        if pending and self.disk_cache:
+            try:
+                rows = await self.disk_cache.get_many(pending)
+            except Exception as exc:  # noqa: BLE001
+                logger.warning("读取本地评分缓存失败: %s", exc)
+                rows = {}
+            for key, raw in rows.items():
+                extraction = self._parse_cached(raw)
+                if extraction is None:
+                    continue
+                found[key] = extraction
+                self.memory_cache.put(key, extraction)
+                backfill[key] = raw
+                stats.disk_hits += 1
+            pending = [key for key in pending if key not in found]
+
+        stats.misses += len(pending)
+        stats.lookups += 1
+        stats.lookup_seconds += time.perf_counter() - start
+        if backfill:
+            # 磁盘命中回填Redis，供其他进程/下次运行直接命中
+            await self._write_redis(backfill)
+        return found
+
+    async def _write_redis(self, items: Dict[str, str]) -> None:
+        """通过pipeline一次往返写入多条缓存"""
+        if not self.redis_client or not items:
+            return
         try:
-            cached = await self.redis_client.get(self._cache_key(candidate))
-            if cached:
-                logger.debug("评分缓存命中: %s", candidate.title[:50])
-                return UnifiedBenchmarkExtraction.parse_raw(cached)
+            pipe = self.redis_client.pipeline(transaction=False)
+            for key, payload in items.items():
+                pipe.setex(key, constants.REDIS_TTL_DAYS * 86400, payload)
+            await pipe.execute()
         except Exception as exc:  # noqa: BLE001
-            logger.warning("读取Redis缓存失败: %s", exc)
-        return None
+            logger.warning("写入Redis缓存失败: %s", exc)
 
     async def _set_cached_score(
-        self, candidate: RawCandidate, extraction: UnifiedBenchmarkExtraction
+        self, key: str, extraction: UnifiedBenchmarkExtraction
     ) -> None:
-        """将评分结果写入Redis缓存"""
-        if not self.redis_client:
+        """写入内存LRU，并攒批写入Redis与本地磁盘缓存"""
+        self.memory_cache.put(key, extraction)
+        self._pending_writes[key] = extraction.model_dump_json()
+        if len(self._pending_writes) >= constants.LLM_CACHE_WRITE_BATCH_SIZE:
+            await self.flush_cache_writes()
+
+    async def _purge_disk_cache(self) -> None:
+        """删除本地缓存中的过期条目：缓存键按内容寻址，不清理会无限增长"""
+
+        if not self.disk_cache:
             return
         try:
-            await self.redis_client.setex(
-                self._cache_key(candidate),
-                constants.REDIS_TTL_DAYS * 86400,
-                extraction.json(),
-            )
+            purged = await self.disk_cache.purge_expired()
         except Exception as exc:  # noqa: BLE001
-            logger.warning("写入Redis缓存失败: %s", exc)
+            logger.warning("清理本地评分缓存失败: %s", exc)
+            return
+        if purged:
+            logger.info("本地评分缓存清理过期条目%d条", purged)
 
-    def _build_prompt(self, candidate: RawCandidate) -> str:
-        """构建4000+ token的超详细评分prompt"""
+    async def flush_cache_writes(self) -> None:
+        """将攒批的评分结果写入Redis（pipeline）与本地磁盘（单事务）"""
+        if not self._pending_writes:
+            return
+        items, self._pending_writes = self._pending_writes, {}
+        self.cache_stats.writes += len(items)
+        self.cache_stats.write_batches += 1
+        await self._write_redis(items)
+        if self.disk_cache:
+            try:
+                await self.disk_cache.set_many(items)
+            except Exception as exc:  # noqa: BLE001
+                logger.warning("写入本地评分缓存失败: %s", exc)
+
+    def log_cache_stats(self) -> None:
+        """输出本次运行的评分缓存命中率与查找耗时"""
+        stats = self.cache_stats
+        if not stats.lookups:
+            return
+        logger.info(
+            "评分缓存: 命中%d(内存%d/Redis%d/磁盘%d) 未命中%d 命中率%.1f%%, "
+            "查找%d次 平均%.1fms, 写入%d条/%d批",
+            stats.hits,
+            stats.memory_hits,
+            stats.redis_hits,
+            stats.disk_hits,
+            stats.misses,
+            stats.hit_rate * 100,
+            stats.lookups,
+            stats.avg_lookup_ms,
+            stats.writes,
+            stats.write_batches,
+        )
+
+    def _build_prompt(
+        self, candidate: RawCandidate, prompt_mode: Optional[str] = None
+    ) -> str:
+        """构建评分prompt
+
+        full: 4000+ token的超详细模板；compact: 省略空字段/空章节与重复的评分示例
+        """
+        fields = self._prompt_fields(candidate)
+        if (prompt_mode or self.prompt_mode) == "compact":
+            return self._render_compact_prompt(fields)
+        return UNIFIED_SCORING_PROMPT_TEMPLATE.format(**fields)
+
+    def _prompt_fields(self, candidate: RawCandidate) -> Dict[str, Any]:
+        """整理prompt占位符取值（缺失字段使用占位说明）"""
         abstract = clean_summary_text(candidate.abstract or "无") or "无"
         if len(abstract) > 2000:
             abstract = abstract[:2000] + "..."
@@ -654,104 +936,134 @@ class LLMScorer:
         raw_institutions = candidate.raw_institutions or "未提取"
         raw_dataset = candidate.raw_dataset_size or "未提取"
 
-        return UNIFIED_SCORING_PROMPT_TEMPLATE.format(
-            task_domain_options=", ".join(constants.TASK_DOMAIN_OPTIONS),
-            max_metrics=constants.MAX_EXTRACTED_METRICS,
-            title=candidate.title,
-            source=candidate.source,
-            url=candidate.url,
-            abstract=abstract,
-            github_stars=candidate.github_stars or "未提供",
-            publish_date=(
+        return {
+            "task_domain_options": ", ".join(constants.TASK_DOMAIN_OPTIONS),
+            "max_metrics": constants.MAX_EXTRACTED_METRICS,
+            "title": candidate.title,
+            "source": candidate.source,
+            "url": candidate.url,
+            "abstract": abstract,
+            "github_stars": candidate.github_stars or "未提供",
+            "publish_date": (
                 candidate.publish_date.strftime("%Y-%m-%d")
                 if candidate.publish_date
                 else "未知"
             ),
-            github_url=candidate.github_url or "未提供",
-            dataset_url=candidate.dataset_url or "未提供",
-            paper_url=candidate.paper_url or "未提供",
-            license_type=candidate.license_type or "未知",
-            task_type=candidate.task_type or "未识别",
-            introduction_summary=introduction_summary,
-            method_summary=method_summary,
-            evaluation_summary=evaluation_summary,
-            dataset_summary=dataset_summary,
-            baselines_summary=baselines_summary,
-            conclusion_summary=conclusion_summary,
-            raw_metrics=raw_metrics,
-            raw_baselines=raw_baselines,
-            raw_authors=raw_authors,
-            raw_institutions=raw_institutions,
-            raw_dataset_size=raw_dataset,
+            "github_url": candidate.github_url or "未提供",
+            "dataset_url": candidate.dataset_url or "未提供",
+            "paper_url": candidate.paper_url or "未提供",
+            "license_type": candidate.license_type or "未知",
+            "task_type": candidate.task_type or "未识别",
+            "introduction_summary": introduction_summary,
+            "method_summary": method_summary,
+            "evaluation_summary": evaluation_summary,
+            "dataset_summary": dataset_summary,
+            "baselines_summary": baselines_summary,
+            "conclusion_summary": conclusion_summary,
+            "raw_metrics": raw_metrics,
+            "raw_baselines": raw_baselines,
+            "raw_authors": raw_authors,
+            "raw_institutions": raw_institutions,
+            "raw_dataset_size": raw_dataset,
+        }
+
+    @staticmethod
+    def _render_compact_prompt(fields: Dict[str, Any]) -> str:
+        """渲染精简prompt：跳过取值为占位说明的字段与整段为空的章节"""
+        placeholders = ("未提供", "未知", "未识别", "未提取", "无")
+
+        def present(value: Any) -> bool:
+            text = str(value)
+            return bool(text) and not any(
+                text == p or text.startswith(f"{p}（") for p in placeholders
+            )
+
+        info = "\n".join(
+            f"{label}: {fields[key]}"
+            for key, label in _COMPACT_INFO_LABELS
+            if present(fields[key])
+        )
+        sections: List[str] = []
+        pdf = [
+            f"> {label}:\n{fields[key]}"
+            for key, label in _COMPACT_PDF_LABELS
+            if present(fields[key])
+        ]
+        if pdf:
+            sections.append("【PDF深度内容】\n" + "\n\n".join(pdf))
+        raw = [
+            f"- {label}: {fields[key]}"
+            for key, label in _COMPACT_RAW_LABELS
+            if present(fields[key])
+        ]
+        if raw:
+            sections.append("【原始提取数据 (采集器粗提取)】\n" + "\n".join(raw))
+        evidence = "".join(f"{section}\n\n" for section in sections)
+        return COMPACT_SCORING_PROMPT_TEMPLATE.format(
+            candidate_info=info,
+            evidence=evidence,
+            task_domain_options=fields["task_domain_options"],
+            max_metrics=fields["max_metrics"],
         )
 
     @retry(
         stop=stop_after_attempt(constants.LLM_MAX_RETRIES),
-        wait=wait_exponential(multiplier=1, min=2, max=10),
+        wait=_retry_wait,
     )
-    async def _call_llm(self, candidate: RawCandidate) -> UnifiedBenchmarkExtraction:
-        """调用LLM获取评分（单次返回所有26个字段）"""
+    async def _call_llm(
+        self, candidate: RawCandidate, initial_content: Optional[str] = None
+    ) -> UnifiedBenchmarkExtraction:
+        """调用LLM获取评分（单次返回所有26个字段）
+
+        initial_content: 已由batch后端取得的首轮响应，提供时跳过首轮实时调用，
+        校验与纠偏流程不变。
+        """
         if not self.client:
             raise RuntimeError("未配置OpenAI接口,无法调用LLM")
 
-        prompt = self._build_prompt(candidate)
-        logger.debug("LLM评分prompt长度: %d 字符", len(prompt))
-
-        messages: List[ChatCompletionMessageParam] = [
-            {
-                "role": "system",
-                "content": (
-                    "你是MGX BenchScope的Benchmark评估专家，将输出可直接入库的JSON评分结果。\n\n"
-                    "【关键硬性要求——违反任意一条将视为失败】\n"
-                    "1. activity/reproducibility/license/novelty/relevance_reasoning 各≥150字符（建议≥180字符）\n"
-                    "2. 若 backend_mgx_relevance 或 backend_engineering_value > 0，则对应的 backend_*_reasoning 各≥200字符；否则可留空字符串\n"
-                    "3. overall_reasoning ≥ 200字符，需要总结推荐意见、优势与风险\n"
-                    f"4. 总推理字数≥{constants.LLM_TOTAL_REASONING_MIN_CHARS}字符（即便无后端字段，也需通过展开细节满足要求）\n\n"
-                    "【如何保证字符要求】\n"
-                    "- 提供具体数据（GitHub stars、提交时间、PR/Issue数量、算力需求等）并展开论述\n"
-                    "- 每个推理段落结构为“证据→分析→结论”，至少2-3句话\n"
-                    "- 如果信息不足也要写明推断依据与潜在风险，不得以一句话带过\n"
-                    "- 输出前自行检查字符数；若不满足要求，继续补充细节再输出\n\n"
-                    "【输出限制】严格遵循给定JSON Schema，不允许新增/缺失字段，不得返回 null（除明确允许）。"
-                ),
-            },
-            {"role": "user", "content": prompt},
-        ]
+        messages = self._scoring_messages(candidate)
 
         repair_attempt = 0
+        if initial_content is None:
+            content = await self._complete_scoring(candidate, messages, repair_attempt)
+        else:
+            content = initial_content
+        payload = self._load_payload(content)
         while True:
-            response = await asyncio.wait_for(
-                self.client.chat.completions.create(
-                    model=self.settings.openai.model or constants.LLM_MODEL,
-                    messages=messages,
-                    temperature=0.1,
-                    max_tokens=4096,  # 增加max_tokens以容纳详细推理
-                ),
-                timeout=constants.LLM_TIMEOUT_SECONDS * 2,  # 增加超时时间
-            )
-
-            content = response.choices[0].message.content or ""
-            logger.debug("LLM原始响应长度: %d 字符", len(content))
-            payload = self._load_payload(content)
             try:
-                extraction = UnifiedBenchmarkExtraction.parse_obj(payload)
+                extraction = UnifiedBenchmarkExtraction.model_validate(payload)
             except ValidationError as exc:  # noqa: PERF203
                 violations = self._extract_length_violations(exc, payload)
                 if violations and repair_attempt < constants.LLM_SELF_HEAL_MAX_ATTEMPTS:
                     repair_attempt += 1
-                    fix_prompt = self._build_length_fix_prompt(violations)
-                    messages.append({"role": "assistant", "content": content})
-                    messages.append({"role": "user", "content": fix_prompt})
                     logger.debug(
-                        "LLM推理长度不足，触发第%d次纠偏: %s",
+                        "LLM推理长度不足，触发第%d次纠偏(%s): %s",
                         repair_attempt,
+                        self.repair_mode,
                         candidate.title[:50],
                     )
+                    if self.repair_mode == "patch":
+                        payload = await self._patch_fields(
+                            candidate, payload, violations, repair_attempt
+                        )
+                        continue
+                    self.repair_stats.record_trigger(list(violations), "resend")
+                    messages.append({"role": "assistant", "content": content})
+                    messages.append(
+                        {"role": "user", "content": self._build_length_fix_prompt(violations)}
+                    )
+                    content = await self._complete_scoring(
+                        candidate, messages, repair_attempt
+                    )
+                    payload = self._load_payload(content)
                     continue
                 # 兜底：纠偏用尽后，对长度不足字段做自动填充再尝试一次
                 autofixed_payload = self._autofix_payload_lengths(payload)
                 try:
-                    extraction = UnifiedBenchmarkExtraction.parse_obj(autofixed_payload)
+                    extraction = UnifiedBenchmarkExtraction.model_validate(
+                        autofixed_payload
+                    )
+                    self.repair_stats.autofixed += 1
                     logger.warning(
                         "LLM响应长度不足已通过自动兜底修复: %s",
                         candidate.title[:50],
@@ -765,16 +1077,10 @@ class LLMScorer:
                     raise
 
             # 检查总推理长度，不足则尝试自愈纠偏
-            total_reasoning_length = (
-                len(extraction.activity_reasoning)
-                + len(extraction.reproducibility_reasoning)
-                + len(extraction.license_reasoning)
-                + len(extraction.novelty_reasoning)
-                + len(extraction.relevance_reasoning)
-                + len(extraction.backend_mgx_reasoning)
-                + len(extraction.backend_engineering_reasoning)
-                + len(extraction.overall_reasoning)
-            )
+            reasoning_lengths = {
+                name: len(getattr(extraction, name)) for name in REASONING_FIELD_ORDER
+            }
+            total_reasoning_length = sum(reasoning_lengths.values())
             min_total_chars = constants.LLM_TOTAL_REASONING_MIN_CHARS
             if (
                 total_reasoning_length < min_total_chars
@@ -782,6 +1088,31 @@ class LLMScorer:
             ):
                 repair_attempt += 1
                 shortage = min_total_chars - total_reasoning_length
+                logger.warning(
+                    "推理总字数不足（%d < %d），触发第%d次纠偏(%s): %s",
+                    total_reasoning_length,
+                    min_total_chars,
+                    repair_attempt,
+                    self.repair_mode,
+                    candidate.title[:50],
+                )
+                if self.repair_mode == "patch":
+                    # 后端推理为空说明非后端Benchmark，不参与扩写
+                    targets = pick_expansion_targets(
+                        {
+                            name: length
+                            for name, length in reasoning_lengths.items()
+                            if length or not name.startswith("backend_")
+                        },
+                        shortage,
+                        constants.LLM_REPAIR_TOTAL_SHORTAGE_FIELDS,
+                    )
+                    payload = await self._patch_fields(
+                        candidate, extraction.model_dump(), targets, repair_attempt
+                    )
+                    continue
+
+                self.repair_stats.record_trigger(["total_reasoning"], "resend")
                 fix_prompt = (
                     "上一次JSON输出的推理总字数不足："
                     f"当前{total_reasoning_length}字符，要求≥{min_total_chars}字符（差{shortage}字符）。\n\n"
@@ -795,13 +1126,8 @@ class LLMScorer:
 
                 messages.append({"role": "assistant", "content": content})
                 messages.append({"role": "user", "content": fix_prompt})
-                logger.warning(
-                    "推理总字数不足（%d < %d），触发第%d次纠偏: %s",
-                    total_reasoning_length,
-                    min_total_chars,
-                    repair_attempt,
-                    candidate.title[:50],
-                )
+                content = await self._complete_scoring(candidate, messages, repair_attempt)
+                payload = self._load_payload(content)
                 continue
 
             if total_reasoning_length < min_total_chars:
@@ -815,6 +1141,154 @@ class LLMScorer:
 
             return extraction
 
+    def _scoring_messages(
+        self, candidate: RawCandidate
+    ) -> List[ChatCompletionMessageParam]:
+        """首轮评分请求的消息列表（实时与batch后端共用）"""
+        prompt = self._build_prompt(candidate)
+        logger.debug("LLM评分prompt长度: %d 字符", len(prompt))
+        return [
+            {
+                "role": "system",
+                "content": SCORING_SYSTEM_PROMPT,
+            },
+            {"role": "user", "content": prompt},
+        ]
+
+    async def _complete_scoring(
+        self,
+        candidate: RawCandidate,
+        messages: List[ChatCompletionMessageParam],
+        attempt: int,
+    ) -> str:
+        """发起一次完整评分补全并记账，返回响应文本"""
+        response = await self._create_completion(messages)
+        self.token_ledger.record(
+            candidate.url, attempt, getattr(response, "usage", None)
+        )
+        content = response.choices[0].message.content or ""
+        logger.debug("LLM原始响应长度: %d 字符", len(content))
+        return content
+
+    async def _patch_fields(
+        self,
+        candidate: RawCandidate,
+        payload: dict[str, Any],
+        violations: Dict[str, Tuple[int, int]],
+        attempt: int,
+    ) -> dict[str, Any]:
+        """定向纠偏：只请求不合格字段的扩写补丁并合并回payload
+
+        与整段重发相比，请求只携带候选摘要、当前分数与待扩写字段，
+        不重复发送4000+ token的评分prompt与上一轮完整响应。
+        """
+        self.repair_stats.record_trigger(list(violations), "patch")
+        messages: List[ChatCompletionMessageParam] = [
+            {"role": "system", "content": REPAIR_SYSTEM_PROMPT},
+            {
+                "role": "user",
+                "content": self._build_patch_prompt(candidate, payload, violations),
+            },
+        ]
+        response = await self._create_completion(
+            messages, max_tokens=constants.LLM_REPAIR_MAX_TOKENS
+        )
+        self.token_ledger.record(
+            candidate.url, attempt, getattr(response, "usage", None)
+        )
+        try:
+            patch = self._load_payload(response.choices[0].message.content or "")
+        except Exception as exc:  # noqa: BLE001
+            logger.warning("纠偏补丁解析失败: %s", exc)
+            return payload
+
+        merged = dict(payload)
+        for name in violations:
+            value = patch.get(name)
+            if isinstance(value, str) and len(value) > len(str(merged.get(name) or "")):
+                merged[name] = value
+                self.repair_stats.fixed[name] += 1
+        return merged
+
+    def _build_patch_prompt(
+        self,
+        candidate: RawCandidate,
+        payload: dict[str, Any],
+        violations: Dict[str, Tuple[int, int]],
+    ) -> str:
+        """构造定向补丁请求：候选概要 + 当前分数 + 待扩写字段原文与目标长度"""
+        abstract = clean_summary_text(candidate.abstract or "") or "无"
+        if len(abstract) > constants.LLM_REPAIR_CONTEXT_CHARS:
+            abstract = abstract[: constants.LLM_REPAIR_CONTEXT_CHARS] + "..."
+        scores = ", ".join(
+            f"{name}={payload.get(name)}"
+            for name in (
+                "activity_score",
+                "reproducibility_score",
+                "license_score",
+                "novelty_score",
+                "relevance_score",
+                "backend_mgx_relevance",
+                "backend_engineering_value",
+            )
+            if payload.get(name) is not None
+        )
+        lines = [
+            f"候选: {candidate.title}",
+            f"URL: {candidate.url}",
+            f"摘要: {abstract}",
+            f"已给出的评分: {scores}",
+            "",
+            "以下推理字段字符数不足，请在保持原有结论与评分一致的前提下扩写，"
+            "补充证据、数据来源、MGX场景影响与潜在风险：",
+        ]
+        for name in sorted(violations, key=_reasoning_order):
+            required, current = violations[name]
+            label = REASONING_FIELD_LABELS.get(name, name)
+            original = str(payload.get(name) or "")
+            lines.append(f"- {label}: 当前{current}字符，至少{required}字符。原文：{original}")
+        lines.append("")
+        lines.append(
+            "只输出一个JSON对象，键仅限上述字段，值为扩写后的完整文本："
+            + json.dumps({name: "..." for name in violations}, ensure_ascii=False)
+        )
+        return "\n".join(lines)
+
+    async def _create_completion(
+        self,
+        messages: List[ChatCompletionMessageParam],
+        max_tokens: int = 4096,  # 增加max_tokens以容纳详细推理
+    ):
+        """在自适应并发窗口内发起一次补全请求，并将响应头/延迟反馈给控制器"""
+        assert self.client is not None
+        async with self.limiter.slot():
+            start = time.monotonic()
+            try:
+                raw = await asyncio.wait_for(
+                    self.client.chat.completions.with_raw_response.create(
+                        model=self.settings.openai.model or constants.LLM_MODEL,
+                        messages=messages,
+                        temperature=0.1,
+                        max_tokens=max_tokens,
+                    ),
+                    timeout=constants.LLM_TIMEOUT_SECONDS * 2,  # 增加超时时间
+                )
+            except RateLimitError as exc:
+                self.limiter.record_rate_limited(exc.response.headers)
+                raise
+            except Exception:
+                self.limiter.record_error(time.monotonic() - start)
+                raise
+
+            response = raw.parse()
+            usage = getattr(response, "usage", None)
+            self.limiter.record_success(
+                time.monotonic() - start,
+                raw.headers,
+                tokens=getattr(usage, "total_tokens", 0) or 0,
+            )
+            return response
+
     def _load_payload(self, content: str) -> dict[str, Any]:
         """解析LLM响应文本为JSON对象"""
         json_str = self._strip_code_fence(content)
@@ -929,23 +1403,81 @@ class LLMScorer:
         payload["overall_reasoning"] = overall_fixed
         return payload
 
-    async def score(self, candidate: RawCandidate) -> ScoredCandidate:
+    async def score(
+        self, candidate: RawCandidate, cache_key: Optional[str] = None
+    ) -> ScoredCandidate:
         """评分单个候选项"""
-        # 尝试读取缓存
-        extraction = await self._get_cached_score(candidate)
-        if not extraction:
-            if not self.client:
-                logger.error("OpenAI未配置且无缓存,无法评分: %s", candidate.title[:50])
-                raise RuntimeError("未配置OpenAI且无缓存,无法评分")
+        key = cache_key or self._cache_key(candidate)
+        extraction = (await self._lookup_cached([key])).get(key)
+        if extraction:
+            return self._to_scored_candidate(candidate, extraction)
+        return await self._score_uncached(candidate, key)
+
+    async def _score_uncached(
+        self,
+        candidate: RawCandidate,
+        key: str,
+        initial_content: Optional[str] = None,
+    ) -> ScoredCandidate:
+        """缓存未命中时调用LLM评分并写入缓存"""
+        if not self.client:
+            logger.error("OpenAI未配置且无缓存,无法评分: %s", candidate.title[:50])
+            raise RuntimeError("未配置OpenAI且无缓存,无法评分")
+        try:
             try:
+                extraction = await self._call_llm(candidate, initial_content)
+            except Exception as exc:  # noqa: BLE001
+                if initial_content is None:
+                    raise
+                logger.warning(
+                    "Batch响应无法使用(%s)，回退实时评分: %s", exc, candidate.title[:50]
+                )
                 extraction = await self._call_llm(candidate)
-                await self._set_cached_score(candidate, extraction)
-            except Exception as exc:
-                logger.error("LLM评分失败: %s, 候选: %s", exc, candidate.title[:50])
-                raise
+            await self._set_cached_score(key, extraction)
+        except Exception as exc:
+            logger.error("LLM评分失败: %s, 候选: %s", exc, candidate.title[:50])
+            raise
 
         return self._to_scored_candidate(candidate, extraction)
 
+    async def _batch_first_pass(
+        self, misses: List[Tuple[RawCandidate, str]]
+    ) -> Dict[str, str]:
+        """通过Batch API取得未命中候选的首轮响应，返回 缓存键 → 响应文本"""
+        if not self.client or not misses:
+            return {}
+        requests: Dict[str, List[ChatCompletionMessageParam]] = {}
+        keys: Dict[str, Tuple[RawCandidate, str]] = {}
+        seen: set[str] = set()
+        for index, (candidate, key) in enumerate(misses):
+            if key in seen:
+                continue
+            seen.add(key)
+            custom_id = f"req-{index}"
+            requests[custom_id] = self._scoring_messages(candidate)
+            keys[custom_id] = (candidate, key)
+
+        backend = OpenAIBatchBackend(
+            self.client,
+            self.settings.logging.directory / "llm_batches",
+            poll_seconds=constants.LLM_BATCH_POLL_SECONDS,
+            max_wait_seconds=constants.LLM_BATCH_MAX_WAIT_SECONDS,
+        )
+        outcome = await backend.complete(
+            cast(Dict[str, List[Dict[str, Any]]], requests),
+            model=self.settings.openai.model or constants.LLM_MODEL,
+            max_tokens=4096,
+            temperature=0.1,
+        )
+        contents: Dict[str, str] = {}
+        for custom_id, content in outcome.contents.items():
+            candidate, key = keys[custom_id]
+            contents[key] = content
+            usage = outcome.usage.get(custom_id)
+            if usage:
+                self.token_ledger.record(candidate.url, 0, SimpleNamespace(**usage))
+        return contents
+
     def _to_scored_candidate(
         self,
         candidate: RawCandidate,
@@ -1044,18 +1576,38 @@ class LLMScorer:
     async def score_batch(
         self, candidates: List[RawCandidate]
     ) -> List[ScoredCandidate]:
-        """批量评分（并发控制）"""
+        """批量评分（自适应并发控制）"""
         if not candidates:
             return []
 
-        semaphore = asyncio.Semaphore(constants.SCORE_CONCURRENCY)
+        # 预查询：一次MGET解析全部缓存键，只有未命中的候选进入LLM调用
+        keys = [self._cache_key(candidate) for candidate in candidates]
+        cached = await self._lookup_cached(keys)
 
-        async def score_with_semaphore(candidate: RawCandidate) -> ScoredCandidate:
-            async with semaphore:
-                return await self.score(candidate)
+        # batch后端：未命中候选的首轮请求走Batch API，纠偏与失败回退仍走实时接口
+        batch_contents: Dict[str, str] = {}
+        if self.scoring_backend == "batch":
+            batch_contents = await self._batch_first_pass(
+                [(c, k) for c, k in zip(candidates, keys) if k not in cached]
+            )
 
-        tasks = [score_with_semaphore(candidate) for candidate in candidates]
+        async def score_one(
+            candidate: RawCandidate, key: str
+        ) -> ScoredCandidate:
+            extraction = cached.get(key)
+            if extraction:
+                return self._to_scored_candidate(candidate, extraction)
+            # 在途请求数由自适应并发控制器约束
+            return await self._score_uncached(
+                candidate, key, initial_content=batch_contents.get(key)
+            )
+
+        tasks = [
+            score_one(candidate, key)
+            for candidate, key in zip(candidates, keys)
+        ]
         results = await asyncio.gather(*tasks, return_exceptions=True)
+        await self.flush_cache_writes()
 
         # 处理异常
         scored_results = []
@@ -1070,9 +1622,10 @@ class LLMScorer:
                 scored_results.append(result)
 
         logger.info(
-            "批量评分完成: 成功%d条/共%d条 (并发上限=%d)",
+            "批量评分完成: 成功%d条/共%d条 (并发窗口=%d, 上限=%d)",
             len(scored_results),
             len(candidates),
+            self.limiter.window,
             constants.SCORE_CONCURRENCY,
         )
         return scored_results
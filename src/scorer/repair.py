@@ -0,0 +1,60 @@
+"""推理字段纠偏：定向补丁的目标选择与统计"""
+
+from __future__ import annotations
+
+import logging
+import math
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Dict, Mapping, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(slots=True)
+class RepairStats:
+    """各字段触发纠偏的次数与修复结果，用于针对性调整prompt"""
+
+    triggered: Counter[str] = field(default_factory=Counter)
+    fixed: Counter[str] = field(default_factory=Counter)
+    patch_calls: int = 0
+    resend_calls: int = 0
+    autofixed: int = 0  # 纠偏用尽后靠本地兜底填充通过校验
+
+    def record_trigger(self, fields: Sequence[str], mode: str) -> None:
+        self.triggered.update(fields)
+        if mode == "patch":
+            self.patch_calls += 1
+        else:
+            self.resend_calls += 1
+
+    def log_summary(self) -> None:
+        if not self.triggered:
+            return
+        detail = ", ".join(
+            f"{name}×{count}(修复{self.fixed[name]})"
+            for name, count in self.triggered.most_common()
+        )
+        logger.info(
+            "推理纠偏统计: 补丁调用%d次, 整段重发%d次, 兜底填充%d次; 字段: %s",
+            self.patch_calls,
+            self.resend_calls,
+            self.autofixed,
+            detail,
+        )
+
+
+def pick_expansion_targets(
+    lengths: Mapping[str, int], shortage: int, max_fields: int
+) -> Dict[str, Tuple[int, int]]:
+    """推理总字数不足时，挑选最短的若干字段平摊差额
+
+    Returns:
+        字段 → (目标字符数, 当前字符数)，与长度违规的结构一致
+    """
+
+    candidates = sorted(lengths.items(), key=lambda item: item[1])[:max_fields]
+    if not candidates:
+        return {}
+    extra = math.ceil(shortage / len(candidates))
+    return {name: (length + extra, length) for name, length in candidates}
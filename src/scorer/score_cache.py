@@ -0,0 +1,169 @@
+"""LLM评分结果缓存分层
+
+查找顺序：进程内LRU → Redis → 本地SQLite（Redis不可用或未命中时的兜底层）。
+"""
+
+from __future__ import annotations
+
+import asyncio
+import sqlite3
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional
+
+
+@dataclass(slots=True)
+class ScoreCacheStats:
+    """评分缓存命中/未命中/耗时统计"""
+
+    memory_hits: int = 0
+    redis_hits: int = 0
+    disk_hits: int = 0
+    misses: int = 0
+    lookups: int = 0  # 查找批次数（单条score与批量预查询各记一次）
+    lookup_seconds: float = 0.0
+    writes: int = 0
+    write_batches: int = 0
+
+    @property
+    def hits(self) -> int:
+        return self.memory_hits + self.redis_hits + self.disk_hits
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    @property
+    def avg_lookup_ms(self) -> float:
+        return self.lookup_seconds * 1000 / self.lookups if self.lookups else 0.0
+
+
+class LRUScoreCache:
+    """进程内LRU，保存已解析的评分结果，避免重复网络往返与反序列化"""
+
+    def __init__(self, max_size: int) -> None:
+        self.max_size = max_size
+        self._data: OrderedDict[str, Any] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get(self, key: str) -> Optional[Any]:
+        value = self._data.get(key)
+        if value is not None:
+            self._data.move_to_end(key)
+        return value
+
+    def put(self, key: str, value: Any) -> None:
+        self._data[key] = value
+        self._data.move_to_end(key)
+        while len(self._data) > self.max_size:
+            self._data.popitem(last=False)
+
+
+class DiskScoreCache:
+    """基于SQLite的键值缓存，按过期时间惰性淘汰"""
+
+    def __init__(self, db_path: Path, ttl_seconds: int) -> None:
+        self.db_path = Path(db_path)
+        self.ttl_seconds = ttl_seconds
+        self._init_db()
+
+    def _init_db(self) -> None:
+        """初始化数据库结构"""
+
+        conn = sqlite3.connect(self.db_path)
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS score_cache (
+                cache_key TEXT PRIMARY KEY,
+                payload TEXT NOT NULL,
+                expires_at REAL NOT NULL
+            )
+            """
+        )
+        conn.commit()
+        conn.close()
+
+    async def get(self, key: str) -> Optional[str]:
+        return await asyncio.to_thread(self._get_sync, key)
+
+    def _get_sync(self, key: str) -> Optional[str]:
+        conn = sqlite3.connect(self.db_path)
+        row = conn.execute(
+            "SELECT payload FROM score_cache WHERE cache_key = ? AND expires_at > ?",
+            (key, time.time()),
+        ).fetchone()
+        conn.close()
+        return row[0] if row else None
+
+    async def set(self, key: str, payload: str) -> None:
+        await asyncio.to_thread(self._set_sync, key, payload)
+
+    def _set_sync(self, key: str, payload: str) -> None:
+        conn = sqlite3.connect(self.db_path)
+        conn.execute(
+            "INSERT OR REPLACE INTO score_cache (cache_key, payload, expires_at) "
+            "VALUES (?, ?, ?)",
+            (key, payload, time.time() + self.ttl_seconds),
+        )
+        conn.commit()
+        conn.close()
+
+    async def get_many(self, keys: Iterable[str]) -> Dict[str, str]:
+        """批量读取，单次查询返回所有未过期命中"""
+
+        return await asyncio.to_thread(self._get_many_sync, list(keys))
+
+    def _get_many_sync(self, keys: list[str]) -> Dict[str, str]:
+        if not keys:
+            return {}
+        conn = sqlite3.connect(self.db_path)
+        found: Dict[str, str] = {}
+        # SQLite默认变量上限999，分片查询
+        for start in range(0, len(keys), 500):
+            chunk = keys[start : start + 500]
+            placeholders = ",".join("?" * len(chunk))
+            rows = conn.execute(
+                f"SELECT cache_key, payload FROM score_cache "
+                f"WHERE cache_key IN ({placeholders}) AND expires_at > ?",
+                (*chunk, time.time()),
+            ).fetchall()
+            found.update(rows)
+        conn.close()
+        return found
+
+    async def set_many(self, items: Dict[str, str]) -> None:
+        """批量写入，单个事务提交"""
+
+        await asyncio.to_thread(self._set_many_sync, dict(items))
+
+    def _set_many_sync(self, items: Dict[str, str]) -> None:
+        if not items:
+            return
+        expires_at = time.time() + self.ttl_seconds
+        conn = sqlite3.connect(self.db_path)
+        conn.executemany(
+            "INSERT OR REPLACE INTO score_cache (cache_key, payload, expires_at) "
+            "VALUES (?, ?, ?)",
+            [(key, payload, expires_at) for key, payload in items.items()],
+        )
+        conn.commit()
+        conn.close()
+
+    async def purge_expired(self) -> int:
+        """删除过期条目，返回删除数量"""
+
+        return await asyncio.to_thread(self._purge_expired_sync)
+
+    def _purge_expired_sync(self) -> int:
+        conn = sqlite3.connect(self.db_path)
+        cursor = conn.execute(
+            "DELETE FROM score_cache WHERE expires_at <= ?", (time.time(),)
+        )
+        conn.commit()
+        conn.close()
+        return cursor.rowcount
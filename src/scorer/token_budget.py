@@ -0,0 +1,98 @@
+"""LLM调用Token记账：按候选与纠偏轮次统计 response.usage"""
+
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(slots=True)
+class TokenRecord:
+    """单次补全调用的token消耗，attempt=0为首次调用，≥1为纠偏轮次"""
+
+    candidate: str
+    attempt: int
+    prompt_tokens: int
+    completion_tokens: int
+
+
+class TokenLedger:
+    """本次运行的token账本"""
+
+    def __init__(self) -> None:
+        self.records: List[TokenRecord] = []
+
+    def record(self, candidate: str, attempt: int, usage: Optional[Any]) -> None:
+        """记录一次调用；兼容服务端未返回usage的情况"""
+
+        if usage is None:
+            return
+        self.records.append(
+            TokenRecord(
+                candidate=candidate,
+                attempt=attempt,
+                prompt_tokens=getattr(usage, "prompt_tokens", 0) or 0,
+                completion_tokens=getattr(usage, "completion_tokens", 0) or 0,
+            )
+        )
+
+    @property
+    def prompt_tokens(self) -> int:
+        return sum(r.prompt_tokens for r in self.records)
+
+    @property
+    def completion_tokens(self) -> int:
+        return sum(r.completion_tokens for r in self.records)
+
+    def per_candidate(self) -> Dict[str, Tuple[int, int]]:
+        """候选 → (输入tokens, 输出tokens)，含全部纠偏轮次"""
+
+        totals: Dict[str, Tuple[int, int]] = {}
+        for r in self.records:
+            prompt, completion = totals.get(r.candidate, (0, 0))
+            totals[r.candidate] = (prompt + r.prompt_tokens, completion + r.completion_tokens)
+        return totals
+
+    def per_attempt(self) -> Dict[int, Tuple[int, int, int]]:
+        """轮次 → (调用次数, 输入tokens, 输出tokens)"""
+
+        totals: Dict[int, Tuple[int, int, int]] = {}
+        for r in self.records:
+            calls, prompt, completion = totals.get(r.attempt, (0, 0, 0))
+            totals[r.attempt] = (
+                calls + 1,
+                prompt + r.prompt_tokens,
+                completion + r.completion_tokens,
+            )
+        return totals
+
+    def log_summary(self, prompt_mode: str) -> None:
+        if not self.records:
+            return
+        candidates = self.per_candidate()
+        attempts = self.per_attempt()
+        repair_prompt = sum(v[1] for k, v in attempts.items() if k > 0)
+        repair_calls = sum(v[0] for k, v in attempts.items() if k > 0)
+        logger.info(
+            "Token统计(prompt=%s): 调用%d次/候选%d条, 输入%d 输出%d tokens, "
+            "单候选平均输入%.0f, 纠偏%d次占输入%.1f%%",
+            prompt_mode,
+            len(self.records),
+            len(candidates),
+            self.prompt_tokens,
+            self.completion_tokens,
+            self.prompt_tokens / len(candidates),
+            repair_calls,
+            repair_prompt * 100 / self.prompt_tokens if self.prompt_tokens else 0.0,
+        )
+        for attempt in sorted(attempts):
+            calls, prompt, completion = attempts[attempt]
+            logger.info(
+                "  第%d轮: %d次, 输入%d 输出%d tokens", attempt, calls, prompt, completion
+            )
+        top = sorted(candidates.items(), key=lambda kv: sum(kv[1]), reverse=True)[:3]
+        for name, (prompt, completion) in top:
+            logger.info("  高消耗候选: %s 输入%d 输出%d", name[:60], prompt, completion)
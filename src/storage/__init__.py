@@ -1,5 +1,6 @@
 """存储模块导出"""
 
+from src.storage.feishu_index import FeishuRecordIndex
 from src.storage.feishu_storage import FeishuAPIError, FeishuStorage
 from src.storage.notification_history import NotificationHistory
 from src.storage.sqlite_fallback import SQLiteFallback
@@ -8,6 +9,7 @@ from src.storage.storage_manager import StorageManager
 __all__ = [
     "FeishuStorage",
     "FeishuAPIError",
+    "FeishuRecordIndex",
     "NotificationHistory",
     "SQLiteFallback",
     "StorageManager",
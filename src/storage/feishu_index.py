@@ -0,0 +1,228 @@
+"""飞书多维表格记录的本地SQLite镜像
+
+只保存去重所需的字段（url_key/来源/创建时间/发布日期），
+冷启动时全量拉取一次，之后按修改时间增量刷新，避免每次运行都翻页读取整张表。
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import sqlite3
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Iterable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# 本地写入但尚未从飞书回读的记录使用的record_id前缀
+LOCAL_RECORD_PREFIX = "local:"
+
+
+class FeishuRecordIndex:
+    """飞书记录本地索引，按 url_key 建索引供去重查询"""
+
+    def __init__(self, db_path: Path) -> None:
+        self.db_path = Path(db_path)
+        self._init_db()
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.db_path)
+
+    def _init_db(self) -> None:
+        """初始化数据库结构"""
+
+        conn = self._connect()
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS feishu_records (
+                record_id TEXT PRIMARY KEY,
+                table_key TEXT NOT NULL,
+                url TEXT NOT NULL,
+                url_key TEXT NOT NULL,
+                source TEXT NOT NULL,
+                created_at TEXT,
+                publish_date TEXT,
+                modified_ms INTEGER
+            )
+            """
+        )
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_feishu_records_url_key "
+            "ON feishu_records (table_key, url_key)"
+        )
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS feishu_index_meta (
+                table_key TEXT PRIMARY KEY,
+                watermark_ms INTEGER NOT NULL,
+                full_synced_at TEXT NOT NULL
+            )
+            """
+        )
+        conn.commit()
+        conn.close()
+
+    # ---- 元数据 ----
+
+    async def get_meta(self, table_key: str) -> Optional[tuple[int, datetime]]:
+        """返回 (增量水位毫秒, 上次全量同步时间)，冷启动返回None"""
+
+        return await asyncio.to_thread(self._get_meta_sync, table_key)
+
+    def _get_meta_sync(self, table_key: str) -> Optional[tuple[int, datetime]]:
+        conn = self._connect()
+        row = conn.execute(
+            "SELECT watermark_ms, full_synced_at FROM feishu_index_meta WHERE table_key = ?",
+            (table_key,),
+        ).fetchone()
+        conn.close()
+        if not row:
+            return None
+        return int(row[0]), datetime.fromisoformat(row[1])
+
+    # ---- 写入 ----
+
+    async def replace_all(
+        self, table_key: str, records: List[dict[str, Any]], watermark_ms: int
+    ) -> None:
+        """全量同步：清空该表的镜像后整体写入"""
+
+        await asyncio.to_thread(
+            self._replace_all_sync, table_key, records, watermark_ms
+        )
+
+    def _replace_all_sync(
+        self, table_key: str, records: List[dict[str, Any]], watermark_ms: int
+    ) -> None:
+        conn = self._connect()
+        with conn:
+            conn.execute("DELETE FROM feishu_records WHERE table_key = ?", (table_key,))
+            self._insert_rows(conn, table_key, records)
+            conn.execute(
+                "INSERT OR REPLACE INTO feishu_index_meta "
+                "(table_key, watermark_ms, full_synced_at) VALUES (?, ?, ?)",
+                (table_key, watermark_ms, datetime.now().isoformat()),
+            )
+        conn.close()
+
+    async def upsert(
+        self, table_key: str, records: List[dict[str, Any]], watermark_ms: int
+    ) -> None:
+        """增量同步：按record_id覆盖，并清理同URL的本地占位记录"""
+
+        await asyncio.to_thread(self._upsert_sync, table_key, records, watermark_ms)
+
+    def _upsert_sync(
+        self, table_key: str, records: List[dict[str, Any]], watermark_ms: int
+    ) -> None:
+        conn = self._connect()
+        with conn:
+            conn.executemany(
+                "DELETE FROM feishu_records WHERE table_key = ? AND url_key = ? "
+                "AND record_id LIKE ?",
+                [
+                    (table_key, record["url_key"], f"{LOCAL_RECORD_PREFIX}%")
+                    for record in records
+                ],
+            )
+            self._insert_rows(conn, table_key, records)
+            conn.execute(
+                "UPDATE feishu_index_meta SET watermark_ms = ? WHERE table_key = ?",
+                (watermark_ms, table_key),
+            )
+        conn.close()
+
+    async def add_local(self, table_key: str, records: List[dict[str, Any]]) -> None:
+        """写入飞书成功后立即登记，保证同一运行内后续去重可见"""
+
+        local_records = [
+            {**record, "record_id": f"{LOCAL_RECORD_PREFIX}{record['url_key']}"}
+            for record in records
+        ]
+        await asyncio.to_thread(self._add_local_sync, table_key, local_records)
+
+    def _add_local_sync(self, table_key: str, records: List[dict[str, Any]]) -> None:
+        conn = self._connect()
+        with conn:
+            self._insert_rows(conn, table_key, records)
+        conn.close()
+
+    @staticmethod
+    def _insert_rows(
+        conn: sqlite3.Connection, table_key: str, records: Iterable[dict[str, Any]]
+    ) -> None:
+        conn.executemany(
+            """
+            INSERT OR REPLACE INTO feishu_records
+            (record_id, table_key, url, url_key, source, created_at, publish_date, modified_ms)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+            [
+                (
+                    record["record_id"],
+                    table_key,
+                    record["url"],
+                    record["url_key"],
+                    record.get("source") or "default",
+                    _to_iso(record.get("created_at")),
+                    _to_iso(record.get("publish_date")),
+                    record.get("modified_ms"),
+                )
+                for record in records
+            ],
+        )
+
+    # ---- 查询 ----
+
+    async def load_records(self, table_key: str) -> List[dict[str, Any]]:
+        """返回与 FeishuStorage.read_existing_records 同构的记录列表"""
+
+        return await asyncio.to_thread(self._load_records_sync, table_key)
+
+    def _load_records_sync(self, table_key: str) -> List[dict[str, Any]]:
+        conn = self._connect()
+        rows = conn.execute(
+            "SELECT url, url_key, source, created_at, publish_date "
+            "FROM feishu_records WHERE table_key = ?",
+            (table_key,),
+        ).fetchall()
+        conn.close()
+        return [
+            {
+                "url": url,
+                "url_key": url_key,
+                "publish_date": _from_iso(publish_date),
+                "created_at": _from_iso(created_at),
+                "source": source,
+            }
+            for url, url_key, source, created_at, publish_date in rows
+        ]
+
+    async def url_keys(self, table_key: str) -> set[str]:
+        return await asyncio.to_thread(self._url_keys_sync, table_key)
+
+    def _url_keys_sync(self, table_key: str) -> set[str]:
+        conn = self._connect()
+        rows = conn.execute(
+            "SELECT DISTINCT url_key FROM feishu_records WHERE table_key = ?",
+            (table_key,),
+        ).fetchall()
+        conn.close()
+        return {row[0] for row in rows}
+
+
+def _to_iso(value: Any) -> Optional[str]:
+    # 与 FeishuStorage._parse_timestamp 一致，统一存为naive时间
+    if isinstance(value, datetime):
+        return value.replace(tzinfo=None).isoformat()
+    return None
+
+
+def _from_iso(value: Optional[str]) -> Optional[datetime]:
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        return None
@@ -3,19 +3,33 @@
 from __future__ import annotations
 
 import asyncio
+import json
 import logging
+import time
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional
 
 import httpx
 
 from src.common import clean_summary_text, constants
+from src.common.http_clients import get_http_client
+from src.common.rate_limit import RetryPolicy, send_with_retry
 from src.common.url_utils import canonicalize_url
 from src.config import Settings, get_settings
 from src.models import ScoredCandidate
+from src.storage.feishu_index import FeishuRecordIndex
 
 logger = logging.getLogger(__name__)
 
+_FEISHU_RETRY_POLICY = RetryPolicy(
+    max_attempts=constants.FEISHU_HTTP_MAX_RETRIES,
+    base_delay=constants.FEISHU_HTTP_RETRY_DELAY_SECONDS,
+    max_delay=constants.FEISHU_HTTP_MAX_RETRY_DELAY_SECONDS,
+    rate_limit_delay=constants.FEISHU_HTTP_429_EXTRA_DELAY_SECONDS,
+    # 只重试429：batch_create 不幂等，5xx 时飞书可能已写入，重发会产生重复记录
+    retry_statuses=frozenset({429}),
+)
+
 
 class FeishuAPIError(Exception):
     """飞书API异常"""
@@ -67,6 +81,13 @@ class FeishuStorage:
         self.token_expire_at: Optional[datetime] = None
         self._field_names: Optional[set[str]] = None
         self._missing_fields_logged: bool = False
+        # 本地索引：每个实例只刷新一次，之后的去重查询直接读本地
+        self.index = FeishuRecordIndex(self.settings.feishu.index_path)
+        self.table_key = (
+            f"{self.settings.feishu.bitable_app_token}/"
+            f"{self.settings.feishu.bitable_table_id}"
+        )
+        self._index_ready: bool = False
         # 降低 httpx 日志等级，避免批量拉取时刷屏
         logging.getLogger("httpx").setLevel(logging.WARNING)
 
@@ -94,80 +115,45 @@ class FeishuStorage:
         url: str,
         **kwargs: Any,
     ) -> httpx.Response:
-        """对飞书API请求增加重试，针对429限流使用更长指数退避
+        """对飞书API请求增加重试，限速与退避由共享的主机限速器统一处理
 
         重试策略：
-        - 普通错误：指数退避 2→3.6→6.5→... 秒
-        - 429限流：额外等待10秒 + 指数退避，最长30秒
-        - 最多重试5次，总等待时间可达90秒
+        - 网络错误：指数退避 2→4→8→... 秒，最长30秒
+        - 5xx 不重试，交由调用方 raise_for_status 后降级到 SQLite
+        - 429限流：按 x-ogw-ratelimit-reset 等待并暂停同主机的所有请求，
+          无该响应头时退避之外额外等待10秒
+        - 最多尝试5次
         """
 
-        timeout = kwargs.pop(
-            "timeout",
-            constants.FEISHU_HTTP_TIMEOUT_SECONDS,
-        )
-        delay = constants.FEISHU_HTTP_RETRY_DELAY_SECONDS
-        max_delay = constants.FEISHU_HTTP_MAX_RETRY_DELAY_SECONDS
-        last_error: Optional[Exception] = None
-
-        for attempt in range(1, constants.FEISHU_HTTP_MAX_RETRIES + 1):
-            try:
-                resp = await client.request(
-                    method,
-                    url,
-                    timeout=timeout,
-                    **kwargs,
-                )
-
-                # 针对429限流错误特殊处理
-                if resp.status_code == 429:
-                    if attempt >= constants.FEISHU_HTTP_MAX_RETRIES:
-                        logger.error(
-                            "飞书API限流(429)重试%d次仍失败: %s",
-                            attempt,
-                            url,
-                        )
-                        resp.raise_for_status()
-
-                    # 429错误使用更长的退避时间：基础延迟 + 额外等待
-                    wait_time = min(
-                        delay + constants.FEISHU_HTTP_429_EXTRA_DELAY_SECONDS,
-                        max_delay,
-                    )
-                    logger.warning(
-                        "飞书API限流(429)，等待%.1f秒后重试(%d/%d): %s",
-                        wait_time,
-                        attempt,
-                        constants.FEISHU_HTTP_MAX_RETRIES,
-                        url,
-                    )
-                    await asyncio.sleep(wait_time)
-                    delay = min(delay * 2, max_delay)  # 指数退避
-                    continue
-
-                return resp
-
-            except (httpx.RequestError, httpx.TimeoutException) as exc:
-                last_error = exc
-                logger.debug(
-                    "飞书请求失败(%s %s)第%d次: %s",
-                    method,
-                    url,
-                    attempt,
-                    exc,
-                )
-                if attempt >= constants.FEISHU_HTTP_MAX_RETRIES:
-                    break
-                await asyncio.sleep(delay)
-                delay = min(delay * 1.8, max_delay)
+        kwargs.setdefault("timeout", constants.FEISHU_HTTP_TIMEOUT_SECONDS)
+        try:
+            resp = await send_with_retry(
+                client, method, url, policy=_FEISHU_RETRY_POLICY, **kwargs
+            )
+        except httpx.TransportError as exc:
+            logger.debug("飞书请求失败(%s %s): %s", method, url, exc)
+            raise FeishuAPIError("飞书请求重试仍失败") from exc
 
-        raise FeishuAPIError("飞书请求重试仍失败") from last_error
+        if resp.status_code == 429:
+            logger.error(
+                "飞书API限流(429)重试%d次仍失败: %s",
+                constants.FEISHU_HTTP_MAX_RETRIES,
+                url,
+            )
+            resp.raise_for_status()
+        return resp
 
-    async def save(self, candidates: List[ScoredCandidate]) -> List[ScoredCandidate]:
+    async def save(
+        self,
+        candidates: List[ScoredCandidate],
+        existing_urls: Optional[set[str]] = None,
+    ) -> List[ScoredCandidate]:
         """批量写入飞书多维表格
 
         Args:
             candidates: 待写入的候选列表
+            existing_urls: 调用方持有的已存在URL集合（运行快照），写入成功后原地追加；
+                为None时自行查询
 
         Returns:
             实际成功写入的候选列表（用于后续通知）
@@ -177,7 +163,8 @@ class FeishuStorage:
             return []
 
         await self._ensure_access_token()
-        existing_urls = await self.get_existing_urls()
+        if existing_urls is None:
+            existing_urls = await self.get_existing_urls()
 
         # 写入前按URL做二次去重，防止飞书表已有记录导致重复条目
         deduped_candidates: list[ScoredCandidate] = []
@@ -198,45 +185,46 @@ class FeishuStorage:
 
         actually_saved: list[ScoredCandidate] = []
 
-        async with httpx.AsyncClient(timeout=10) as client:
-            for start in range(0, len(deduped_candidates), self.batch_size):
-                chunk = deduped_candidates[start : start + self.batch_size]
-                records = [self._to_feishu_record(c) for c in chunk]
-                try:
+        client = get_http_client(self.base_url)
+        for start in range(0, len(deduped_candidates), self.batch_size):
+            chunk = deduped_candidates[start : start + self.batch_size]
+            records = [self._to_feishu_record(c) for c in chunk]
+            try:
+                created_count, expected_count = (
+                    await self._batch_create_records_with_count(client, records)
+                )
+            except FeishuAPIError as exc:
+                if "access_token不存在" in str(exc):
+                    logger.warning("飞书写入token失效，自动刷新后重试当前批次")
+                    await self._ensure_access_token()
                     created_count, expected_count = (
                         await self._batch_create_records_with_count(client, records)
                     )
-                except FeishuAPIError as exc:
-                    if "access_token不存在" in str(exc):
-                        logger.warning("飞书写入token失效，自动刷新后重试当前批次")
-                        await self._ensure_access_token()
-                        created_count, expected_count = (
-                            await self._batch_create_records_with_count(client, records)
-                        )
-                    else:
-                        raise
-                except Exception:
-                    # 未知异常直接跳过当前批次，避免影响后续流程
-                    logger.exception("飞书批次写入出现异常，已跳过当前批次")
-                    created_count = -1
-                    expected_count = len(chunk)
-
-                # 仅在完全成功时返回并更新缓存；部分成功不纳入通知列表
-                if created_count == expected_count == len(chunk):
-                    actually_saved.extend(chunk)
-                    for cand in chunk:
-                        url_key = canonicalize_url(cand.url)
-                        if url_key:
-                            existing_urls.add(url_key)
                 else:
-                    logger.warning(
-                        "飞书批次写入未完全成功: 预期%d条, 成功%d条",
-                        len(chunk),
-                        created_count,
-                    )
+                    raise
+            except Exception:
+                # 未知异常直接跳过当前批次，避免影响后续流程
+                logger.exception("飞书批次写入出现异常，已跳过当前批次")
+                created_count = -1
+                expected_count = len(chunk)
+
+            # 仅在完全成功时返回并更新缓存；部分成功不纳入通知列表
+            if created_count == expected_count == len(chunk):
+                actually_saved.extend(chunk)
+                for cand in chunk:
+                    url_key = canonicalize_url(cand.url)
+                    if url_key:
+                        existing_urls.add(url_key)
+                await self._register_saved(chunk)
+            else:
+                logger.warning(
+                    "飞书批次写入未完全成功: 预期%d条, 成功%d条",
+                    len(chunk),
+                    created_count,
+                )
 
-                if start + self.batch_size < len(deduped_candidates):
-                    await asyncio.sleep(self.rate_interval)
+            if start + self.batch_size < len(deduped_candidates):
+                await asyncio.sleep(self.rate_interval)
 
         logger.info(
             "飞书写入完成: 去重后待写入%d条, 实际成功%d条",
@@ -328,27 +316,27 @@ class FeishuStorage:
             "app_secret": self.settings.feishu.app_secret,
         }
 
-        async with httpx.AsyncClient() as client:
-            resp = await self._request_with_retry(
-                client,
-                "POST",
-                url,
-                json=payload,
-            )
-            resp.raise_for_status()
-            data = resp.json()
-            token = data.get("tenant_access_token")
-            if not token:
-                # 打印飞书业务错误码，便于定位 app_id/app_secret/租户问题；不输出敏感字段
-                code = data.get("code")
-                msg = data.get("msg")
-                if code or msg:
-                    logger.error("飞书token获取失败: code=%s, msg=%s", code, msg)
-                raise FeishuAPIError("飞书token获取失败，返回空token")
-            self.access_token = token
-            expire_seconds = int(data.get("expire", 7200)) - 300
-            self.token_expire_at = now + timedelta(seconds=max(expire_seconds, 600))
-            logger.info("飞书access_token刷新成功")
+        client = get_http_client(self.base_url)
+        resp = await self._request_with_retry(
+            client,
+            "POST",
+            url,
+            json=payload,
+        )
+        resp.raise_for_status()
+        data = resp.json()
+        token = data.get("tenant_access_token")
+        if not token:
+            # 打印飞书业务错误码，便于定位 app_id/app_secret/租户问题；不输出敏感字段
+            code = data.get("code")
+            msg = data.get("msg")
+            if code or msg:
+                logger.error("飞书token获取失败: code=%s, msg=%s", code, msg)
+            raise FeishuAPIError("飞书token获取失败，返回空token")
+        self.access_token = token
+        expire_seconds = int(data.get("expire", 7200)) - 300
+        self.token_expire_at = now + timedelta(seconds=max(expire_seconds, 600))
+        logger.info("飞书access_token刷新成功")
 
     def _auth_header(self) -> dict[str, str]:
         if not self.access_token:
@@ -360,6 +348,8 @@ class FeishuStorage:
         client: httpx.AsyncClient,
         max_pages: int = 20,
         page_size: int = 500,
+        extra_params: Optional[Dict[str, Any]] = None,
+        stop_when: Optional[Callable[[List[dict]], bool]] = None,
     ) -> List[dict]:
         """通用分页获取飞书记录
 
@@ -367,6 +357,8 @@ class FeishuStorage:
             client: httpx客户端
             max_pages: 最大分页数，防止无限循环
             page_size: 每页记录数
+            extra_params: 附加查询参数（排序/系统字段等）
+            stop_when: 传入当前页items，返回True时停止翻页（增量刷新用）
 
         Returns:
             所有items列表
@@ -382,7 +374,7 @@ class FeishuStorage:
                 f"{self.settings.feishu.bitable_table_id}/records"
             )
 
-            params: Dict[str, Any] = {"page_size": page_size}
+            params: Dict[str, Any] = {"page_size": page_size, **(extra_params or {})}
             if page_token:
                 params["page_token"] = page_token
 
@@ -399,8 +391,10 @@ class FeishuStorage:
             if data.get("code") != 0:
                 raise FeishuAPIError(f"飞书查询失败: {data}")
 
-            items = data.get("data", {}).get("items", [])
+            items = data.get("data", {}).get("items", []) or []
             all_items.extend(items)
+            if stop_when is not None and stop_when(items):
+                break
 
             has_more = data.get("data", {}).get("has_more", False)
             if not has_more:
@@ -620,32 +614,10 @@ class FeishuStorage:
         """查询飞书Bitable已存在的所有URL（用于去重）
 
         P13修复: 改用GET records接口，规避search接口分页token重复导致漏数
+        本地索引: 读取本地镜像，飞书侧仅做增量刷新
         """
-        await self._ensure_access_token()
-
-        existing_urls: set[str] = set()
-        url_field_name = self.FIELD_MAPPING["url"]
-
-        async with httpx.AsyncClient(timeout=10) as client:
-            await self._ensure_field_cache(client)
-            items = await self._paginated_fetch(client)
-
-            for item in items:
-                fields = item.get("fields", {})
-                url_obj = fields.get(url_field_name)
-
-                # 飞书URL字段是对象格式: {"link": "url", "text": "display text"}
-                if isinstance(url_obj, dict):
-                    url_value = url_obj.get("link")
-                elif isinstance(url_obj, str):
-                    url_value = url_obj
-                else:
-                    continue
-
-                url_key = canonicalize_url(url_value)
-                if url_key:
-                    existing_urls.add(url_key)
-
+        await self.refresh_index()
+        existing_urls = await self.index.url_keys(self.table_key)
         logger.info("飞书已存在URL数量: %d", len(existing_urls))
         return existing_urls
 
@@ -654,54 +626,198 @@ class FeishuStorage:
 
         P12修复: 读取飞书系统字段创建时间，基于入库时间完成去重
         P13修复: 改用GET records接口，避免search分页token重复导致漏数
+        本地索引: 读取本地镜像，飞书侧仅做增量刷新
         """
 
-        await self._ensure_access_token()
+        await self.refresh_index()
+        records = await self.index.load_records(self.table_key)
+        logger.info("飞书历史记录读取完成: %d条", len(records))
+        return records
 
-        records: List[dict[str, Any]] = []
-        url_field = self.FIELD_MAPPING["url"]
-        publish_field = self.FIELD_MAPPING["publish_date"]
+    async def refresh_index(self, force: bool = False) -> None:
+        """刷新本地索引：冷启动/强制/超期时全量拉取，否则按修改时间增量拉取
+
+        同一实例只刷新一次；飞书不可用时若本地已有镜像则继续使用旧数据。
+        """
 
-        async with httpx.AsyncClient(timeout=10) as client:
+        if self._index_ready and not force:
+            return
+
+        force = force or self.settings.feishu.index_force_resync
+        meta = await self.index.get_meta(self.table_key)
+        needs_full = (
+            force
+            or meta is None
+            or datetime.now() - meta[1]
+            > timedelta(days=constants.FEISHU_INDEX_FULL_RESYNC_DAYS)
+        )
+
+        try:
+            await self._ensure_access_token()
+            client = get_http_client(self.base_url)
             await self._ensure_field_cache(client)
-            items = await self._paginated_fetch(client)
+            sort_field = self._index_sort_field()
+            if not needs_full and sort_field is None:
+                logger.warning(
+                    "飞书表缺少%s/%s字段，无法增量刷新，改为全量拉取",
+                    constants.FEISHU_INDEX_MODIFIED_FIELD,
+                    constants.FEISHU_INDEX_CREATED_FIELD,
+                )
+                needs_full = True
+
+            if needs_full:
+                await self._full_index_sync(client)
+            else:
+                assert meta is not None and sort_field is not None
+                await self._incremental_index_sync(client, sort_field, meta[0])
+        except Exception as exc:  # noqa: BLE001
+            if meta is None:
+                raise
+            logger.warning("飞书索引刷新失败，沿用本地镜像: %s", exc)
+
+        self._index_ready = True
+
+    def _index_sort_field(self) -> Optional[str]:
+        """增量刷新的排序字段：优先最后更新时间，其次创建时间"""
+
+        field_names = self._field_names or set()
+        for name in (
+            constants.FEISHU_INDEX_MODIFIED_FIELD,
+            constants.FEISHU_INDEX_CREATED_FIELD,
+        ):
+            if name in field_names:
+                return name
+        return None
 
-            for item in items:
-                fields = item.get("fields", {})
-                url_obj = fields.get(url_field)
-                publish_raw = fields.get(publish_field)
-                created_raw = fields.get("创建时间")
-
-                # URL字段兼容两种格式
-                if isinstance(url_obj, dict):
-                    url_value = url_obj.get("link")
-                elif isinstance(url_obj, str):
-                    url_value = url_obj
-                else:
-                    url_value = None
-
-                url_key = canonicalize_url(url_value)
-                publish_date = self._parse_timestamp(publish_raw)
-                created_at = self._parse_timestamp(created_raw)
-
-                if url_key:
-                    source_field = self.FIELD_MAPPING.get("source", "来源")
-                    source_value = fields.get(source_field, "default")
-                    # P18修复：规范化source字段，飞书可能存为列表或大写
-                    if isinstance(source_value, list):
-                        source_value = source_value[0] if source_value else "default"
-                    source_value = str(source_value).lower()
-                    record_item: dict[str, Any] = {
-                        "url": str(url_value),
-                        "url_key": url_key,
-                        "publish_date": publish_date,
-                        "created_at": created_at,
-                        "source": source_value,
-                    }
-                    records.append(record_item)
+    async def _full_index_sync(self, client: httpx.AsyncClient) -> None:
+        started_ms = int(time.time() * 1000)
+        items = await self._paginated_fetch(
+            client, extra_params={"automatic_fields": "true"}
+        )
+        records = [
+            record for item in items if (record := self._item_to_record(item))
+        ]
+        # 水位与增量刷新使用同一排序字段，否则按创建时间排序时会漏拉/重拉
+        sort_field = self._index_sort_field()
+        watermark = max(
+            (self._item_sort_ms(item, sort_field) for item in items if sort_field),
+            default=0,
+        ) or started_ms
+        await self.index.replace_all(self.table_key, records, watermark)
+        logger.info("飞书索引全量同步完成: %d条记录", len(records))
+
+    async def _incremental_index_sync(
+        self, client: httpx.AsyncClient, sort_field: str, watermark_ms: int
+    ) -> None:
+        since_ms = watermark_ms - constants.FEISHU_INDEX_OVERLAP_MS
+
+        def _reached_watermark(items: List[dict]) -> bool:
+            # 按排序字段倒序，本页最旧一条早于水位即可停止翻页
+            oldest = min(
+                (self._item_sort_ms(item, sort_field) for item in items),
+                default=0,
+            )
+            return oldest < since_ms
+
+        items = await self._paginated_fetch(
+            client,
+            extra_params={
+                "automatic_fields": "true",
+                "sort": json.dumps([f"{sort_field} DESC"], ensure_ascii=False),
+            },
+            stop_when=_reached_watermark,
+        )
+        changed = [
+            item for item in items if self._item_sort_ms(item, sort_field) >= since_ms
+        ]
+        records = [record for item in changed if (record := self._item_to_record(item))]
+        watermark = max(
+            (self._item_sort_ms(item, sort_field) for item in changed),
+            default=watermark_ms,
+        )
+        await self.index.upsert(self.table_key, records, max(watermark, watermark_ms))
+        logger.info(
+            "飞书索引增量刷新完成: 拉取%d条, 变更%d条", len(items), len(records)
+        )
 
-        logger.info("飞书历史记录读取完成: %d条", len(records))
-        return records
+    @staticmethod
+    def _item_sort_ms(item: dict, sort_field: str) -> int:
+        """读取排序字段的毫秒时间戳，缺失时回退到对应的系统字段
+
+        增量刷新按 sort_field 排序和截断，水位也必须取同一字段：按创建时间排序时
+        若读 last_modified_time，创建后被编辑过的记录会导致提前停止或重复拉取。
+        """
+
+        value = item.get("fields", {}).get(sort_field)
+        if not isinstance(value, (int, float)):
+            system_field = (
+                "created_time"
+                if sort_field == constants.FEISHU_INDEX_CREATED_FIELD
+                else "last_modified_time"
+            )
+            value = item.get(system_field)
+        if isinstance(value, (int, float)):
+            return int(value)
+        return 0
+
+    def _item_to_record(self, item: dict) -> Optional[dict[str, Any]]:
+        """将飞书记录转换为索引行，URL缺失时返回None"""
+
+        fields = item.get("fields", {})
+        url_obj = fields.get(self.FIELD_MAPPING["url"])
+        # URL字段兼容两种格式: {"link": "url", "text": "display text"} 或字符串
+        if isinstance(url_obj, dict):
+            url_value = url_obj.get("link")
+        elif isinstance(url_obj, str):
+            url_value = url_obj
+        else:
+            url_value = None
+
+        url_key = canonicalize_url(url_value)
+        if not url_key:
+            return None
+
+        source_value = fields.get(self.FIELD_MAPPING.get("source", "来源"), "default")
+        # P18修复：规范化source字段，飞书可能存为列表或大写
+        if isinstance(source_value, list):
+            source_value = source_value[0] if source_value else "default"
+        created_at = self._parse_timestamp(
+            fields.get(constants.FEISHU_INDEX_CREATED_FIELD)
+        ) or self._parse_timestamp(item.get("created_time"))
+        return {
+            "record_id": str(item.get("record_id") or f"url:{url_key}"),
+            "url": str(url_value),
+            "url_key": url_key,
+            "publish_date": self._parse_timestamp(
+                fields.get(self.FIELD_MAPPING["publish_date"])
+            ),
+            "created_at": created_at,
+            "source": str(source_value).lower(),
+            "modified_ms": self._item_sort_ms(
+                item, constants.FEISHU_INDEX_MODIFIED_FIELD
+            )
+            or None,
+        }
+
+    async def _register_saved(self, candidates: List[ScoredCandidate]) -> None:
+        """写入成功后登记到本地索引，下次增量刷新时由真实记录替换"""
+
+        now = datetime.now()
+        records = [
+            {
+                "url": cand.url,
+                "url_key": url_key,
+                "source": cand.source,
+                "created_at": now,
+                "publish_date": cand.publish_date,
+            }
+            for cand in candidates
+            if (url_key := canonicalize_url(cand.url))
+        ]
+        try:
+            await self.index.add_local(self.table_key, records)
+        except Exception as exc:  # noqa: BLE001
+            logger.warning("本地索引登记失败: %s", exc)
 
     @staticmethod
     def _parse_timestamp(value: Any) -> Optional[datetime]:
@@ -739,22 +855,22 @@ class FeishuStorage:
         field_map = {f: self.FIELD_MAPPING.get(f, f) for f in target_fields}
         records: List[dict[str, Any]] = []
 
-        async with httpx.AsyncClient(timeout=10) as client:
-            await self._ensure_field_cache(client)
-            items = await self._paginated_fetch(client)
-
-            for item in items:
-                fields_data = item.get("fields", {})
-                record: dict[str, Any] = {}
-                for key, feishu_field in field_map.items():
-                    value = fields_data.get(feishu_field)
-                    if key == "publish_date":
-                        record[key] = self._parse_timestamp(value)
-                    elif isinstance(value, dict):
-                        record[key] = value.get("link") or value.get("text") or value
-                    else:
-                        record[key] = value
-                records.append(record)
+        client = get_http_client(self.base_url)
+        await self._ensure_field_cache(client)
+        items = await self._paginated_fetch(client)
+
+        for item in items:
+            fields_data = item.get("fields", {})
+            record: dict[str, Any] = {}
+            for key, feishu_field in field_map.items():
+                value = fields_data.get(feishu_field)
+                if key == "publish_date":
+                    record[key] = self._parse_timestamp(value)
+                elif isinstance(value, dict):
+                    record[key] = value.get("link") or value.get("text") or value
+                else:
+                    record[key] = value
+            records.append(record)
 
         logger.info("飞书brief记录读取完成: %d条", len(records))
         return records
@@ -2,10 +2,16 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
-from typing import Awaitable, Callable, List, Optional, TypeVar
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Awaitable, Callable, List, Optional, TypeVar
 
 from src.common import constants
+from src.common.url_utils import canonicalize_url
 from src.models import ScoredCandidate
 from src.storage.feishu_storage import FeishuAPIError, FeishuStorage
 from src.storage.sqlite_fallback import SQLiteFallback
@@ -15,6 +21,39 @@ logger = logging.getLogger(__name__)
 T = TypeVar("T")
 
 
+@dataclass(slots=True)
+class StorageSnapshot:
+    """单次运行内的飞书记录快照：只拉取一次，写入后原地更新"""
+
+    records: List[dict[str, Any]]
+    url_keys: set[str]
+    fetched_at: float = field(default_factory=time.monotonic)
+    hits: Counter[str] = field(default_factory=Counter)
+
+    @property
+    def age_seconds(self) -> float:
+        return time.monotonic() - self.fetched_at
+
+    def add_saved(self, candidates: List[ScoredCandidate]) -> None:
+        """将本次写入成功的候选追加到快照，后续去重立即可见"""
+
+        now = datetime.now()
+        for cand in candidates:
+            url_key = canonicalize_url(cand.url)
+            if not url_key:
+                continue
+            self.url_keys.add(url_key)
+            self.records.append(
+                {
+                    "url": cand.url,
+                    "url_key": url_key,
+                    "publish_date": cand.publish_date,
+                    "created_at": now,
+                    "source": cand.source,
+                }
+            )
+
+
 class StorageManager:
     """飞书主存储 + SQLite 降级"""
 
@@ -25,6 +64,45 @@ class StorageManager:
     ) -> None:
         self.feishu = feishu or FeishuStorage()
         self.sqlite = sqlite or SQLiteFallback()
+        self._snapshot: Optional[StorageSnapshot] = None
+        # 流式管道中过滤阶段与存储阶段可能同时首次调用 snapshot，只允许一个拉取
+        self._snapshot_lock = asyncio.Lock()
+        self.snapshot_fetches = 0
+
+    async def snapshot(self, consumer: str) -> StorageSnapshot:
+        """获取本次运行的记录快照，首次调用时拉取，之后只记录命中"""
+
+        if self._snapshot is not None:
+            self._snapshot.hits[consumer] += 1
+            return self._snapshot
+        async with self._snapshot_lock:
+            if self._snapshot is not None:
+                # 等锁期间已由其他调用方拉取完成
+                self._snapshot.hits[consumer] += 1
+                return self._snapshot
+            self.snapshot_fetches += 1
+            records = await self.feishu.read_existing_records()
+            self._snapshot = StorageSnapshot(
+                records=list(records),
+                url_keys={r["url_key"] for r in records if r.get("url_key")},
+            )
+            return self._snapshot
+
+    def log_snapshot_stats(self) -> None:
+        """输出快照拉取次数、年龄与各调用方命中数，确认无重复全表扫描"""
+
+        if self._snapshot is None:
+            logger.info("飞书记录快照: 本次运行未使用")
+            return
+        hits = self._snapshot.hits
+        logger.info(
+            "飞书记录快照: 拉取%d次, 年龄%.1fs, 记录%d条, 命中%d次 (%s)",
+            self.snapshot_fetches,
+            self._snapshot.age_seconds,
+            len(self._snapshot.records),
+            sum(hits.values()),
+            ", ".join(f"{k}:{v}" for k, v in sorted(hits.items())) or "无",
+        )
 
     async def _with_token_retry(self, operation: Callable[[], Awaitable[T]]) -> T:
         """封装token刷新重试逻辑
@@ -61,9 +139,12 @@ class StorageManager:
             return []
 
         try:
+            existing_urls = await self._snapshot_urls("save")
             actually_saved = await self._with_token_retry(
-                lambda: self.feishu.save(candidates)
+                lambda: self.feishu.save(candidates, existing_urls=existing_urls)
             )
+            if self._snapshot is not None:
+                self._snapshot.add_saved(actually_saved)
             logger.info(
                 "飞书存储成功: %d条 (新增%d条)", len(candidates), len(actually_saved)
             )
@@ -85,7 +166,12 @@ class StorageManager:
 
         logger.info("发现%d条未同步记录", len(pending))
         try:
-            await self._with_token_retry(lambda: self.feishu.save(pending))
+            existing_urls = await self._snapshot_urls("sync_from_sqlite")
+            saved = await self._with_token_retry(
+                lambda: self.feishu.save(pending, existing_urls=existing_urls)
+            )
+            if self._snapshot is not None:
+                self._snapshot.add_saved(saved)
             await self.sqlite.mark_synced([item.url for item in pending])
             logger.info("同步完成: %d条", len(pending))
         except Exception as exc:  # noqa: BLE001
@@ -97,10 +183,19 @@ class StorageManager:
         await self.sqlite.cleanup_old_records(constants.SQLITE_RETENTION_DAYS)
         logger.info("SQLite已清理过期记录")
 
+    async def _snapshot_urls(self, consumer: str) -> Optional[set[str]]:
+        """读取快照URL集合；快照不可用时返回None，由飞书存储自行查询"""
+
+        try:
+            return (await self.snapshot(consumer)).url_keys
+        except Exception as exc:  # noqa: BLE001
+            logger.warning("飞书记录快照不可用: %s", exc)
+            return None
+
     async def get_existing_urls(self) -> set[str]:
         """查询已存在的URL（用于去重）"""
         try:
-            return await self.feishu.get_existing_urls()
+            return set((await self.snapshot("get_existing_urls")).url_keys)
         except Exception as exc:  # noqa: BLE001
             logger.warning("查询飞书失败,返回空集合: %s", exc)
             return set()
@@ -108,7 +203,7 @@ class StorageManager:
     async def read_existing_records(self) -> List[dict]:
         """读取已存在记录（含URL/发布日期/来源），用于时间窗去重"""
         try:
-            return await self.feishu.read_existing_records()
+            return list((await self.snapshot("read_existing_records")).records)
         except Exception as exc:  # noqa: BLE001
             logger.warning("查询飞书记录失败,返回空列表: %s", exc)
             return []
@@ -0,0 +1,68 @@
+"""LLM自适应并发控制测试。
+
+覆盖范围：
+1. 成功响应使窗口加性增长，429使窗口减半并按retry-after暂停
+2. 剩余配额接近耗尽时提前收缩
+3. 在途请求数不超过当前窗口
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+
+import pytest
+
+from src.scorer.concurrency import AdaptiveConcurrencyLimiter, retry_after_seconds
+
+
+def test_aimd_window_adjustment() -> None:
+    """加性增长、乘性收缩"""
+
+    limiter = AdaptiveConcurrencyLimiter(initial=4, minimum=1, maximum=50)
+    for _ in range(40):
+        limiter.record_success(1.0, tokens=100)
+    grown = limiter.window
+    assert grown > 4
+
+    limiter.record_rate_limited({"retry-after": "0.2"})
+    assert limiter.window == max(1, int(grown * 0.5))
+    assert limiter._paused_until > time.monotonic()
+
+    report = limiter.report()
+    assert report.requests == 40
+    assert report.rate_limited == 1
+    assert report.tokens == 4000
+
+
+def test_low_remaining_quota_shrinks_window() -> None:
+    """x-ratelimit-remaining-* 低于水位线时收缩"""
+
+    limiter = AdaptiveConcurrencyLimiter(initial=16, minimum=1, maximum=50)
+    limiter.record_success(
+        1.0,
+        {
+            "x-ratelimit-limit-requests": "500",
+            "x-ratelimit-remaining-requests": "20",
+        },
+    )
+    assert limiter.window == 8
+    assert retry_after_seconds({"x-ratelimit-reset-requests": "1m30s"}) == 90
+
+
+@pytest.mark.asyncio
+async def test_in_flight_bounded_by_window() -> None:
+    """同时在途数不超过窗口"""
+
+    limiter = AdaptiveConcurrencyLimiter(initial=3, minimum=1, maximum=3)
+    peak = 0
+
+    async def worker() -> None:
+        nonlocal peak
+        async with limiter.slot():
+            peak = max(peak, limiter.in_flight)
+            await asyncio.sleep(0.01)
+
+    await asyncio.gather(*(worker() for _ in range(12)))
+    assert peak == 3
+    assert limiter.in_flight == 0
@@ -0,0 +1,162 @@
+"""ArxivCollector 增量采集与分片单元测试。
+
+覆盖范围：
+1. 首次运行全量采集，结果入库后（commit_state）才写入水位，未提交的运行下次重新采集
+2. 再次运行只返回新论文，遇到水位重叠窗口之前的论文即停止翻页
+3. 重叠窗口内已采集过的论文按 ID 跳过
+4. 分片超时后从断点 offset 继续，已完成的分片不重新请求；跨分类论文只输出一次
+5. max_results 按分类均分，合并结果不超过 max_results
+6. 全局节拍器保证相邻请求间隔
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+import pytest
+import requests
+
+from src.collectors import arxiv_collector
+from src.collectors.arxiv_collector import ArxivCollector, _RequestPacer
+from src.common import constants
+from src.config import ArxivSourceSettings
+
+NOW = datetime.now(timezone.utc)
+
+
+def _paper(arxiv_id: str, hours_ago: float) -> SimpleNamespace:
+    return SimpleNamespace(
+        entry_id=f"http://arxiv.org/abs/{arxiv_id}v1",
+        published=NOW - timedelta(hours=hours_ago),
+        title=f"Paper {arxiv_id}",
+        summary="A new benchmark.",
+        comment=None,
+        pdf_url=f"http://arxiv.org/pdf/{arxiv_id}v1",
+        authors=[SimpleNamespace(name="Alice")],
+        categories=["cs.CL"],
+    )
+
+
+class _FakeClient:
+    """按分类返回按提交时间倒序排列的论文，记录每次调用的 offset 与被消费的条数"""
+
+    feeds: dict[str, list[SimpleNamespace]] = {}
+    fail_after: dict[str, int] = {}  # 分类 -> 读到第几条时抛出一次超时
+    calls: list[tuple[str, int]] = []
+    consumed = 0
+
+    def __init__(self, page_size: int, delay_seconds: float, num_retries: int) -> None:
+        self.page_size = page_size
+
+    def results(self, search, offset: int = 0):
+        category = search.query.rsplit("cat:", 1)[1]
+        cls = type(self)
+        cls.calls.append((category, offset))
+        feed = cls.feeds[category][: search.max_results]
+        for index, paper in enumerate(feed[offset:], start=offset):
+            if cls.fail_after.get(category) == index:
+                del cls.fail_after[category]
+                raise requests.exceptions.Timeout("read timeout")
+            cls.consumed += 1
+            yield paper
+
+
+def _collector(categories: list[str], **overrides) -> ArxivCollector:
+    cfg = ArxivSourceSettings(categories=categories, **overrides)
+    settings = SimpleNamespace(sources=SimpleNamespace(arxiv=cfg))
+    return ArxivCollector(settings=settings)  # type: ignore[arg-type]
+
+
+@pytest.fixture(autouse=True)
+def _fake_arxiv(tmp_path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("ARXIV_STATE_PATH", str(tmp_path / "arxiv_state.db"))
+    monkeypatch.setattr(arxiv_collector.arxiv, "Client", _FakeClient)
+    monkeypatch.setattr(constants, "ARXIV_RETRY_DELAYS_SECONDS", (0,))
+    _FakeClient.feeds, _FakeClient.fail_after, _FakeClient.calls = {}, {}, []
+    _FakeClient.consumed = 0
+
+
+@pytest.mark.asyncio
+async def test_incremental_harvest_stops_at_watermark() -> None:
+    collector = _collector(["cs.CL"])
+    known = [_paper("2501.00003", 10), _paper("2501.00002", 20), _paper("2501.00001", 30)]
+    _FakeClient.feeds["cs.CL"] = known
+    first = await collector.collect()
+    assert [c.raw_metadata["arxiv_id"] for c in first] == [
+        "2501.00003",
+        "2501.00002",
+        "2501.00001",
+    ]
+    # 模拟入库前崩溃：未提交水位，下次运行仍返回全部论文
+    assert len(await _collector(["cs.CL"]).collect()) == 3
+    await collector.commit_state()
+
+    # 新增两篇，其中 00004 晚公告、提交时间早于水位；重叠窗口(48小时)之前的论文不再读取
+    _FakeClient.feeds["cs.CL"] = [
+        _paper("2501.00005", 1),
+        known[0],
+        _paper("2501.00004", 12),
+        *known[1:],
+        _paper("2501.00000", 100),
+        _paper("2412.99999", 120),
+    ]
+    _FakeClient.consumed = 0
+    second = await collector.collect()
+
+    assert [c.raw_metadata["arxiv_id"] for c in second] == ["2501.00005", "2501.00004"]
+    assert _FakeClient.consumed == 6  # 读到 00000 即停止翻页
+
+
+@pytest.mark.asyncio
+async def test_timed_out_shard_resumes_from_checkpoint() -> None:
+    shared = _paper("2501.00010", 2)  # 同时属于两个分类
+    _FakeClient.feeds = {
+        "cs.SE": [shared, _paper("2501.00011", 5)],
+        "cs.CL": [shared, _paper("2501.00012", 3), _paper("2501.00013", 8)],
+    }
+    _FakeClient.fail_after = {"cs.CL": 2}
+
+    candidates = await _collector(["cs.SE", "cs.CL"]).collect()
+
+    assert sorted(_FakeClient.calls) == [("cs.CL", 0), ("cs.CL", 2), ("cs.SE", 0)]
+    assert _FakeClient.consumed == 5  # 每条只读取一次
+    assert sorted(c.raw_metadata["arxiv_id"] for c in candidates) == [
+        "2501.00010",
+        "2501.00011",
+        "2501.00012",
+        "2501.00013",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_max_results_split_across_shards() -> None:
+    _FakeClient.feeds = {
+        "cs.SE": [_paper(f"2501.001{i:02d}", i + 1) for i in range(5)],
+        "cs.CL": [_paper(f"2501.002{i:02d}", i + 1) for i in range(5)],
+    }
+
+    candidates = await _collector(["cs.SE", "cs.CL"], max_results=6).collect()
+
+    assert len(candidates) == 6
+    assert _FakeClient.consumed == 6  # 每个分片只读取 3 条
+
+
+def test_pacer_spaces_requests_across_threads() -> None:
+    pacer = _RequestPacer(interval=0.05)
+    stamps: list[float] = []
+
+    def worker() -> None:
+        pacer.wait()
+        stamps.append(time.monotonic())
+
+    threads = [threading.Thread(target=worker) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    stamps.sort()
+    assert all(b - a >= 0.04 for a, b in zip(stamps, stamps[1:]))
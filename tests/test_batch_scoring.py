@@ -0,0 +1,70 @@
+"""Batch API评分后端测试（使用本地替身服务，离线运行）。
+
+覆盖范围：
+1. 未命中缓存的候选经 Batch API 提交、轮询并解析为评分结果
+2. 超时未完成的batch被取消，调用方拿到待回退列表
+"""
+
+from __future__ import annotations
+
+import pytest
+from openai import AsyncOpenAI
+
+from src.models import RawCandidate
+from src.scorer.batch_backend import OpenAIBatchBackend
+from src.scorer.batch_stub import BatchStubServer
+from src.scorer.llm_scorer import LLMScorer
+
+
+def _candidate(index: int) -> RawCandidate:
+    return RawCandidate(
+        title=f"Agent Benchmark {index}",
+        url=f"https://arxiv.org/abs/2401.0000{index}",
+        source="arxiv",
+        abstract="A benchmark for evaluating LLM agents.",
+    )
+
+
+@pytest.mark.asyncio
+async def test_score_batch_via_batch_api(tmp_path, monkeypatch) -> None:
+    """batch后端一次提交全部未命中候选，结果写入缓存"""
+
+    monkeypatch.setenv("LLM_DISK_CACHE_PATH", str(tmp_path / "cache.db"))
+    monkeypatch.setenv("LLM_SCORING_BACKEND", "batch")
+    monkeypatch.setenv("LOG_DIR", str(tmp_path / "logs"))
+    monkeypatch.setattr("src.scorer.llm_scorer.constants.LLM_BATCH_POLL_SECONDS", 0.01)
+
+    with BatchStubServer(polls_until_complete=2) as stub:
+        scorer = LLMScorer()
+        scorer.client = AsyncOpenAI(api_key="k", base_url=stub.base_url, max_retries=0)
+        candidates = [_candidate(i) for i in range(3)]
+
+        scored = await scorer.score_batch(candidates)
+
+        assert [c.url for c in scored] == [c.url for c in candidates]
+        assert all(c.relevance_score == 6.0 for c in scored)
+        assert len(stub.batches) == 1
+        assert scorer.limiter.requests == 0  # 首轮没有走实时接口
+        assert scorer.cache_stats.writes == 3
+        assert list((tmp_path / "logs" / "llm_batches").glob("*.jsonl"))
+
+
+@pytest.mark.asyncio
+async def test_batch_timeout_cancels_and_reports_pending(tmp_path) -> None:
+    """等待超时后取消batch，全部请求交由调用方回退"""
+
+    with BatchStubServer(polls_until_complete=1000) as stub:
+        client = AsyncOpenAI(api_key="k", base_url=stub.base_url, max_retries=0)
+        backend = OpenAIBatchBackend(
+            client, tmp_path, poll_seconds=0.01, max_wait_seconds=0.05
+        )
+        outcome = await backend.complete(
+            {"req-0": [{"role": "user", "content": "hi"}]},
+            model="stub",
+            max_tokens=10,
+            temperature=0.1,
+        )
+
+    assert outcome.status == "timeout"
+    assert outcome.failed == ["req-0"]
+    assert next(iter(stub.batches.values()))["status"] == "cancelled"
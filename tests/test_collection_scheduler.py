@@ -0,0 +1,101 @@
+"""CollectionScheduler 单元测试。
+
+覆盖范围：
+1. 多个采集器并发执行，墙钟时间取决于最慢来源
+2. 超过截止时间的来源被取消并返回部分结果
+3. 单个来源异常不影响其他来源
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from types import SimpleNamespace
+from typing import List
+
+import pytest
+
+from src.collectors.scheduler import CollectionScheduler
+from src.config import SourceScheduleSettings, SourcesSettings
+from src.models import RawCandidate
+
+
+def _candidate(idx: int, source: str = "github") -> RawCandidate:
+    return RawCandidate(title=f"bench-{idx}", url=f"https://x/{idx}", source=source)
+
+
+class _SleepyCollector:
+    """按固定间隔逐条产出候选的假采集器"""
+
+    def __init__(self, count: int, interval: float) -> None:
+        self.count = count
+        self.interval = interval
+        self.partial_candidates: List[RawCandidate] = []
+
+    async def collect(self) -> List[RawCandidate]:
+        for idx in range(self.count):
+            await asyncio.sleep(self.interval)
+            self.partial_candidates.append(_candidate(idx))
+        return list(self.partial_candidates)
+
+
+class _BrokenCollector:
+    async def collect(self) -> List[RawCandidate]:
+        raise RuntimeError("boom")
+
+
+def _settings(**deadlines: float) -> SimpleNamespace:
+    schedules = {
+        name: SourceScheduleSettings(deadline_seconds=value, cancel_grace_seconds=0.5)
+        for name, value in deadlines.items()
+    }
+    return SimpleNamespace(sources=SourcesSettings(schedules=schedules))
+
+
+@pytest.mark.asyncio
+async def test_collectors_run_concurrently() -> None:
+    """三个各耗时0.2s的来源并发执行，总耗时远小于串行"""
+
+    scheduler = CollectionScheduler(
+        [(f"src{i}", _SleepyCollector(count=2, interval=0.1)) for i in range(3)],
+        settings=_settings(src0=5, src1=5, src2=5),
+    )
+    start = time.perf_counter()
+    report = await scheduler.run()
+
+    assert time.perf_counter() - start < 0.5
+    assert [run.status for run in report.runs] == ["ok", "ok", "ok"]
+    assert len(report.candidates) == 6
+
+
+@pytest.mark.asyncio
+async def test_deadline_cancels_and_keeps_partial() -> None:
+    """超时来源被取消，已产出的候选保留"""
+
+    slow = _SleepyCollector(count=100, interval=0.05)
+    scheduler = CollectionScheduler(
+        [("slow", slow), ("fast", _SleepyCollector(count=1, interval=0.01))],
+        settings=_settings(slow=0.18, fast=5),
+    )
+    report = await scheduler.run()
+
+    slow_run, fast_run = report.runs
+    assert slow_run.status == "timeout"
+    assert 1 <= len(slow_run.candidates) < 100
+    assert fast_run.status == "ok"
+    assert report.critical_path is slow_run
+
+
+@pytest.mark.asyncio
+async def test_error_is_isolated() -> None:
+    """单个来源抛异常时记录error，其他来源正常返回"""
+
+    scheduler = CollectionScheduler(
+        [("broken", _BrokenCollector()), ("ok", _SleepyCollector(1, 0.01))],
+        settings=_settings(broken=5, ok=5),
+    )
+    report = await scheduler.run()
+
+    assert report.runs[0].status == "error"
+    assert "boom" in (report.runs[0].error or "")
+    assert len(report.candidates) == 1
@@ -0,0 +1,170 @@
+"""本地快速 PDF 抽取单元测试。
+
+覆盖范围：
+1. 编号/无编号标题、摘要、参考文献、机构行的识别，正文中以数字开头的行不误判为标题
+2. 多页重复的页眉页脚被去除
+3. PDFEnhancer 核心章节足够时不调用 GROBID，不足时回退
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import List
+
+import pytest
+
+from src.common import constants
+from src.enhancer import PDFEnhancer, grobid_pool
+from src.enhancer.fast_pdf_extractor import extract_article
+
+
+def _make_pdf(path: Path, pages: List[List[str]]) -> Path:
+    """生成每行一个文本对象的最小PDF（Helvetica），供 pypdf 抽取"""
+
+    objects: List[bytes] = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        b"",  # Pages 占位，页对象编号确定后回填
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+    ]
+    kids = []
+    for lines in pages:
+        ops = ["BT", "/F1 10 Tf", "12 TL", "50 780 Td"]
+        for line in lines:
+            escaped = line.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+            ops.append(f"({escaped}) Tj T*")
+        ops.append("ET")
+        stream = "\n".join(ops).encode("latin-1")
+        page_id, content_id = len(objects) + 1, len(objects) + 2
+        kids.append(f"{page_id} 0 R")
+        objects.append(
+            (
+                "<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+                f"/Resources << /Font << /F1 3 0 R >> >> /Contents {content_id} 0 R >>"
+            ).encode()
+        )
+        objects.append(
+            f"<< /Length {len(stream)} >>\nstream\n".encode() + stream + b"\nendstream"
+        )
+    objects[1] = f"<< /Type /Pages /Kids [{' '.join(kids)}] /Count {len(kids)} >>".encode()
+
+    data = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(data))
+        data += f"{number} 0 obj\n".encode() + body + b"\nendobj\n"
+    xref = len(data)
+    data += f"xref\n0 {len(objects) + 1}\n0000000000 65535 f \n".encode()
+    data += b"".join(f"{offset:010d} 00000 n \n".encode() for offset in offsets)
+    data += (
+        f"trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\n"
+        f"startxref\n{xref}\n%%EOF\n"
+    ).encode()
+    path.write_bytes(bytes(data))
+    return path
+
+
+_PAPER = [
+    [
+        "Under review at a conference",
+        "AgentBench: Evaluating LLMs as Agents",
+        "Alice Zhang, Bob Li",
+        "1 Tsinghua University  alice@example.com",
+        "Abstract",
+        "We present a bench-",
+        "mark for LLM agents.",
+        "1 Introduction",
+        "Agents are evaluated in many environments.",
+        "2 Benchmark Design",
+        "2.1 Dataset Construction",
+        "We release data at https://github.com/THUDM/AgentBench for all.",
+    ],
+    [
+        "Under review at a conference",
+        "3 models were tested on 8 environments.",
+        "3 Experiments",
+        "Results show a large gap.",
+        "7 Table of results",
+        "4 Conclusion",
+        "Agents remain hard.",
+        "References",
+        "[1] A. Author. Paper one. 2020.",
+        "[2] B. Author. Paper two. 2021.",
+        "A Environment Details",
+        "More details.",
+    ],
+    ["Under review at a conference", "B Prompts", "Prompt text."],
+]
+
+
+def test_extract_sections_and_front_matter(tmp_path: Path) -> None:
+    article = extract_article(_make_pdf(tmp_path / "paper.pdf", _PAPER))
+    assert article is not None
+
+    headings = [section["heading"] for section in article["sections"]]
+    assert headings == [
+        "Introduction",
+        "Benchmark Design",
+        "Dataset Construction",
+        "Experiments",
+        "Conclusion",
+        "Environment Details",
+        "Prompts",
+    ]
+    sections = {s["heading"]: s["text"] for s in article["sections"]}
+    # 跨页续接的正文行以数字开头，不应被当作第3节
+    assert sections["Dataset Construction"].endswith("3 models were tested on 8 environments.")
+    assert "7 Table of results" in sections["Experiments"]
+
+    assert article["title"] == "AgentBench: Evaluating LLMs as Agents"
+    assert article["abstract"] == "We present a benchmark for LLM agents."
+    assert article["references"] == [
+        "A. Author. Paper one. 2020.",
+        "B. Author. Paper two. 2021.",
+    ]
+    assert article["authors"] == [
+        {"name": "", "affiliation": {"institution": "Tsinghua University"}}
+    ]
+    assert all("Under review" not in s["text"] for s in article["sections"])
+
+
+def test_scanned_or_invalid_pdf_returns_none(tmp_path: Path) -> None:
+    assert extract_article(_make_pdf(tmp_path / "blank.pdf", [[]])) is None
+    broken = tmp_path / "broken.pdf"
+    broken.write_bytes(b"not a pdf")
+    assert extract_article(broken) is None
+
+
+@pytest.mark.asyncio
+async def test_enhancer_falls_back_to_grobid_only_when_needed(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(grobid_pool, "probe_grobid_version", lambda url: "0.8.0")
+    enhancer = PDFEnhancer(
+        cache_dir=str(tmp_path), content_cache_path=str(tmp_path / "c.db")
+    )
+    grobid_calls: List[Path] = []
+
+    async def _grobid(pdf_path: Path):
+        grobid_calls.append(pdf_path)
+        return {
+            "title": "t",
+            "abstract": "a",
+            "sections": [
+                {"heading": "Introduction", "text": "intro"},
+                {"heading": "Evaluation", "text": "eval"},
+            ],
+        }, "0.8.0"
+
+    monkeypatch.setattr(enhancer.grobid_pool, "parse", _grobid)
+
+    content = await enhancer._parse_pdf(_make_pdf(tmp_path / "paper.pdf", _PAPER))
+    assert content is not None and not grobid_calls
+    assert content.grobid_version == constants.PDF_FAST_EXTRACTOR_VERSION
+    assert content.dataset_summary and "github.com/THUDM" in content.dataset_summary
+    assert content.authors_affiliations == [("", "Tsinghua University")]
+
+    thin = _make_pdf(tmp_path / "thin.pdf", [["A Short Note", "Just one paragraph."]])
+    content = await enhancer._parse_pdf(thin)
+    assert grobid_calls == [thin]
+    assert content is not None and content.grobid_version == "0.8.0"
+    assert (enhancer.fast_path_hits, enhancer.fast_path_fallbacks) == (1, 1)
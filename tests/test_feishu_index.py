@@ -0,0 +1,137 @@
+"""飞书记录本地索引测试。
+
+覆盖范围：
+1. 冷启动全量同步后，再次运行只做增量刷新
+2. 写入成功的记录立即对去重可见
+3. 表中只有创建时间字段时，水位与排序都按创建时间，创建后被编辑的记录不影响增量
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, List
+
+import pytest
+
+from src.models import ScoredCandidate
+from src.storage.feishu_storage import FeishuStorage
+
+
+def _item(record_id: str, url: str, modified_ms: int) -> dict[str, Any]:
+    return {
+        "record_id": record_id,
+        "last_modified_time": modified_ms,
+        "fields": {
+            "URL": {"link": url, "text": url},
+            "来源": "arxiv",
+            "创建时间": modified_ms,
+        },
+    }
+
+
+def _storage(
+    tmp_path: Path,
+    fetch_calls: List[dict],
+    field_names: frozenset[str] = frozenset({"URL", "来源", "创建时间", "最后更新时间"}),
+) -> FeishuStorage:
+    settings = SimpleNamespace(
+        feishu=SimpleNamespace(
+            bitable_app_token="app",
+            bitable_table_id="tbl",
+            index_path=tmp_path / "index.db",
+            index_force_resync=False,
+        )
+    )
+    storage = FeishuStorage(settings=settings)
+    storage._field_names = set(field_names)
+
+    async def _noop(*_args, **_kwargs) -> None:
+        return None
+
+    storage._ensure_access_token = _noop  # type: ignore[method-assign]
+    storage._ensure_field_cache = _noop  # type: ignore[method-assign]
+    return storage
+
+
+@pytest.mark.asyncio
+async def test_cold_start_full_then_incremental(tmp_path: Path) -> None:
+    """首次全量，第二个实例只拉取增量并按修改时间提前停止"""
+
+    calls: List[dict] = []
+    table = [_item("rec1", "https://arxiv.org/abs/2501.00001", 1_000_000)]
+
+    async def fake_fetch(_client, extra_params=None, stop_when=None, **_kw):
+        calls.append(dict(extra_params or {}))
+        items = sorted(table, key=lambda i: -i["last_modified_time"])
+        if stop_when is not None:
+            stop_when(items)
+        return items
+
+    first = _storage(tmp_path, calls)
+    first._paginated_fetch = fake_fetch  # type: ignore[method-assign]
+    assert await first.get_existing_urls() == {"https://arxiv.org/abs/2501.00001"}
+    # 同一实例再次查询不会重复访问飞书
+    await first.read_existing_records()
+    assert len(calls) == 1
+    assert "sort" not in calls[0]
+
+    table.append(_item("rec2", "https://arxiv.org/abs/2501.00002", 9_000_000_000))
+    second = _storage(tmp_path, calls)
+    second._paginated_fetch = fake_fetch  # type: ignore[method-assign]
+    urls = await second.get_existing_urls()
+
+    assert len(calls) == 2
+    assert "sort" in calls[1]
+    assert urls == {
+        "https://arxiv.org/abs/2501.00001",
+        "https://arxiv.org/abs/2501.00002",
+    }
+
+
+@pytest.mark.asyncio
+async def test_saved_records_visible_without_refetch(tmp_path: Path) -> None:
+    """写入成功后登记到本地索引，后续去重直接可见"""
+
+    storage = _storage(tmp_path, [])
+
+    async def empty_fetch(*_args, **_kwargs):
+        return []
+
+    storage._paginated_fetch = empty_fetch  # type: ignore[method-assign]
+    await storage.refresh_index()
+    await storage._register_saved(
+        [ScoredCandidate(title="t", url="https://github.com/a/b", source="github")]
+    )
+
+    assert await storage.get_existing_urls() == {"https://github.com/a/b"}
+    records = await storage.read_existing_records()
+    assert records[0]["source"] == "github"
+    assert records[0]["created_at"] is not None
+
+
+@pytest.mark.asyncio
+async def test_created_time_watermark_ignores_later_edits(tmp_path: Path) -> None:
+    """按创建时间增量刷新：旧记录被编辑过，也不能把水位推到新记录之后"""
+
+    edited = _item("rec1", "https://arxiv.org/abs/2501.00001", 1_000_000)
+    edited["last_modified_time"] = 9_000_000_000
+    table = [edited]
+    fields = frozenset({"URL", "来源", "创建时间"})
+
+    async def fake_fetch(_client, extra_params=None, stop_when=None, **_kw):
+        items = sorted(table, key=lambda i: -i["fields"]["创建时间"])
+        if stop_when is not None:
+            assert "创建时间" in extra_params["sort"]
+            stop_when(items)
+        return items
+
+    first = _storage(tmp_path, [], fields)
+    first._paginated_fetch = fake_fetch  # type: ignore[method-assign]
+    await first.refresh_index()
+
+    table.append(_item("rec2", "https://arxiv.org/abs/2501.00002", 5_000_000_000))
+    second = _storage(tmp_path, [], fields)
+    second._paginated_fetch = fake_fetch  # type: ignore[method-assign]
+
+    assert "https://arxiv.org/abs/2501.00002" in await second.get_existing_urls()
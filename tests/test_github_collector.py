@@ -0,0 +1,103 @@
+"""GitHubCollector 请求调度单元测试。
+
+覆盖范围：
+1. README 通过一次 GraphQL 请求批量获取，未取到的仓库回退 REST 逐个获取
+2. 下次采集时未推送新提交的仓库直接使用本地 README 快照
+3. 共享并发池按 x-ratelimit-remaining 收缩对应额度类别的并发，不影响其他类别
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from types import SimpleNamespace
+
+import httpx
+import pytest
+
+from src.collectors.github_collector import GitHubCollector, _BudgetedPool
+from src.config import GitHubSourceSettings
+
+
+@pytest.fixture(autouse=True)
+def _tmp_http_cache(tmp_path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("GITHUB_HTTP_CACHE_PATH", str(tmp_path / "github_http_cache.db"))
+
+
+def _repo(full_name: str) -> dict:
+    return {"full_name": full_name, "pushed_at": "2025-01-01T00:00:00Z"}
+
+
+def _collector(token: str | None = "test-token") -> GitHubCollector:
+    settings = SimpleNamespace(
+        sources=SimpleNamespace(github=GitHubSourceSettings(token=token))
+    )
+    return GitHubCollector(settings=settings)  # type: ignore[arg-type]
+
+
+@pytest.mark.asyncio
+async def test_readmes_batched_via_graphql_with_rest_fallback() -> None:
+    graphql_bodies: list[dict] = []
+    rest_paths: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/graphql":
+            graphql_bodies.append(json.loads(request.content))
+            return httpx.Response(
+                200,
+                json={
+                    "data": {
+                        "r0": {"p0": None, "p1": {"text": "# Agent bench"}},
+                        "r1": {"p0": None, "p1": None, "p2": None, "p3": None},
+                    }
+                },
+            )
+        rest_paths.append(request.url.path)
+        return httpx.Response(200, text="rest readme")
+
+    collector = _collector()
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+        repos = [_repo("org/alpha"), _repo("org/beta"), _repo("org/alpha")]
+        await collector._prefetch_readmes(client, repos)
+        alpha = await collector._fetch_readme(client, "org/alpha")
+        beta = await collector._fetch_readme(client, "org/beta")
+
+        # 新进程：alpha 未推送新提交，直接命中快照，只有 beta 需要重新获取
+        next_run = _collector()
+        await next_run._prefetch_readmes(client, repos)
+
+    assert len(graphql_bodies) == 2
+    assert next_run._readme_cache["org/alpha"] == "# Agent bench"
+    assert graphql_bodies[1]["variables"] == {"o0": "org", "n0": "beta"}
+    assert graphql_bodies[0]["variables"] == {
+        "o0": "org",
+        "n0": "alpha",
+        "o1": "org",
+        "n1": "beta",
+    }
+    assert alpha == "# Agent bench"
+    assert beta == "rest readme"
+    assert rest_paths == ["/repos/org/beta/readme"]
+
+
+@pytest.mark.asyncio
+async def test_pool_shrinks_per_resource_budget() -> None:
+    pool = _BudgetedPool(max_workers=4)
+    pool.observe(
+        httpx.Headers({"x-ratelimit-resource": "search", "x-ratelimit-remaining": "7"})
+    )
+    started: list[str] = []
+    release = asyncio.Event()
+
+    async def hold(resource: str) -> None:
+        async with pool.slot(resource):
+            started.append(resource)
+            await release.wait()
+
+    tasks = [asyncio.create_task(hold(r)) for r in ("search", "search", "core")]
+    await asyncio.sleep(0.01)
+    assert sorted(started) == ["core", "search"]  # 第二个搜索请求等待额度
+
+    release.set()
+    await asyncio.gather(*tasks)
+    assert started.count("search") == 2
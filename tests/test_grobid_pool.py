@@ -0,0 +1,130 @@
+"""GrobidPool 单元测试。
+
+覆盖范围：
+1. 请求按预计完成时间路由，快实例承担更多负载
+2. 连续网络失败摘除端点，全部摘除后才使用云端兜底
+3. 并发上限按成功/失败自适应增减
+4. 构造时不探测端点，异步探测只执行一次，不可用端点进入冷却
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import Counter
+from pathlib import Path
+
+import pytest
+
+from src.common import constants
+from src.enhancer import grobid_pool
+from src.enhancer.grobid_pool import GrobidPool, GrobidUnavailableError
+
+
+def _pool(urls: list[str], fallback_url: str | None, parse) -> GrobidPool:
+    pool = GrobidPool(urls, fallback_url=fallback_url, parse_fn=parse)
+    for endpoint in pool.endpoints:
+        endpoint.version = "0.8.0"  # 跳过首次使用时的版本探测
+    return pool
+
+
+@pytest.fixture
+def pdf_path(tmp_path: Path) -> Path:
+    path = tmp_path / "paper.pdf"
+    path.write_bytes(b"%PDF-1.4" + b"0" * 1024)
+    return path
+
+
+@pytest.mark.asyncio
+async def test_routes_more_work_to_faster_endpoint(pdf_path: Path) -> None:
+    delays = {"http://fast": 0.005, "http://slow": 0.05}
+    calls: Counter[str] = Counter()
+
+    def parse(path: str, grobid_url: str) -> dict:
+        calls[grobid_url] += 1
+        time.sleep(delays[grobid_url])
+        return {"title": path}
+
+    pool = _pool(list(delays), None, parse)
+    results = await asyncio.gather(*(pool.parse(pdf_path) for _ in range(40)))
+
+    assert all(r == ({"title": str(pdf_path)}, "0.8.0") for r in results)
+    assert calls["http://fast"] > calls["http://slow"] * 2
+    assert all(e.in_flight == 0 for e in pool.endpoints)
+
+
+@pytest.mark.asyncio
+async def test_failing_endpoint_removed_and_fallback_last(pdf_path: Path) -> None:
+    calls: Counter[str] = Counter()
+
+    def parse(path: str, grobid_url: str) -> dict:
+        calls[grobid_url] += 1
+        if grobid_url == "http://broken":
+            raise ConnectionError("refused")
+        return {}
+
+    pool = _pool(["http://broken", "http://ok"], "http://cloud", parse)
+    for _ in range(20):
+        try:
+            await pool.parse(pdf_path)
+        except ConnectionError:
+            pass
+
+    broken = pool.endpoints[0]
+    assert calls["http://broken"] <= constants.GROBID_ENDPOINT_MAX_FAILURES
+    assert not broken.healthy(time.monotonic())
+    assert calls["http://cloud"] == 0
+
+    pool.endpoints[1].down_until = time.monotonic() + 60
+    await pool.parse(pdf_path)
+    assert calls["http://cloud"] == 1
+
+    pool.endpoints[2].down_until = time.monotonic() + 60
+    with pytest.raises(GrobidUnavailableError):
+        await pool.parse(pdf_path)
+
+
+@pytest.mark.asyncio
+async def test_concurrency_limit_adapts(pdf_path: Path) -> None:
+    fail = False
+
+    def parse(path: str, grobid_url: str) -> dict:
+        if fail:
+            raise ConnectionError("reset")
+        time.sleep(0.005)  # 稳定耗时，避免微秒级抖动被判为过载
+        return {}
+
+    pool = _pool(["http://a"], None, parse)
+    endpoint = pool.endpoints[0]
+    for _ in range(30):
+        await pool.parse(pdf_path)
+    assert endpoint.capacity > constants.GROBID_ENDPOINT_INITIAL_CONCURRENCY
+    assert endpoint.capacity <= constants.GROBID_ENDPOINT_MAX_CONCURRENCY
+
+    before = endpoint.limit
+    fail = True
+    with pytest.raises(ConnectionError):
+        await pool.parse(pdf_path)
+    assert endpoint.limit == pytest.approx(before / 2)
+
+
+@pytest.mark.asyncio
+async def test_probe_runs_once_off_event_loop(monkeypatch: pytest.MonkeyPatch) -> None:
+    probed: Counter[str] = Counter()
+
+    def probe(url: str) -> str | None:
+        probed[url] += 1
+        time.sleep(0.01)
+        return None if url == "http://down" else "0.8.0"
+
+    monkeypatch.setattr(grobid_pool, "probe_grobid_version", probe)
+    monkeypatch.setenv("GROBID_URLS", "http://up,http://down")
+    pool = GrobidPool.from_env()
+    assert not probed
+
+    await asyncio.gather(*(pool.probe() for _ in range(5)))
+
+    assert probed == Counter({"http://up": 1, "http://down": 1})
+    up, down = pool.endpoints[:2]
+    assert up.version == "0.8.0" and up.healthy(time.monotonic())
+    assert not down.healthy(time.monotonic())
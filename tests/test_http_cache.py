@@ -0,0 +1,57 @@
+"""HTTPResponseCache 单元测试。
+
+覆盖范围：
+1. 首次请求保存 ETag，再次请求带 If-None-Match，304 时返回缓存内容并计入统计
+2. 内容变化（200 新 ETag）时覆盖缓存
+3. 条目数超过上限时淘汰最久未使用的条目
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import httpx
+import pytest
+
+from src.common.http_cache import HTTPResponseCache
+
+
+@pytest.mark.asyncio
+async def test_conditional_get_reuses_body_on_304(tmp_path: Path) -> None:
+    versions = iter(['"v1"', '"v1"', '"v2"'])
+    seen_validators: list[str | None] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen_validators.append(request.headers.get("If-None-Match"))
+        etag = next(versions)
+        if request.headers.get("If-None-Match") == etag:
+            return httpx.Response(304, headers={"ETag": etag})
+        return httpx.Response(
+            200, headers={"ETag": etag}, json={"stargazers_count": len(seen_validators)}
+        )
+
+    cache = HTTPResponseCache(tmp_path / "http.db", max_entries=10)
+    url = "https://cache.example.test/repos/org/bench"
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+        first = await cache.conditional_get(client, url)
+        second = await cache.conditional_get(client, url)
+        third = await cache.conditional_get(client, url)
+
+    assert seen_validators == [None, '"v1"', '"v1"']
+    assert first.json() == second.json() == {"stargazers_count": 1}
+    assert second.status_code == 200
+    assert third.json() == {"stargazers_count": 3}
+    assert (cache.stats.requests, cache.stats.not_modified) == (2, 1)
+
+
+@pytest.mark.asyncio
+async def test_evicts_least_recently_used(tmp_path: Path) -> None:
+    cache = HTTPResponseCache(tmp_path / "http.db", max_entries=2)
+    await cache.put_snapshot("readme:a", "t1", b"a")
+    await cache.put_snapshot("readme:b", "t1", b"b")
+    assert await cache.get_snapshot("readme:a", "t1") == b"a"  # a 最近被使用
+    await cache.put_snapshot("readme:c", "t1", b"c")
+
+    assert await cache.get_snapshot("readme:b", "t1") is None
+    assert await cache.get_snapshot("readme:a", "t1") == b"a"
+    assert await cache.get_snapshot("readme:c", "t2") is None  # 校验值不一致视为过期
@@ -0,0 +1,70 @@
+"""HTTPClientRegistry 单元测试。
+
+覆盖范围：
+1. 同一主机复用同一客户端，不同主机/端口各自独立
+2. 对本地 HTTP 服务连续请求只建一次连接，复用率统计正确
+"""
+
+from __future__ import annotations
+
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Iterator
+
+import httpx
+import pytest
+
+from src.common.http_clients import HTTPClientRegistry
+
+
+class _OkHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # 保持长连接
+
+    def do_GET(self) -> None:  # noqa: N802
+        body = b"ok"
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args: object) -> None:
+        return None
+
+
+@pytest.fixture
+def local_server() -> Iterator[str]:
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _OkHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.mark.asyncio
+async def test_clients_are_shared_per_host() -> None:
+    registry = HTTPClientRegistry(
+        transport=httpx.MockTransport(lambda request: httpx.Response(200))
+    )
+    feishu = registry.client("https://open.feishu.cn/open-apis/auth")
+    assert registry.client("https://open.feishu.cn/open-apis/bitable") is feishu
+    assert registry.client("https://api.github.com/repos/a/b") is not feishu
+    assert registry.client("https://open.feishu.cn:8443/x") is not feishu
+
+    await feishu.get("https://open.feishu.cn/open-apis/auth")
+    assert registry.stats["https://open.feishu.cn"].requests == 1
+    await registry.aclose()
+
+
+@pytest.mark.asyncio
+async def test_connection_reuse_is_counted(local_server: str) -> None:
+    registry = HTTPClientRegistry()
+    for _ in range(3):
+        response = await registry.client(local_server).get(f"{local_server}/api/isalive")
+        assert response.text == "ok"
+    await registry.aclose()
+
+    stats = registry.stats[local_server]
+    assert stats.requests == 3
+    assert stats.connections == 1
+    assert stats.reuse_rate == pytest.approx(2 / 3)
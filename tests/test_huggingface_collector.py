@@ -0,0 +1,92 @@
+"""HuggingFaceCollector 请求调度单元测试。
+
+覆盖范围：
+1. 各关键词并发搜索，同时在途请求数不超过上限
+2. 沿 Link 头翻页，当前页最旧的数据集早于回溯窗口时停止
+"""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+import httpx
+import pytest
+
+from src.collectors.huggingface_collector import HuggingFaceCollector
+from src.common import constants
+from src.config import HuggingFaceSourceSettings
+
+API_URL = "https://hf.example.test/api/datasets"
+
+
+def _dataset(name: str, days_ago: float) -> dict:
+    modified = datetime.now(timezone.utc) - timedelta(days=days_ago)
+    return {
+        "id": f"org/{name}",
+        "downloads": 500,
+        "tags": ["benchmark"],
+        "lastModified": modified.isoformat().replace("+00:00", "Z"),
+        "cardData": {"pretty_name": name},
+    }
+
+
+def _collector(keywords: list[str], handler) -> HuggingFaceCollector:
+    cfg = HuggingFaceSourceSettings(api_url=API_URL, keywords=keywords, lookback_days=7)
+    settings = SimpleNamespace(sources=SimpleNamespace(huggingface=cfg))
+    collector = HuggingFaceCollector(settings=settings)  # type: ignore[arg-type]
+    collector.http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return collector
+
+
+@pytest.mark.asyncio
+async def test_keywords_fetched_concurrently_with_limit(monkeypatch) -> None:
+    monkeypatch.setattr(constants, "HUGGINGFACE_KEYWORD_CONCURRENCY", 2)
+    in_flight = peak = 0
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.02)
+        in_flight -= 1
+        keyword = request.url.params["search"]
+        return httpx.Response(200, json=[_dataset(f"{keyword}-bench", 30)])
+
+    collector = _collector(["code", "sql", "api", "benchmark"], handler)
+    candidates = await collector.collect()
+
+    assert peak == 2
+    assert sorted(c.title for c in candidates) == [
+        "api-bench",
+        "benchmark-bench",
+        "code-bench",
+        "sql-bench",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_link_pagination_stops_behind_lookback() -> None:
+    pages = {
+        None: ([_dataset("a", 1), _dataset("b", 3)], "p2"),
+        "p2": ([_dataset("c", 5), _dataset("d", 9)], "p3"),
+        "p3": ([_dataset("e", 12)], None),
+    }
+    requested: list[str | None] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        cursor = request.url.params.get("cursor")
+        requested.append(cursor)
+        items, next_cursor = pages[cursor]
+        headers = {}
+        if next_cursor:
+            headers["Link"] = f'<{API_URL}?search=benchmark&cursor={next_cursor}>; rel="next"'
+        return httpx.Response(200, json=items, headers=headers)
+
+    collector = _collector(["benchmark"], handler)
+    datasets = await collector._fetch_datasets_by_keyword("benchmark")
+    await collector.aclose()
+
+    assert requested == [None, "p2"]  # 第二页最旧的 d 已超出7天窗口，不再请求第三页
+    assert [ds["id"] for ds in datasets] == ["org/a", "org/b", "org/c", "org/d"]
@@ -0,0 +1,37 @@
+"""KeywordMatcher 单元测试。
+
+覆盖范围：
+1. 冗余关键词裁剪不改变 any() 判定
+2. 全文/标题/摘要三个区域的命中语义与原子串判断一致（含跨边界）
+"""
+
+from __future__ import annotations
+
+import random
+
+from src.prefilter.keyword_matcher import KeywordMatcher
+
+
+def test_pruned_groups_keep_any_semantics() -> None:
+    words = ["benchmark", "evaluation benchmark", "benchmarking", "test set", "test"]
+    matcher = KeywordMatcher({"g": words})
+    assert matcher.groups["g"] == ("test", "benchmark")
+
+    rng = random.Random(3)
+    vocab = ["bench", "mark", "test", " ", "set", "evaluation", "ing"]
+    for _ in range(500):
+        text = "".join(rng.choice(vocab) for _ in range(rng.randint(0, 8)))
+        hits = matcher.scan(text, "")
+        assert hits.in_title("g") == any(w in text.lower() for w in words)
+
+
+def test_regions_match_substring_semantics() -> None:
+    matcher = KeywordMatcher({"g": ["awesome "]})
+    # "awesome " 跨越标题与摘要的拼接边界：全文命中，标题/摘要均不命中
+    hits = matcher.scan("My Awesome", "list of papers")
+    assert hits.in_text("g")
+    assert not hits.in_title("g")
+    assert not hits.in_abstract("g")
+
+    hits = matcher.scan("Awesome LLM", "")
+    assert hits.in_title("g") and hits.in_text("g")
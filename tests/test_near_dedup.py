@@ -0,0 +1,80 @@
+"""跨来源近似重复合并测试"""
+
+from __future__ import annotations
+
+from src.models import RawCandidate
+from src.pipeline.near_dedup import merge_near_duplicates
+
+
+def test_paper_repo_dataset_merged_into_one() -> None:
+    """同一Benchmark的论文/仓库/数据集合并为一条，以arXiv为主并补齐链接"""
+
+    paper = RawCandidate(
+        title="SWE-bench: Can Language Models Resolve Real-World GitHub Issues?",
+        url="https://arxiv.org/pdf/2310.06770v2",
+        source="arxiv",
+        paper_url="http://arxiv.org/abs/2310.06770v2",
+        raw_metadata={"arxiv_id": "2310.06770"},
+    )
+    repo = RawCandidate(
+        title="princeton-nlp/SWE-bench",
+        url="https://github.com/princeton-nlp/SWE-bench",
+        source="github",
+        github_url="https://github.com/princeton-nlp/SWE-bench",
+        github_stars=1800,
+        license_type="MIT",
+    )
+    dataset = RawCandidate(
+        title="princeton-nlp/SWE-bench_Lite",
+        url="https://huggingface.co/datasets/princeton-nlp/SWE-bench_Lite",
+        source="huggingface",
+        dataset_url="https://huggingface.co/datasets/princeton-nlp/SWE-bench_Lite",
+        raw_metadata={"tags": "task_categories:text-generation,arxiv:2310.06770"},
+    )
+    other = RawCandidate(
+        title="WebArena: A Realistic Web Environment for Building Autonomous Agents",
+        url="https://arxiv.org/pdf/2307.13854",
+        source="arxiv",
+    )
+
+    merged, report = merge_near_duplicates([repo, paper, other, dataset])
+
+    assert len(merged) == 2
+    assert report.clusters == 1
+    assert report.merged == 2
+    assert report.llm_calls_saved == 2
+    primary = merged[0]
+    assert primary.source == "arxiv"
+    assert primary.github_url == "https://github.com/princeton-nlp/SWE-bench"
+    assert primary.github_stars == 1800
+    assert primary.license_type == "MIT"
+    assert primary.dataset_url.endswith("SWE-bench_Lite")
+    assert "github:" in primary.raw_metadata["merged_from"]
+
+
+def test_similar_titles_merged_distinct_titles_kept() -> None:
+    """标题几乎相同的候选合并，主题不同的候选保留"""
+
+    a = RawCandidate(
+        title="ToolBench: Evaluating Tool Use in Large Language Models",
+        url="https://example.org/toolbench",
+        source="helm",
+    )
+    b = RawCandidate(
+        title="ToolBench - Evaluating Tool Use in Large Language Models.",
+        url="https://twitter.com/x/status/1",
+        source="twitter",
+    )
+    c = RawCandidate(
+        title="A Survey of Database Query Optimization",
+        url="https://example.org/db",
+        source="dbengines",
+    )
+
+    merged, report = merge_near_duplicates([a, b, c])
+
+    assert [m.url for m in merged] == [
+        "https://example.org/toolbench",
+        "https://example.org/db",
+    ]
+    assert report.merged == 1
@@ -0,0 +1,90 @@
+"""PDFContentCache 单元测试。
+
+覆盖范围：
+1. PDFContent 序列化往返，按哈希/版本精确匹配，无本地PDF时取最近一次结果
+2. 超出大小上限时按最近访问时间淘汰
+3. PDFEnhancer 命中缓存时跳过下载与 GROBID 解析
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from src.enhancer import PDFContent, PDFEnhancer
+from src.enhancer import grobid_pool
+from src.enhancer.pdf_content_cache import PDFContentCache
+from src.models import RawCandidate
+
+
+def _content(title: str, body: str = "x") -> PDFContent:
+    return PDFContent(
+        title=title,
+        abstract="A benchmark for agents.",
+        sections={"Evaluation": body},
+        authors_affiliations=[("Alice", "Stanford")],
+        references=["[1] ref"],
+        evaluation_summary=body,
+        grobid_version="0.8.0",
+    )
+
+
+@pytest.mark.asyncio
+async def test_roundtrip_and_key_matching(tmp_path: Path) -> None:
+    cache = PDFContentCache(tmp_path / "c.db", max_bytes=1 << 20)
+    await cache.put("2501.00001", "sha-old", "0.8.0", _content("old"))
+    await cache.put("2501.00001", "sha-new", "0.8.0", _content("new"))
+
+    hit = await cache.get("2501.00001", "sha-old", {"0.8.0"})
+    assert hit == _content("old")
+    assert hit.authors_affiliations == [("Alice", "Stanford")]
+    assert (await cache.get("2501.00001", None, {"0.8.0"})).title == "new"
+    assert await cache.get("2501.00001", "sha-old", {"0.8.1"}) is None
+    assert await cache.get("2501.00002", None, {"0.8.0"}) is None
+    assert (cache.stats.hits, cache.stats.misses) == (2, 2)
+
+
+@pytest.mark.asyncio
+async def test_size_eviction_is_lru(tmp_path: Path) -> None:
+    cache = PDFContentCache(tmp_path / "c.db", max_bytes=4000)
+    body = "y" * 600
+    await cache.put("a", "1", "v", _content("a", body))
+    await cache.put("b", "1", "v", _content("b", body))
+    assert await cache.get("a", "1", {"v"}) is not None  # a 变为最近访问
+    await cache.put("c", "1", "v", _content("c", body))
+
+    assert cache.stats.evictions >= 1
+    assert await cache.get("b", "1", {"v"}) is None
+    assert await cache.get("a", "1", {"v"}) is not None
+    assert await cache.get("c", "1", {"v"}) is not None
+
+
+@pytest.mark.asyncio
+async def test_enhancer_hit_skips_download_and_grobid(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(grobid_pool, "probe_grobid_version", lambda url: "0.8.0")
+    enhancer = PDFEnhancer(
+        cache_dir=str(tmp_path / "pdf"), content_cache_path=str(tmp_path / "c.db")
+    )
+    assert enhancer.content_cache is not None
+    await enhancer.content_cache.put("2501.00001", "sha", "0.8.0", _content("cached"))
+
+    async def _fail(*args, **kwargs):
+        raise AssertionError("命中缓存时不应下载或解析")
+
+    monkeypatch.setattr(enhancer, "_download_pdf", _fail)
+    monkeypatch.setattr(enhancer, "_parse_pdf", _fail)
+    monkeypatch.setattr(enhancer, "_fetch_github_metadata", _fail)
+
+    candidate = RawCandidate(
+        title="Agent Bench",
+        url="https://arxiv.org/abs/2501.00001v2",
+        source="arxiv",
+        abstract="short",
+    )
+    enhanced = await enhancer.enhance_candidate(candidate)
+    assert enhanced.abstract == "A benchmark for agents."
+    assert enhanced.raw_metadata["evaluation_summary"] == "x"
+    assert enhancer.content_cache.stats.hits == 1
@@ -0,0 +1,83 @@
+"""PDFDownloader 单元测试。
+
+覆盖范围：
+1. export 站点 404 / 返回非PDF内容时回退主站，成功后原子落盘、不残留临时文件
+2. 同一篇论文的并发请求（含预取）只发起一次下载
+3. 全部失败时返回 None，缓存目录中不留半截文件
+"""
+
+from __future__ import annotations
+
+import asyncio
+from pathlib import Path
+
+import httpx
+import pytest
+
+from src.common import constants
+from src.common.http_clients import HTTPClientRegistry
+from src.enhancer.pdf_downloader import PDFDownloader
+
+_PDF_BYTES = b"%PDF-1.4\n" + b"0" * 20000
+
+
+def _registry(handler) -> HTTPClientRegistry:
+    return HTTPClientRegistry(transport=httpx.MockTransport(handler))
+
+
+@pytest.fixture(autouse=True)
+def _no_retry_delay(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(constants, "ARXIV_PDF_HTTP_RETRY_DELAY_SECONDS", 0.0)
+
+
+@pytest.mark.asyncio
+async def test_falls_back_to_primary_and_writes_atomically(tmp_path: Path) -> None:
+    requested: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requested.append(request.url.host)
+        if request.url.host == "export.arxiv.org":
+            return httpx.Response(404)
+        return httpx.Response(200, content=_PDF_BYTES)
+
+    downloader = PDFDownloader(tmp_path, clients=_registry(handler))
+    pdf_path = await downloader.fetch("2501.00001")
+    await downloader.aclose()
+
+    assert pdf_path == tmp_path / "2501.00001.pdf"
+    assert pdf_path.read_bytes() == _PDF_BYTES
+    assert requested == ["export.arxiv.org", "arxiv.org"]
+    assert not list(tmp_path.glob("*.part"))
+
+
+@pytest.mark.asyncio
+async def test_concurrent_requests_share_one_download(tmp_path: Path) -> None:
+    calls = 0
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return httpx.Response(200, content=_PDF_BYTES)
+
+    downloader = PDFDownloader(tmp_path, clients=_registry(handler))
+    assert downloader.prefetch(["2501.00002"]) == 1
+    paths = await asyncio.gather(*(downloader.fetch("2501.00002") for _ in range(5)))
+    await downloader.aclose()
+
+    assert calls == 1
+    assert set(paths) == {tmp_path / "2501.00002.pdf"}
+    assert downloader.downloaded == 1
+
+
+@pytest.mark.asyncio
+async def test_non_pdf_responses_leave_no_file(tmp_path: Path) -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, content=b"<html>PDF is being generated</html>")
+
+    downloader = PDFDownloader(tmp_path, clients=_registry(handler))
+    assert await downloader.fetch("2501.00003") is None
+    await downloader.aclose()
+
+    assert downloader.failed == 1
+    assert not list(tmp_path.iterdir())
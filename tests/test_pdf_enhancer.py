@@ -18,6 +18,13 @@ from src.enhancer import PDFEnhancer
 from src.models import RawCandidate
 
 
+@pytest.fixture(autouse=True)
+def _content_cache_path(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """解析结果缓存写入临时目录，避免在仓库根目录生成 pdf_content_cache.db。"""
+
+    monkeypatch.setenv("PDF_CONTENT_CACHE_PATH", str(tmp_path / "pdf_content_cache.db"))
+
+
 @pytest.fixture
 def pdf_enhancer() -> PDFEnhancer:
     """创建 PDFEnhancer 实例（使用单独的测试缓存目录）。"""
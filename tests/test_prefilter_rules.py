@@ -0,0 +1,137 @@
+"""声明式预筛选规则引擎单元测试。
+
+覆盖范围：
+1. 随仓库发布的规则文件可编译，典型候选得到预期过滤原因
+2. 规则文件错误（未知关键词表/常量、重名）在编译期报错
+3. 修改规则文件后热加载并延续统计，坏文件保留上一版
+4. 逐条规则统计与 evaluate_all 全量命中
+"""
+
+from __future__ import annotations
+
+import os
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+import pytest
+
+from src.models import RawCandidate
+from src.prefilter.rule_engine import (
+    RuleConfigError,
+    RuleEngine,
+    RuleEngineProvider,
+    default_rules_path,
+)
+
+
+def _candidate(**overrides) -> RawCandidate:
+    data = dict(
+        title="CodeBench: A Benchmark for Repository-level Code Generation",
+        url="https://arxiv.org/abs/2501.00001",
+        source="arxiv",
+        abstract="We introduce a benchmark dataset for code generation with a leaderboard.",
+    )
+    data.update(overrides)
+    return RawCandidate(**data)
+
+
+def test_shipped_rules_compile_and_classify() -> None:
+    engine = RuleEngine.load(default_rules_path())
+
+    assert engine.evaluate(_candidate())[:2] == (True, "pass")
+    assert engine.evaluate(_candidate(title="Qwen3 Technical Report"))[1] == "tech_report"
+    assert engine.evaluate(_candidate(url="ftp://example.com"))[1] == "invalid_url"
+    assert engine.evaluate(_candidate(source="reddit"))[1] == "invalid_source"
+
+    repo = _candidate(
+        title="fast-tokenizer",
+        url="https://github.com/a/fast-tokenizer",
+        source="github",
+        abstract="A fast tokenizer with benchmark results and performance comparison. " * 10,
+        github_stars=500,
+        publish_date=datetime.now(timezone.utc) - timedelta(days=3),
+    )
+    assert engine.evaluate(repo)[1] == "tool_repo"
+
+
+@pytest.mark.parametrize(
+    "data, message",
+    [
+        ({"rules": [{"name": "r", "drop_if": {"keyword": "nope"}}]}, "未定义的关键词表"),
+        ({"rules": [{"name": "r", "drop_if": {"stars_below": "$NOPE"}}]}, "未知常量"),
+        ({"rules": [{"name": "r", "drop_if": {"bogus": 1}}]}, "未知条件"),
+        (
+            {
+                "rules": [
+                    {"name": "r", "drop_if": {"missing": "url"}},
+                    {"name": "r", "drop_if": {"missing": "url"}},
+                ]
+            },
+            "重复",
+        ),
+    ],
+)
+def test_invalid_rules_rejected(data: dict, message: str) -> None:
+    with pytest.raises(RuleConfigError, match=message):
+        RuleEngine.from_dict(data)
+
+
+_RULES_V1 = """
+tables:
+  noise: [spam]
+rules:
+  - name: spam
+    drop_if: {keyword: noise}
+"""
+
+_RULES_V2 = _RULES_V1 + """
+  - name: short
+    drop_if: {shorter_than: {field: title, length: 5}}
+"""
+
+
+def test_hot_reload_keeps_stats_and_survives_bad_file(tmp_path: Path) -> None:
+    path = tmp_path / "rules.yaml"
+    path.write_text(_RULES_V1, encoding="utf-8")
+    provider = RuleEngineProvider(path, check_interval=0)
+
+    engine = provider.get()
+    assert engine.evaluate(_candidate(title="spam spam"))[1] == "spam"
+    assert provider.get() is engine
+
+    path.write_text(_RULES_V2, encoding="utf-8")
+    os.utime(path, (engine.mtime + 10, engine.mtime + 10))
+    reloaded = provider.get()
+    assert reloaded is not engine
+    assert [r.name for r in reloaded.rules] == ["spam", "short"]
+    assert reloaded.rule("spam").stats.hits == 1
+    assert reloaded.evaluate(_candidate(title="abc"))[1] == "short"
+
+    path.write_text("rules: [oops", encoding="utf-8")
+    os.utime(path, (engine.mtime + 20, engine.mtime + 20))
+    assert provider.get() is reloaded
+
+
+def test_stats_and_evaluate_all(tmp_path: Path) -> None:
+    data = {
+        "evaluate_all": True,
+        "tables": {"noise": ["spam"]},
+        "rules": [
+            {"name": "spam", "drop_if": {"keyword": "noise"}},
+            {"name": "short", "drop_if": {"shorter_than": {"field": "title", "length": 20}}},
+            {"name": "github_only", "sources": ["github"], "drop_if": {"missing": "url"}},
+        ],
+    }
+    engine = RuleEngine.from_dict(data)
+    passed, reason, fired = engine.evaluate(_candidate(title="spam title"))
+    assert (passed, reason, fired) == (False, "spam", ["spam", "short"])
+    engine.evaluate(_candidate())
+
+    stats = engine.stats()
+    assert stats["spam"]["evaluations"] == 2 and stats["spam"]["hits"] == 1
+    assert stats["short"]["hits"] == 1
+    assert stats["github_only"]["evaluations"] == 0
+
+    out = tmp_path / "stats.json"
+    engine.export_stats(out)
+    assert '"spam"' in out.read_text(encoding="utf-8")
@@ -0,0 +1,61 @@
+"""评分prompt精简模式与token记账测试。
+
+覆盖范围：
+1. 精简prompt省略空字段/空章节与评分示例，保留已有证据
+2. 两种prompt模式产生不同缓存键
+3. token账本按候选与纠偏轮次汇总
+"""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+from src.models import RawCandidate
+from src.scorer.llm_scorer import LLMScorer
+from src.scorer.token_budget import TokenLedger
+
+
+def _candidate() -> RawCandidate:
+    return RawCandidate(
+        title="SWE-bench: Can Language Models Resolve GitHub Issues?",
+        url="https://arxiv.org/abs/2310.06770",
+        source="arxiv",
+        abstract="A benchmark of real GitHub issues.",
+        raw_metadata={"method_summary": "基于真实仓库的补丁验证"},
+    )
+
+
+def test_compact_prompt_drops_empty_sections(tmp_path, monkeypatch) -> None:
+    """精简模式只保留有内容的字段与章节"""
+
+    monkeypatch.setenv("LLM_DISK_CACHE_PATH", str(tmp_path / "cache.db"))
+    scorer = LLMScorer()
+    candidate = _candidate()
+
+    full = scorer._build_prompt(candidate, "full")
+    compact = scorer._build_prompt(candidate, "compact")
+
+    assert len(compact) < len(full)
+    assert "未提供（论文无Introduction章节" in full
+    assert "未提供" not in compact
+    assert "字符计数示例" not in compact
+    assert "基于真实仓库的补丁验证" in compact
+    assert "【原始提取数据" not in compact
+    assert "第7部分：JSON输出格式" in compact
+    assert scorer._cache_key(candidate, "full") != scorer._cache_key(
+        candidate, "compact"
+    )
+
+
+def test_token_ledger_groups_by_attempt() -> None:
+    """首次调用与纠偏轮次分别汇总"""
+
+    ledger = TokenLedger()
+    ledger.record("a", 0, SimpleNamespace(prompt_tokens=4000, completion_tokens=900))
+    ledger.record("a", 1, SimpleNamespace(prompt_tokens=5200, completion_tokens=950))
+    ledger.record("b", 0, SimpleNamespace(prompt_tokens=3800, completion_tokens=800))
+    ledger.record("c", 0, None)
+
+    assert ledger.per_candidate() == {"a": (9200, 1850), "b": (3800, 800)}
+    assert ledger.per_attempt() == {0: (2, 7800, 1700), 1: (1, 5200, 950)}
+    assert ledger.prompt_tokens == 13000
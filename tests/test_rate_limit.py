@@ -0,0 +1,123 @@
+"""按主机限速与统一重试（rate_limit）单元测试。
+
+覆盖范围：
+1. Retry-After（秒/HTTP日期）、GitHub X-RateLimit-Reset、飞书 x-ogw-ratelimit-reset 解析
+2. 429 按 Retry-After 暂停整个主机，同主机的并发请求一起等待而不是各自重撞
+3. 服务端要求的等待超过上限时直接返回响应；不可重试状态不重试
+4. 飞书 batch_create 遇到 5xx 不重发，避免重复写入
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+import httpx
+import pytest
+
+from src.common import constants
+from src.common.rate_limit import (
+    RetryPolicy,
+    host_limiter,
+    rate_limit_wait_seconds,
+    send_with_retry,
+)
+from src.storage.feishu_storage import FeishuAPIError, FeishuStorage
+
+
+def test_wait_hint_parsing() -> None:
+    now = 1_700_000_000.0
+    assert rate_limit_wait_seconds(httpx.Headers({"Retry-After": "7"}), now) == 7
+    http_date = "Tue, 14 Nov 2023 22:13:40 GMT"  # now + 20s
+    assert rate_limit_wait_seconds(httpx.Headers({"Retry-After": http_date}), now) == 20
+    github = httpx.Headers(
+        {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": str(int(now) + 42)}
+    )
+    assert rate_limit_wait_seconds(github, now) == 42
+    assert rate_limit_wait_seconds(httpx.Headers({"x-ogw-ratelimit-reset": "3"}), now) == 3
+    assert rate_limit_wait_seconds(httpx.Headers({"X-RateLimit-Remaining": "12"}), now) is None
+
+
+@pytest.mark.asyncio
+async def test_rate_limit_pauses_whole_host() -> None:
+    calls = 0
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal calls
+        calls += 1
+        if calls == 1:
+            return httpx.Response(429, headers={"Retry-After": "0.2"})
+        return httpx.Response(200)
+
+    policy = RetryPolicy(max_attempts=3, base_delay=0.01)
+    url = "https://pause.example.test/api"
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+        first = asyncio.create_task(send_with_retry(client, "GET", url, policy=policy))
+        await asyncio.sleep(0.05)
+        started = time.monotonic()
+        second = await send_with_retry(client, "GET", url, policy=policy)
+        waited = time.monotonic() - started
+        assert (await first).status_code == 200
+
+    assert second.status_code == 200
+    assert waited >= 0.1  # 第二个任务也在等待限流窗口
+    stats = host_limiter(url).stats
+    assert (stats.requests, stats.retries, stats.rate_limited) == (3, 1, 1)
+    assert stats.throttle_wait > 0.2
+
+
+@pytest.mark.asyncio
+async def test_gives_up_on_long_waits_and_non_retryable(monkeypatch) -> None:
+    monkeypatch.setattr(constants, "HTTP_RETRY_MAX_WAIT_SECONDS", 1.0)
+    responses = {
+        "/limited": httpx.Response(
+            403, headers={"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "9999999999"}
+        ),
+        "/missing": httpx.Response(404),
+    }
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return responses[request.url.path]
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+        started = time.monotonic()
+        limited = await send_with_retry(client, "GET", "https://giveup.example.test/limited")
+        missing = await send_with_retry(client, "GET", "https://giveup.example.test/missing")
+
+    assert time.monotonic() - started < 0.5
+    assert (limited.status_code, missing.status_code) == (403, 404)
+    stats = host_limiter("https://giveup.example.test").stats
+    assert (stats.requests, stats.retries, stats.gave_up) == (2, 0, 1)
+
+
+@pytest.mark.asyncio
+async def test_feishu_batch_create_not_retried_on_5xx(tmp_path: Path) -> None:
+    methods: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        methods.append(request.method)
+        if len(methods) == 1:
+            return httpx.Response(502)
+        return httpx.Response(200, json={"code": 0, "data": {"records": [{}]}})
+
+    settings = SimpleNamespace(
+        feishu=SimpleNamespace(
+            bitable_app_token="app",
+            bitable_table_id="tbl",
+            index_path=tmp_path / "index.db",
+            index_force_resync=False,
+        )
+    )
+    storage = FeishuStorage(settings=settings)  # type: ignore[arg-type]
+    storage.access_token = "token"
+    storage._field_names = {"标题"}
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+        with pytest.raises(FeishuAPIError):
+            await storage._batch_create_records_with_count(
+                client, [{"fields": {"标题": "t"}}]
+            )
+
+    assert methods == ["POST"]
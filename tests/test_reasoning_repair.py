@@ -0,0 +1,112 @@
+"""推理字段定向纠偏测试。
+
+覆盖范围：
+1. 长度不足时只请求不合格字段的补丁，不重发完整评分prompt
+2. 补丁合并后通过校验，并记录字段触发统计
+"""
+
+from __future__ import annotations
+
+import json
+from typing import List
+
+import httpx
+import pytest
+from openai import AsyncOpenAI
+
+from src.models import RawCandidate
+from src.scorer.llm_scorer import LLMScorer
+from src.scorer.repair import pick_expansion_targets
+
+
+def _payload(short_field: str) -> dict:
+    reasoning = "推理" * 120
+    payload = {
+        "activity_score": 7,
+        "reproducibility_score": 8,
+        "license_score": 9,
+        "novelty_score": 6,
+        "relevance_score": 9,
+        "activity_reasoning": reasoning,
+        "reproducibility_reasoning": reasoning,
+        "license_reasoning": reasoning,
+        "novelty_reasoning": reasoning,
+        "relevance_reasoning": reasoning,
+        "overall_reasoning": reasoning,
+        "task_domain": "Coding",
+        "institution": "Princeton",
+        "dataset_size_description": "2294个任务",
+        "task_type": "代码修复",
+        "license_type": "MIT",
+    }
+    payload[short_field] = "太短"
+    return payload
+
+
+def _completion(content: str) -> httpx.Response:
+    return httpx.Response(
+        200,
+        json={
+            "id": "x",
+            "object": "chat.completion",
+            "created": 0,
+            "model": "m",
+            "choices": [
+                {
+                    "index": 0,
+                    "finish_reason": "stop",
+                    "message": {"role": "assistant", "content": content},
+                }
+            ],
+            "usage": {"prompt_tokens": 10, "completion_tokens": 5, "total_tokens": 15},
+        },
+    )
+
+
+@pytest.mark.asyncio
+async def test_patch_repair_requests_only_violating_fields(
+    tmp_path, monkeypatch
+) -> None:
+    """纠偏请求只携带不合格字段，补丁合并后评分成功"""
+
+    monkeypatch.setenv("LLM_DISK_CACHE_PATH", str(tmp_path / "cache.db"))
+    monkeypatch.setenv("LLM_REPAIR_MODE", "patch")
+    requests: List[dict] = []
+    replies = [
+        json.dumps(_payload("novelty_reasoning"), ensure_ascii=False),
+        json.dumps({"novelty_reasoning": "扩写" * 100}, ensure_ascii=False),
+    ]
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(json.loads(request.content))
+        return _completion(replies[len(requests) - 1])
+
+    scorer = LLMScorer()
+    scorer.client = AsyncOpenAI(
+        api_key="k",
+        base_url="http://llm.local/v1",
+        max_retries=0,
+        http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+    )
+    candidate = RawCandidate(
+        title="SWE-bench", url="https://arxiv.org/abs/2310.06770", source="arxiv"
+    )
+
+    extraction = await scorer._call_llm(candidate)
+
+    assert extraction.novelty_reasoning == "扩写" * 100
+    assert len(requests) == 2
+    repair_messages = requests[1]["messages"]
+    assert len(repair_messages) == 2
+    assert "novelty_reasoning" in repair_messages[1]["content"]
+    assert "第2部分：MGX场景定义" not in repair_messages[1]["content"]
+    assert scorer.repair_stats.triggered["novelty_reasoning"] == 1
+    assert scorer.repair_stats.fixed["novelty_reasoning"] == 1
+    assert scorer.token_ledger.per_attempt()[1][0] == 1
+
+
+def test_total_shortage_spreads_over_shortest_fields() -> None:
+    """总字数不足时扩写最短的字段"""
+
+    targets = pick_expansion_targets({"a": 100, "b": 120, "c": 300}, 60, 2)
+    assert targets == {"a": (130, 100), "b": (150, 120)}
@@ -0,0 +1,118 @@
+"""相关性预筛模型单元测试。
+
+覆盖范围：
+1. 训练后对明显相关/无关文本的预测可区分，模型文件往返后预测不变
+2. 安全边际校准满足目标召回
+3. 模型文件缺失时 RelevanceGate 全部放行，加载后丢弃低预测候选
+4. 评分标签追加写入JSONL
+"""
+
+from __future__ import annotations
+
+import json
+import random
+from pathlib import Path
+
+import pytest
+
+from src.common import constants
+from src.models import RawCandidate, ScoredCandidate
+from src.prefilter.relevance_model import (
+    LabeledExample,
+    RelevanceGate,
+    RelevanceModel,
+    append_relevance_labels,
+    calibrate_margin,
+    train_relevance_model,
+)
+
+_POSITIVE = ["benchmark", "evaluation", "leaderboard", "code generation", "agent tasks"]
+_NEGATIVE = ["sdk", "wrapper", "tutorial", "awesome list", "ui theme"]
+
+
+def _examples(count: int) -> list[LabeledExample]:
+    rng = random.Random(7)
+    examples = []
+    for i in range(count):
+        good = i % 2 == 0
+        words = rng.sample(_POSITIVE if good else _NEGATIVE, 3)
+        examples.append(
+            LabeledExample(
+                title=" ".join(words),
+                abstract="We release " + " ".join(words * 2),
+                source="github",
+                relevance=rng.uniform(6, 9) if good else rng.uniform(0, 1.5),
+                url=f"https://example.com/{i}",
+            )
+        )
+    return examples
+
+
+@pytest.fixture(scope="module")
+def model() -> RelevanceModel:
+    return train_relevance_model(_examples(300), dim=1 << 14, epochs=8)
+
+
+def test_model_separates_and_round_trips(model: RelevanceModel, tmp_path: Path) -> None:
+    good = model.predict_text("agent tasks benchmark", "evaluation leaderboard", "github")
+    bad = model.predict_text("sdk wrapper tutorial", "We release sdk wrapper", "github")
+    assert good > 5.0
+    assert bad < constants.RELEVANCE_HARD_FLOOR
+
+    path = tmp_path / "model.json"
+    model.save(path)
+    loaded = RelevanceModel.load(path)
+    assert loaded.predict_text("agent tasks benchmark", "", "github") == pytest.approx(
+        model.predict_text("agent tasks benchmark", "", "github"), abs=1e-3
+    )
+
+
+def test_calibrate_margin_meets_target_recall() -> None:
+    predictions = [1.0, 2.5, 3.0, 6.0, 7.0]
+    labels = [5.0, 5.0, 5.0, 5.0, 0.0]
+    margin = calibrate_margin(predictions, labels, floor=4.0, target_recall=1.0)
+    assert margin == pytest.approx(3.0)
+    kept = [p + margin >= 4.0 for p, y in zip(predictions, labels) if y >= 4.0]
+    assert all(kept)
+    assert calibrate_margin([1.0], [0.0], floor=4.0, target_recall=1.0) == 0.0
+
+
+def test_gate_passthrough_and_filtering(model: RelevanceModel, tmp_path: Path) -> None:
+    tool = RawCandidate(
+        title="sdk wrapper tutorial",
+        url="https://github.com/a/b",
+        source="github",
+        abstract="We release sdk wrapper tutorial",
+    )
+    bench = RawCandidate(
+        title="agent tasks benchmark",
+        url="https://github.com/a/c",
+        source="github",
+        abstract="evaluation leaderboard for code generation",
+    )
+
+    missing = RelevanceGate.from_path(tmp_path / "missing.json")
+    assert not missing.enabled
+    assert missing.filter_batch([tool, bench]) == [tool, bench]
+
+    path = tmp_path / "model.json"
+    model.save(path)
+    gate = RelevanceGate.from_path(path)
+    assert gate.enabled
+    assert gate.filter_batch([tool, bench]) == [bench]
+    assert gate.dropped["github"] == 1
+
+
+def test_append_relevance_labels(tmp_path: Path) -> None:
+    path = tmp_path / "logs" / "labels.jsonl"
+    scored = [
+        ScoredCandidate(
+            title="Bench", url="https://x/1", source="arxiv", relevance_score=1.5
+        )
+    ]
+    assert append_relevance_labels(scored, path) == 1
+    assert append_relevance_labels(scored, path) == 1
+    rows = [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+    assert len(rows) == 2
+    assert rows[0]["relevance_score"] == 1.5
+    assert rows[0]["source"] == "arxiv"
@@ -0,0 +1,139 @@
+"""LLM评分缓存测试。
+
+覆盖范围：
+1. 缓存键随渲染后的prompt变化，与prompt无关的字段不影响缓存键
+2. Redis不可用时评分结果落入本地磁盘缓存并可跨实例命中
+3. 批量评分通过单次MGET预查询缓存，命中结果进入内存LRU
+4. 评分器退出时清理本地磁盘缓存中的过期条目
+"""
+
+from __future__ import annotations
+
+import sqlite3
+from pathlib import Path
+from typing import Dict, List
+
+import pytest
+
+from src.models import RawCandidate
+from src.scorer.llm_scorer import LLMScorer, UnifiedBenchmarkExtraction
+from src.scorer.score_cache import DiskScoreCache
+
+
+def _scorer(tmp_path: Path, monkeypatch) -> LLMScorer:
+    monkeypatch.setenv("LLM_DISK_CACHE_PATH", str(tmp_path / "cache.db"))
+    monkeypatch.setenv("OPENAI_API_KEY", "")
+    return LLMScorer()
+
+
+def _candidate() -> RawCandidate:
+    return RawCandidate(
+        title="SWE-bench: Can Language Models Resolve GitHub Issues?",
+        url="https://arxiv.org/abs/2310.06770",
+        source="arxiv",
+        abstract="A benchmark of real GitHub issues.",
+        raw_metadata={"arxiv_id": "2310.06770"},
+    )
+
+
+def _extraction() -> UnifiedBenchmarkExtraction:
+    reasoning = "推理" * 120
+    return UnifiedBenchmarkExtraction(
+        activity_score=7,
+        reproducibility_score=8,
+        license_score=9,
+        novelty_score=6,
+        relevance_score=9,
+        activity_reasoning=reasoning,
+        reproducibility_reasoning=reasoning,
+        license_reasoning=reasoning,
+        novelty_reasoning=reasoning,
+        relevance_reasoning=reasoning,
+        overall_reasoning=reasoning,
+        task_domain="Coding",
+        institution="Princeton",
+        dataset_size_description="2294个任务",
+        task_type="代码修复",
+        license_type="MIT",
+    )
+
+
+def test_cache_key_follows_rendered_prompt(tmp_path, monkeypatch) -> None:
+    """PDF增强补充摘要后缓存键变化，prompt未使用的元数据不影响缓存键"""
+
+    scorer = _scorer(tmp_path, monkeypatch)
+    candidate = _candidate()
+    base_key = scorer._cache_key(candidate)
+
+    candidate.raw_metadata["categories"] = "cs.SE"
+    assert scorer._cache_key(candidate) == base_key
+
+    candidate.raw_metadata["method_summary"] = "基于真实仓库的补丁验证"
+    assert scorer._cache_key(candidate) != base_key
+
+
+@pytest.mark.asyncio
+async def test_disk_cache_used_without_redis(tmp_path, monkeypatch) -> None:
+    """Redis不可用时评分写入磁盘缓存，新实例无需LLM即可命中"""
+
+    candidate = _candidate()
+    writer = _scorer(tmp_path, monkeypatch)
+    assert writer.redis_client is None
+    await writer._set_cached_score(writer._cache_key(candidate), _extraction())
+    await writer.flush_cache_writes()
+
+    reader = _scorer(tmp_path, monkeypatch)
+    scored = await reader.score(candidate)
+
+    assert scored.relevance_score == 9
+    assert scored.license_type == "MIT"
+
+
+@pytest.mark.asyncio
+async def test_expired_disk_entries_purged_on_exit(tmp_path, monkeypatch) -> None:
+    """内容寻址的缓存键不会被覆盖，过期条目在评分器退出时删除"""
+
+    scorer = _scorer(tmp_path, monkeypatch)
+    await DiskScoreCache(tmp_path / "cache.db", ttl_seconds=-1).set("stale", "{}")
+    await scorer._set_cached_score(scorer._cache_key(_candidate()), _extraction())
+    await scorer.__aexit__(None, None, None)
+
+    conn = sqlite3.connect(tmp_path / "cache.db")
+    keys = [row[0] for row in conn.execute("SELECT cache_key FROM score_cache")]
+    conn.close()
+    assert keys == [scorer._cache_key(_candidate())]
+
+
+class _FakeRedis:
+    def __init__(self, data: Dict[str, str]) -> None:
+        self.data = data
+        self.mget_calls: List[List[str]] = []
+
+    async def mget(self, keys: List[str]) -> List[str | None]:
+        self.mget_calls.append(list(keys))
+        return [self.data.get(key) for key in keys]
+
+
+@pytest.mark.asyncio
+async def test_batch_prefetch_uses_single_mget(tmp_path, monkeypatch) -> None:
+    """批量评分只发一次MGET，缓存命中不调用LLM，随后由内存LRU直接服务"""
+
+    scorer = _scorer(tmp_path, monkeypatch)
+    hits = [_candidate(), _candidate()]
+    hits[1].url = "https://arxiv.org/abs/2401.00001"
+    miss = _candidate()
+    miss.url = "https://arxiv.org/abs/2401.00002"
+    payload = _extraction().model_dump_json()
+    fake = _FakeRedis({scorer._cache_key(c): payload for c in hits})
+    scorer.redis_client = fake  # type: ignore[assignment]
+
+    scored = await scorer.score_batch([*hits, miss])
+
+    assert [s.url for s in scored] == [c.url for c in hits]
+    assert len(fake.mget_calls) == 1
+    assert scorer.cache_stats.redis_hits == 2
+    assert scorer.cache_stats.misses == 1
+
+    await scorer.score(hits[0])
+    assert len(fake.mget_calls) == 1
+    assert scorer.cache_stats.memory_hits == 1
@@ -0,0 +1,77 @@
+"""StorageManager 运行快照测试：一次运行只读取一次飞书记录"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any, List, Optional
+
+import pytest
+
+from src.models import ScoredCandidate
+from src.storage.storage_manager import StorageManager
+
+
+class _FakeFeishu:
+    def __init__(self) -> None:
+        self.read_calls = 0
+        self.seen_existing: List[Optional[set[str]]] = []
+
+    async def read_existing_records(self) -> List[dict[str, Any]]:
+        self.read_calls += 1
+        await asyncio.sleep(0)
+        return [{"url": "https://a/1", "url_key": "https://a/1", "source": "arxiv"}]
+
+    async def save(
+        self, candidates: List[ScoredCandidate], existing_urls: Optional[set[str]] = None
+    ) -> List[ScoredCandidate]:
+        self.seen_existing.append(existing_urls)
+        return [c for c in candidates if existing_urls is None or c.url not in existing_urls]
+
+
+class _FakeSQLite:
+    async def get_unsynced(self) -> List[ScoredCandidate]:
+        return [ScoredCandidate(title="p", url="https://a/2", source="github")]
+
+    async def mark_synced(self, urls: List[str]) -> None:
+        return None
+
+
+@pytest.mark.asyncio
+async def test_snapshot_fetched_once_and_updated_by_save() -> None:
+    feishu = _FakeFeishu()
+    storage = StorageManager(feishu=feishu, sqlite=_FakeSQLite())  # type: ignore[arg-type]
+
+    records = await storage.read_existing_records()
+    saved = await storage.save(
+        [
+            ScoredCandidate(title="old", url="https://a/1", source="arxiv"),
+            ScoredCandidate(title="new", url="https://a/2", source="github"),
+        ]
+    )
+    await storage.sync_from_sqlite()
+
+    assert len(records) == 1
+    assert [c.url for c in saved] == ["https://a/2"]
+    assert feishu.read_calls == 1
+    # sync阶段复用快照，已包含本次写入的URL
+    assert "https://a/2" in (feishu.seen_existing[-1] or set())
+    assert await storage.get_existing_urls() == {"https://a/1", "https://a/2"}
+    snapshot = await storage.snapshot("test")
+    assert snapshot.hits["save"] == 1
+    assert snapshot.hits["sync_from_sqlite"] == 1
+    assert storage.snapshot_fetches == 1
+
+
+@pytest.mark.asyncio
+async def test_concurrent_first_callers_share_one_fetch() -> None:
+    feishu = _FakeFeishu()
+    storage = StorageManager(feishu=feishu, sqlite=_FakeSQLite())  # type: ignore[arg-type]
+
+    first, second = await asyncio.gather(
+        storage.snapshot("filter"), storage.snapshot("save")
+    )
+
+    assert first is second
+    assert feishu.read_calls == 1
+    assert storage.snapshot_fetches == 1
+    assert first.hits["save"] == 1
@@ -0,0 +1,212 @@
+"""StreamingPipeline 单元测试。
+
+覆盖范围：
+1. 快速来源的候选在慢来源结束前即完成入库
+2. 批内重复与飞书历史重复被过滤
+3. 近似重复只在预筛选通过后登记；arXiv 为主条目，晚到的 arXiv 不会被已下发的仓库吞掉
+"""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime
+from pathlib import Path
+from types import SimpleNamespace
+from typing import List
+
+import pytest
+
+from src.config import SourceScheduleSettings, SourcesSettings
+from src.models import RawCandidate, ScoredCandidate
+from src.pipeline import StreamingPipeline
+
+
+class _ListCollector:
+    def __init__(self, candidates: List[RawCandidate], delay: float = 0.0) -> None:
+        self.candidates = candidates
+        self.delay = delay
+
+    async def collect(self) -> List[RawCandidate]:
+        await asyncio.sleep(self.delay)
+        return list(self.candidates)
+
+
+class _FakeStorage:
+    def __init__(self, existing: List[dict]) -> None:
+        self.existing = existing
+        self.saved_at: List[tuple[float, List[str]]] = []
+
+    async def read_existing_records(self) -> List[dict]:
+        return self.existing
+
+    async def save(self, candidates: List[ScoredCandidate]) -> List[ScoredCandidate]:
+        loop = asyncio.get_running_loop()
+        self.saved_at.append((loop.time(), [c.url for c in candidates]))
+        return candidates
+
+
+class _PassthroughEnhancer:
+    concurrency = 2
+
+    def prefetch(self, candidates: List[RawCandidate]) -> None:
+        return None
+
+    async def enhance_candidate(self, candidate: RawCandidate) -> RawCandidate:
+        return candidate
+
+
+class _FakeScorer:
+    async def score(self, candidate: RawCandidate) -> ScoredCandidate:
+        return ScoredCandidate(
+            title=candidate.title, url=candidate.url, source=candidate.source
+        )
+
+
+def _candidate(
+    url: str, title: str = "Agent Benchmark", source: str = "helm"
+) -> RawCandidate:
+    return RawCandidate(
+        title=title,
+        url=url,
+        source=source,
+        abstract="A benchmark for evaluating LLM agents on tool use tasks.",
+    )
+
+
+def _settings(tmp_path: Path) -> SimpleNamespace:
+    schedule = SourceScheduleSettings(deadline_seconds=5, cancel_grace_seconds=0.1)
+    return SimpleNamespace(
+        sources=SourcesSettings(schedules={"fast": schedule, "slow": schedule}),
+        logging=SimpleNamespace(directory=tmp_path),
+        relevance_model_path=tmp_path / "relevance_model.json",
+    )
+
+
+@pytest.mark.asyncio
+async def test_fast_source_stored_before_slow_source_finishes(
+    monkeypatch, tmp_path: Path
+) -> None:
+    """快速来源结果不等待慢来源"""
+
+    monkeypatch.setattr("src.pipeline.streaming.prefilter", lambda c: True)
+    monkeypatch.setattr("src.pipeline.streaming.constants.STREAMING_STORE_BATCH_SIZE", 1)
+    storage = _FakeStorage(existing=[])
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+
+    pipeline = StreamingPipeline(
+        [
+            ("fast", _ListCollector([_candidate("https://a/1")])),
+            (
+                "slow",
+                _ListCollector(
+                    [_candidate("https://a/2", title="Database Query Suite")],
+                    delay=0.3,
+                ),
+            ),
+        ],
+        settings=_settings(tmp_path),
+        storage=storage,
+        enhancer=_PassthroughEnhancer(),
+        scorer=_FakeScorer(),
+        finalize=lambda batch: batch,
+    )
+    result = await pipeline.run()
+
+    assert len(result.saved) == 2
+    first_time, first_urls = storage.saved_at[0]
+    assert first_urls == ["https://a/1"]
+    assert first_time - start < 0.2
+
+
+@pytest.mark.asyncio
+async def test_duplicates_are_dropped(monkeypatch, tmp_path: Path) -> None:
+    """批内重复与飞书窗口内已存在URL均被过滤"""
+
+    monkeypatch.setattr("src.pipeline.streaming.prefilter", lambda c: True)
+    storage = _FakeStorage(
+        existing=[
+            {
+                "url": "https://a/old",
+                "source": "helm",
+                "created_at": datetime.now(),
+            }
+        ]
+    )
+    pipeline = StreamingPipeline(
+        [
+            (
+                "fast",
+                _ListCollector(
+                    [
+                        _candidate("https://a/1"),
+                        _candidate("https://a/1/"),
+                        _candidate("https://a/old"),
+                    ]
+                ),
+            )
+        ],
+        settings=_settings(tmp_path),
+        storage=storage,
+        enhancer=_PassthroughEnhancer(),
+        scorer=_FakeScorer(),
+        finalize=lambda batch: batch,
+    )
+    result = await pipeline.run()
+
+    assert [c.url for c in result.saved] == ["https://a/1"]
+    assert result.counts["internal_duplicate"] == 1
+    assert result.counts["feishu_duplicate"] == 1
+
+
+def _swe_bench_pair() -> tuple[RawCandidate, RawCandidate]:
+    repo = RawCandidate(
+        title="princeton-nlp/SWE-bench",
+        url="https://github.com/princeton-nlp/SWE-bench",
+        source="github",
+        github_url="https://github.com/princeton-nlp/SWE-bench",
+        github_stars=1800,
+    )
+    paper = RawCandidate(
+        title="SWE-bench: Can Language Models Resolve Real-World GitHub Issues?",
+        url="https://arxiv.org/pdf/2310.06770v2",
+        source="arxiv",
+        raw_metadata={"arxiv_id": "2310.06770"},
+    )
+    return repo, paper
+
+
+async def _run_streaming(tmp_path: Path, candidates: List[RawCandidate]):
+    pipeline = StreamingPipeline(
+        [("fast", _ListCollector(candidates))],
+        settings=_settings(tmp_path),
+        storage=_FakeStorage(existing=[]),
+        enhancer=_PassthroughEnhancer(),
+        scorer=_FakeScorer(),
+        finalize=lambda batch: batch,
+    )
+    return await pipeline.run()
+
+
+@pytest.mark.asyncio
+async def test_near_duplicates_prefer_arxiv(monkeypatch, tmp_path: Path) -> None:
+    # 仓库被预筛选拒绝时不占用近似重复索引，论文照常下发
+    monkeypatch.setattr("src.pipeline.streaming.prefilter", lambda c: c.source == "arxiv")
+    result = await _run_streaming(tmp_path, list(_swe_bench_pair()))
+    assert [c.source for c in result.saved] == ["arxiv"]
+    assert result.counts["near_duplicate"] == 0
+
+    # 仓库先到并已下发：论文优先级更高，仍然下发并补齐仓库信息
+    monkeypatch.setattr("src.pipeline.streaming.prefilter", lambda c: True)
+    repo, paper = _swe_bench_pair()
+    result = await _run_streaming(tmp_path, [repo, paper])
+    assert sorted(c.source for c in result.saved) == ["arxiv", "github"]
+    assert result.counts["near_duplicate_promoted"] == 1
+    assert paper.github_url == repo.github_url
+
+    # 论文先到：仓库并入论文后丢弃
+    repo, paper = _swe_bench_pair()
+    result = await _run_streaming(tmp_path, [paper, repo])
+    assert [c.source for c in result.saved] == ["arxiv"]
+    assert result.counts["near_duplicate"] == 1
+    assert paper.github_stars == 1800